@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+
+from application.interfaces.dto import CatalogImportResultDTO
+
+
+class ImportRecord(NamedTuple):
+    """取り込む1行分のフィールド（形式が不正な行は fields がNoneで error に理由を持つ）"""
+    line: int
+    fields: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+
+
+class CatalogImportInputBoundary(ABC):
+    """顧客・製品の一括取り込みのインプットポート
+    
+    records は1行ずつ読み進めるイテラブルで、チャンク単位で検証・保存するため全体をメモリに保持しない。
+    """
+    
+    @abstractmethod
+    def import_customers(self, records: Iterable[ImportRecord]) -> CatalogImportResultDTO:
+        """顧客を取り込む"""
+        pass
+    
+    @abstractmethod
+    def import_products(self, records: Iterable[ImportRecord]) -> CatalogImportResultDTO:
+        """製品を取り込む"""
+        pass
+
+
+class CatalogImportOutputBoundary(ABC):
+    """顧客・製品の一括取り込みの出力境界"""
+    
+    @abstractmethod
+    def present_import_progress(self, result: CatalogImportResultDTO) -> None:
+        """チャンクを保存するたびに途中経過を表示する"""
+        pass
+    
+    @abstractmethod
+    def present_import_result(self, result: CatalogImportResultDTO) -> None:
+        """取り込みの結果を表示する"""
+        pass
+
+
+class CatalogImportErrorOutputBoundary(ABC):
+    """顧客・製品の一括取り込みのエラー出力境界"""
+    
+    @abstractmethod
+    def present_error(self, message: str) -> None:
+        """エラーを表示する"""
+        pass
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from application.interfaces.dto import CustomerDTO
+
+
+class CustomerCommandInputBoundary(ABC):
+    """顧客コマンド操作のインプットポート"""
+    
+    @abstractmethod
+    def register_customer(self, customer_dto: CustomerDTO) -> CustomerDTO:
+        """顧客を登録する"""
+        pass
+
+
+class CustomerQueryInputBoundary(ABC):
+    """顧客クエリ操作のインプットポート"""
+    
+    @abstractmethod
+    def get_customer(self, customer_id: UUID) -> CustomerDTO:
+        """顧客を取得する"""
+        pass
+    
+    @abstractmethod
+    def find_customer_by_email(self, email: str) -> CustomerDTO:
+        """メールアドレスで顧客を取得する"""
+        pass
+
+
+class CustomerCommandOutputBoundary(ABC):
+    """顧客コマンド操作の出力境界"""
+    
+    @abstractmethod
+    def present_registered_customer(self, customer_dto: CustomerDTO) -> None:
+        """登録された顧客を表示する"""
+        pass
+
+
+class CustomerQueryOutputBoundary(ABC):
+    """顧客クエリ操作の出力境界"""
+    
+    @abstractmethod
+    def present_customer(self, customer_dto: CustomerDTO) -> None:
+        """顧客を表示する"""
+        pass
+
+
+class CustomerErrorOutputBoundary(ABC):
+    """顧客操作のエラー出力境界"""
+    
+    @abstractmethod
+    def present_error(self, message: str) -> None:
+        """エラーを表示する"""
+        pass
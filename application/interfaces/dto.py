@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderItemDTO:
     """注文アイテムのデータ転送オブジェクト"""
     product_id: UUID
@@ -12,7 +12,7 @@ class OrderItemDTO:
     price_per_unit: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderDTO:
     """注文のデータ転送オブジェクト"""
     id: Optional[UUID] = None
@@ -24,7 +24,63 @@ class OrderDTO:
     total_amount: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
+class OrderSummaryDTO:
+    """読み取りモデルの注文サマリー
+    
+    書き込み時に作成され、dataには表示用に整形済みの内容（合計金額を含む）を保持する。
+    読み取り時は変換や再計算をせずにdataをそのまま出力に使う。
+    """
+    id: UUID
+    customer_id: UUID
+    status: str
+    created_at: datetime
+    total_amount: float
+    version: int = 1
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class OrderPageDTO:
+    """注文一覧の1ページ分（次ページがなければnext_cursorはNone）"""
+    orders: List[OrderSummaryDTO] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+@dataclass(slots=True)
+class OrderCreationResultDTO:
+    """一括注文作成における1件ごとの結果"""
+    index: int
+    order: Optional[OrderDTO] = None
+    error: Optional[str] = None
+    
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class OrderStatusUpdateResultDTO:
+    """一括ステータス変更における1件ごとの結果（成功した場合は変更後のステータス）"""
+    order_id: UUID
+    status: Optional[str] = None
+    error: Optional[str] = None
+    
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class RevenueDTO:
+    """集計単位（商品・顧客・日）ごとの売上のデータ転送オブジェクト"""
+    key: str
+    revenue: float = 0.0
+    quantity: int = 0
+    lines: int = 0
+
+
+@dataclass(slots=True)
 class CustomerDTO:
     """顧客のデータ転送オブジェクト"""
     id: Optional[UUID] = None
@@ -36,13 +92,46 @@ class CustomerDTO:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProductDTO:
-    """製品のデータ転送オブジェクト"""
-    id: Optional[UUID] = None
-    name: str = ""
+    """製品のデータ転送オブジェクト（カタログのスナップショットに入れた後は変更しない）"""
+    id: UUID
+    name: str
+    price: float
     description: Optional[str] = None
-    price: float = 0.0
     stock_quantity: int = 0
     created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None 
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class ProductPageDTO:
+    """製品一覧の1ページ分（versionは参照したカタログの版、次ページがなければnext_cursorはNone）"""
+    products: List[ProductDTO] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    version: int = 0
+
+
+@dataclass(slots=True)
+class ImportRejectionDTO:
+    """取り込みで除外した行（行番号は入力の1始まりの行番号）"""
+    line: int
+    error: str
+
+
+@dataclass(slots=True)
+class CatalogImportResultDTO:
+    """顧客・製品の取り込みの結果（途中経過の報告にも使う）
+    
+    rejections には除外した行のうち先頭の一部だけを保持し、件数は rejected で数える。
+    """
+    kind: str
+    rows: int = 0
+    imported: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+    rejections: List[ImportRejectionDTO] = field(default_factory=list)
+    
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
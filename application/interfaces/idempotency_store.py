@@ -0,0 +1,78 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+# Idempotency-Key ヘッダーの最大長
+MAX_KEY_LENGTH = 255
+
+
+@dataclass(frozen=True)
+class IdempotentResponse:
+    """Idempotency-Key ごとに保存するレスポンス"""
+    fingerprint: str  # リクエストボディのハッシュ（同じキーで別の内容が送られたことを検出する）
+    body: bytes
+
+
+class IdempotencyKeyError(Exception):
+    """Idempotency-Key を処理できない場合の例外の基底クラス"""
+    pass
+
+
+class IdempotencyKeyConflictError(IdempotencyKeyError):
+    """同じキーで別の内容のリクエストが送られた場合の例外"""
+
+    def __init__(self, key: str):
+        super().__init__(f"Idempotency-Key {key} was already used with a different request")
+        self.key = key
+
+
+class IdempotencyKeyInProgressError(IdempotencyKeyError):
+    """同じキーのリクエストが待ち時間内に完了しなかった場合の例外"""
+
+    def __init__(self, key: str):
+        super().__init__(f"A request with Idempotency-Key {key} is still in progress")
+        self.key = key
+
+
+def request_fingerprint(request_data: Dict[str, Any]) -> str:
+    """リクエストボディのハッシュを作成する（キーの並びに依存しない）"""
+    canonical = json.dumps(request_data, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class IdempotencyStoreInterface(ABC):
+    """Idempotency-Key ごとの処理結果のストアのインターフェース
+
+    begin でキーの処理権を得た呼び出しだけがユースケースを実行し、complete で結果を保存するか、
+    失敗した場合は release で処理権を手放す。処理中のキーで begin した呼び出しは完了を待ち、
+    保存された結果を受け取る。
+    """
+
+    @abstractmethod
+    def begin(self, key: str, fingerprint: str, timeout: Optional[float] = None) -> Optional[IdempotentResponse]:
+        """保存済みの結果を返す。なければ処理権を得てNoneを返す
+
+        同じキーを処理中の呼び出しがあれば最大timeout秒（Noneはストアの既定値）完了を待つ。
+
+        Raises:
+            IdempotencyKeyConflictError: 同じキーで別の内容のリクエストが保存・処理されている場合
+            IdempotencyKeyInProgressError: 待ち時間内に処理中のリクエストが完了しなかった場合
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, key: str, response: IdempotentResponse) -> None:
+        """処理結果を保存し、完了を待っている呼び出しに渡す"""
+        pass
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """結果を保存せずに処理権を手放す（待っている呼び出しのうち1つが改めて処理する）"""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """保存件数や再送の件数などを返す"""
+        pass
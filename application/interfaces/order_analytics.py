@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from application.interfaces.dto import RevenueDTO
+
+
+class OrderAnalyticsInterface(ABC):
+    """注文明細の売上集計のインターフェース
+    
+    statuses を省略した場合はキャンセル以外の注文を対象とし、since/until は作成日時の範囲 [since, until) で絞り込む。
+    """
+    
+    @abstractmethod
+    def revenue_by_product(self, statuses: Optional[List[str]] = None, since: Optional[datetime] = None,
+                           until: Optional[datetime] = None, limit: Optional[int] = None) -> List[RevenueDTO]:
+        """商品ごとの売上を売上の多い順に取得する"""
+        pass
+    
+    @abstractmethod
+    def revenue_by_customer(self, statuses: Optional[List[str]] = None, since: Optional[datetime] = None,
+                            until: Optional[datetime] = None, limit: Optional[int] = None) -> List[RevenueDTO]:
+        """顧客ごとの売上を売上の多い順に取得する"""
+        pass
+    
+    @abstractmethod
+    def revenue_by_day(self, statuses: Optional[List[str]] = None, since: Optional[datetime] = None,
+                       until: Optional[datetime] = None) -> List[RevenueDTO]:
+        """日ごとの売上を日付順に取得する"""
+        pass
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class OrderCacheInterface(ABC):
+    """注文の読み取り結果のキャッシュのインターフェース
+    
+    コマンド側は注文を書き込んだ後に、書き込んだ版より古い内容を無効化する。
+    """
+    
+    @abstractmethod
+    def invalidate(self, order_id: UUID, version: int) -> None:
+        """注文のversionより前の版のキャッシュを無効化する"""
+        pass
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from domain.entities.order import Order
+
+
+class OrderHistoryInterface(ABC):
+    """過去の時点の注文を取得するインターフェース（イベントソーシングのリポジトリ使用時のみ）"""
+    
+    @abstractmethod
+    def find_as_of(self, order_id: UUID, at: datetime) -> Optional[Order]:
+        """at の時点の注文を取得する（その時点で作成されていなければNone）"""
+        pass
+    
+    @abstractmethod
+    def find_by_customer_as_of(self, customer_id: UUID, at: datetime) -> List[Order]:
+        """at 以前に作成された顧客の注文を、それぞれ at の時点の状態で取得する"""
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+from uuid import UUID
+
+
+class OrderProjectionRepairInterface(ABC):
+    """読み取りモデルへの反映に失敗した注文の修復のインターフェース
+    
+    コマンド側は注文の書き込みに成功した後で反映に失敗した場合、エラーにせず注文IDをここに記録する。
+    記録された注文は後で書き込み側から読み直して反映し直される。
+    """
+    
+    @abstractmethod
+    def schedule(self, order_ids: Iterable[UUID]) -> None:
+        """注文の反映し直しを予約する"""
+        pass
@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional
+from uuid import UUID
+
+from application.interfaces.dto import OrderSummaryDTO
+from domain.repositories.order_repository import OrderPageCursor
+
+
+class OrderReadModelInterface(ABC):
+    """注文の読み取りモデル（表示用に整形済みの注文サマリー）のインターフェース
+    
+    コマンド側の書き込みに合わせて更新され、クエリ側はこれだけを参照する。
+    """
+    
+    @abstractmethod
+    def upsert(self, summaries: List[OrderSummaryDTO]) -> None:
+        """注文サマリーを追加し、既にある場合は version が新しい場合だけ置き換える"""
+        pass
+    
+    @abstractmethod
+    def get(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        """注文IDでサマリーを取得する"""
+        pass
+    
+    @abstractmethod
+    def list_by_customer(self, customer_id: UUID) -> List[OrderSummaryDTO]:
+        """顧客の注文サマリーを作成日時・ID順に取得する"""
+        pass
+    
+    @abstractmethod
+    def page_by_customer(self, customer_id: UUID, limit: int,
+                         after: Optional[OrderPageCursor] = None) -> List[OrderSummaryDTO]:
+        """顧客の注文サマリーをafterより後ろから最大limit件取得する"""
+        pass
+    
+    @abstractmethod
+    def count(self) -> int:
+        """保持している注文サマリーの件数を返す"""
+        pass
+    
+    def iter_by_customer(self, customer_id: UUID, batch_size: int = 500) -> Iterator[OrderSummaryDTO]:
+        """顧客の注文サマリーをbatch_size件ずつ取得しながら1件ずつ返す"""
+        after: Optional[OrderPageCursor] = None
+        while True:
+            summaries = self.page_by_customer(customer_id, batch_size, after)
+            yield from summaries
+            if len(summaries) < batch_size:
+                return
+            last = summaries[-1]
+            after = OrderPageCursor(last.created_at, last.id)
+
+
+class AsyncOrderReadModelInterface(ABC):
+    """注文の読み取りモデルの非同期インターフェース"""
+    
+    @abstractmethod
+    async def upsert(self, summaries: List[OrderSummaryDTO]) -> None:
+        """注文サマリーを追加し、既にある場合は version が新しい場合だけ置き換える"""
+        pass
+    
+    @abstractmethod
+    async def get(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        """注文IDでサマリーを取得する"""
+        pass
+    
+    @abstractmethod
+    async def list_by_customer(self, customer_id: UUID) -> List[OrderSummaryDTO]:
+        """顧客の注文サマリーを作成日時・ID順に取得する"""
+        pass
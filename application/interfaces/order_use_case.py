@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import Iterator, List, Optional
 from uuid import UUID
 
-from application.interfaces.dto import OrderDTO
+from application.interfaces.dto import (
+    OrderCreationResultDTO,
+    OrderDTO,
+    OrderPageDTO,
+    OrderStatusUpdateResultDTO,
+    OrderSummaryDTO,
+    RevenueDTO
+)
 
 
 class OrderCommandInputBoundary(ABC):
@@ -13,11 +21,21 @@ class OrderCommandInputBoundary(ABC):
         """注文を作成する"""
         pass
     
+    @abstractmethod
+    def create_orders(self, order_dtos: List[OrderDTO]) -> List[OrderCreationResultDTO]:
+        """複数の注文を一括で作成する（注文ごとに成功または失敗を返す）"""
+        pass
+    
     @abstractmethod
     def update_order_status(self, order_id: UUID, status: str) -> OrderDTO:
         """注文ステータスを更新する"""
         pass
     
+    @abstractmethod
+    def update_orders_status(self, order_ids: List[UUID], status: str) -> List[OrderStatusUpdateResultDTO]:
+        """複数の注文のステータスを一括で更新する（注文ごとに成功または失敗を返す）"""
+        pass
+    
     @abstractmethod
     def cancel_order(self, order_id: UUID) -> OrderDTO:
         """注文をキャンセルする"""
@@ -28,12 +46,79 @@ class OrderQueryInputBoundary(ABC):
     """注文クエリ操作のインプットポート"""
     
     @abstractmethod
-    def get_order(self, order_id: UUID) -> OrderDTO:
+    def get_order(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        """注文を取得する"""
+        pass
+    
+    @abstractmethod
+    def get_customer_orders(self, customer_id: UUID) -> List[OrderSummaryDTO]:
+        """顧客の注文を取得する"""
+        pass
+    
+    @abstractmethod
+    def get_customer_orders_page(self, customer_id: UUID, limit: int, cursor: Optional[str] = None) -> OrderPageDTO:
+        """顧客の注文をカーソル位置から最大limit件取得する"""
+        pass
+    
+    @abstractmethod
+    def stream_customer_orders(self, customer_id: UUID) -> None:
+        """顧客の注文を1件ずつ出力境界へ流す"""
+        pass
+
+
+class OrderAnalyticsInputBoundary(ABC):
+    """注文の売上集計のインプットポート"""
+    
+    @abstractmethod
+    def get_revenue(self, by: str, statuses: Optional[List[str]] = None, since: Optional[datetime] = None,
+                    until: Optional[datetime] = None, limit: Optional[int] = None) -> List[RevenueDTO]:
+        """商品・顧客・日（by）ごとの売上を取得する"""
+        pass
+
+
+class OrderHistoryInputBoundary(ABC):
+    """過去の時点の注文を取得するインプットポート"""
+    
+    @abstractmethod
+    def get_order_as_of(self, order_id: UUID, at: datetime) -> Optional[OrderSummaryDTO]:
+        """at の時点の注文を取得する"""
+        pass
+    
+    @abstractmethod
+    def get_customer_orders_as_of(self, customer_id: UUID, at: datetime) -> List[OrderSummaryDTO]:
+        """at の時点の顧客の注文を取得する"""
+        pass
+
+
+class AsyncOrderCommandInputBoundary(ABC):
+    """注文コマンド操作の非同期インプットポート"""
+    
+    @abstractmethod
+    async def create_order(self, order_dto: OrderDTO) -> OrderDTO:
+        """注文を作成する"""
+        pass
+    
+    @abstractmethod
+    async def update_order_status(self, order_id: UUID, status: str) -> OrderDTO:
+        """注文ステータスを更新する"""
+        pass
+    
+    @abstractmethod
+    async def cancel_order(self, order_id: UUID) -> OrderDTO:
+        """注文をキャンセルする"""
+        pass
+
+
+class AsyncOrderQueryInputBoundary(ABC):
+    """注文クエリ操作の非同期インプットポート"""
+    
+    @abstractmethod
+    async def get_order(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
         """注文を取得する"""
         pass
     
     @abstractmethod
-    def get_customer_orders(self, customer_id: UUID) -> List[OrderDTO]:
+    async def get_customer_orders(self, customer_id: UUID) -> List[OrderSummaryDTO]:
         """顧客の注文を取得する"""
         pass
 
@@ -46,11 +131,21 @@ class OrderCommandOutputBoundary(ABC):
         """作成された注文を表示する"""
         pass
     
+    @abstractmethod
+    def present_created_orders(self, results: List[OrderCreationResultDTO]) -> None:
+        """一括作成の結果を表示する"""
+        pass
+    
     @abstractmethod
     def present_updated_order(self, order_dto: OrderDTO) -> None:
         """更新された注文を表示する"""
         pass
     
+    @abstractmethod
+    def present_updated_orders(self, results: List[OrderStatusUpdateResultDTO]) -> None:
+        """一括ステータス更新の結果を表示する"""
+        pass
+    
     @abstractmethod
     def present_cancelled_order(self, order_dto: OrderDTO) -> None:
         """キャンセルされた注文を表示する"""
@@ -61,14 +156,33 @@ class OrderQueryOutputBoundary(ABC):
     """注文クエリ操作の出力境界"""
     
     @abstractmethod
-    def present_order(self, order_dto: OrderDTO) -> None:
+    def present_order(self, summary: OrderSummaryDTO) -> None:
         """注文を表示する"""
         pass
     
     @abstractmethod
-    def present_orders(self, order_dtos: List[OrderDTO]) -> None:
+    def present_orders(self, summaries: List[OrderSummaryDTO]) -> None:
         """注文リストを表示する"""
         pass
+    
+    @abstractmethod
+    def present_order_page(self, order_page: OrderPageDTO) -> None:
+        """注文リストの1ページを表示する"""
+        pass
+    
+    @abstractmethod
+    def present_order_stream(self, summaries: Iterator[OrderSummaryDTO]) -> None:
+        """注文を逐次表示する（イテレータは表示時に消費される）"""
+        pass
+
+
+class OrderAnalyticsOutputBoundary(ABC):
+    """注文の売上集計の出力境界"""
+    
+    @abstractmethod
+    def present_revenue(self, by: str, rows: List[RevenueDTO]) -> None:
+        """集計単位ごとの売上を表示する"""
+        pass
 
 
 class OrderErrorOutputBoundary(ABC):
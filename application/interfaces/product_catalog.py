@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterable, List, Mapping, Optional, Tuple
+from uuid import UUID
+
+from application.interfaces.dto import ProductDTO
+
+# カタログの並び順のキー（名前の小文字、製品ID）
+CatalogKey = Tuple[str, UUID]
+
+
+def catalog_sort_key(product: ProductDTO) -> CatalogKey:
+    """カタログの並び順のキーを返す"""
+    return product.name.lower(), product.id
+
+
+@dataclass(frozen=True)
+class ProductCatalogSnapshot:
+    """ある版の製品カタログ
+    
+    products は名前・ID順に並べた不変のタプルで、by_id とともに作成後は変更しない。
+    読み取り中に次の版が作られても、参照しているスナップショットの内容は変わらない。
+    """
+    version: int
+    products: Tuple[ProductDTO, ...]
+    by_id: Mapping[UUID, ProductDTO]
+    
+    def page(self, limit: int, after: Optional[CatalogKey] = None, query: Optional[str] = None) -> List[ProductDTO]:
+        """afterより後ろの製品を最大limit件返す（queryを指定した場合は名前に含む製品のみ）"""
+        products = self.products
+        start = bisect_right(products, after, key=catalog_sort_key) if after is not None else 0
+        if query is None:
+            return list(products[start:start + limit])
+        needle = query.lower()
+        matched: List[ProductDTO] = []
+        for index in range(start, len(products)):
+            if needle in products[index].name.lower():
+                matched.append(products[index])
+                if len(matched) == limit:
+                    break
+        return matched
+
+
+class ProductCatalogInterface(ABC):
+    """製品カタログ（読み取り専用の版付きスナップショット）のインターフェース
+    
+    製品の書き込み側は mark_changed で版を上げ、読み取り側は snapshot で最新の版を参照する。
+    """
+    
+    @abstractmethod
+    def version(self) -> int:
+        """最新の版を返す（スナップショットを作らずに参照できる）"""
+        pass
+    
+    @abstractmethod
+    def snapshot(self) -> ProductCatalogSnapshot:
+        """最新の版のスナップショットを返す"""
+        pass
+    
+    @abstractmethod
+    def mark_changed(self, product_ids: Optional[Iterable[UUID]] = None) -> None:
+        """製品が変更されたことを記録して版を上げる（Noneの場合は全件が変更されたものとする）"""
+        pass
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from application.interfaces.dto import ProductDTO, ProductPageDTO
+
+
+class ProductQueryInputBoundary(ABC):
+    """製品クエリ操作のインプットポート"""
+    
+    @abstractmethod
+    def catalog_version(self) -> int:
+        """参照するカタログの最新の版を返す"""
+        pass
+    
+    @abstractmethod
+    def get_product(self, product_id: UUID) -> Optional[ProductDTO]:
+        """製品を取得する"""
+        pass
+    
+    @abstractmethod
+    def list_products(self, limit: int, cursor: Optional[str] = None) -> ProductPageDTO:
+        """製品を名前順にカーソル位置から最大limit件取得する"""
+        pass
+    
+    @abstractmethod
+    def search_products(self, query: str, limit: int, cursor: Optional[str] = None) -> ProductPageDTO:
+        """名前にqueryを含む製品を名前順にカーソル位置から最大limit件取得する"""
+        pass
+
+
+class ProductQueryOutputBoundary(ABC):
+    """製品クエリ操作の出力境界"""
+    
+    @abstractmethod
+    def present_product(self, product_dto: ProductDTO) -> None:
+        """製品を表示する"""
+        pass
+    
+    @abstractmethod
+    def present_product_page(self, product_page: ProductPageDTO) -> None:
+        """製品一覧の1ページを表示する"""
+        pass
+
+
+class ProductErrorOutputBoundary(ABC):
+    """製品操作のエラー出力境界"""
+    
+    @abstractmethod
+    def present_error(self, message: str) -> None:
+        """エラーを表示する"""
+        pass
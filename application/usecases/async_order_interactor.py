@@ -0,0 +1,236 @@
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from application.interfaces.dto import OrderDTO, OrderSummaryDTO
+from application.interfaces.order_cache import OrderCacheInterface
+from application.interfaces.order_projection_repair import OrderProjectionRepairInterface
+from application.interfaces.order_read_model import AsyncOrderReadModelInterface
+from application.interfaces.order_use_case import (
+    AsyncOrderCommandInputBoundary,
+    AsyncOrderQueryInputBoundary,
+    OrderCommandOutputBoundary,
+    OrderQueryOutputBoundary,
+    OrderErrorOutputBoundary
+)
+from application.usecases.order_interactor import (
+    _build_order,
+    _invalid_status_message,
+    _parse_status,
+    _projection_failed,
+    _quantities,
+    _stock_error_message,
+    _to_dto
+)
+from application.usecases.order_projection import project_order
+from domain.entities.order import Order, OrderStatus
+from domain.exceptions import InsufficientStockError
+from domain.repositories.customer_repository import AsyncCustomerRepository
+from domain.repositories.order_repository import (
+    AsyncOrderCommandRepositoryInterface,
+    AsyncOrderQueryRepositoryInterface
+)
+from domain.repositories.product_repository import AsyncProductRepository
+
+
+class AsyncOrderCommandInteractor(AsyncOrderCommandInputBoundary):
+    """注文コマンド操作の責務を持つ非同期インタラクター
+
+    検証とエンティティの組み立ては同期版と共通の関数を使い、リポジトリ呼び出しだけをawaitする。
+    """
+
+    def __init__(self,
+                order_repository: AsyncOrderCommandRepositoryInterface,
+                order_query_repository: AsyncOrderQueryRepositoryInterface,
+                customer_repository: AsyncCustomerRepository,
+                product_repository: AsyncProductRepository,
+                output_boundary: OrderCommandOutputBoundary,
+                error_boundary: OrderErrorOutputBoundary,
+                read_model: Optional[AsyncOrderReadModelInterface] = None,
+                cache: Optional[OrderCacheInterface] = None,
+                repairs: Optional[OrderProjectionRepairInterface] = None):
+        self.order_repository = order_repository
+        self.order_query_repository = order_query_repository
+        self.customer_repository = customer_repository
+        self.product_repository = product_repository
+        self.output_boundary = output_boundary
+        self.error_boundary = error_boundary
+        self.read_model = read_model
+        self.cache = cache
+        self.repairs = repairs
+
+    async def create_order(self, order_dto: OrderDTO) -> OrderDTO:
+        """注文を作成する"""
+        try:
+            # 顧客が存在するか確認
+            customer = await self.customer_repository.find_by_id(order_dto.customer_id)
+            if not customer:
+                self.error_boundary.present_error(f"Customer with ID {order_dto.customer_id} not found")
+                return order_dto
+
+            # 注文に含まれる製品を一括で取得する
+            products = await self.product_repository.find_by_ids(item_dto.product_id for item_dto in order_dto.items)
+
+            # 注文エンティティの作成と在庫の検証
+            reserved: Dict[UUID, int] = {}
+            order, error = _build_order(order_dto, products, reserved)
+            if error:
+                self.error_boundary.present_error(error)
+                return order_dto
+
+            # 全ての検証が通ってから在庫を原子的に確保する
+            try:
+                await self.product_repository.reserve_stock(reserved)
+            except InsufficientStockError as e:
+                self.error_boundary.present_error(_stock_error_message(e, products))
+                return order_dto
+
+            # 注文を保存（保存に失敗した場合は確保した在庫を戻す）
+            try:
+                saved_order = await self.order_repository.save(order)
+            except Exception:
+                await self.product_repository.release_stock(reserved)
+                raise
+            await self._project(saved_order)
+
+            # DTOに変換
+            result_dto = _to_dto(saved_order)
+
+            # 出力境界を通じて結果を表示
+            self.output_boundary.present_created_order(result_dto)
+            return result_dto
+
+        except Exception as e:
+            self.error_boundary.present_error(f"Error creating order: {str(e)}")
+            return order_dto
+
+    async def _project(self, order: Order) -> None:
+        """書き込んだ注文を読み取りモデルに反映する（失敗した場合はエラーにせず修復を予約する）"""
+        if self.read_model is None:
+            return
+        try:
+            await self.read_model.upsert([project_order(order)])
+        except Exception as e:
+            _projection_failed(e, [order], self.repairs)
+
+    def _invalidate(self, order: Order) -> None:
+        """更新した注文の古い版のキャッシュを無効化する"""
+        if self.cache is not None:
+            self.cache.invalidate(order.id, order.version)
+
+    async def _change_status(self, order_ids: List[UUID], status: OrderStatus) -> List[Order]:
+        """遷移表で status に変更できる注文だけを条件付きで変更し、変更した注文を返す
+        
+        キャンセルした注文の在庫は、ステータスの変更に成功した注文の分だけ戻す（同時にキャンセルしても二重に戻らない）。
+        """
+        updated = await self.order_repository.update_status_many(order_ids, status, status.previous_statuses())
+        if status == OrderStatus.CANCELLED and updated:
+            # 在庫を戻す（読み込まずに原子的に加算する）
+            await self.product_repository.release_stock(_quantities(updated))
+        for order in updated:
+            await self._project(order)
+            self._invalidate(order)
+        return updated
+
+    async def _transition_error(self, order_id: UUID, status: OrderStatus) -> Tuple[Optional[Order], Optional[str]]:
+        """条件付きの変更で対象にならなかった注文を読み込み、理由を返す（既に同じステータスならエラーなし）"""
+        order = await self.order_query_repository.find_by_id(order_id)
+        if not order:
+            return None, f"Order with ID {order_id} not found"
+        if order.status == status:
+            return order, None
+        if status == OrderStatus.CANCELLED:
+            return order, f"Cannot cancel order with status {order.status}"
+        return order, f"Cannot change order status from {order.status} to {status}"
+
+    async def update_order_status(self, order_id: UUID, status: str) -> OrderDTO:
+        """注文ステータスを更新する"""
+        try:
+            # ステータスの検証
+            target = _parse_status(status)
+            if target is None:
+                self.error_boundary.present_error(_invalid_status_message(status))
+                return OrderDTO()
+
+            # 遷移表で許可された元のステータスの場合だけ更新する（読み込みと書き込みの間に変更されても上書きしない）
+            updated = await self._change_status([order_id], target)
+            if updated:
+                order = updated[0]
+            else:
+                order, error = await self._transition_error(order_id, target)
+                if error:
+                    self.error_boundary.present_error(error)
+                    return _to_dto(order) if order else OrderDTO()
+
+            # DTOに変換
+            order_dto = _to_dto(order)
+
+            # 出力境界を通じて結果を表示
+            self.output_boundary.present_updated_order(order_dto)
+            return order_dto
+
+        except Exception as e:
+            self.error_boundary.present_error(f"Error updating order status: {str(e)}")
+            return OrderDTO()
+
+    async def cancel_order(self, order_id: UUID) -> OrderDTO:
+        """注文をキャンセルする"""
+        try:
+            # キャンセルできるのは遷移表でキャンセルに変更できる（PENDINGまたはCONFIRMEDの）注文のみ
+            updated = await self._change_status([order_id], OrderStatus.CANCELLED)
+            if not updated:
+                order, error = await self._transition_error(order_id, OrderStatus.CANCELLED)
+                # 既にキャンセル済みの注文も在庫を戻さずにエラーにする
+                self.error_boundary.present_error(error or f"Cannot cancel order with status {order.status}")
+                return _to_dto(order) if order else OrderDTO()
+
+            # DTOに変換
+            order_dto = _to_dto(updated[0])
+
+            # 出力境界を通じて結果を表示
+            self.output_boundary.present_cancelled_order(order_dto)
+            return order_dto
+
+        except Exception as e:
+            self.error_boundary.present_error(f"Error cancelling order: {str(e)}")
+            return OrderDTO()
+
+
+class AsyncOrderQueryInteractor(AsyncOrderQueryInputBoundary):
+    """注文クエリ操作の責務を持つ非同期インタラクター（読み取りモデルを参照する）"""
+
+    def __init__(self,
+                read_model: AsyncOrderReadModelInterface,
+                output_boundary: OrderQueryOutputBoundary,
+                error_boundary: OrderErrorOutputBoundary):
+        self.read_model = read_model
+        self.output_boundary = output_boundary
+        self.error_boundary = error_boundary
+
+    async def get_order(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        """注文を取得する"""
+        try:
+            summary = await self.read_model.get(order_id)
+            if not summary:
+                self.error_boundary.present_error(f"Order with ID {order_id} not found")
+                return None
+
+            # 出力境界を通じて結果を表示
+            self.output_boundary.present_order(summary)
+            return summary
+
+        except Exception as e:
+            self.error_boundary.present_error(f"Error getting order: {str(e)}")
+            return None
+
+    async def get_customer_orders(self, customer_id: UUID) -> List[OrderSummaryDTO]:
+        """顧客の注文を取得する"""
+        try:
+            summaries = await self.read_model.list_by_customer(customer_id)
+
+            # 出力境界を通じて結果を表示
+            self.output_boundary.present_orders(summaries)
+            return summaries
+
+        except Exception as e:
+            self.error_boundary.present_error(f"Error getting customer orders: {str(e)}")
+            return []
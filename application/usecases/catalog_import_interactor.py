@@ -0,0 +1,172 @@
+import math
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from application.interfaces.catalog_import_use_case import (
+    CatalogImportErrorOutputBoundary,
+    CatalogImportInputBoundary,
+    CatalogImportOutputBoundary,
+    ImportRecord
+)
+from application.interfaces.dto import CatalogImportResultDTO, ImportRejectionDTO
+from domain.entities.customer import Customer
+from domain.entities.product import Product
+from domain.exceptions import DomainError
+from domain.repositories.customer_repository import CustomerRepository
+from domain.repositories.product_repository import ProductRepository
+
+T = TypeVar("T")
+
+# 1回の一括保存で書き込む行数
+DEFAULT_CHUNK_SIZE = 1000
+# 結果に含める除外行の上限（件数は全て数える）
+MAX_REPORTED_REJECTIONS = 100
+
+
+def _text(fields: Dict[str, Any], name: str) -> Optional[str]:
+    """文字列のフィールドを取り出す（空文字列はNoneとして扱う）"""
+    value = fields.get(name)
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _identity(fields: Dict[str, Any]) -> Dict[str, UUID]:
+    """id 列があればエンティティのIDとして使う（なければ新しいIDを振る）"""
+    value = _text(fields, "id")
+    if value is None:
+        return {}
+    try:
+        return {"id": UUID(value)}
+    except ValueError:
+        raise ValueError(f"Invalid id: {value}") from None
+
+
+def _number(fields: Dict[str, Any], name: str, kind: Callable[[Any], T]) -> Optional[T]:
+    """数値のフィールドを取り出す（CSVの文字列とNDJSONの数値の両方を受け付ける）"""
+    value = fields.get(name)
+    if value is None or value == "":
+        return None
+    try:
+        number = kind(value.strip() if isinstance(value, str) else value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {name}: {value}") from None
+    if isinstance(number, float) and not math.isfinite(number):
+        raise ValueError(f"Invalid {name}: {value}")
+    return number
+
+
+def _to_customer(fields: Dict[str, Any]) -> Customer:
+    """1行分のフィールドを検証して顧客エンティティを作る"""
+    name = _text(fields, "name")
+    email = _text(fields, "email")
+    if not name or not email:
+        raise ValueError("Customer name and email are required")
+    return Customer(
+        name=name,
+        email=email,
+        phone=_text(fields, "phone"),
+        address=_text(fields, "address"),
+        **_identity(fields)
+    )
+
+
+def _to_product(fields: Dict[str, Any]) -> Product:
+    """1行分のフィールドを検証して製品エンティティを作る"""
+    name = _text(fields, "name")
+    price = _number(fields, "price", float)
+    if not name or price is None:
+        raise ValueError("Product name and price are required")
+    stock_quantity = _number(fields, "stock_quantity", int) or 0
+    if price < 0 or stock_quantity < 0:
+        raise ValueError("Product price and stock_quantity must not be negative")
+    return Product(
+        name=name,
+        price=price,
+        description=_text(fields, "description"),
+        stock_quantity=stock_quantity,
+        **_identity(fields)
+    )
+
+
+def _reject(result: CatalogImportResultDTO, line: int, error: str) -> None:
+    result.rejected += 1
+    if len(result.rejections) < MAX_REPORTED_REJECTIONS:
+        result.rejections.append(ImportRejectionDTO(line, error))
+
+
+class CatalogImportInteractor(CatalogImportInputBoundary):
+    """顧客・製品の一括取り込みの責務を持つインタラクター
+    
+    行を読み進めながら chunk_size 件ごとに検証済みのエンティティをリポジトリの save_many で保存する。
+    保持するのは処理中の1チャンクだけなので、入力の大きさに関わらずメモリ使用量は一定になる。
+    一括保存が重複で失敗したチャンクは1件ずつ保存し直し、保存できなかった行だけを除外する。
+    """
+    
+    def __init__(self,
+                customer_repository: CustomerRepository,
+                product_repository: ProductRepository,
+                output_boundary: CatalogImportOutputBoundary,
+                error_boundary: CatalogImportErrorOutputBoundary,
+                chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.customer_repository = customer_repository
+        self.product_repository = product_repository
+        self.output_boundary = output_boundary
+        self.error_boundary = error_boundary
+        self.chunk_size = chunk_size
+    
+    def import_customers(self, records: Iterable[ImportRecord]) -> CatalogImportResultDTO:
+        """顧客を取り込む"""
+        return self._import("customers", records, _to_customer, self.customer_repository)
+    
+    def import_products(self, records: Iterable[ImportRecord]) -> CatalogImportResultDTO:
+        """製品を取り込む"""
+        return self._import("products", records, _to_product, self.product_repository)
+    
+    def _import(self, kind: str, records: Iterable[ImportRecord],
+                build: Callable[[Dict[str, Any]], Any], repository: Any) -> CatalogImportResultDTO:
+        result = CatalogImportResultDTO(kind=kind)
+        started = perf_counter()
+        try:
+            chunk: List[Tuple[int, Any]] = []
+            for record in records:
+                result.rows += 1
+                if record.fields is None:
+                    _reject(result, record.line, record.error or "Malformed record")
+                    continue
+                try:
+                    chunk.append((record.line, build(record.fields)))
+                except ValueError as e:
+                    _reject(result, record.line, str(e))
+                    continue
+                if len(chunk) >= self.chunk_size:
+                    self._save(result, repository, chunk)
+                    chunk = []
+                    result.seconds = perf_counter() - started
+                    self.output_boundary.present_import_progress(result)
+            if chunk:
+                self._save(result, repository, chunk)
+            result.seconds = perf_counter() - started
+            self.output_boundary.present_import_result(result)
+            return result
+            
+        except Exception as e:
+            result.seconds = perf_counter() - started
+            self.error_boundary.present_error(f"Error importing {kind}: {str(e)}")
+            return result
+    
+    @staticmethod
+    def _save(result: CatalogImportResultDTO, repository: Any, chunk: List[Tuple[int, Any]]) -> None:
+        try:
+            repository.save_many([entity for _, entity in chunk])
+            result.imported += len(chunk)
+        except DomainError:
+            # 登録済みのメールアドレスなどで一括保存できなかったチャンクは1件ずつ保存する
+            for line, entity in chunk:
+                try:
+                    repository.save(entity)
+                    result.imported += 1
+                except DomainError as e:
+                    _reject(result, line, str(e))
@@ -0,0 +1,112 @@
+from uuid import UUID
+
+from application.interfaces.customer_use_case import (
+    CustomerCommandInputBoundary,
+    CustomerCommandOutputBoundary,
+    CustomerErrorOutputBoundary,
+    CustomerQueryInputBoundary,
+    CustomerQueryOutputBoundary
+)
+from application.interfaces.dto import CustomerDTO
+from domain.entities.customer import Customer
+from domain.exceptions import DuplicateEmailError
+from domain.repositories.customer_repository import CustomerRepository
+
+
+def _to_dto(customer: Customer) -> CustomerDTO:
+    """エンティティからDTOに変換する"""
+    return CustomerDTO(
+        id=customer.id,
+        name=customer.name,
+        email=customer.email,
+        phone=customer.phone,
+        address=customer.address,
+        created_at=customer.created_at,
+        updated_at=customer.updated_at
+    )
+
+
+class CustomerCommandInteractor(CustomerCommandInputBoundary):
+    """顧客コマンド操作の責務を持つインタラクター"""
+    
+    def __init__(self,
+                customer_repository: CustomerRepository,
+                output_boundary: CustomerCommandOutputBoundary,
+                error_boundary: CustomerErrorOutputBoundary):
+        self.customer_repository = customer_repository
+        self.output_boundary = output_boundary
+        self.error_boundary = error_boundary
+    
+    def register_customer(self, customer_dto: CustomerDTO) -> CustomerDTO:
+        """顧客を登録する"""
+        try:
+            if not customer_dto.name or not customer_dto.email:
+                self.error_boundary.present_error("Customer name and email are required")
+                return customer_dto
+            
+            # メールアドレスの重複はリポジトリの一意インデックスで検出する
+            customer = Customer(
+                name=customer_dto.name,
+                email=customer_dto.email.strip(),
+                phone=customer_dto.phone,
+                address=customer_dto.address
+            )
+            saved_customer = self.customer_repository.save(customer)
+            
+            # DTOに変換
+            result_dto = _to_dto(saved_customer)
+            
+            # 出力境界を通じて結果を表示
+            self.output_boundary.present_registered_customer(result_dto)
+            return result_dto
+            
+        except DuplicateEmailError as e:
+            self.error_boundary.present_error(str(e))
+            return customer_dto
+        except Exception as e:
+            self.error_boundary.present_error(f"Error registering customer: {str(e)}")
+            return customer_dto
+
+
+class CustomerQueryInteractor(CustomerQueryInputBoundary):
+    """顧客クエリ操作の責務を持つインタラクター"""
+    
+    def __init__(self,
+                customer_repository: CustomerRepository,
+                output_boundary: CustomerQueryOutputBoundary,
+                error_boundary: CustomerErrorOutputBoundary):
+        self.customer_repository = customer_repository
+        self.output_boundary = output_boundary
+        self.error_boundary = error_boundary
+    
+    def get_customer(self, customer_id: UUID) -> CustomerDTO:
+        """顧客を取得する"""
+        try:
+            customer = self.customer_repository.find_by_id(customer_id)
+            if not customer:
+                self.error_boundary.present_error(f"Customer with ID {customer_id} not found")
+                return CustomerDTO()
+            
+            customer_dto = _to_dto(customer)
+            self.output_boundary.present_customer(customer_dto)
+            return customer_dto
+            
+        except Exception as e:
+            self.error_boundary.present_error(f"Error getting customer: {str(e)}")
+            return CustomerDTO()
+    
+    def find_customer_by_email(self, email: str) -> CustomerDTO:
+        """メールアドレスで顧客を取得する"""
+        try:
+            customer = self.customer_repository.find_by_email(email)
+            if not customer:
+                self.error_boundary.present_error(f"Customer with email {email} not found")
+                return CustomerDTO()
+            
+            customer_dto = _to_dto(customer)
+            self.output_boundary.present_customer(customer_dto)
+            return customer_dto
+            
+        except Exception as e:
+            self.error_boundary.present_error(f"Error finding customer by email: {str(e)}")
+            return CustomerDTO()
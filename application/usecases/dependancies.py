@@ -1,168 +1,268 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 from typing import Annotated
-from fastapi import status
 from application.interfaces.order_use_case import (
+    AsyncOrderCommandInputBoundary,
+    OrderAnalyticsInputBoundary,
+    OrderHistoryInputBoundary,
+    AsyncOrderQueryInputBoundary,
     OrderCommandInputBoundary,
-    OrderCommandOutputBoundary,
-    OrderQueryInputBoundary,
-    OrderQueryOutputBoundary,
-    OrderErrorOutputBoundary
+    OrderQueryInputBoundary
 )
-from application.interfaces.dto import OrderDTO
-from presentation.viewmodels.order_view_model import HttpResponseOrderCreationViewModel
-from infrastructure.repositories.in_memory_order_repository import (
-    InMemoryOrderCommandRepository,
-    InMemoryOrderQueryRepository
+from application.interfaces.idempotency_store import IdempotencyStoreInterface
+from application.interfaces.order_analytics import OrderAnalyticsInterface
+from application.interfaces.order_history import OrderHistoryInterface
+from application.interfaces.order_projection_repair import OrderProjectionRepairInterface
+from application.interfaces.order_read_model import AsyncOrderReadModelInterface, OrderReadModelInterface
+from application.interfaces.product_catalog import ProductCatalogInterface
+from application.interfaces.product_use_case import ProductQueryInputBoundary
+from infrastructure.cache.order_response_cache import OrderResponseCache
+from infrastructure.cache.product_page_cache import ProductPageCache
+from infrastructure.metrics.instrumentation import instrument
+from application.interfaces.catalog_import_use_case import CatalogImportInputBoundary
+from application.interfaces.customer_use_case import (
+    CustomerCommandInputBoundary,
+    CustomerQueryInputBoundary
 )
+from application.usecases.catalog_import_interactor import CatalogImportInteractor
+from application.usecases.customer_interactor import (
+    CustomerCommandInteractor,
+    CustomerQueryInteractor
+)
+from application.usecases.async_order_interactor import (
+    AsyncOrderCommandInteractor,
+    AsyncOrderQueryInteractor
+)
+from application.usecases.order_analytics_interactor import OrderAnalyticsInteractor
+from application.usecases.order_history_interactor import OrderHistoryInteractor
 from application.usecases.order_interactor import (
     OrderCommandInteractor,
     OrderQueryInteractor
 )
-from domain.repositories.customer_repository import CustomerRepository
-from domain.repositories.product_repository import ProductRepository
-from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
-from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from application.usecases.product_interactor import ProductQueryInteractor
+from domain.repositories.customer_repository import AsyncCustomerRepository, CustomerRepository
+from domain.repositories.order_repository import (
+    AsyncOrderCommandRepositoryInterface,
+    AsyncOrderQueryRepositoryInterface,
+    OrderCommandRepositoryInterface,
+    OrderQueryRepositoryInterface
+)
+from domain.repositories.product_repository import AsyncProductRepository, ProductRepository
+from config.container import Container
+from config.environment import env
+from presentation.presenters.catalog_import_presenter import CatalogImportPresenter
+from presentation.presenters.customer_presenter import CustomerCommandPresenter, CustomerQueryPresenter
+from presentation.presenters.order_presenter import OrderAnalyticsPresenter, OrderCommandPresenter, OrderQueryPresenter
+from presentation.presenters.product_presenter import ProductQueryPresenter
 
-def get_order_command_presenter() -> OrderCommandOutputBoundary:
+async def get_container(request: Request) -> Container:
+    """起動時に作成したアプリケーションスコープのコンテナを提供"""
+    return request.app.state.container
+
+# プレゼンターのみリクエストスコープ（同一リクエスト内ではコントローラーと同じインスタンスが共有される）
+async def get_order_command_presenter() -> OrderCommandPresenter:
     """注文コマンド用プレゼンターを提供"""
-    return HttpResponseOrderCommandPresenter()
+    return OrderCommandPresenter()
 
-def get_order_query_presenter() -> OrderQueryOutputBoundary:
+async def get_order_query_presenter() -> OrderQueryPresenter:
     """注文クエリ用プレゼンターを提供"""
-    return HttpResponseOrderQueryPresenter()
+    return OrderQueryPresenter()
+
+async def get_order_analytics_presenter() -> OrderAnalyticsPresenter:
+    """注文の売上集計用プレゼンターを提供"""
+    return OrderAnalyticsPresenter()
+
+async def get_customer_command_presenter() -> CustomerCommandPresenter:
+    """顧客コマンド用プレゼンターを提供"""
+    return CustomerCommandPresenter()
 
+async def get_customer_query_presenter() -> CustomerQueryPresenter:
+    """顧客クエリ用プレゼンターを提供"""
+    return CustomerQueryPresenter()
 
-def get_error_presenter() -> OrderErrorOutputBoundary:
-    """エラー用プレゼンターを提供"""
-    return HttpResponseOrderCommandPresenter()
+async def get_product_query_presenter() -> ProductQueryPresenter:
+    """製品クエリ用プレゼンターを提供"""
+    return ProductQueryPresenter()
 
-def get_customer_repository() -> CustomerRepository:
+async def get_catalog_import_presenter() -> CatalogImportPresenter:
+    """顧客・製品の一括取り込み用プレゼンターを提供"""
+    return CatalogImportPresenter()
+
+# リポジトリはコンテナが保持する長寿命のインスタンスを辞書参照で返す
+async def get_customer_repository(container: Annotated[Container, Depends(get_container)]) -> CustomerRepository:
     """顧客リポジトリを提供"""
-    return InMemoryCustomerRepository()
+    return container.resolve("customer_repository")
 
-def get_product_repository() -> ProductRepository:
+async def get_product_repository(container: Annotated[Container, Depends(get_container)]) -> ProductRepository:
     """製品リポジトリを提供"""
-    return InMemoryProductRepository()
+    return container.resolve("product_repository")
 
-def get_order_command_repository():
+async def get_order_command_repository(container: Annotated[Container, Depends(get_container)]) -> OrderCommandRepositoryInterface:
     """注文コマンドリポジトリを提供"""
-    return InMemoryOrderCommandRepository()
+    return container.resolve("order_command_repository")
 
-def get_order_query_repository():
+async def get_order_query_repository(container: Annotated[Container, Depends(get_container)]) -> OrderQueryRepositoryInterface:
     """注文クエリリポジトリを提供"""
-    return InMemoryOrderQueryRepository()
-
-class HttpResponseOrderCommandPresenter(OrderCommandOutputBoundary, OrderErrorOutputBoundary):
-    """注文コマンド結果をHTTPレスポンス用に変換するプレゼンター"""
-    
-    def __init__(self):
-        self.view_model = HttpResponseOrderCreationViewModel()
-    
-    def present_created_order(self, order_dto: OrderDTO) -> None:
-        """作成された注文を表示する"""
-        self.view_model = HttpResponseOrderCreationViewModel(status.HTTP_201_CREATED)
-        order_data = self._to_dict(order_dto)
-        self.view_model.set_body(order_data)
-        if order_dto.id:
-            self.view_model.add_header("Location", f"/orders/{order_dto.id}")
-    
-    def present_updated_order(self, order_dto: OrderDTO) -> None:
-        """更新された注文を表示する"""
-        self.view_model = HttpResponseOrderCreationViewModel(status.HTTP_200_OK)
-        order_data = self._to_dict(order_dto)
-        self.view_model.set_body(order_data)
-    
-    def present_cancelled_order(self, order_dto: OrderDTO) -> None:
-        """キャンセルされた注文を表示する"""
-        self.view_model = HttpResponseOrderCreationViewModel(status.HTTP_200_OK)
-        order_data = self._to_dict(order_dto)
-        self.view_model.set_body(order_data)
-    
-    def present_error(self, message: str) -> None:
-        """エラーを表示する"""
-        self.view_model = HttpResponseOrderCreationViewModel(status.HTTP_400_BAD_REQUEST)
-        self.view_model.set_error(message)
-    
-    def _to_dict(self, order_dto: OrderDTO) -> dict:
-        """OrderDTOを辞書に変換する"""
-        return {
-            "id": str(order_dto.id) if order_dto.id else None,
-            "customer_id": str(order_dto.customer_id) if order_dto.customer_id else None,
-            "items": [
-                {
-                    "product_id": str(item.product_id),
-                    "quantity": item.quantity,
-                    "price_per_unit": item.price_per_unit,
-                    "total_price": item.quantity * item.price_per_unit
-                }
-                for item in order_dto.items
-            ],
-            "status": order_dto.status,
-            "created_at": order_dto.created_at.isoformat() if order_dto.created_at else None,
-            "updated_at": order_dto.updated_at.isoformat() if order_dto.updated_at else None,
-            "total_amount": order_dto.total_amount or sum(item.quantity * item.price_per_unit for item in order_dto.items)
-        }
-
-
-class HttpResponseOrderQueryPresenter(OrderQueryOutputBoundary, OrderErrorOutputBoundary):
-    """注文クエリ結果をHTTPレスポンス用に変換するプレゼンター"""
-    
-    def __init__(self):
-        self.view_model = HttpResponseOrderCreationViewModel()
-    
-    def present_order(self, order_dto: OrderDTO) -> None:
-        """単一の注文を表示する"""
-        self.view_model = HttpResponseOrderCreationViewModel(status.HTTP_200_OK)
-        order_data = self._to_dict(order_dto)
-        self.view_model.set_body(order_data)
-    
-    def present_orders(self, order_dtos: list[OrderDTO]) -> None:
-        """注文リストを表示する"""
-        self.view_model = HttpResponseOrderCreationViewModel(status.HTTP_200_OK)
-        orders_data = [self._to_dict(order_dto) for order_dto in order_dtos]
-        self.view_model.set_body(orders_data)
-    
-    def present_error(self, message: str) -> None:
-        """エラーを表示する"""
-        self.view_model = HttpResponseOrderCreationViewModel(status.HTTP_400_BAD_REQUEST)
-        self.view_model.set_error(message)
-    
-    def _to_dict(self, order_dto: OrderDTO) -> dict:
-        """OrderDTOを辞書に変換する"""
-        return {
-            "id": str(order_dto.id) if order_dto.id else None,
-            "customer_id": str(order_dto.customer_id) if order_dto.customer_id else None,
-            "items": [
-                {
-                    "product_id": str(item.product_id),
-                    "quantity": item.quantity,
-                    "price_per_unit": item.price_per_unit,
-                    "total_price": item.quantity * item.price_per_unit
-                }
-                for item in order_dto.items
-            ],
-            "status": order_dto.status,
-            "created_at": order_dto.created_at.isoformat() if order_dto.created_at else None,
-            "updated_at": order_dto.updated_at.isoformat() if order_dto.updated_at else None,
-            "total_amount": order_dto.total_amount or sum(item.quantity * item.price_per_unit for item in order_dto.items)
-        }
-
-
-def order_command_usecase(
-    order_repo: Annotated[InMemoryOrderCommandRepository, Depends(get_order_command_repository)],
+    return container.resolve("order_query_repository")
+
+async def get_async_customer_repository(container: Annotated[Container, Depends(get_container)]) -> AsyncCustomerRepository:
+    """非同期の顧客リポジトリを提供"""
+    return container.resolve("async_customer_repository")
+
+async def get_async_product_repository(container: Annotated[Container, Depends(get_container)]) -> AsyncProductRepository:
+    """非同期の製品リポジトリを提供"""
+    return container.resolve("async_product_repository")
+
+async def get_async_order_command_repository(container: Annotated[Container, Depends(get_container)]) -> AsyncOrderCommandRepositoryInterface:
+    """非同期の注文コマンドリポジトリを提供"""
+    return container.resolve("async_order_command_repository")
+
+async def get_async_order_query_repository(container: Annotated[Container, Depends(get_container)]) -> AsyncOrderQueryRepositoryInterface:
+    """非同期の注文クエリリポジトリを提供"""
+    return container.resolve("async_order_query_repository")
+
+async def get_order_read_model(container: Annotated[Container, Depends(get_container)]) -> OrderReadModelInterface:
+    """注文の読み取りモデルを提供"""
+    return container.resolve("order_read_model")
+
+async def get_async_order_read_model(container: Annotated[Container, Depends(get_container)]) -> AsyncOrderReadModelInterface:
+    """非同期の注文読み取りモデルを提供"""
+    return container.resolve("async_order_read_model")
+
+async def get_order_projection_repairer(container: Annotated[Container, Depends(get_container)]) -> OrderProjectionRepairInterface:
+    """読み取りモデルへの反映に失敗した注文の修復を提供"""
+    return container.resolve("order_projection_repairer")
+
+async def get_order_response_cache(container: Annotated[Container, Depends(get_container)]) -> OrderResponseCache:
+    """注文取得レスポンスのキャッシュを提供"""
+    return container.resolve("order_response_cache")
+
+async def get_product_catalog(container: Annotated[Container, Depends(get_container)]) -> ProductCatalogInterface:
+    """製品カタログを提供"""
+    return container.resolve("product_catalog")
+
+async def get_product_page_cache(container: Annotated[Container, Depends(get_container)]) -> ProductPageCache:
+    """製品一覧・検索・取得のレスポンスのキャッシュを提供"""
+    return container.resolve("product_page_cache")
+
+async def get_idempotency_store(container: Annotated[Container, Depends(get_container)]) -> IdempotencyStoreInterface:
+    """Idempotency-Key ごとの処理結果のストアを提供"""
+    return container.resolve("idempotency_store")
+
+async def get_order_analytics(container: Annotated[Container, Depends(get_container)]) -> OrderAnalyticsInterface:
+    """注文明細の売上集計を提供（メモリ内リポジトリ以外ではNone）"""
+    return container.resolve("order_analytics")
+
+async def get_order_history(container: Annotated[Container, Depends(get_container)]) -> OrderHistoryInterface:
+    """過去の時点の注文の取得を提供（イベントソーシングのリポジトリ以外ではNone）"""
+    return container.resolve("order_history")
+
+async def order_command_usecase(
+    order_repo: Annotated[OrderCommandRepositoryInterface, Depends(get_order_command_repository)],
     customer_repo: Annotated[CustomerRepository, Depends(get_customer_repository)],
     product_repo: Annotated[ProductRepository, Depends(get_product_repository)],
-    presenter: Annotated[OrderCommandOutputBoundary, Depends(get_order_command_presenter)],
-    error_presenter: Annotated[OrderErrorOutputBoundary, Depends(get_error_presenter)]
+    read_model: Annotated[OrderReadModelInterface, Depends(get_order_read_model)],
+    cache: Annotated[OrderResponseCache, Depends(get_order_response_cache)],
+    repairs: Annotated[OrderProjectionRepairInterface, Depends(get_order_projection_repairer)],
+    presenter: Annotated[OrderCommandPresenter, Depends(get_order_command_presenter)]
 ) -> OrderCommandInputBoundary:
     """注文コマンド用ユースケースを提供"""
-    return OrderCommandInteractor(order_repo, customer_repo, product_repo, presenter, error_presenter)
+    # プレゼンターは出力境界とエラー境界の両方を兼ねる
+    # 計測が有効な場合は入力境界（インタラクター）と出力境界（プレゼンター）の呼び出しを計測する
+    output = instrument(presenter, "output_boundary")
+    return instrument(
+        OrderCommandInteractor(order_repo, customer_repo, product_repo, output, output, read_model, cache, repairs),
+        "input_boundary"
+    )
 
 
-def order_query_usecase(
-    order_repo: Annotated[InMemoryOrderQueryRepository, Depends(get_order_query_repository)],
-    presenter: Annotated[OrderQueryOutputBoundary, Depends(get_order_query_presenter)],
-    error_presenter: Annotated[OrderErrorOutputBoundary, Depends(get_error_presenter)]
+async def order_query_usecase(
+    read_model: Annotated[OrderReadModelInterface, Depends(get_order_read_model)],
+    presenter: Annotated[OrderQueryPresenter, Depends(get_order_query_presenter)]
 ) -> OrderQueryInputBoundary:
-    """注文クエリ用ユースケースを提供"""
-    return OrderQueryInteractor(order_repo, presenter, error_presenter)
+    """注文クエリ用ユースケースを提供（読み取りモデルのみを参照する）"""
+    output = instrument(presenter, "output_boundary")
+    return instrument(OrderQueryInteractor(read_model, output, output), "input_boundary")
+
+
+async def async_order_command_usecase(
+    order_repo: Annotated[AsyncOrderCommandRepositoryInterface, Depends(get_async_order_command_repository)],
+    order_query_repo: Annotated[AsyncOrderQueryRepositoryInterface, Depends(get_async_order_query_repository)],
+    customer_repo: Annotated[AsyncCustomerRepository, Depends(get_async_customer_repository)],
+    product_repo: Annotated[AsyncProductRepository, Depends(get_async_product_repository)],
+    read_model: Annotated[AsyncOrderReadModelInterface, Depends(get_async_order_read_model)],
+    cache: Annotated[OrderResponseCache, Depends(get_order_response_cache)],
+    repairs: Annotated[OrderProjectionRepairInterface, Depends(get_order_projection_repairer)],
+    presenter: Annotated[OrderCommandPresenter, Depends(get_order_command_presenter)]
+) -> AsyncOrderCommandInputBoundary:
+    """非同期の注文コマンド用ユースケースを提供"""
+    output = instrument(presenter, "output_boundary")
+    return instrument(AsyncOrderCommandInteractor(
+        order_repo, order_query_repo, customer_repo, product_repo, output, output, read_model, cache, repairs
+    ), "input_boundary")
+
+
+async def async_order_query_usecase(
+    read_model: Annotated[AsyncOrderReadModelInterface, Depends(get_async_order_read_model)],
+    presenter: Annotated[OrderQueryPresenter, Depends(get_order_query_presenter)]
+) -> AsyncOrderQueryInputBoundary:
+    """非同期の注文クエリ用ユースケースを提供（読み取りモデルのみを参照する）"""
+    output = instrument(presenter, "output_boundary")
+    return instrument(AsyncOrderQueryInteractor(read_model, output, output), "input_boundary")
+
+
+async def order_analytics_usecase(
+    analytics: Annotated[OrderAnalyticsInterface, Depends(get_order_analytics)],
+    presenter: Annotated[OrderAnalyticsPresenter, Depends(get_order_analytics_presenter)]
+) -> OrderAnalyticsInputBoundary:
+    """注文の売上集計用ユースケースを提供"""
+    output = instrument(presenter, "output_boundary")
+    return instrument(OrderAnalyticsInteractor(analytics, output, output), "input_boundary")
+
+
+async def order_history_usecase(
+    history: Annotated[OrderHistoryInterface, Depends(get_order_history)],
+    presenter: Annotated[OrderQueryPresenter, Depends(get_order_query_presenter)]
+) -> OrderHistoryInputBoundary:
+    """過去の時点の注文を取得するユースケースを提供"""
+    output = instrument(presenter, "output_boundary")
+    return instrument(OrderHistoryInteractor(history, output, output), "input_boundary")
+
+
+async def customer_command_usecase(
+    customer_repo: Annotated[CustomerRepository, Depends(get_customer_repository)],
+    presenter: Annotated[CustomerCommandPresenter, Depends(get_customer_command_presenter)]
+) -> CustomerCommandInputBoundary:
+    """顧客コマンド用ユースケースを提供"""
+    output = instrument(presenter, "output_boundary")
+    return instrument(CustomerCommandInteractor(customer_repo, output, output), "input_boundary")
+
+
+async def customer_query_usecase(
+    customer_repo: Annotated[CustomerRepository, Depends(get_customer_repository)],
+    presenter: Annotated[CustomerQueryPresenter, Depends(get_customer_query_presenter)]
+) -> CustomerQueryInputBoundary:
+    """顧客クエリ用ユースケースを提供"""
+    output = instrument(presenter, "output_boundary")
+    return instrument(CustomerQueryInteractor(customer_repo, output, output), "input_boundary")
+
+
+async def product_query_usecase(
+    catalog: Annotated[ProductCatalogInterface, Depends(get_product_catalog)],
+    presenter: Annotated[ProductQueryPresenter, Depends(get_product_query_presenter)]
+) -> ProductQueryInputBoundary:
+    """製品クエリ用ユースケースを提供（製品カタログのスナップショットのみを参照する）"""
+    output = instrument(presenter, "output_boundary")
+    return instrument(ProductQueryInteractor(catalog, output, output), "input_boundary")
+
+
+async def catalog_import_usecase(
+    customer_repo: Annotated[CustomerRepository, Depends(get_customer_repository)],
+    product_repo: Annotated[ProductRepository, Depends(get_product_repository)],
+    presenter: Annotated[CatalogImportPresenter, Depends(get_catalog_import_presenter)]
+) -> CatalogImportInputBoundary:
+    """顧客・製品の一括取り込み用ユースケースを提供"""
+    output = instrument(presenter, "output_boundary")
+    return instrument(
+        CatalogImportInteractor(customer_repo, product_repo, output, output, chunk_size=int(env.IMPORT_CHUNK_SIZE)),
+        "input_boundary"
+    )
@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import List, Optional
+
+from application.interfaces.dto import RevenueDTO
+from application.interfaces.order_analytics import OrderAnalyticsInterface
+from application.interfaces.order_use_case import (
+    OrderAnalyticsInputBoundary,
+    OrderAnalyticsOutputBoundary,
+    OrderErrorOutputBoundary
+)
+from domain.entities.order import OrderStatus
+
+REVENUE_DIMENSIONS = ("product", "customer", "day")
+
+
+class OrderAnalyticsInteractor(OrderAnalyticsInputBoundary):
+    """注文の売上集計の責務を持つインタラクター"""
+    
+    def __init__(self,
+                analytics: Optional[OrderAnalyticsInterface],
+                output_boundary: OrderAnalyticsOutputBoundary,
+                error_boundary: OrderErrorOutputBoundary):
+        self.analytics = analytics
+        self.output_boundary = output_boundary
+        self.error_boundary = error_boundary
+    
+    def get_revenue(self, by: str, statuses: Optional[List[str]] = None, since: Optional[datetime] = None,
+                    until: Optional[datetime] = None, limit: Optional[int] = None) -> List[RevenueDTO]:
+        """商品・顧客・日（by）ごとの売上を取得する"""
+        try:
+            if self.analytics is None:
+                self.error_boundary.present_error("Order analytics is only available with the in-memory order repository")
+                return []
+            if by not in REVENUE_DIMENSIONS:
+                self.error_boundary.present_error(f"Invalid revenue dimension: {by}")
+                return []
+            invalid = [status for status in statuses or [] if status not in OrderStatus.__members__]
+            if invalid:
+                self.error_boundary.present_error(f"Invalid order status: {', '.join(invalid)}")
+                return []
+            
+            if by == "product":
+                rows = self.analytics.revenue_by_product(statuses, since, until, limit)
+            elif by == "customer":
+                rows = self.analytics.revenue_by_customer(statuses, since, until, limit)
+            else:
+                rows = self.analytics.revenue_by_day(statuses, since, until)
+            
+            # 出力境界を通じて結果を表示
+            self.output_boundary.present_revenue(by, rows)
+            return rows
+            
+        except Exception as e:
+            self.error_boundary.present_error(f"Error getting revenue: {str(e)}")
+            return []
@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from application.interfaces.dto import OrderSummaryDTO
+from application.interfaces.order_history import OrderHistoryInterface
+from application.interfaces.order_use_case import (
+    OrderErrorOutputBoundary,
+    OrderHistoryInputBoundary,
+    OrderQueryOutputBoundary
+)
+from application.usecases.order_projection import project_order
+
+
+class OrderHistoryInteractor(OrderHistoryInputBoundary):
+    """過去の時点の注文を取得する責務を持つインタラクター
+    
+    履歴から組み立てた注文を読み取りモデルと同じ形式のサマリーにして、注文クエリの出力境界に渡す。
+    """
+    
+    def __init__(self,
+                history: Optional[OrderHistoryInterface],
+                output_boundary: OrderQueryOutputBoundary,
+                error_boundary: OrderErrorOutputBoundary):
+        self.history = history
+        self.output_boundary = output_boundary
+        self.error_boundary = error_boundary
+    
+    def get_order_as_of(self, order_id: UUID, at: datetime) -> Optional[OrderSummaryDTO]:
+        """at の時点の注文を取得する"""
+        try:
+            if self.history is None:
+                self.error_boundary.present_error("Order history is only available with ORDER_STORE=event_sourced")
+                return None
+            order = self.history.find_as_of(order_id, _local(at))
+            if order is None:
+                self.error_boundary.present_error(f"Order with ID {order_id} not found at {at.isoformat()}")
+                return None
+            
+            # 出力境界を通じて結果を表示
+            summary = project_order(order)
+            self.output_boundary.present_order(summary)
+            return summary
+            
+        except Exception as e:
+            self.error_boundary.present_error(f"Error getting order history: {str(e)}")
+            return None
+    
+    def get_customer_orders_as_of(self, customer_id: UUID, at: datetime) -> List[OrderSummaryDTO]:
+        """at の時点の顧客の注文を取得する"""
+        try:
+            if self.history is None:
+                self.error_boundary.present_error("Order history is only available with ORDER_STORE=event_sourced")
+                return []
+            summaries = [project_order(order) for order in self.history.find_by_customer_as_of(customer_id, _local(at))]
+            
+            # 出力境界を通じて結果を表示
+            self.output_boundary.present_orders(summaries)
+            return summaries
+            
+        except Exception as e:
+            self.error_boundary.present_error(f"Error getting customer order history: {str(e)}")
+            return []
+
+
+def _local(at: datetime) -> datetime:
+    """タイムゾーン付きの日時を、注文の日時と同じタイムゾーンなしのローカル時刻にそろえる"""
+    return at.astimezone().replace(tzinfo=None) if at.tzinfo is not None else at
@@ -1,7 +1,19 @@
-from typing import List
+import base64
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
-from application.interfaces.dto import OrderDTO, OrderItemDTO
+from application.interfaces.dto import (
+    OrderCreationResultDTO,
+    OrderDTO,
+    OrderItemDTO,
+    OrderPageDTO,
+    OrderStatusUpdateResultDTO,
+    OrderSummaryDTO
+)
+from application.interfaces.order_cache import OrderCacheInterface
+from application.interfaces.order_projection_repair import OrderProjectionRepairInterface
+from application.interfaces.order_read_model import OrderReadModelInterface
 from application.interfaces.order_use_case import (
     OrderCommandInputBoundary,
     OrderCommandOutputBoundary,
@@ -9,8 +21,14 @@ from application.interfaces.order_use_case import (
     OrderQueryOutputBoundary,
     OrderErrorOutputBoundary
 )
-from domain.entities.order import Order, OrderItem
-from domain.repositories.order_repository import OrderCommandRepositoryInterface, OrderQueryRepositoryInterface
+from application.usecases.order_projection import project_order
+from domain.entities.order import Order, OrderItem, OrderStatus
+from domain.entities.product import Product
+from domain.exceptions import InsufficientStockError, InvalidQuantityError
+from domain.repositories.order_repository import (
+    OrderCommandRepositoryInterface,
+    OrderPageCursor
+)
 from domain.repositories.customer_repository import CustomerRepository
 from domain.repositories.product_repository import ProductRepository
 
@@ -30,27 +48,139 @@ def _to_dto(order: Order) -> OrderDTO:
         id=order.id,
         customer_id=order.customer_id,
         items=item_dtos,
-        status=order.status,
+        status=order.status.value,
         created_at=order.created_at,
         updated_at=order.updated_at,
         total_amount=order.total_amount
     )
 
 
+# ステータスの検証エラーで示す値の一覧
+_STATUS_VALUES = [status.value for status in OrderStatus]
+
+
+def _parse_status(status: str) -> Optional[OrderStatus]:
+    """ステータスの文字列を列挙型に変換する（不正な値はNone）"""
+    try:
+        return OrderStatus(status)
+    except ValueError:
+        return None
+
+
+def _invalid_status_message(status: str) -> str:
+    return f"Invalid status: {status}. Must be one of {_STATUS_VALUES}"
+
+
+def _encode_cursor(summary: OrderSummaryDTO) -> str:
+    """注文の位置を不透明なカーソル文字列に変換する"""
+    raw = f"{summary.created_at.isoformat()}|{summary.id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> OrderPageCursor:
+    """カーソル文字列を注文の位置に戻す"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, order_id = raw.split("|")
+        return OrderPageCursor(datetime.fromisoformat(created_at), UUID(order_id))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def _build_order(order_dto: OrderDTO, products: Dict[UUID, Product],
+                 reserved: Dict[UUID, int]) -> Tuple[Optional[Order], Optional[str]]:
+    """DTOから注文を組み立てる
+    
+    reservedには既に確保済みの製品ごとの数量を渡す。検証に成功した場合のみ
+    この注文の数量を加算し、失敗した場合はエラーメッセージを返す。
+    """
+    order = Order(
+        customer_id=order_dto.customer_id,
+        status="PENDING"
+    )
+    
+    # 製品ごとの要求数量（同じ製品が複数行に含まれる場合は合算する）
+    requested: Dict[UUID, int] = {}
+    
+    # 注文アイテムの追加
+    for item_dto in order_dto.items:
+        # 数量は正の整数のみ（負の数量で在庫が増えたり売上が負になったりしないようにする）
+        if item_dto.quantity <= 0:
+            return None, str(InvalidQuantityError(item_dto.product_id, item_dto.quantity))
+        
+        # 製品が存在するか確認
+        product = products.get(item_dto.product_id)
+        if not product:
+            return None, f"Product with ID {item_dto.product_id} not found"
+        
+        # 在庫が十分にあるか確認
+        available = product.stock_quantity - reserved.get(product.id, 0) - requested.get(product.id, 0)
+        if available < item_dto.quantity:
+            return None, f"Not enough stock for product {product.name}. Available: {available}, Requested: {item_dto.quantity}"
+        requested[product.id] = requested.get(product.id, 0) + item_dto.quantity
+        
+        # 注文に追加
+        order.add_item(OrderItem(
+            product_id=item_dto.product_id,
+            quantity=item_dto.quantity,
+            price_per_unit=product.price
+        ))
+    
+    for product_id, quantity in requested.items():
+        reserved[product_id] = reserved.get(product_id, 0) + quantity
+    order.place()
+    return order, None
+
+
+def _projection_failed(error: Exception, orders: List[Order],
+                       repairs: Optional[OrderProjectionRepairInterface]) -> None:
+    """読み取りモデルへの反映の失敗を記録し、修復を予約する"""
+    print(f"Order projection failed for {len(orders)} order(s), scheduled for repair: {error}")
+    if repairs is not None:
+        repairs.schedule(order.id for order in orders)
+
+
+def _quantities(orders: Iterable[Order]) -> Dict[UUID, int]:
+    """注文に含まれる製品ごとの数量を合算する"""
+    quantities: Dict[UUID, int] = {}
+    for order in orders:
+        for item in order.items:
+            quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
+    return quantities
+
+
+def _stock_error_message(error: InsufficientStockError, products: Dict[UUID, Product]) -> str:
+    """在庫確保の失敗を検証時と同じ形式のメッセージにする"""
+    product = products.get(error.product_id)
+    name = product.name if product else error.product_id
+    return f"Not enough stock for product {name}. Available: {error.available}, Requested: {error.requested}"
+
+
 class OrderCommandInteractor(OrderCommandInputBoundary):
-    """注文コマンド操作の責務を持つインタラクター"""
+    """注文コマンド操作の責務を持つインタラクター
+    
+    read_modelを渡した場合は、注文を書き込むたびに読み取りモデルのサマリーも同期的に更新する。
+    反映に失敗した注文は、repairsを渡した場合はそこに記録して後で反映し直す（書き込み自体は成功として扱う）。
+    cacheを渡した場合は、ステータス更新とキャンセルの後に注文の読み取り結果のキャッシュを無効化する。
+    """
     
     def __init__(self, 
                 order_repository: OrderCommandRepositoryInterface,
                 customer_repository: CustomerRepository,
                 product_repository: ProductRepository,
                 output_boundary: OrderCommandOutputBoundary,
-                error_boundary: OrderErrorOutputBoundary):
+                error_boundary: OrderErrorOutputBoundary,
+                read_model: Optional[OrderReadModelInterface] = None,
+                cache: Optional[OrderCacheInterface] = None,
+                repairs: Optional[OrderProjectionRepairInterface] = None):
         self.order_repository = order_repository
         self.customer_repository = customer_repository
         self.product_repository = product_repository
         self.output_boundary = output_boundary
         self.error_boundary = error_boundary
+        self.read_model = read_model
+        self.cache = cache
+        self.repairs = repairs
     
     def create_order(self, order_dto: OrderDTO) -> OrderDTO:
         """注文を作成する"""
@@ -61,43 +191,30 @@ class OrderCommandInteractor(OrderCommandInputBoundary):
                 self.error_boundary.present_error(f"Customer with ID {order_dto.customer_id} not found")
                 return order_dto
             
-            # 注文エンティティの作成
-            order = Order(
-                customer_id=order_dto.customer_id,
-                status="PENDING"
-            )
+            # 注文に含まれる製品を一括で取得する
+            products = self.product_repository.find_by_ids(item_dto.product_id for item_dto in order_dto.items)
             
-            # 注文アイテムの追加
-            for item_dto in order_dto.items:
-                # 製品が存在するか確認
-                product = self.product_repository.find_by_id(item_dto.product_id)
-                if not product:
-                    self.error_boundary.present_error(f"Product with ID {item_dto.product_id} not found")
-                    return order_dto
-                
-                # 在庫が十分にあるか確認
-                if product.stock_quantity < item_dto.quantity:
-                    self.error_boundary.present_error(
-                        f"Not enough stock for product {product.name}. Available: {product.stock_quantity}, Requested: {item_dto.quantity}"
-                    )
-                    return order_dto
-                
-                # 注文アイテムの作成
-                order_item = OrderItem(
-                    product_id=item_dto.product_id,
-                    quantity=item_dto.quantity,
-                    price_per_unit=product.price
-                )
-                
-                # 注文に追加
-                order.add_item(order_item)
-                
-                # 在庫を更新
-                product.update_stock(product.stock_quantity - item_dto.quantity)
-                self.product_repository.update(product)
+            # 注文エンティティの作成と在庫の検証
+            reserved: Dict[UUID, int] = {}
+            order, error = _build_order(order_dto, products, reserved)
+            if error:
+                self.error_boundary.present_error(error)
+                return order_dto
+            
+            # 全ての検証が通ってから在庫を原子的に確保する（並行する注文に先を越された場合はここで失敗する）
+            try:
+                self.product_repository.reserve_stock(reserved)
+            except InsufficientStockError as e:
+                self.error_boundary.present_error(_stock_error_message(e, products))
+                return order_dto
             
-            # 注文を保存
-            saved_order = self.order_repository.save(order)
+            # 注文を保存（保存に失敗した場合は確保した在庫を戻す）
+            try:
+                saved_order = self.order_repository.save(order)
+            except Exception:
+                self.product_repository.release_stock(reserved)
+                raise
+            self._project([saved_order])
             
             # DTOに変換
             result_dto = _to_dto(saved_order)
@@ -110,30 +227,132 @@ class OrderCommandInteractor(OrderCommandInputBoundary):
             self.error_boundary.present_error(f"Error creating order: {str(e)}")
             return order_dto
     
+    def create_orders(self, order_dtos: List[OrderDTO]) -> List[OrderCreationResultDTO]:
+        """複数の注文を一括で作成する"""
+        try:
+            # 顧客と製品はバッチ全体で1回ずつ取得する
+            customers = self.customer_repository.find_by_ids({order_dto.customer_id for order_dto in order_dtos})
+            products = self.product_repository.find_by_ids(
+                {item_dto.product_id for order_dto in order_dtos for item_dto in order_dto.items}
+            )
+            
+            # 先の注文で確保した数量を差し引きながら、注文ごとに検証する
+            reserved: Dict[UUID, int] = {}
+            results: List[OrderCreationResultDTO] = []
+            created: List[Tuple[OrderCreationResultDTO, Order]] = []
+            for index, order_dto in enumerate(order_dtos):
+                if order_dto.customer_id not in customers:
+                    results.append(OrderCreationResultDTO(index=index, error=f"Customer with ID {order_dto.customer_id} not found"))
+                    continue
+                
+                order, error = _build_order(order_dto, products, reserved)
+                result = OrderCreationResultDTO(index=index, error=error)
+                results.append(result)
+                if order is not None:
+                    created.append((result, order))
+            
+            # 在庫の確保と注文の保存はそれぞれ1回で行う
+            # 並行する注文との競合で在庫が足りなくなった場合のみ、注文ごとに確保し直す
+            try:
+                self.product_repository.reserve_stock(reserved)
+            except InsufficientStockError:
+                created = self._reserve_each(created, products)
+                reserved = _quantities(order for _, order in created)
+            try:
+                self.order_repository.save_many([order for _, order in created])
+            except Exception:
+                self.product_repository.release_stock(reserved)
+                raise
+            self._project([order for _, order in created])
+            
+            for result, order in created:
+                result.order = _to_dto(order)
+            
+            # 出力境界を通じて結果を表示
+            self.output_boundary.present_created_orders(results)
+            return results
+            
+        except Exception as e:
+            self.error_boundary.present_error(f"Error creating orders: {str(e)}")
+            return []
+    
+    def _project(self, orders: List[Order]) -> None:
+        """書き込んだ注文を読み取りモデルに反映する
+        
+        書き込みは既に成功しているため、反映に失敗してもエラーにはしない（再送で注文が重複しないように）。
+        失敗した注文は修復を予約する。
+        """
+        if self.read_model is None or not orders:
+            return
+        try:
+            self.read_model.upsert([project_order(order) for order in orders])
+        except Exception as e:
+            _projection_failed(e, orders, self.repairs)
+    
+    def _invalidate(self, order: Order) -> None:
+        """更新した注文の古い版のキャッシュを無効化する"""
+        if self.cache is not None:
+            self.cache.invalidate(order.id, order.version)
+    
+    def _reserve_each(self, created: List[Tuple[OrderCreationResultDTO, Order]],
+                      products: Dict[UUID, Product]) -> List[Tuple[OrderCreationResultDTO, Order]]:
+        """注文ごとに在庫を確保し、確保できなかった注文を結果から外す"""
+        reserved_orders = []
+        for result, order in created:
+            try:
+                self.product_repository.reserve_stock(_quantities([order]))
+            except InsufficientStockError as e:
+                result.error = _stock_error_message(e, products)
+                continue
+            reserved_orders.append((result, order))
+        return reserved_orders
+    
+    def _change_status(self, order_ids: List[UUID], status: OrderStatus) -> List[Order]:
+        """遷移表で status に変更できる注文だけを条件付きで変更し、変更した注文を返す
+        
+        キャンセルした注文の在庫は、ステータスの変更に成功した注文の分だけ戻す（同時にキャンセルしても二重に戻らない）。
+        """
+        updated = self.order_repository.update_status_many(order_ids, status, status.previous_statuses())
+        if status == OrderStatus.CANCELLED and updated:
+            # 在庫を戻す（読み込まずに原子的に加算する）
+            self.product_repository.release_stock(_quantities(updated))
+        self._project(updated)
+        for order in updated:
+            self._invalidate(order)
+        return updated
+    
+    def _transition_error(self, order_id: UUID, status: OrderStatus) -> Tuple[Optional[Order], Optional[str]]:
+        """条件付きの変更で対象にならなかった注文を読み込み、理由を返す（既に同じステータスならエラーなし）"""
+        order = self.order_repository.find_by_id(order_id)
+        if not order:
+            return None, f"Order with ID {order_id} not found"
+        if order.status == status:
+            return order, None
+        if status == OrderStatus.CANCELLED:
+            return order, f"Cannot cancel order with status {order.status}"
+        return order, f"Cannot change order status from {order.status} to {status}"
+    
     def update_order_status(self, order_id: UUID, status: str) -> OrderDTO:
         """注文ステータスを更新する"""
         try:
-            # 注文を取得
-            order_repo = self.order_repository
-            order = order_repo.find_by_id(order_id)
-            if not order:
-                self.error_boundary.present_error(f"Order with ID {order_id} not found")
-                return OrderDTO()
-            
             # ステータスの検証
-            valid_statuses = ["PENDING", "CONFIRMED", "SHIPPED", "DELIVERED", "CANCELLED"]
-            if status not in valid_statuses:
-                self.error_boundary.present_error(f"Invalid status: {status}. Must be one of {valid_statuses}")
-                return _to_dto(order)
-            
-            # 注文ステータスを更新
-            order.update_status(status)
+            target = _parse_status(status)
+            if target is None:
+                self.error_boundary.present_error(_invalid_status_message(status))
+                return OrderDTO()
             
-            # 更新した注文を保存
-            updated_order = self.order_repository.update(order)
+            # 遷移表で許可された元のステータスの場合だけ更新する（読み込みと書き込みの間に変更されても上書きしない）
+            updated = self._change_status([order_id], target)
+            if updated:
+                order = updated[0]
+            else:
+                order, error = self._transition_error(order_id, target)
+                if error:
+                    self.error_boundary.present_error(error)
+                    return _to_dto(order) if order else OrderDTO()
             
             # DTOに変換
-            order_dto = _to_dto(updated_order)
+            order_dto = _to_dto(order)
             
             # 出力境界を通じて結果を表示
             self.output_boundary.present_updated_order(order_dto)
@@ -143,36 +362,51 @@ class OrderCommandInteractor(OrderCommandInputBoundary):
             self.error_boundary.present_error(f"Error updating order status: {str(e)}")
             return OrderDTO()
     
-    def cancel_order(self, order_id: UUID) -> OrderDTO:
-        """注文をキャンセルする"""
+    def update_orders_status(self, order_ids: List[UUID], status: str) -> List[OrderStatusUpdateResultDTO]:
+        """複数の注文のステータスを一括で更新する"""
         try:
-            # 注文を取得
-            order_repo = self.order_repository 
-            order = order_repo.find_by_id(order_id)
-            if not order:
-                self.error_boundary.present_error(f"Order with ID {order_id} not found")
-                return OrderDTO()
+            # ステータスの検証
+            target = _parse_status(status)
+            if target is None:
+                self.error_boundary.present_error(_invalid_status_message(status))
+                return []
             
-            # キャンセルできるのはPENDINGまたはCONFIRMEDの注文のみ
-            if order.status not in ["PENDING", "CONFIRMED"]:
-                self.error_boundary.present_error(f"Cannot cancel order with status {order.status}")
-                return _to_dto(order)
+            # 重複を除いてリポジトリの条件付き更新を1回呼ぶ
+            order_ids = list(dict.fromkeys(order_ids))
+            updated = {order.id: order for order in self._change_status(order_ids, target)}
             
-            # 注文ステータスを更新
-            order.update_status("CANCELLED")
+            # 更新されなかった注文だけを読み込んで理由を返す
+            results: List[OrderStatusUpdateResultDTO] = []
+            for order_id in order_ids:
+                if order_id in updated:
+                    results.append(OrderStatusUpdateResultDTO(order_id=order_id, status=target.value))
+                    continue
+                _, error = self._transition_error(order_id, target)
+                results.append(OrderStatusUpdateResultDTO(
+                    order_id=order_id, status=None if error else target.value, error=error
+                ))
             
-            # 在庫を戻す
-            for item in order.items:
-                product = self.product_repository.find_by_id(item.product_id)
-                if product:
-                    product.update_stock(product.stock_quantity + item.quantity)
-                    self.product_repository.update(product)
+            # 出力境界を通じて結果を表示
+            self.output_boundary.present_updated_orders(results)
+            return results
             
-            # 更新した注文を保存
-            updated_order = self.order_repository.update(order)
+        except Exception as e:
+            self.error_boundary.present_error(f"Error updating order statuses: {str(e)}")
+            return []
+    
+    def cancel_order(self, order_id: UUID) -> OrderDTO:
+        """注文をキャンセルする"""
+        try:
+            # キャンセルできるのは遷移表でキャンセルに変更できる（PENDINGまたはCONFIRMEDの）注文のみ
+            updated = self._change_status([order_id], OrderStatus.CANCELLED)
+            if not updated:
+                order, error = self._transition_error(order_id, OrderStatus.CANCELLED)
+                # 既にキャンセル済みの注文も在庫を戻さずにエラーにする
+                self.error_boundary.present_error(error or f"Cannot cancel order with status {order.status}")
+                return _to_dto(order) if order else OrderDTO()
             
             # DTOに変換
-            order_dto = _to_dto(updated_order)
+            order_dto = _to_dto(updated[0])
             
             # 出力境界を通じて結果を表示
             self.output_boundary.present_cancelled_order(order_dto)
@@ -184,47 +418,76 @@ class OrderCommandInteractor(OrderCommandInputBoundary):
 
 
 class OrderQueryInteractor(OrderQueryInputBoundary):
-    """注文クエリ操作の責務を持つインタラクター"""
+    """注文クエリ操作の責務を持つインタラクター
+    
+    読み取りモデルの整形済みサマリーをそのまま出力境界に渡す（読み取り時の変換や再計算は行わない）。
+    """
     
     def __init__(self, 
-                order_repository: OrderQueryRepositoryInterface,
+                read_model: OrderReadModelInterface,
                 output_boundary: OrderQueryOutputBoundary,
                 error_boundary: OrderErrorOutputBoundary):
-        self.order_repository = order_repository
+        self.read_model = read_model
         self.output_boundary = output_boundary
         self.error_boundary = error_boundary
     
-    def get_order(self, order_id: UUID) -> OrderDTO:
+    def get_order(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
         """注文を取得する"""
         try:
-            order = self.order_repository.find_by_id(order_id)
-            if not order:
+            summary = self.read_model.get(order_id)
+            if not summary:
                 self.error_boundary.present_error(f"Order with ID {order_id} not found")
-                return OrderDTO()
-            
-            # DTOに変換
-            order_dto = _to_dto(order)
+                return None
             
             # 出力境界を通じて結果を表示
-            self.output_boundary.present_order(order_dto)
-            return order_dto
+            self.output_boundary.present_order(summary)
+            return summary
             
         except Exception as e:
             self.error_boundary.present_error(f"Error getting order: {str(e)}")
-            return OrderDTO()
+            return None
     
-    def get_customer_orders(self, customer_id: UUID) -> List[OrderDTO]:
+    def get_customer_orders(self, customer_id: UUID) -> List[OrderSummaryDTO]:
         """顧客の注文を取得する"""
         try:
-            orders = self.order_repository.find_all_by_customer_id(customer_id)
+            summaries = self.read_model.list_by_customer(customer_id)
             
-            # DTOに変換
-            order_dtos = [_to_dto(order) for order in orders]
+            # 出力境界を通じて結果を表示
+            self.output_boundary.present_orders(summaries)
+            return summaries
+            
+        except Exception as e:
+            self.error_boundary.present_error(f"Error getting customer orders: {str(e)}")
+            return []
+    
+    def get_customer_orders_page(self, customer_id: UUID, limit: int, cursor: Optional[str] = None) -> OrderPageDTO:
+        """顧客の注文をカーソル位置から最大limit件取得する"""
+        try:
+            after = _decode_cursor(cursor) if cursor else None
+            
+            # 1件多く取得して次ページの有無を判定する
+            summaries = self.read_model.page_by_customer(customer_id, limit + 1, after)
+            has_next = len(summaries) > limit
+            summaries = summaries[:limit]
+            
+            order_page = OrderPageDTO(
+                orders=summaries,
+                next_cursor=_encode_cursor(summaries[-1]) if has_next else None
+            )
             
             # 出力境界を通じて結果を表示
-            self.output_boundary.present_orders(order_dtos)
-            return order_dtos
+            self.output_boundary.present_order_page(order_page)
+            return order_page
             
         except Exception as e:
             self.error_boundary.present_error(f"Error getting customer orders: {str(e)}")
-            return []
\ No newline at end of file
+            return OrderPageDTO()
+    
+    def stream_customer_orders(self, customer_id: UUID) -> None:
+        """顧客の注文を1件ずつ出力境界へ流す"""
+        try:
+            # 読み取りモデルからページ単位で取り出しながら流す（全件をメモリに載せない）
+            self.output_boundary.present_order_stream(self.read_model.iter_by_customer(customer_id))
+            
+        except Exception as e:
+            self.error_boundary.present_error(f"Error streaming customer orders: {str(e)}")
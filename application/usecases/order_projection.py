@@ -0,0 +1,35 @@
+from application.interfaces.dto import OrderSummaryDTO
+from domain.entities.order import Order
+
+
+def project_order(order: Order) -> OrderSummaryDTO:
+    """注文エンティティから読み取りモデルのサマリーを作成する
+
+    dataのキーはAPIレスポンスの注文の形式に合わせる。合計金額や明細ごとの金額はここで一度だけ計算する。
+    """
+    items = [
+        {
+            "product_id": str(item.product_id),
+            "quantity": item.quantity,
+            "price_per_unit": item.price_per_unit,
+            "total_price": item.quantity * item.price_per_unit
+        }
+        for item in order.items
+    ]
+    total_amount = sum(item["total_price"] for item in items)
+    return OrderSummaryDTO(
+        id=order.id,
+        customer_id=order.customer_id,
+        status=order.status.value,
+        created_at=order.created_at,
+        total_amount=total_amount,
+        version=order.version,
+        data={
+            "order_id": str(order.id),
+            "customer_id": str(order.customer_id),
+            "items": items,
+            "status": order.status.value,
+            "created_at": order.created_at.isoformat(),
+            "total_amount": total_amount
+        }
+    )
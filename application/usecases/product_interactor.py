@@ -0,0 +1,97 @@
+import base64
+from typing import Optional
+from uuid import UUID
+
+from application.interfaces.dto import ProductDTO, ProductPageDTO
+from application.interfaces.product_catalog import CatalogKey, ProductCatalogInterface, catalog_sort_key
+from application.interfaces.product_use_case import (
+    ProductErrorOutputBoundary,
+    ProductQueryInputBoundary,
+    ProductQueryOutputBoundary
+)
+
+
+def _encode_cursor(product: ProductDTO) -> str:
+    """製品の位置を不透明なカーソル文字列に変換する"""
+    name, product_id = catalog_sort_key(product)
+    raw = f"{name}|{product_id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> CatalogKey:
+    """カーソル文字列を製品の位置に戻す"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        name, product_id = raw.rsplit("|", 1)
+        return name, UUID(product_id)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+class ProductQueryInteractor(ProductQueryInputBoundary):
+    """製品クエリ操作の責務を持つインタラクター（製品カタログのスナップショットのみを参照する）"""
+    
+    def __init__(self,
+                catalog: ProductCatalogInterface,
+                output_boundary: ProductQueryOutputBoundary,
+                error_boundary: ProductErrorOutputBoundary):
+        self.catalog = catalog
+        self.output_boundary = output_boundary
+        self.error_boundary = error_boundary
+    
+    def catalog_version(self) -> int:
+        """参照するカタログの最新の版を返す"""
+        return self.catalog.version()
+    
+    def get_product(self, product_id: UUID) -> Optional[ProductDTO]:
+        """製品を取得する"""
+        try:
+            product = self.catalog.snapshot().by_id.get(product_id)
+            if product is None:
+                self.error_boundary.present_error(f"Product with ID {product_id} not found")
+                return None
+            
+            self.output_boundary.present_product(product)
+            return product
+            
+        except Exception as e:
+            self.error_boundary.present_error(f"Error getting product: {str(e)}")
+            return None
+    
+    def list_products(self, limit: int, cursor: Optional[str] = None) -> ProductPageDTO:
+        """製品を名前順にカーソル位置から最大limit件取得する"""
+        try:
+            return self._page(limit, cursor)
+        except Exception as e:
+            self.error_boundary.present_error(f"Error listing products: {str(e)}")
+            return ProductPageDTO()
+    
+    def search_products(self, query: str, limit: int, cursor: Optional[str] = None) -> ProductPageDTO:
+        """名前にqueryを含む製品を名前順にカーソル位置から最大limit件取得する"""
+        try:
+            if not query or not query.strip():
+                self.error_boundary.present_error("Search query is required")
+                return ProductPageDTO()
+            return self._page(limit, cursor, query.strip())
+        except Exception as e:
+            self.error_boundary.present_error(f"Error searching products: {str(e)}")
+            return ProductPageDTO()
+    
+    def _page(self, limit: int, cursor: Optional[str], query: Optional[str] = None) -> ProductPageDTO:
+        after = _decode_cursor(cursor) if cursor else None
+        snapshot = self.catalog.snapshot()
+        
+        # 1件多く取得して次ページの有無を判定する
+        products = snapshot.page(limit + 1, after, query)
+        has_next = len(products) > limit
+        products = products[:limit]
+        
+        product_page = ProductPageDTO(
+            products=products,
+            next_cursor=_encode_cursor(products[-1]) if has_next else None,
+            version=snapshot.version
+        )
+        
+        # 出力境界を通じて結果を表示
+        self.output_boundary.present_product_page(product_page)
+        return product_page
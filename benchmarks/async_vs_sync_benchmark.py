@@ -0,0 +1,107 @@
+"""同期ルートと非同期ルートの同時実行性能のベンチマーク
+
+ファイルベースのSQLiteに対して /api/orders（def・スレッドプール）と
+/api/async/orders（async def・aiosqlite）に同じ負荷をかけ、同時接続数ごとの
+スループットとレイテンシ（p50/p99）、p99がSLO以内に収まる最大同時接続数を比較する。
+リクエストは注文作成1回につき注文取得を--reads回行う混合負荷とする。
+
+    python -m benchmarks.async_vs_sync_benchmark --concurrency 1 8 32 128 --requests 2000 --slo-ms 100
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+from time import perf_counter
+from typing import Dict, List
+from uuid import uuid4
+
+# 設定はインポート時に読み込まれるため、アプリを読み込む前にファイルベースのSQLiteを指定する
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ.setdefault("DATABASE_DIALECT", "sqlite")
+os.environ.setdefault("DATABASE_NAME", os.path.join(_tmpdir.name, "benchmark.db"))
+
+import httpx  # noqa: E402
+
+from domain.entities.customer import Customer  # noqa: E402
+from domain.entities.product import Product  # noqa: E402
+from main import app  # noqa: E402
+
+MODES = {"sync": "/api/orders", "async": "/api/async/orders"}
+
+
+def _percentile(samples: List[float], percent: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+async def _load(client: httpx.AsyncClient, base: str, payload: Dict, concurrency: int,
+                requests: int, reads: int) -> Dict[str, float]:
+    """同時接続数concurrencyでrequests件のリクエストを送り、統計を返す"""
+    latencies: List[float] = []
+    order_ids: List[str] = []
+    remaining = iter(range(requests))
+
+    async def worker():
+        for index in remaining:
+            started = perf_counter()
+            if index % (reads + 1) == 0 or not order_ids:
+                response = await client.post(f"{base}/", json=payload)
+                data = response.json().get("data")
+                if data and data.get("order_id"):
+                    order_ids.append(data["order_id"])
+            else:
+                await client.get(f"{base}/{order_ids[index % len(order_ids)]}")
+            latencies.append((perf_counter() - started) * 1000)
+
+    started = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = perf_counter() - started
+    return {
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(_percentile(latencies, 50), 2),
+        "p99_ms": round(_percentile(latencies, 99), 2),
+    }
+
+
+async def run(concurrency_levels: List[int], requests: int = 2000, reads: int = 4, slo_ms: float = 100.0):
+    """モードと同時接続数ごとの統計と、SLOを満たす最大同時接続数を返す"""
+    results: Dict[str, Dict] = {mode: {} for mode in MODES}
+    async with app.router.lifespan_context(app):
+        container = app.state.container
+        customer = container.resolve("customer_repository").save(
+            Customer(name="ベンチマーク顧客", email=f"{uuid4().hex}@example.com")
+        )
+        product = container.resolve("product_repository").save(
+            Product(name="ベンチマーク製品", price=100.0, stock_quantity=10_000_000)
+        )
+        payload = {
+            "customer_id": str(customer.id),
+            "items": [{"product_id": str(product.id), "quantity": 1, "price_per_unit": 100.0}]
+        }
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for concurrency in concurrency_levels:
+                for mode, base in MODES.items():
+                    results[mode][concurrency] = await _load(client, base, payload, concurrency, requests, reads)
+
+    for mode in MODES:
+        within_slo = [c for c, stats in results[mode].items() if stats["p99_ms"] <= slo_ms]
+        results[mode]["max_concurrency_within_slo"] = max(within_slo) if within_slo else 0
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--reads", type=int, default=4)
+    parser.add_argument("--slo-ms", type=float, default=100.0)
+    args = parser.parse_args()
+    results = asyncio.run(run(args.concurrency, args.requests, args.reads, args.slo_ms))
+    for mode, stats in results.items():
+        print(mode, stats)
+
+
+if __name__ == "__main__":
+    main()
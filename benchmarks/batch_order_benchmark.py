@@ -0,0 +1,74 @@
+"""一括注文作成エンドポイントのスループットのベンチマーク
+
+POST /api/orders/ を注文の数だけ繰り返す場合と、POST /api/orders/batch に
+まとめて送る場合の注文/秒を比較する（アプリはTestClient経由でプロセス内で動かす）。
+
+    python -m benchmarks.batch_order_benchmark --orders 2000 --batch-size 500
+"""
+import argparse
+from time import perf_counter
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from domain.entities.customer import Customer
+from domain.entities.product import Product
+from main import app
+
+
+def _order_payloads(customer_ids, product_ids, count: int):
+    return [
+        {
+            "customer_id": str(customer_ids[i % len(customer_ids)]),
+            "items": [
+                {"product_id": str(product_ids[(i + j) % len(product_ids)]), "quantity": 1, "price_per_unit": 100.0}
+                for j in range(3)
+            ]
+        }
+        for i in range(count)
+    ]
+
+
+def run(orders: int = 2000, batch_size: int = 500):
+    """単一エンドポイントと一括エンドポイントの注文/秒を返す"""
+    with TestClient(app) as client:
+        container = app.state.container
+        customer_repository = container.resolve("customer_repository")
+        product_repository = container.resolve("product_repository")
+        customer_ids = [
+            customer_repository.save(Customer(name=f"顧客{i}", email=f"{uuid4().hex}@example.com")).id
+            for i in range(100)
+        ]
+        product_ids = [
+            product_repository.save(Product(name=f"製品{i}", price=100.0, stock_quantity=10_000_000)).id
+            for i in range(200)
+        ]
+        payloads = _order_payloads(customer_ids, product_ids, orders)
+
+        started = perf_counter()
+        for payload in payloads:
+            client.post("/api/orders/", json=payload)
+        single = orders / (perf_counter() - started)
+
+        started = perf_counter()
+        for offset in range(0, orders, batch_size):
+            client.post("/api/orders/batch", json={"orders": payloads[offset:offset + batch_size]})
+        batched = orders / (perf_counter() - started)
+
+    return {
+        "single_orders_per_sec": round(single, 1),
+        "batch_orders_per_sec": round(batched, 1),
+        "speedup": round(batched / single, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    print(run(args.orders, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
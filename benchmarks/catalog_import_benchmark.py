@@ -0,0 +1,98 @@
+"""製品の一括取り込みのベンチマーク
+
+製品のCSV/NDJSONを逐次生成し（全体をメモリに作らない）、HTTPの本文と同じく64KBのチャンクに区切って
+split_lines → read_records → CatalogImportInteractor で取り込む。
+- import: チャンクごとの save_many による取り込みの行数/秒
+- per_row: 同じ検証のあと1行ずつ save する場合の行数/秒（--baseline-rows 行で計測）
+- peak_kb: --trace-memory 指定時の取り込み中のピークメモリ（SQLite使用時はリポジトリが行を保持しないため、
+  行数を増やしても一定であることを確認できる）
+
+    python -m benchmarks.catalog_import_benchmark --rows 1000000 --store sqlite
+    python -m benchmarks.catalog_import_benchmark --rows 200000 --store sqlite --trace-memory
+"""
+import argparse
+import json
+import os
+import tempfile
+import tracemalloc
+from time import perf_counter
+from typing import Any, Dict, Iterator
+
+from application.usecases.catalog_import_interactor import CatalogImportInteractor
+from infrastructure.db.engine import dispose_engines, get_session_factory
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from infrastructure.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from infrastructure.repositories.sqlalchemy_product_repository import SqlAlchemyProductRepository
+from presentation.presenters.catalog_import_presenter import CatalogImportPresenter
+from presentation.serializers.catalog_record_reader import read_records, split_lines
+
+_BODY_CHUNK = 64 * 1024
+
+
+def _body(rows: int, record_format: str) -> Iterator[bytes]:
+    """製品の行を生成し、64KBずつのチャンクにまとめて返す"""
+    buffer = bytearray(b"name,description,price,stock_quantity\n" if record_format == "csv" else b"")
+    for index in range(rows):
+        if record_format == "csv":
+            buffer += f"製品{index},説明{index % 97},{index % 50_000 / 100 + 1},{index % 1000}\n".encode()
+        else:
+            buffer += (
+                f'{{"name": "製品{index}", "description": "説明{index % 97}", '
+                f'"price": {index % 50_000 / 100 + 1}, "stock_quantity": {index % 1000}}}\n'
+            ).encode()
+        if len(buffer) >= _BODY_CHUNK:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _interactor(store: str, directory: str, chunk_size: int):
+    if store == "sqlite":
+        session_factory = get_session_factory(f"sqlite:///{os.path.join(directory, f'{os.urandom(8).hex()}.db')}")
+        customers, products = SqlAlchemyCustomerRepository(session_factory), SqlAlchemyProductRepository(session_factory)
+    else:
+        customers, products = InMemoryCustomerRepository(), InMemoryProductRepository()
+    presenter = CatalogImportPresenter()
+    return CatalogImportInteractor(customers, products, presenter, presenter, chunk_size=chunk_size), presenter
+
+
+def run(rows: int, store: str, record_format: str, chunk_size: int, baseline_rows: int,
+        trace_memory: bool) -> Dict[str, Any]:
+    results: Dict[str, Any] = {"rows": rows, "store": store, "format": record_format, "chunk_size": chunk_size}
+    with tempfile.TemporaryDirectory() as directory:
+        for mode, count, size in (("per_row", baseline_rows, 1), ("import", rows, chunk_size)):
+            if count <= 0:
+                continue
+            interactor, presenter = _interactor(store, directory, size)
+            if trace_memory and mode == "import":
+                tracemalloc.start()
+            started = perf_counter()
+            result = interactor.import_products(read_records(split_lines(_body(count, record_format)), record_format))
+            elapsed = perf_counter() - started
+            if trace_memory and mode == "import":
+                results["peak_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+                tracemalloc.stop()
+            if not presenter.view_model.success or result.imported != count:
+                raise RuntimeError(presenter.view_model.error or f"imported {result.imported} of {count}")
+            results[f"{mode}_rows_per_second"] = round(count / elapsed)
+        dispose_engines()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--store", choices=["memory", "sqlite"], default="sqlite")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--baseline-rows", type=int, default=5_000)
+    parser.add_argument("--trace-memory", action="store_true")
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.store, args.format, args.chunk_size, args.baseline_rows,
+                         args.trace_memory), indent=2))
+
+
+if __name__ == "__main__":
+    main()
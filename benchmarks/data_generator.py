@@ -0,0 +1,119 @@
+"""ベンチマーク用の決定的なデータ生成
+
+同じシードと件数からは常に同じ顧客・製品・注文（ID、日時、数量、単価を含む）を生成する。
+注文数の目安は SCALES の 1k / 100k / 1m で、顧客は注文10件に1人、製品は注文100件に1つ（50〜10,000）とする。
+
+    python -m benchmarks.data_generator --scale 100k
+"""
+import argparse
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from application.interfaces.dto import OrderDTO, OrderItemDTO
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderItem, OrderStatus
+from domain.entities.product import Product
+
+SCALES: Dict[str, int] = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_SEED = 20240501
+# 注文の作成日時の起点（注文ごとに平均30秒ずつ進める）
+EPOCH = datetime(2024, 1, 1)
+# 作成済みの注文のステータスの分布
+_STATUS_WEIGHTS = [
+    (OrderStatus.PENDING, 20),
+    (OrderStatus.CONFIRMED, 25),
+    (OrderStatus.SHIPPED, 25),
+    (OrderStatus.DELIVERED, 25),
+    (OrderStatus.CANCELLED, 5),
+]
+
+
+@dataclass
+class Dataset:
+    """生成した顧客・製品・注文"""
+    seed: int
+    customers: List[Customer]
+    products: List[Product]
+    orders: List[Order]
+
+
+def _uuid(rng: random.Random) -> UUID:
+    """乱数生成器から決定的なUUID（バージョン4の形式）を作る"""
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def resolve_scale(scale: str) -> int:
+    """規模の名前（1k / 100k / 1m）または数値の文字列を注文数に変換する"""
+    if scale.lower() in SCALES:
+        return SCALES[scale.lower()]
+    return int(scale)
+
+
+def generate(orders: int, seed: int = DEFAULT_SEED, customers: Optional[int] = None,
+             products: Optional[int] = None, max_items: int = 5) -> Dataset:
+    """注文orders件と、それらが参照する顧客・製品を生成する
+
+    在庫は注文の作成を繰り返しても尽きない数にしておく。
+    """
+    rng = random.Random(seed)
+    customer_count = customers or max(orders // 10, 1)
+    product_count = products or min(max(orders // 100, 50), 10_000)
+
+    customer_list = [
+        Customer(name=f"顧客{index}", email=f"customer{index}@example.com", id=_uuid(rng), created_at=EPOCH)
+        for index in range(customer_count)
+    ]
+    product_list = [
+        Product(name=f"製品{index}", price=rng.randrange(100, 50_000) / 100, id=_uuid(rng),
+                stock_quantity=1_000_000_000, created_at=EPOCH)
+        for index in range(product_count)
+    ]
+
+    statuses = [status for status, _ in _STATUS_WEIGHTS]
+    weights = [weight for _, weight in _STATUS_WEIGHTS]
+    order_list = []
+    for index in range(orders):
+        chosen = rng.sample(product_list, rng.randint(1, min(max_items, product_count)))
+        order_list.append(Order(
+            id=_uuid(rng),
+            customer_id=customer_list[rng.randrange(customer_count)].id,
+            items=[OrderItem(product_id=product.id, quantity=rng.randint(1, 5), price_per_unit=product.price)
+                   for product in chosen],
+            status=rng.choices(statuses, weights)[0],
+            created_at=EPOCH + timedelta(seconds=index * 30 + rng.randrange(30))
+        ))
+    return Dataset(seed=seed, customers=customer_list, products=product_list, orders=order_list)
+
+
+def order_requests(dataset: Dataset) -> List[OrderDTO]:
+    """生成した注文を作成リクエストのDTO（IDなし、顧客と明細のみ）にする"""
+    return [
+        OrderDTO(
+            customer_id=order.customer_id,
+            items=[OrderItemDTO(product_id=item.product_id, quantity=item.quantity, price_per_unit=item.price_per_unit)
+                   for item in order.items]
+        )
+        for order in dataset.orders
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", default="1k", help="1k / 100k / 1m または注文数")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+    dataset = generate(resolve_scale(args.scale), args.seed)
+    print({
+        "customers": len(dataset.customers),
+        "products": len(dataset.products),
+        "orders": len(dataset.orders),
+        "items": sum(len(order.items) for order in dataset.orders),
+        "first_order_id": str(dataset.orders[0].id) if dataset.orders else None,
+    })
+
+
+if __name__ == "__main__":
+    main()
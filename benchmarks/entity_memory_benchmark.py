@@ -0,0 +1,101 @@
+"""注文をメモリ内に保持する際の1件あたりのバイト数のベンチマーク
+
+同じ注文（顧客・商品は共有、明細は --items 件）を --orders 件格納し、tracemalloc で計測した
+ストア全体（インデックスを含む）の確保量を注文数で割って比較する。
+
+- legacy: 以前のエンティティ（slotsなし・ステータスは文字列・イベントのリストを常に持つ）をそのまま保持
+- slotted: slots付きのエンティティ・列挙型のステータスで保持
+- compact: CompactOrderStore で1件1つのバイト列（金額は整数のセント）に詰めて保持
+
+    python -m benchmarks.entity_memory_benchmark --orders 1000000
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+from domain.entities.order import Order, OrderItem
+from infrastructure.repositories.compact_order_store import CompactOrderStore
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderStore
+
+CUSTOMERS = 10000
+PRODUCTS = 1000
+
+
+@dataclass
+class LegacyOrderItem:
+    """変更前の注文アイテム（比較用）"""
+    product_id: UUID
+    quantity: int
+    price_per_unit: float
+
+
+@dataclass
+class LegacyOrder:
+    """変更前の注文エンティティ（比較用）"""
+    id: UUID = field(default_factory=uuid4)
+    customer_id: UUID = None
+    items: List[LegacyOrderItem] = field(default_factory=list)
+    status: str = "PENDING"
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = None
+    version: int = 1
+    events: list = field(default_factory=list)
+
+
+def _fill(store: InMemoryOrderStore, orders: int, items: int, order_class, item_class) -> None:
+    rng = random.Random(42)
+    customers = [uuid4() for _ in range(CUSTOMERS)]
+    products = [uuid4() for _ in range(PRODUCTS)]
+    started_at = datetime(2024, 1, 1)
+    for index in range(orders):
+        store.put(order_class(
+            customer_id=rng.choice(customers),
+            items=[
+                item_class(product_id=rng.choice(products), quantity=rng.randint(1, 5),
+                           price_per_unit=rng.randint(100, 100000) / 100)
+                for _ in range(items)
+            ],
+            # JSONやDBから読み込んだ場合と同じく、注文ごとに別の文字列・日時のオブジェクトを持たせる
+            status="".join(["PEND", "ING"]) if order_class is LegacyOrder else "PENDING",
+            created_at=started_at + timedelta(seconds=index)
+        ))
+
+
+def measure(store_class, orders: int, items: int, order_class=Order, item_class=OrderItem) -> dict:
+    """ストアに注文を格納し、1件あたりのバイト数を返す"""
+    gc.collect()
+    tracemalloc.start()
+    store = store_class()
+    _fill(store, orders, items, order_class, item_class)
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(store.orders) == orders
+    return {"bytes_per_order": round(allocated / orders, 1), "total_mb": round(allocated / 2**20, 1)}
+
+
+def run(orders: int = 1000000, items: int = 3):
+    """保持形式ごとの1件あたりのバイト数を返す"""
+    return {
+        "legacy": measure(InMemoryOrderStore, orders, items, LegacyOrder, LegacyOrderItem),
+        "slotted": measure(InMemoryOrderStore, orders, items),
+        "compact": measure(CompactOrderStore, orders, items),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=1000000)
+    parser.add_argument("--items", type=int, default=3)
+    args = parser.parse_args()
+    for name, stats in run(args.orders, args.items).items():
+        print(name, stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""イベントソーシングの注文リポジトリの読み込み時間のベンチマーク
+
+ストリームの長さ（イベント数）ごとに、スナップショットなしとあり（--snapshot-every 件ごと）で
+- load: 最新の状態の再生（find_by_id）
+- as_of: ストリームの中ほどの日時の状態の再生（find_as_of）
+の1回あたりの時間[µs]を計測する。ステータスの変更を繰り返して長いストリームを作る。
+
+    python -m benchmarks.event_sourced_order_benchmark --lengths 10,100,1000,10000 --snapshot-every 64
+"""
+import argparse
+import json
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Callable, Dict, List
+from uuid import uuid4
+
+from domain.entities.order import Order, OrderItem, OrderStatus
+from infrastructure.repositories.event_sourced_order_repository import (
+    EventSourcedOrderCommandRepository,
+    EventSourcedOrderHistory,
+    InMemoryOrderEventStore
+)
+
+_START = datetime(2024, 5, 1)
+_CYCLE = (OrderStatus.CONFIRMED, OrderStatus.SHIPPED, OrderStatus.PENDING)
+
+
+def _per_call_us(function: Callable[[], object], min_seconds: float) -> float:
+    calls, started = 0, perf_counter()
+    while True:
+        function()
+        calls += 1
+        elapsed = perf_counter() - started
+        if elapsed >= min_seconds:
+            return round(elapsed / calls * 1e6, 2)
+
+
+def _build(length: int, snapshot_every: int):
+    events = InMemoryOrderEventStore(snapshot_every=snapshot_every)
+    repository = EventSourcedOrderCommandRepository(events)
+    order = Order(customer_id=uuid4(), created_at=_START, updated_at=_START,
+                  items=[OrderItem(product_id=uuid4(), quantity=1, price_per_unit=10.0) for _ in range(3)])
+    repository.save(order)
+    # 作成時のイベント（作成 + アイテム3件）の後はステータスの変更を1件ずつ追記する
+    for index in range(max(length - 4, 0)):
+        order.status = _CYCLE[index % len(_CYCLE)]
+        order.updated_at = _START + timedelta(seconds=index + 1)
+        repository.update(order)
+    return repository, EventSourcedOrderHistory(events), order
+
+
+def run(lengths: List[int], snapshot_every: int, min_seconds: float) -> List[Dict[str, object]]:
+    results = []
+    for length in lengths:
+        for label, every in (("none", 0), (f"every_{snapshot_every}", snapshot_every)):
+            repository, history, order = _build(length, every)
+            middle = _START + timedelta(seconds=max(length - 4, 0) // 2)
+            assert repository.find_by_id(order.id) == order
+            results.append({
+                "events": repository.events.stream_length(order.id),
+                "snapshots": label,
+                "load_us": _per_call_us(lambda: repository.find_by_id(order.id), min_seconds),
+                "as_of_us": _per_call_us(lambda: history.find_as_of(order.id, middle), min_seconds),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lengths", default="10,100,1000,10000")
+    parser.add_argument("--snapshot-every", type=int, default=64)
+    parser.add_argument("--min-seconds", type=float, default=0.5)
+    args = parser.parse_args()
+    lengths = [int(length) for length in args.lengths.split(",")]
+    print(json.dumps(run(lengths, args.snapshot_every, args.min_seconds), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""レイヤーごとの計測（/metrics）のオーバーヘッドのベンチマーク
+
+- 呼び出し1回あたり: リポジトリの find_by_id を直接呼ぶ場合と、計測用のプロキシを通す場合（計測の有効・無効）を比較する
+- リクエスト1件あたり: ASGIで GET /api/orders/{order_id} と POST /api/orders/ を送り、計測の有効・無効を切り替えて比較する
+  （起動時に METRICS_ENABLED=false とした場合はプロキシ自体を挟まないため、無効時の値より小さくなる）
+
+    python -m benchmarks.metrics_overhead_benchmark --calls 200000 --requests 2000
+"""
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Callable, Dict
+from uuid import uuid4
+
+import httpx
+
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderItem
+from domain.entities.product import Product
+from infrastructure.metrics.instrumentation import InstrumentedProxy
+from infrastructure.metrics.registry import MetricsRegistry, metrics
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderQueryRepository, InMemoryOrderStore
+from main import app
+
+
+def _per_call_ns(function: Callable[[], object], calls: int) -> float:
+    started = perf_counter()
+    for _ in range(calls):
+        function()
+    return round((perf_counter() - started) / calls * 1e9, 1)
+
+
+def measure_calls(calls: int) -> Dict[str, float]:
+    """find_by_id 1回あたりの時間[ns]"""
+    store = InMemoryOrderStore()
+    order = Order(customer_id=uuid4(), items=[OrderItem(product_id=uuid4(), quantity=1, price_per_unit=100.0)])
+    store.put(order)
+    repository = InMemoryOrderQueryRepository(store)
+    registry = MetricsRegistry(enabled=True)
+    proxy = InstrumentedProxy(repository, "repository", registry)
+
+    results = {"direct": _per_call_ns(lambda: repository.find_by_id(order.id), calls),
+               "proxy_enabled": _per_call_ns(lambda: proxy.find_by_id(order.id), calls)}
+    registry.enabled = False
+    results["proxy_disabled"] = _per_call_ns(lambda: proxy.find_by_id(order.id), calls)
+    return results
+
+
+async def measure_requests(requests: int) -> Dict[str, Dict[str, float]]:
+    """リクエスト1件あたりの時間[µs]（計測の有効・無効）"""
+    results: Dict[str, Dict[str, float]] = {}
+    async with app.router.lifespan_context(app):
+        container = app.state.container
+        customer = container.resolve("customer_repository").save(
+            Customer(name="ベンチマーク顧客", email=f"{uuid4().hex}@example.com")
+        )
+        product = container.resolve("product_repository").save(
+            Product(name="ベンチマーク製品", price=100.0, stock_quantity=10_000_000)
+        )
+        payload = {
+            "customer_id": str(customer.id),
+            "items": [{"product_id": str(product.id), "quantity": 1, "price_per_unit": 100.0}]
+        }
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            order_id = (await client.post("/api/orders/", json=payload)).json()["data"]["order_id"]
+            enabled = metrics.enabled
+            try:
+                for label, state in (("enabled", True), ("disabled", False), ("enabled_again", True)):
+                    metrics.enabled = state
+                    timings = {}
+                    for name, send in (("get_order", lambda: client.get(f"/api/orders/{order_id}")),
+                                       ("create_order", lambda: client.post("/api/orders/", json=payload))):
+                        started = perf_counter()
+                        for _ in range(requests):
+                            await send()
+                        timings[name] = round((perf_counter() - started) / requests * 1e6, 1)
+                    results[label] = timings
+            finally:
+                metrics.enabled = enabled
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    print("find_by_id_ns", measure_calls(args.calls))
+    for label, timings in asyncio.run(measure_requests(args.requests)).items():
+        print(f"request_us[{label}]", timings)
+
+
+if __name__ == "__main__":
+    main()
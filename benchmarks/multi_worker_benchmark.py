@@ -0,0 +1,94 @@
+"""uvicornのワーカープロセス数ごとのスループットのベンチマーク
+
+一時ファイルのSQLite（WAL）を共有する uvicorn main:app を --workers 1, 2, 4, ... で起動し、
+order_load_harness と同じ負荷をかけてスループットとp99レイテンシを比較する。
+在庫を少なくして在庫切れと在庫の戻し（キャンセル）が起きるようにし、計測後に
+「製品ごとの在庫 = 初期在庫 - キャンセルされていない注文の数量の合計」かつ在庫が負でないことを確認する。
+
+    python -m benchmarks.multi_worker_benchmark --workers 1,2,4,8 --duration 10
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+from typing import Dict, List
+
+from sqlalchemy import create_engine, func, select
+
+from benchmarks.data_generator import DEFAULT_SEED
+from benchmarks.order_load_harness import run as run_load
+from domain.entities.order import OrderStatus
+from infrastructure.db.models import OrderItemModel, OrderModel, ProductModel
+
+DEFAULT_MIX = "create=4,get=3,list=1,update=1,cancel=1"
+
+
+def check_stock(db_path: str, initial_stock: int) -> Dict[str, object]:
+    """在庫が注文と矛盾していないかを確認する"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    try:
+        with engine.connect() as connection:
+            stocks = dict(connection.execute(select(ProductModel.id, ProductModel.stock_quantity)).all())
+            reserved = dict(connection.execute(
+                select(OrderItemModel.product_id, func.sum(OrderItemModel.quantity))
+                .join(OrderModel, OrderModel.id == OrderItemModel.order_id)
+                .where(OrderModel.status != OrderStatus.CANCELLED.value)
+                .group_by(OrderItemModel.product_id)
+            ).all())
+    finally:
+        engine.dispose()
+    mismatched = [product_id for product_id, stock in stocks.items()
+                  if stock != initial_stock - reserved.get(product_id, 0)]
+    return {
+        "stock_consistent": not mismatched and min(stocks.values(), default=0) >= 0,
+        "mismatched_products": len(mismatched),
+        "units_reserved": sum(reserved.values()),
+    }
+
+
+def run(workers: int, args) -> Dict[str, object]:
+    """ワーカー数を指定して負荷をかけ、スループットと在庫の確認結果を返す"""
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, "shared.db")
+        load_args = argparse.Namespace(
+            target="uvicorn", prefix=args.prefix, mix=args.mix, concurrency=args.concurrency, rate=None,
+            duration=args.duration, warmup=args.warmup, preload=args.preload, customers=args.customers,
+            products=args.products, workers=workers, stock=args.stock, seed=args.seed, database=db_path
+        )
+        result = asyncio.run(run_load(load_args))
+        total = result["total"]
+        row = {
+            "workers": workers,
+            "requests_per_second": total["requests_per_sec"],
+            "p99_ms": total.get("p99_ms"),
+            "errors": total["errors"],
+        }
+        row.update(check_stock(db_path, args.stock))
+        return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4,8", help="カンマ区切りのワーカープロセス数")
+    parser.add_argument("--prefix", default="/api", help="/api（同期ルート）または /api/async（非同期ルート）")
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--preload", type=int, default=100)
+    parser.add_argument("--customers", type=int, default=100)
+    parser.add_argument("--products", type=int, default=20)
+    parser.add_argument("--stock", type=int, default=500, help="製品ごとの初期在庫（在庫切れの注文はエラーに数える）")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    counts: List[int] = [int(value) for value in args.workers.split(",")]
+    print(f"{'workers':>8} {'req/s':>10} {'p99(ms)':>10} {'errors':>8} {'reserved':>10} {'stock_ok':>9}")
+    for workers in counts:
+        row = run(workers, args)
+        print(f"{row['workers']:>8} {row['requests_per_second']:>10} {row['p99_ms']:>10} {row['errors']:>8} "
+              f"{row['units_reserved']:>10} {str(row['stock_consistent']):>9}")
+
+
+if __name__ == "__main__":
+    main()
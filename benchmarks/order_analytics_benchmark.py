@@ -0,0 +1,103 @@
+"""売上集計のベンチマーク（Pythonのループ vs 列指向ミラーのNumPy集計）
+
+--lines 件の注文明細（1注文 --items 件）を列指向ミラーに追記し、商品・顧客・日ごとの売上の集計時間を計測する。
+比較として、先頭の --baseline-lines 件分の注文エンティティを OrderItem.total_price で1件ずつ合計する時間を計測する。
+
+    python -m benchmarks.order_analytics_benchmark --lines 20000000
+"""
+import argparse
+import random
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Dict, List
+from uuid import uuid4
+
+from domain.entities.order import Order, OrderItem, OrderStatus
+from infrastructure.analytics.columnar_order_analytics import ColumnarOrderAnalytics
+from infrastructure.analytics.order_line_columns import OrderLineColumns
+
+CUSTOMERS = 100000
+PRODUCTS = 10000
+DAYS = 365
+
+
+def _fill(lines: int, items: int, baseline_lines: int):
+    """列指向ミラーと、比較用の先頭の注文エンティティを作成する"""
+    rng = random.Random(42)
+    customers = [uuid4() for _ in range(CUSTOMERS)]
+    # 明細は値オブジェクトのため、数量・単価の組み合わせごとに作ったものを注文間で共有する
+    catalog = [
+        OrderItem(product_id=uuid4(), quantity=rng.randint(1, 5), price_per_unit=rng.randint(100, 100000) / 100)
+        for _ in range(PRODUCTS)
+    ]
+    statuses = [status.value for status in OrderStatus]
+    started_at = datetime(2024, 1, 1)
+    columns = OrderLineColumns()
+    baseline: List[Order] = []
+    for index in range(lines // items):
+        order = Order(
+            customer_id=rng.choice(customers),
+            items=rng.sample(catalog, items),
+            status=rng.choice(statuses),
+            created_at=started_at + timedelta(seconds=rng.randrange(DAYS * 86400))
+        )
+        columns.append(order)
+        if index * items < baseline_lines:
+            baseline.append(order)
+    return columns, baseline
+
+
+def _python_revenue_by_product(orders: List[Order]) -> Dict:
+    revenue: Dict = {}
+    for order in orders:
+        if order.status == OrderStatus.CANCELLED:
+            continue
+        for item in order.items:
+            revenue[item.product_id] = revenue.get(item.product_id, 0) + item.total_price
+    return revenue
+
+
+def _timed(function) -> float:
+    started = perf_counter()
+    function()
+    return round((perf_counter() - started) * 1000, 1)
+
+
+def run(lines: int = 20000000, items: int = 4, baseline_lines: int = 1000000):
+    """集計の所要時間[ms]を返す"""
+    started = perf_counter()
+    columns, baseline = _fill(lines, items, baseline_lines)
+    analytics = ColumnarOrderAnalytics(columns)
+    results = {"fill": {"lines": len(columns), "seconds": round(perf_counter() - started, 1)}}
+    # 初回の集計は追記待ちの明細の書き込みを含むため、ここで済ませておく
+    columns.columns()
+
+    baseline_ms = _timed(lambda: _python_revenue_by_product(baseline))
+    results["python_loop_by_product"] = {
+        "lines": len(baseline) * items,
+        "ms": baseline_ms,
+        "estimated_ms_for_all_lines": round(baseline_ms * len(columns) / max(len(baseline) * items, 1), 1),
+    }
+    results["numpy_by_product_ms"] = _timed(analytics.revenue_by_product)
+    results["numpy_by_customer_top100_ms"] = _timed(lambda: analytics.revenue_by_customer(limit=100))
+    # 全顧客分（10万行）の結果を組み立てる時間を含む
+    results["numpy_by_customer_all_ms"] = _timed(analytics.revenue_by_customer)
+    results["numpy_by_day_ms"] = _timed(analytics.revenue_by_day)
+    results["numpy_by_product_top10_last_30_days_ms"] = _timed(
+        lambda: analytics.revenue_by_product(since=datetime(2024, 12, 1), limit=10)
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=20000000)
+    parser.add_argument("--items", type=int, default=4)
+    parser.add_argument("--baseline-lines", type=int, default=1000000)
+    args = parser.parse_args()
+    for name, stats in run(args.lines, args.items, args.baseline_lines).items():
+        print(name, stats)
+
+
+if __name__ == "__main__":
+    main()
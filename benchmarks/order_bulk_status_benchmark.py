@@ -0,0 +1,85 @@
+"""注文ステータスの一括更新のベンチマーク
+
+CONFIRMED の注文を SHIPPED に変更するのにかかる時間を、1件ずつの update_order_status
+（条件付き更新を1件ずつ呼ぶ）と update_orders_status（1回の条件付き更新）で比較する。
+読み取りモデルへの反映とアウトボックスへの追加を含む。
+
+    python -m benchmarks.order_bulk_status_benchmark --orders 10000 --store compact
+    python -m benchmarks.order_bulk_status_benchmark --orders 10000 --store sqlite
+"""
+import argparse
+import os
+import tempfile
+from time import perf_counter
+from uuid import uuid4
+
+from application.usecases.order_interactor import OrderCommandInteractor
+from domain.entities.order import Order, OrderItem, OrderStatus
+from infrastructure.db.engine import dispose_engines, get_session_factory
+from infrastructure.read_models.in_memory_order_read_model import InMemoryOrderReadModel
+from infrastructure.read_models.sqlalchemy_order_read_model import SqlAlchemyOrderReadModel
+from infrastructure.repositories.compact_order_store import CompactOrderStore
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderCommandRepository, InMemoryOrderStore
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from infrastructure.repositories.sqlalchemy_order_repository import SqlAlchemyOrderCommandRepository
+from presentation.presenters.order_presenter import OrderCommandPresenter
+
+
+def _orders(count: int):
+    customer_ids = [uuid4() for _ in range(max(1, count // 10))]
+    orders = []
+    for i in range(count):
+        order = Order(customer_id=customer_ids[i % len(customer_ids)], status=OrderStatus.CONFIRMED)
+        order.items.append(OrderItem(product_id=uuid4(), quantity=1, price_per_unit=10.0))
+        orders.append(order)
+    return orders
+
+
+def _interactor(store: str, directory: str):
+    if store == "sqlite":
+        session_factory = get_session_factory(f"sqlite:///{os.path.join(directory, f'{uuid4().hex}.db')}")
+        repository = SqlAlchemyOrderCommandRepository(session_factory)
+        read_model = SqlAlchemyOrderReadModel(session_factory)
+    else:
+        repository = InMemoryOrderCommandRepository(CompactOrderStore() if store == "compact" else InMemoryOrderStore())
+        read_model = InMemoryOrderReadModel()
+    presenter = OrderCommandPresenter()
+    interactor = OrderCommandInteractor(repository, None, InMemoryProductRepository(), presenter, presenter, read_model)
+    return interactor, repository, presenter
+
+
+def run(count: int, store: str):
+    """1件ずつの更新と一括更新の所要時間（ミリ秒）を返す"""
+    with tempfile.TemporaryDirectory() as directory:
+        results = {"orders": count, "store": store}
+        for mode in ("per_order", "bulk"):
+            interactor, repository, presenter = _interactor(store, directory)
+            orders = _orders(count)
+            repository.save_many(orders)
+            order_ids = [order.id for order in orders]
+            started = perf_counter()
+            if mode == "bulk":
+                interactor.update_orders_status(order_ids, "SHIPPED")
+            else:
+                for order_id in order_ids:
+                    interactor.update_order_status(order_id, "SHIPPED")
+            results[f"{mode}_ms"] = round((perf_counter() - started) * 1000, 1)
+            if presenter.view_model.error:
+                raise RuntimeError(presenter.view_model.error)
+        dispose_engines()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=10_000)
+    parser.add_argument("--store", choices=["entity", "compact", "sqlite"], default="compact")
+    args = parser.parse_args()
+
+    row = run(args.orders, args.store)
+    print(f"{'store':>8} {'orders':>8} {'per_order(ms)':>14} {'bulk(ms)':>10}")
+    print(f"{row['store']:>8} {row['orders']:>8} {row['per_order_ms']:>14} {row['bulk_ms']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""50行の注文作成のベンチマーク
+
+製品を1件ずつ取得・更新する従来の流れと、find_by_ids / update_many で
+一括取得・一括更新する OrderCommandInteractor.create_order を比較する。
+
+    python -m benchmarks.order_creation_benchmark --lines 50 --orders 200
+"""
+import argparse
+import os
+import tempfile
+from time import perf_counter
+
+from sqlalchemy import event
+
+from application.interfaces.dto import OrderDTO, OrderItemDTO
+from application.usecases.order_interactor import OrderCommandInteractor, _to_dto
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderItem
+from domain.entities.product import Product
+from infrastructure.db.engine import dispose_engines, get_engine, get_session_factory
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderCommandRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from infrastructure.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from infrastructure.repositories.sqlalchemy_order_repository import SqlAlchemyOrderCommandRepository
+from infrastructure.repositories.sqlalchemy_product_repository import SqlAlchemyProductRepository
+from presentation.presenters.order_presenter import OrderCommandPresenter
+
+
+class _PerItemOrderCommandInteractor(OrderCommandInteractor):
+    """比較用: 製品を1件ずつ取得・更新する従来の create_order"""
+    
+    def create_order(self, order_dto: OrderDTO) -> OrderDTO:
+        customer = self.customer_repository.find_by_id(order_dto.customer_id)
+        if not customer:
+            self.error_boundary.present_error(f"Customer with ID {order_dto.customer_id} not found")
+            return order_dto
+        order = Order(customer_id=order_dto.customer_id, status="PENDING")
+        for item_dto in order_dto.items:
+            product = self.product_repository.find_by_id(item_dto.product_id)
+            order.add_item(OrderItem(product_id=product.id, quantity=item_dto.quantity, price_per_unit=product.price))
+            product.update_stock(product.stock_quantity - item_dto.quantity)
+            self.product_repository.update(product)
+        result_dto = _to_dto(self.order_repository.save(order))
+        self.output_boundary.present_created_order(result_dto)
+        return result_dto
+
+
+def _run_backend(name, order_repository, customer_repository, product_repository, lines, orders, engine=None):
+    customer = customer_repository.save(Customer(name="ベンチマーク顧客", email=f"{name}@example.com"))
+    products = [
+        product_repository.save(Product(name=f"製品{i}", price=100.0 + i, stock_quantity=10_000_000))
+        for i in range(lines)
+    ]
+    order_dto = OrderDTO(
+        customer_id=customer.id,
+        items=[OrderItemDTO(product_id=product.id, quantity=1, price_per_unit=product.price) for product in products]
+    )
+    presenter = OrderCommandPresenter()
+    dependencies = (order_repository, customer_repository, product_repository, presenter, presenter)
+
+    statements = [0]
+
+    def count(*args):
+        statements[0] += 1
+
+    if engine is not None:
+        event.listen(engine, "before_cursor_execute", count)
+
+    results = {}
+    for label, interactor in (
+        ("per_item", _PerItemOrderCommandInteractor(*dependencies)),
+        ("batched", OrderCommandInteractor(*dependencies)),
+    ):
+        statements[0] = 0
+        started = perf_counter()
+        for _ in range(orders):
+            interactor.create_order(order_dto)
+        elapsed = perf_counter() - started
+        results[label] = {
+            "orders_per_sec": round(orders / elapsed, 1),
+            "ms_per_order": round(elapsed / orders * 1000, 3),
+            "statements_per_order": round(statements[0] / orders, 1) if engine is not None else None,
+        }
+
+    if engine is not None:
+        event.remove(engine, "before_cursor_execute", count)
+    return results
+
+
+def run(lines: int = 50, orders: int = 200):
+    """バックエンドごとの結果を返す"""
+    results = {
+        "memory": _run_backend(
+            "memory",
+            InMemoryOrderCommandRepository(),
+            InMemoryCustomerRepository(),
+            InMemoryProductRepository(),
+            lines,
+            orders
+        )
+    }
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_url = f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+        session_factory = get_session_factory(db_url)
+        results["sqlite"] = _run_backend(
+            "sqlite",
+            SqlAlchemyOrderCommandRepository(session_factory),
+            SqlAlchemyCustomerRepository(session_factory),
+            SqlAlchemyProductRepository(session_factory),
+            lines,
+            orders,
+            engine=get_engine(db_url)
+        )
+        dispose_engines()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=50)
+    parser.add_argument("--orders", type=int, default=200)
+    args = parser.parse_args()
+
+    for backend, rows in run(args.lines, args.orders).items():
+        for label, row in rows.items():
+            print(f"{backend:>7} {label:>9} {row}")
+
+
+if __name__ == "__main__":
+    main()
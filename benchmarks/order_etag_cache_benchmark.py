@@ -0,0 +1,64 @@
+"""注文取得のポーリングのベンチマーク（キャッシュなし vs キャッシュ vs 304）
+
+同じ注文の取得を繰り返し、キャッシュを無効（件数上限0）にした場合、
+キャッシュ済みのボディを返す場合、If-None-Matchで304を返す場合のリクエスト数/秒を比較する。
+
+    python -m benchmarks.order_etag_cache_benchmark --requests 3000
+    DATABASE_NAME=./bench.db python -m benchmarks.order_etag_cache_benchmark  # キャッシュミス時にDBを読む場合
+"""
+import argparse
+from time import perf_counter
+
+from fastapi.testclient import TestClient
+
+from domain.entities.customer import Customer
+from domain.entities.product import Product
+from main import app
+
+
+def _measure(client: TestClient, path: str, requests: int, headers=None) -> float:
+    started = perf_counter()
+    for _ in range(requests):
+        client.get(path, headers=headers)
+    return round(requests / (perf_counter() - started), 1)
+
+
+def run(requests: int = 3000):
+    """モードごとのリクエスト数/秒を返す"""
+    with TestClient(app) as client:
+        container = app.state.container
+        customer = container.resolve("customer_repository").save(Customer(name="ベンチマーク顧客", email="bench@example.com"))
+        product = container.resolve("product_repository").save(Product(name="ベンチマーク商品", price=100.0, stock_quantity=10**6))
+        client.post("/api/orders/", json={
+            "customer_id": str(customer.id),
+            "items": [{"product_id": str(product.id), "quantity": 1, "price_per_unit": 100.0}] * 5
+        })
+        order_id = container.resolve("order_read_model").list_by_customer(customer.id)[0].id
+        path = f"/api/orders/{order_id}"
+        cache = container.resolve("order_response_cache")
+
+        max_entries = cache.max_entries
+        cache.max_entries = 0
+        uncached = _measure(client, path, requests)
+        cache.max_entries = max_entries
+
+        etag = client.get(path).headers["etag"]
+        results = {
+            "uncached": uncached,
+            "cached_200": _measure(client, path, requests),
+            "not_modified_304": _measure(client, path, requests, headers={"If-None-Match": etag}),
+        }
+        results["cache"] = cache.stats()
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=3000)
+    args = parser.parse_args()
+    for name, stats in run(args.requests).items():
+        print(name, stats)
+
+
+if __name__ == "__main__":
+    main()
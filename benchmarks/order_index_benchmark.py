@@ -0,0 +1,84 @@
+"""注文クエリリポジトリのセカンダリインデックスのベンチマーク
+
+総注文数を増やしても、顧客ごとの注文数が一定であれば
+find_all_by_customer_id / find_all_by_status のレイテンシが一定であることを確認する。
+
+    python -m benchmarks.order_index_benchmark --sizes 10000 100000 1000000 5000000
+"""
+import argparse
+import random
+from time import perf_counter
+from uuid import uuid4
+
+from domain.entities.order import Order
+from infrastructure.repositories.in_memory_order_repository import (
+    InMemoryOrderCommandRepository,
+    InMemoryOrderQueryRepository,
+    InMemoryOrderStore
+)
+
+ORDERS_PER_CUSTOMER = 10
+STATUSES = ["PENDING", "CONFIRMED", "SHIPPED", "DELIVERED", "CANCELLED"]
+
+
+def _populate(size: int, seed: int):
+    rng = random.Random(seed)
+    store = InMemoryOrderStore()
+    command_repository = InMemoryOrderCommandRepository(store)
+    customer_ids = [uuid4() for _ in range(max(1, size // ORDERS_PER_CUSTOMER))]
+    for i in range(size):
+        command_repository.save(Order(customer_id=customer_ids[i % len(customer_ids)]))
+    # ステータス別の件数を一定に保つため、固定件数だけ珍しいステータスに変更する
+    for order_id in rng.sample(list(store.orders), min(ORDERS_PER_CUSTOMER, size)):
+        order = store.orders[order_id]
+        order.update_status("SHIPPED")
+        command_repository.update(order)
+    return InMemoryOrderQueryRepository(store), customer_ids
+
+
+def _time(func, args, repeat: int) -> float:
+    started = perf_counter()
+    for arg in args[:repeat]:
+        func(arg)
+    return (perf_counter() - started) / repeat * 1_000_000
+
+
+def run(sizes, repeat: int = 1000, seed: int = 42):
+    """各サイズでの1回あたりのレイテンシ（マイクロ秒）を返す"""
+    results = []
+    for size in sizes:
+        query_repository, customer_ids = _populate(size, seed)
+        rng = random.Random(seed)
+        targets = [rng.choice(customer_ids) for _ in range(repeat)]
+
+        by_customer = _time(query_repository.find_all_by_customer_id, targets, repeat)
+        by_status = _time(query_repository.find_all_by_status, ["SHIPPED"] * repeat, repeat)
+        # 比較用: インデックス導入前と同じ全件走査
+        scan_repeat = max(1, min(repeat, 1_000_000 // size))
+        linear_scan = _time(
+            lambda customer_id: [o for o in query_repository.orders.values() if o.customer_id == customer_id],
+            targets,
+            scan_repeat
+        )
+        results.append({
+            "orders": size,
+            "by_customer_us": round(by_customer, 3),
+            "by_status_us": round(by_status, 3),
+            "linear_scan_us": round(linear_scan, 3),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'orders':>10} {'by_customer(us)':>16} {'by_status(us)':>14} {'linear_scan(us)':>16}")
+    for row in run(args.sizes, args.repeat):
+        print(f"{row['orders']:>10} {row['by_customer_us']:>16} {row['by_status_us']:>14} {row['linear_scan_us']:>16}")
+
+
+if __name__ == "__main__":
+    main()
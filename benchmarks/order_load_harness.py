@@ -0,0 +1,355 @@
+"""注文APIの負荷生成ハーネス（ASGIで直接、またはローカルに起動したuvicornに対して）
+
+作成・取得・顧客の注文一覧・ステータス更新・キャンセルを --mix の比率で混ぜたリクエストを送り、
+エンドポイントごとのスループット、エラー数、レイテンシのパーセンタイル（p50/p95/p99/p99.9）をJSONで出力する。
+
+- --target asgi: main:app を httpx.ASGITransport で同じプロセス内から呼ぶ（ネットワークを通らない）
+- --target uvicorn: 一時ファイルのSQLiteにデータを用意してから uvicorn main:app を子プロセスで起動し、TCPで呼ぶ
+
+負荷のかけ方は2通り。
+- --concurrency N（既定）: N個のワーカーが応答を待ってから次のリクエストを送る（クローズドループ）
+- --rate R: 応答を待たずに平均R件/秒（指数分布の間隔）でリクエストを送る（オープンループ）。
+  レイテンシは予定した送信時刻から測るため、送信が遅れた分の待ち時間も含まれる。
+
+ステータス更新はPENDINGの注文をCONFIRMEDに、キャンセルはPENDINGかCONFIRMEDの注文に対して行う。
+対象の注文が残っていない場合は代わりに注文を作成する。
+
+    python -m benchmarks.order_load_harness --mix create=1,get=6,list=2,update=1,cancel=0.5 --concurrency 32 --duration 10
+    python -m benchmarks.order_load_harness --target uvicorn --rate 300 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.data_generator import DEFAULT_SEED, generate
+
+OPERATIONS = ("create", "get", "list", "update", "cancel")
+DEFAULT_MIX = "create=1,get=6,list=2,update=1,cancel=0.5"
+PERCENTILES = (50, 95, 99, 99.9)
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """"create=1,get=6" 形式の比率を辞書にする"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {name}. Must be one of {list(OPERATIONS)}")
+        mix[name] = float(weight or 1)
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("At least one operation must have a positive weight")
+    return mix
+
+
+def percentile(ordered: List[float], percent: float) -> float:
+    """昇順に並べた値のパーセンタイル（最近接順位法）"""
+    index = max(0, min(len(ordered) - 1, int(-(-len(ordered) * percent // 100)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class _EndpointStats:
+    route: str
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, elapsed: float) -> Dict[str, object]:
+        ordered = sorted(self.latencies_ms)
+        result: Dict[str, object] = {
+            "route": self.route,
+            "requests": len(ordered),
+            "errors": self.errors,
+            "requests_per_sec": round(len(ordered) / elapsed, 1),
+        }
+        if ordered:
+            for percent in PERCENTILES:
+                result[f"p{percent:g}_ms"] = round(percentile(ordered, percent), 3)
+            result["max_ms"] = round(ordered[-1], 3)
+            result["mean_ms"] = round(sum(ordered) / len(ordered), 3)
+        return result
+
+
+class Workload:
+    """操作の選択と、作成した注文の状態（更新・キャンセルの対象）を管理する"""
+
+    def __init__(self, client: httpx.AsyncClient, prefix: str, customers: List[str], products: List[Tuple[str, float]],
+                 mix: Dict[str, float], seed: int):
+        self.client = client
+        self.prefix = prefix
+        self.customers = customers
+        self.products = products
+        self.rng = random.Random(seed)
+        self.operations = [name for name in mix if mix[name] > 0]
+        self.weights = [mix[name] for name in self.operations]
+        self.order_ids: List[str] = []
+        self.pending: List[str] = []
+        self.confirmed: List[str] = []
+        self.stats: Dict[str, _EndpointStats] = {}
+        self.recording = False
+
+    def choose(self) -> str:
+        return self.rng.choices(self.operations, self.weights)[0]
+
+    def _take(self, pool: List[str]) -> Optional[str]:
+        if not pool:
+            return None
+        index = self.rng.randrange(len(pool))
+        pool[index], pool[-1] = pool[-1], pool[index]
+        return pool.pop()
+
+    def _request(self, operation: str):
+        """操作に対応するリクエストと、成功した場合に状態へ反映する処理を返す"""
+        orders = f"{self.prefix}/orders"
+        if operation == "update":
+            order_id = self._take(self.pending)
+            if order_id is not None:
+                return ("update", "PUT /orders/{order_id}/status",
+                        self.client.put(f"{orders}/{order_id}/status", json={"status": "CONFIRMED"}),
+                        lambda data: self.confirmed.append(order_id))
+        if operation == "cancel":
+            order_id = self._take(self.confirmed) or self._take(self.pending)
+            if order_id is not None:
+                return "cancel", "DELETE /orders/{order_id}", self.client.delete(f"{orders}/{order_id}"), None
+        if operation == "get" and self.order_ids:
+            order_id = self.rng.choice(self.order_ids)
+            return "get", "GET /orders/{order_id}", self.client.get(f"{orders}/{order_id}"), None
+        if operation == "list":
+            customer_id = self.rng.choice(self.customers)
+            return "list", "GET /orders/customer/{customer_id}", self.client.get(f"{orders}/customer/{customer_id}"), None
+        return "create", "POST /orders", self.client.post(f"{orders}/", json=self._order_payload()), self._created
+
+    def _order_payload(self) -> Dict[str, object]:
+        chosen = self.rng.sample(self.products, self.rng.randint(1, min(3, len(self.products))))
+        return {
+            "customer_id": self.rng.choice(self.customers),
+            "items": [{"product_id": product_id, "quantity": 1, "price_per_unit": price} for product_id, price in chosen]
+        }
+
+    def _created(self, data) -> None:
+        if data and data.get("order_id"):
+            self.order_ids.append(data["order_id"])
+            self.pending.append(data["order_id"])
+
+    async def issue(self, operation: str, scheduled: Optional[float] = None) -> None:
+        """1件のリクエストを送り、記録中であればレイテンシを記録する"""
+        name, route, request, on_success = self._request(operation)
+        started = scheduled if scheduled is not None else perf_counter()
+        ok = False
+        data = None
+        try:
+            response = await request
+            body = response.json() if response.status_code != 304 else {"success": True}
+            ok = response.status_code < 400 and body.get("success", True)
+            data = body.get("data")
+        except Exception:
+            ok = False
+        latency_ms = (perf_counter() - started) * 1000
+        if ok and on_success is not None:
+            on_success(data)
+        if self.recording:
+            stats = self.stats.setdefault(name, _EndpointStats(route))
+            stats.latencies_ms.append(latency_ms)
+            if not ok:
+                stats.errors += 1
+
+
+async def _closed_loop(workload: Workload, concurrency: int, duration: float) -> None:
+    deadline = perf_counter() + duration
+
+    async def worker():
+        while perf_counter() < deadline:
+            await workload.issue(workload.choose())
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def _open_loop(workload: Workload, rate: float, duration: float, seed: int) -> None:
+    rng = random.Random(seed + 1)
+    in_flight = set()
+    started = perf_counter()
+    scheduled = started
+    while scheduled < started + duration:
+        delay = scheduled - perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        task = asyncio.create_task(workload.issue(workload.choose(), scheduled))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+        scheduled += rng.expovariate(rate)
+    if in_flight:
+        await asyncio.gather(*in_flight)
+
+
+async def _drive(workload: Workload, args) -> float:
+    """ウォームアップの後に計測区間の負荷をかけ、計測区間の経過時間を返す"""
+    async def load(duration: float):
+        if args.rate:
+            await _open_loop(workload, args.rate, duration, args.seed)
+        else:
+            await _closed_loop(workload, args.concurrency, duration)
+
+    for _ in range(args.preload):
+        await workload.issue("create")
+    if args.warmup > 0:
+        await load(args.warmup)
+    workload.recording = True
+    started = perf_counter()
+    await load(args.duration)
+    return perf_counter() - started
+
+
+def _seed_data(args):
+    dataset = generate(0, args.seed, customers=args.customers, products=args.products)
+    if getattr(args, "stock", None) is not None:
+        for product in dataset.products:
+            product.stock_quantity = args.stock
+    return dataset.customers, dataset.products
+
+
+@asynccontextmanager
+async def _asgi_client(args) -> AsyncIterator[Tuple[httpx.AsyncClient, List[str], List[Tuple[str, float]]]]:
+    """同じプロセス内のアプリに顧客・製品を登録し、ASGIで呼ぶクライアントを返す"""
+    from main import app
+
+    async with app.router.lifespan_context(app):
+        container = app.state.container
+        customers, products = _seed_data(args)
+        customer_repository = container.resolve("customer_repository")
+        product_repository = container.resolve("product_repository")
+        for customer in customers:
+            customer_repository.save(customer)
+        for product in products:
+            product_repository.save(product)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-harness") as client:
+            yield client, [str(c.id) for c in customers], [(str(p.id), p.price) for p in products]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_until_ready(client: httpx.AsyncClient, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = perf_counter() + timeout
+    while perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+        try:
+            if (await client.get("/")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError(f"uvicorn did not become ready within {timeout}s")
+
+
+@asynccontextmanager
+async def _uvicorn_client(args) -> AsyncIterator[Tuple[httpx.AsyncClient, List[str], List[Tuple[str, float]]]]:
+    """一時ファイルのSQLiteに顧客・製品を登録してからuvicornを起動し、TCPで呼ぶクライアントを返す"""
+    from config.database import get_customer_repository, get_product_repository
+    from infrastructure.db.engine import dispose_engines
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # 計測後にデータベースを確認する場合は呼び出し側がパスを指定する
+        db_path = getattr(args, "database", None) or os.path.join(tmpdir, "load.db")
+        customers, products = _seed_data(args)
+        customer_repository = get_customer_repository(f"sqlite:///{db_path}")
+        product_repository = get_product_repository(f"sqlite:///{db_path}")
+        for customer in customers:
+            customer_repository.save(customer)
+        for product in products:
+            product_repository.save(product)
+        dispose_engines()
+
+        port = _free_port()
+        server_env = dict(os.environ, DATABASE_DIALECT="sqlite", DATABASE_NAME=db_path, WEB_CONCURRENCY=str(args.workers))
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+             "--workers", str(args.workers), "--log-level", "warning", "--no-access-log"],
+            env=server_env
+        )
+        limits = httpx.Limits(max_connections=max(args.concurrency, 100), max_keepalive_connections=max(args.concurrency, 100))
+        try:
+            async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30.0) as client:
+                await _wait_until_ready(client, process)
+                yield client, [str(c.id) for c in customers], [(str(p.id), p.price) for p in products]
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+async def run(args) -> Dict[str, object]:
+    """負荷をかけ、エンドポイントごとの統計を返す"""
+    mix = parse_mix(args.mix)
+    open_client = _uvicorn_client if args.target == "uvicorn" else _asgi_client
+    async with open_client(args) as (client, customers, products):
+        workload = Workload(client, args.prefix, customers, products, mix, args.seed)
+        elapsed = await _drive(workload, args)
+
+    everything = _EndpointStats("*")
+    for stats in workload.stats.values():
+        everything.latencies_ms.extend(stats.latencies_ms)
+        everything.errors += stats.errors
+    return {
+        "meta": {
+            "target": args.target,
+            "prefix": args.prefix,
+            "mode": "open" if args.rate else "closed",
+            "concurrency": None if args.rate else args.concurrency,
+            "rate": args.rate,
+            "duration_s": round(elapsed, 3),
+            "warmup_s": args.warmup,
+            "mix": mix,
+            "seed": args.seed,
+            "workers": args.workers if args.target == "uvicorn" else None,
+        },
+        "endpoints": {name: workload.stats[name].summary(elapsed) for name in OPERATIONS if name in workload.stats},
+        "total": everything.summary(elapsed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--prefix", default="/api", help="/api（同期ルート）または /api/async（非同期ルート）")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="操作ごとの比率（create, get, list, update, cancel）")
+    parser.add_argument("--concurrency", type=int, default=16, help="クローズドループのワーカー数")
+    parser.add_argument("--rate", type=float, help="オープンループの平均リクエスト数/秒（指定した場合は --concurrency を使わない）")
+    parser.add_argument("--duration", type=float, default=10.0, help="計測する秒数")
+    parser.add_argument("--warmup", type=float, default=2.0, help="計測前に負荷をかける秒数")
+    parser.add_argument("--preload", type=int, default=200, help="計測前に作成しておく注文数")
+    parser.add_argument("--customers", type=int, default=100)
+    parser.add_argument("--products", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=1, help="uvicornのワーカープロセス数")
+    parser.add_argument("--stock", type=int, help="製品ごとの在庫数（省略時は在庫切れにならない数）")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", help="結果のJSONを書き出すファイル")
+    args = parser.parse_args()
+    text = json.dumps(asyncio.run(run(args)), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
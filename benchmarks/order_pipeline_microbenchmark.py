@@ -0,0 +1,307 @@
+"""注文の処理経路のレイヤーごとのマイクロベンチマーク
+
+data_generator で生成した決定的なデータを使い、リポジトリ、エンティティからDTOへの変換（_to_dto）、
+インタラクター（create_order / get_order / get_customer_orders）、プレゼンターをそれぞれ単独で計測する。
+インタラクターの計測では出力境界に結果を捨てるだけの実装を渡し、プレゼンターの処理を含めない。
+
+ケースごとに計測を2回に分ける。
+- 時間: tracemalloc を止めた状態で ops 回実行し、ops/s と1回あたりの時間を求める
+- メモリ: tracemalloc を有効にして実行し、1回あたりに残ったバイト数・ブロック数と、実行中のピークを求める
+結果は機械で読めるJSONで出力する（--output を省略すると標準出力）。
+
+    python -m benchmarks.order_pipeline_microbenchmark --scale 100k --output results.json
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+from application.interfaces.order_use_case import (
+    OrderCommandOutputBoundary,
+    OrderErrorOutputBoundary,
+    OrderQueryOutputBoundary
+)
+from application.usecases.order_interactor import OrderCommandInteractor, OrderQueryInteractor, _to_dto
+from application.usecases.order_projection import project_order
+from benchmarks.data_generator import DEFAULT_SEED, Dataset, generate, order_requests, resolve_scale
+from infrastructure.read_models.in_memory_order_read_model import InMemoryOrderReadModel
+from infrastructure.repositories.compact_order_store import CompactOrderStore
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_order_repository import (
+    InMemoryOrderCommandRepository,
+    InMemoryOrderQueryRepository,
+    InMemoryOrderStore
+)
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from presentation.presenters.order_presenter import OrderCommandPresenter, OrderQueryPresenter
+
+STORES = {"entity": InMemoryOrderStore, "compact": CompactOrderStore}
+
+
+class _DiscardingPresenter(OrderCommandOutputBoundary, OrderQueryOutputBoundary, OrderErrorOutputBoundary):
+    """結果を捨てる出力境界（インタラクターだけを計測するために使う）"""
+
+    def present_created_order(self, order_dto):
+        pass
+
+    def present_created_orders(self, results):
+        pass
+
+    def present_updated_order(self, order_dto):
+        pass
+
+    def present_updated_orders(self, results):
+        pass
+
+    def present_cancelled_order(self, order_dto):
+        pass
+
+    def present_order(self, summary):
+        pass
+
+    def present_orders(self, summaries):
+        pass
+
+    def present_order_page(self, order_page):
+        pass
+
+    def present_order_stream(self, summaries):
+        pass
+
+    def present_error(self, message):
+        raise RuntimeError(message)
+
+
+class _Environment:
+    """計測対象のリポジトリと読み取りモデル
+
+    fresh() は空のストアに顧客と製品だけを登録した状態、seeded() は生成した全注文を格納した状態を返す。
+    seeded() は読み取り専用のケースで共有する。
+    """
+
+    def __init__(self, dataset: Dataset, store: str):
+        self.dataset = dataset
+        self.store_class = STORES[store]
+        self._seeded: Optional[Dict[str, object]] = None
+
+    def fresh(self) -> Dict[str, object]:
+        customers = InMemoryCustomerRepository()
+        for customer in self.dataset.customers:
+            customers.save(customer)
+        products = InMemoryProductRepository()
+        for product in self.dataset.products:
+            products.save(product)
+        store = self.store_class()
+        return {
+            "store": store,
+            "command": InMemoryOrderCommandRepository(store),
+            "query": InMemoryOrderQueryRepository(store),
+            "customers": customers,
+            "products": products,
+            "read_model": InMemoryOrderReadModel(),
+        }
+
+    def seeded(self) -> Dict[str, object]:
+        if self._seeded is None:
+            self._seeded = self.fresh()
+            self._seeded["command"].save_many(self.dataset.orders)
+            self._seeded["read_model"].upsert([project_order(order) for order in self.dataset.orders])
+        return self._seeded
+
+
+@dataclass
+class Case:
+    """計測ケース（build は計測対象の処理を、連番を受け取る関数として返す）"""
+    name: str
+    layer: str
+    build: Callable[[_Environment], Callable[[int], object]]
+    # 状態を書き換えるケースは生成した注文の件数までしか実行しない
+    bounded: bool = False
+
+
+def _save(env: _Environment):
+    repository = env.fresh()["command"]
+    orders = env.dataset.orders
+    return lambda index: repository.save(orders[index])
+
+
+def _find_by_id(env: _Environment):
+    repository = env.seeded()["query"]
+    ids = [order.id for order in env.dataset.orders]
+    return lambda index: repository.find_by_id(ids[index % len(ids)])
+
+
+def _find_all_by_customer_id(env: _Environment):
+    repository = env.seeded()["query"]
+    ids = [customer.id for customer in env.dataset.customers]
+    return lambda index: repository.find_all_by_customer_id(ids[index % len(ids)])
+
+
+def _to_dto_case(env: _Environment):
+    orders = env.dataset.orders
+    return lambda index: _to_dto(orders[index % len(orders)])
+
+
+def _create_order(env: _Environment):
+    repositories = env.fresh()
+    discard = _DiscardingPresenter()
+    interactor = OrderCommandInteractor(
+        repositories["command"], repositories["customers"], repositories["products"],
+        discard, discard, read_model=repositories["read_model"]
+    )
+    requests = order_requests(env.dataset)
+    return lambda index: interactor.create_order(requests[index])
+
+
+def _query_interactor(env: _Environment) -> OrderQueryInteractor:
+    discard = _DiscardingPresenter()
+    return OrderQueryInteractor(env.seeded()["read_model"], discard, discard)
+
+
+def _get_order(env: _Environment):
+    interactor = _query_interactor(env)
+    ids = [order.id for order in env.dataset.orders]
+    return lambda index: interactor.get_order(ids[index % len(ids)])
+
+
+def _get_customer_orders(env: _Environment):
+    interactor = _query_interactor(env)
+    ids = [customer.id for customer in env.dataset.customers]
+    return lambda index: interactor.get_customer_orders(ids[index % len(ids)])
+
+
+def _present_created_order(env: _Environment):
+    dtos = [_to_dto(order) for order in env.dataset.orders[:10_000]]
+
+    def present(index):
+        presenter = OrderCommandPresenter()
+        presenter.present_created_order(dtos[index % len(dtos)])
+        return presenter.view_model.to_json()
+    return present
+
+
+def _present_orders(env: _Environment):
+    read_model = env.seeded()["read_model"]
+    pages = [read_model.list_by_customer(customer.id) for customer in env.dataset.customers[:1_000]]
+
+    def present(index):
+        presenter = OrderQueryPresenter()
+        presenter.present_orders(pages[index % len(pages)])
+        return presenter.view_model.to_json()
+    return present
+
+
+CASES: List[Case] = [
+    Case("repository.save", "repository", _save, bounded=True),
+    Case("repository.find_by_id", "repository", _find_by_id),
+    Case("repository.find_all_by_customer_id", "repository", _find_all_by_customer_id),
+    Case("mapper._to_dto", "mapper", _to_dto_case),
+    Case("interactor.create_order", "interactor", _create_order, bounded=True),
+    Case("interactor.get_order", "interactor", _get_order),
+    Case("interactor.get_customer_orders", "interactor", _get_customer_orders),
+    Case("presenter.present_created_order", "presenter", _present_created_order),
+    Case("presenter.present_orders", "presenter", _present_orders),
+]
+
+
+def _time(op: Callable[[int], object], ops: int) -> float:
+    """ops回実行した秒数を返す"""
+    gc.collect()
+    started = perf_counter()
+    for index in range(ops):
+        op(index)
+    return perf_counter() - started
+
+
+def _trace(op: Callable[[int], object], ops: int) -> Dict[str, float]:
+    """ops回実行したときに残ったメモリと、実行中のピークを返す"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        for index in range(ops):
+            op(index)
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        retained_blocks = sys.getallocatedblocks() - blocks
+    finally:
+        tracemalloc.stop()
+    return {
+        "retained_bytes_per_op": round((current - baseline) / ops, 1),
+        "retained_blocks_per_op": round(retained_blocks / ops, 2),
+        "peak_bytes": peak - baseline,
+    }
+
+
+def run_case(case: Case, env: _Environment, ops: int, traced_ops: int) -> Dict[str, object]:
+    """1ケースを計測する（時間とメモリはそれぞれ新しく組み立てた状態で計測する）"""
+    if case.bounded:
+        ops = min(ops, len(env.dataset.orders))
+        traced_ops = min(traced_ops, len(env.dataset.orders))
+    seconds = _time(case.build(env), ops)
+    result = {
+        "name": case.name,
+        "layer": case.layer,
+        "ops": ops,
+        "seconds": round(seconds, 4),
+        "ops_per_sec": round(ops / seconds, 1),
+        "us_per_op": round(seconds / ops * 1e6, 3),
+        "traced_ops": traced_ops,
+    }
+    result.update(_trace(case.build(env), traced_ops))
+    return result
+
+
+def run(orders: int = 1_000, seed: int = DEFAULT_SEED, ops: int = 20_000, traced_ops: int = 2_000,
+        store: str = "entity", only: Optional[str] = None) -> Dict[str, object]:
+    """全ケース（onlyを指定した場合は名前にその文字列を含むケース）を計測し、結果をJSON互換の辞書で返す"""
+    started = perf_counter()
+    dataset = generate(orders, seed)
+    generate_seconds = perf_counter() - started
+    env = _Environment(dataset, store)
+    results = [run_case(case, env, ops, traced_ops) for case in CASES if not only or only in case.name]
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "seed": seed,
+            "store": store,
+            "orders": len(dataset.orders),
+            "customers": len(dataset.customers),
+            "products": len(dataset.products),
+            "generate_seconds": round(generate_seconds, 2),
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", default="1k", help="1k / 100k / 1m または注文数")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--ops", type=int, default=20_000, help="時間を計測する実行回数")
+    parser.add_argument("--traced-ops", type=int, default=2_000, help="メモリを計測する実行回数")
+    parser.add_argument("--store", choices=sorted(STORES), default="entity")
+    parser.add_argument("--only", help="名前にこの文字列を含むケースだけを計測する")
+    parser.add_argument("--output", help="結果のJSONを書き出すファイル")
+    args = parser.parse_args()
+    report = run(resolve_scale(args.scale), args.seed, args.ops, args.traced_ops, args.store, args.only)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""注文読み取りのスループットのベンチマーク（集約からの変換 vs 読み取りモデル）
+
+顧客ごとに注文を用意し、顧客の注文一覧の取得を繰り返す。
+従来の経路（クエリリポジトリで集約を組み立て、_to_dtoで変換し、JSONに整形して合計を再計算）と、
+書き込み時に整形済みのサマリーを保持する読み取りモデルの経路を、メモリ内とSQLiteで比較する。
+
+    python -m benchmarks.order_read_model_benchmark --customers 50 --orders 20 --seconds 2
+"""
+import argparse
+import os
+import tempfile
+from time import perf_counter
+from uuid import uuid4
+
+from application.usecases.order_interactor import _to_dto
+from application.usecases.order_projection import project_order
+from domain.entities.order import Order, OrderItem
+from infrastructure.db.engine import dispose_engines, get_session_factory
+from infrastructure.read_models.in_memory_order_read_model import InMemoryOrderReadModel
+from infrastructure.read_models.sqlalchemy_order_read_model import SqlAlchemyOrderReadModel
+from infrastructure.repositories.in_memory_order_repository import (
+    InMemoryOrderCommandRepository,
+    InMemoryOrderQueryRepository,
+    InMemoryOrderStore
+)
+from infrastructure.repositories.sqlalchemy_order_repository import (
+    SqlAlchemyOrderCommandRepository,
+    SqlAlchemyOrderQueryRepository
+)
+from presentation.serializers.order_serializer import serialize_orders
+
+
+def _seed(command_repository, read_model, customers: int, orders: int):
+    """顧客ごとにorders件の注文を保存し、読み取りモデルにも投影する"""
+    customer_ids = [uuid4() for _ in range(customers)]
+    batch = []
+    for customer_id in customer_ids:
+        for _ in range(orders):
+            order = Order(customer_id=customer_id)
+            for _ in range(3):
+                order.add_item(OrderItem(product_id=uuid4(), quantity=2, price_per_unit=120.0))
+            batch.append(order)
+    command_repository.save_many(batch)
+    read_model.upsert([project_order(order) for order in batch])
+    return customer_ids
+
+
+def _measure(read, customer_ids, seconds: float) -> float:
+    """一覧取得の回数/秒を返す"""
+    done = 0
+    deadline = perf_counter() + seconds
+    while perf_counter() < deadline:
+        read(customer_ids[done % len(customer_ids)])
+        done += 1
+    return round(done / seconds, 1)
+
+
+def _compare(query_repository, read_model, customer_ids, seconds: float):
+    def legacy(customer_id):
+        return serialize_orders(_to_dto(order) for order in query_repository.find_all_by_customer_id(customer_id))
+
+    def projected(customer_id):
+        return [summary.data for summary in read_model.list_by_customer(customer_id)]
+
+    return {
+        "aggregate_to_dto": _measure(legacy, customer_ids, seconds),
+        "read_model": _measure(projected, customer_ids, seconds),
+    }
+
+
+def run(customers: int = 50, orders: int = 20, seconds: float = 2.0):
+    """バックエンドごとの一覧取得回数/秒を返す"""
+    store = InMemoryOrderStore()
+    read_model = InMemoryOrderReadModel()
+    customer_ids = _seed(InMemoryOrderCommandRepository(store), read_model, customers, orders)
+    results = {"memory": _compare(InMemoryOrderQueryRepository(store), read_model, customer_ids, seconds)}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session_factory = get_session_factory(f"sqlite:///{os.path.join(tmpdir, 'benchmark.db')}")
+        read_model = SqlAlchemyOrderReadModel(session_factory)
+        customer_ids = _seed(SqlAlchemyOrderCommandRepository(session_factory), read_model, customers, orders)
+        results["sqlite"] = _compare(SqlAlchemyOrderQueryRepository(session_factory), read_model, customer_ids, seconds)
+        dispose_engines()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--customers", type=int, default=50)
+    parser.add_argument("--orders", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+    for name, stats in run(args.customers, args.orders, args.seconds).items():
+        print(name, stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""注文のシリアライズのベンチマーク（辞書 + response_model vs 事前に組み立てたシリアライザー）
+
+従来の経路（プレゼンターで辞書を作り、FastAPIが response_model で検証し直してからJSONにする）と、
+シリアライザーでJSONのバイト列を直接作る経路の、注文1件・注文リストあたりの所要時間を比較する。
+
+    python -m benchmarks.order_serialization_benchmark --items 5 --repeat 20000
+"""
+import argparse
+import json
+from datetime import datetime
+from time import perf_counter
+from typing import List
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from application.interfaces.dto import OrderDTO, OrderItemDTO
+from presentation.controllers.order_controller import OrderListResponse, OrderResultResponse
+from presentation.serializers.order_serializer import serialize_order, serialize_orders
+from presentation.viewmodels.order_view_model import OrderViewModel
+
+
+def _legacy_to_dict(order_dto: OrderDTO) -> dict:
+    """変更前のプレゼンターの辞書への変換（比較用）"""
+    return {
+        "order_id": str(order_dto.id) if order_dto.id else None,
+        "customer_id": str(order_dto.customer_id) if order_dto.customer_id else None,
+        "items": [
+            {
+                "product_id": str(item.product_id),
+                "quantity": item.quantity,
+                "price_per_unit": item.price_per_unit,
+                "total_price": item.quantity * item.price_per_unit
+            }
+            for item in order_dto.items
+        ],
+        "status": order_dto.status,
+        "created_at": order_dto.created_at.isoformat() if order_dto.created_at else None,
+        "total_amount": order_dto.total_amount or sum(item.quantity * item.price_per_unit for item in order_dto.items)
+    }
+
+
+def _response_model_path(adapter: TypeAdapter, body) -> bytes:
+    """FastAPIが response_model を指定したルートの戻り値に行う処理（検証 → JSON互換の値 → JSONResponse）"""
+    validated = adapter.validate_python(body)
+    content = adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def _order(items: int) -> OrderDTO:
+    order_items = [OrderItemDTO(product_id=uuid4(), quantity=index + 1, price_per_unit=19.99) for index in range(items)]
+    return OrderDTO(id=uuid4(), customer_id=uuid4(), items=order_items, status="PENDING",
+                    created_at=datetime.now(), total_amount=sum(item.quantity * 19.99 for item in order_items))
+
+
+def _per_call_us(function, repeat: int) -> float:
+    started = perf_counter()
+    for _ in range(repeat):
+        function()
+    return round((perf_counter() - started) / repeat * 1e6, 2)
+
+
+def run(items: int = 5, repeat: int = 20000, list_size: int = 100):
+    """1件・リストあたりの所要時間[µs]を返す"""
+    order = _order(items)
+    orders: List[OrderDTO] = [_order(items) for _ in range(list_size)]
+    single_adapter = TypeAdapter(OrderResultResponse)
+    list_adapter = TypeAdapter(OrderListResponse)
+
+    def legacy_single():
+        return _response_model_path(single_adapter, {"success": True, "data": _legacy_to_dict(order)})
+
+    def compiled_single():
+        view_model = OrderViewModel()
+        view_model.set_data_json(serialize_order(order))
+        return view_model.to_json()
+
+    def legacy_list():
+        return _response_model_path(list_adapter, {"success": True, "data": [_legacy_to_dict(o) for o in orders]})
+
+    def compiled_list():
+        view_model = OrderViewModel()
+        view_model.set_data_json(serialize_orders(orders))
+        return view_model.to_json()
+
+    # response_model は値のないフィールド（error: null）を補う点だけが異なる
+    legacy_data = {key: value for key, value in json.loads(legacy_single())["data"].items() if value is not None}
+    assert legacy_data == json.loads(compiled_single())["data"]
+    list_repeat = max(repeat // list_size, 1)
+    return {
+        "single_order_us": {"response_model": _per_call_us(legacy_single, repeat),
+                            "compiled": _per_call_us(compiled_single, repeat)},
+        f"list_of_{list_size}_us": {"response_model": _per_call_us(legacy_list, list_repeat),
+                                    "compiled": _per_call_us(compiled_list, list_repeat)},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20000)
+    parser.add_argument("--list-size", type=int, default=100)
+    args = parser.parse_args()
+    for name, stats in run(args.items, args.repeat, args.list_size).items():
+        print(name, stats)
+
+
+if __name__ == "__main__":
+    main()
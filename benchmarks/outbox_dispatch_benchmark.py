@@ -0,0 +1,109 @@
+"""アウトボックス配信のベンチマーク（購読者の処理時間とリクエストの遅延）
+
+1件あたり --consumer-ms ミリ秒かかる購読者を想定し、注文作成の遅延を
+購読者をリクエスト内で呼ぶ場合（inline）と、アウトボックスに追加するだけの場合（outbox）で比較する。
+続けてワーカー数ごとに、溜まったイベントを配信し切るまでのスループットと最大遅延を計測する。
+
+    python -m benchmarks.outbox_dispatch_benchmark --orders 500 --consumer-ms 2
+"""
+import argparse
+import statistics
+import threading
+from time import perf_counter, sleep
+
+from application.interfaces.dto import OrderDTO, OrderItemDTO
+from application.usecases.order_interactor import OrderCommandInteractor
+from domain.entities.customer import Customer
+from domain.entities.product import Product
+from infrastructure.messaging.outbox_dispatcher import OutboxDispatcher
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderCommandRepository
+from infrastructure.repositories.in_memory_outbox_repository import InMemoryOutboxRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from presentation.presenters.order_presenter import OrderCommandPresenter
+
+
+def _create_orders(orders: int, consumer_ms: float, inline: bool):
+    """注文を作成し、(アウトボックス, 作成の遅延[ms]のリスト) を返す"""
+    outbox = InMemoryOutboxRepository()
+    customer_repository = InMemoryCustomerRepository()
+    product_repository = InMemoryProductRepository()
+    presenter = OrderCommandPresenter()
+    interactor = OrderCommandInteractor(
+        InMemoryOrderCommandRepository(outbox=outbox), customer_repository, product_repository, presenter, presenter
+    )
+    customer = customer_repository.save(Customer(name="ベンチマーク顧客", email="bench@example.com"))
+    product = product_repository.save(Product(name="ベンチマーク商品", price=100.0, stock_quantity=10**9))
+    order_dto = OrderDTO(customer_id=customer.id, items=[OrderItemDTO(product_id=product.id, quantity=1, price_per_unit=100.0)])
+
+    latencies = []
+    for _ in range(orders):
+        started = perf_counter()
+        interactor.create_order(order_dto)
+        if inline:
+            # 購読者の処理をリクエスト内で行う場合
+            sleep(consumer_ms / 1000)
+        latencies.append((perf_counter() - started) * 1000)
+    if inline:
+        outbox.mark_dispatched([message.id for message in outbox.fetch_pending(orders)])
+    return outbox, latencies
+
+
+def _latency_stats(latencies):
+    ordered = sorted(latencies)
+    return {
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p99_ms": round(ordered[int(len(ordered) * 0.99) - 1], 3),
+    }
+
+
+def _drain(outbox: InMemoryOutboxRepository, workers: int, consumer_ms: float, orders: int):
+    """溜まったイベントを配信し切るまでの時間と配信の指標を返す"""
+    done = threading.Event()
+    received = []
+    lock = threading.Lock()
+
+    def consumer(message):
+        sleep(consumer_ms / 1000)
+        with lock:
+            received.append(message.id)
+            if len(received) == orders:
+                done.set()
+
+    dispatcher = OutboxDispatcher(outbox, max_workers=workers, batch_size=100, poll_interval=0.01)
+    dispatcher.subscribe("OrderCreated", consumer)
+    started = perf_counter()
+    dispatcher.start()
+    done.wait(600)
+    elapsed = perf_counter() - started
+    dispatcher.stop()
+    metrics = dispatcher.metrics()
+    return {
+        "events_per_second": round(orders / elapsed, 1),
+        "max_lag_ms": metrics["last_dispatch_lag_ms"],
+        "batches": metrics["batches_total"],
+    }
+
+
+def run(orders: int = 500, consumer_ms: float = 2.0, workers=(1, 4, 8)):
+    """作成の遅延と配信のスループットを返す"""
+    _, inline_latencies = _create_orders(orders, consumer_ms, inline=True)
+    results = {"create_inline": _latency_stats(inline_latencies)}
+    for count in workers:
+        outbox, latencies = _create_orders(orders, consumer_ms, inline=False)
+        results.setdefault("create_outbox", _latency_stats(latencies))
+        results[f"dispatch_workers_{count}"] = _drain(outbox, count, consumer_ms, orders)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--consumer-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    for name, stats in run(args.orders, args.consumer_ms).items():
+        print(name, stats)
+
+
+if __name__ == "__main__":
+    main()
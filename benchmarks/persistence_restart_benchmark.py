@@ -0,0 +1,92 @@
+"""スナップショットとジャーナルからの再起動時間のベンチマーク
+
+data_generator で生成した注文・顧客・製品を永続化付きのメモリ内リポジトリに書き込み、
+- 書き込み: fsyncの方針ごとのジャーナルへの追記を含む save 1回あたりの時間
+- スナップショット: 全件のスナップショットを書く時間とファイルサイズ
+- 復元: 新しいリポジトリにスナップショット（と --tail 件のジャーナル）を読み込む時間と、
+  続けて行う読み取りモデルの再構築の時間
+を計測する。10M件の時間は計測した件数からの線形な見積もり。
+
+    python -m benchmarks.persistence_restart_benchmark --scale 1m --store compact
+"""
+import argparse
+import json
+import tempfile
+from time import perf_counter
+from typing import Any, Dict
+
+from application.usecases.order_projection import project_order
+from benchmarks.data_generator import DEFAULT_SEED, generate, resolve_scale
+from infrastructure.persistence.persistence_manager import PersistenceManager
+from infrastructure.read_models.in_memory_order_read_model import InMemoryOrderReadModel
+from infrastructure.repositories.compact_order_store import CompactOrderStore
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderStore
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+
+_TARGET_ORDERS = 10_000_000
+
+
+def _manager(directory: str, store_kind: str, fsync: str) -> PersistenceManager:
+    store = CompactOrderStore() if store_kind == "compact" else InMemoryOrderStore()
+    return PersistenceManager(directory, store, InMemoryCustomerRepository(), InMemoryProductRepository(),
+                              fsync=fsync)
+
+
+def run(orders: int, store_kind: str, fsync: str, tail: int, seed: int) -> Dict[str, Any]:
+    dataset = generate(orders, seed)
+    results: Dict[str, Any] = {"orders": orders, "store": store_kind, "fsync": fsync, "tail": tail}
+    with tempfile.TemporaryDirectory() as directory:
+        manager = _manager(directory, store_kind, fsync).open()
+        for customer in dataset.customers:
+            manager.customer_repository.save(customer)
+        for product in dataset.products:
+            manager.product_repository.save(product)
+
+        started = perf_counter()
+        bulk = dataset.orders[:len(dataset.orders) - tail]
+        for order in bulk:
+            manager.order_store.put(order)
+        manager.journal.sync()
+        results["write_us_per_order"] = round((perf_counter() - started) / max(len(bulk), 1) * 1e6, 2)
+
+        started = perf_counter()
+        results["snapshot_records"] = manager.compact()
+        results["snapshot_seconds"] = round(perf_counter() - started, 3)
+        for order in dataset.orders[len(bulk):]:
+            manager.order_store.put(order)
+        manager.journal.close()
+        del dataset, bulk, manager
+
+        restored = _manager(directory, store_kind, fsync)
+        started = perf_counter()
+        restored.restore()
+        results["restore_seconds"] = round(perf_counter() - started, 3)
+        results["restored"] = restored.restored_counts
+
+        started = perf_counter()
+        InMemoryOrderReadModel().upsert([project_order(order) for order in restored.order_store.all()])
+        results["read_model_rebuild_seconds"] = round(perf_counter() - started, 3)
+
+    scale = _TARGET_ORDERS / orders
+    results["estimated_10m"] = {
+        "restore_seconds": round(results["restore_seconds"] * scale, 1),
+        "read_model_rebuild_seconds": round(results["read_model_rebuild_seconds"] * scale, 1),
+    }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", default="100k", help="1k / 100k / 1m または件数")
+    parser.add_argument("--store", choices=("entity", "compact"), default="compact")
+    parser.add_argument("--fsync", choices=("always", "interval", "never"), default="interval")
+    parser.add_argument("--tail", type=int, default=10_000, help="スナップショット後にジャーナルだけに書く件数")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+    orders = resolve_scale(args.scale)
+    print(json.dumps(run(orders, args.store, args.fsync, min(args.tail, orders), args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""製品カタログの読み取りのベンチマーク
+
+製品一覧の1ページを取得するのにかかる時間を、リポジトリの全件取得と並べ替え（カタログを使わない場合）、
+カタログのスナップショットからの取得、キャッシュ済みレスポンスの取得で比較する。
+在庫の引き当て1回の後に、スナップショットを差し替えるのにかかる時間も計測する。
+
+    python -m benchmarks.product_catalog_benchmark --products 100000
+"""
+import argparse
+from time import perf_counter
+
+from application.usecases.product_interactor import ProductQueryInteractor
+from domain.entities.product import Product
+from infrastructure.cache.product_page_cache import ProductPageCache
+from infrastructure.read_models.product_catalog import ProductCatalog
+from infrastructure.repositories.catalog_tracking_product_repository import CatalogTrackingProductRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from presentation.presenters.product_presenter import ProductQueryPresenter
+
+
+def _ms(started: float, repeat: int = 1) -> float:
+    return round((perf_counter() - started) * 1000 / repeat, 3)
+
+
+def run(count: int, page_size: int, repeat: int):
+    """ページ取得とスナップショットの差し替えの所要時間（ミリ秒）を返す"""
+    raw = InMemoryProductRepository()
+    raw.save_many(Product(name=f"product-{i:07d}", price=100.0, stock_quantity=10) for i in range(count))
+    catalog = ProductCatalog(raw)
+    repository = CatalogTrackingProductRepository(raw, catalog)
+    presenter = ProductQueryPresenter()
+    interactor = ProductQueryInteractor(catalog, presenter, presenter)
+    cache = ProductPageCache()
+    results = {"products": count}
+
+    started = perf_counter()
+    for _ in range(repeat):
+        sorted(raw.find_all(), key=lambda p: (p.name.lower(), p.id))[:page_size]
+    results["repository_sort_ms"] = _ms(started, repeat)
+
+    started = perf_counter()
+    catalog.snapshot()
+    results["full_build_ms"] = _ms(started)
+
+    started = perf_counter()
+    for _ in range(repeat):
+        interactor.list_products(page_size)
+        presenter.view_model.to_json()
+    results["snapshot_page_ms"] = _ms(started, repeat)
+
+    version = catalog.version()
+    cache.put(version, "page", presenter.view_model.to_json())
+    started = perf_counter()
+    for _ in range(repeat):
+        cache.get(version, "page")
+    results["cached_page_ms"] = _ms(started, repeat)
+
+    product = catalog.snapshot().products[count // 2]
+    repository.reserve_stock({product.id: 1})
+    started = perf_counter()
+    catalog.snapshot()
+    results["patch_ms"] = _ms(started)
+    assert catalog.snapshot().by_id[product.id].stock_quantity == 9
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    row = run(args.products, args.page_size, args.repeat)
+    for key, value in row.items():
+        print(f"{key:>20} {value:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""在庫確保のスループットのベンチマーク（人気商品への集中）
+
+半数のスレッドが1つの人気商品を、残りのスレッドがそれぞれ別の製品を確保し続ける。
+ストライプロック（デフォルト）と、ストライプ数1（全製品で1つのロック）を比較し、
+人気商品への集中が無関係な製品の確保をどれだけ遅らせるかを確認する。
+SQLiteのバックエンドでは条件付きUPDATEによる確保の確保数/秒も計測する。
+
+    python -m benchmarks.stock_reservation_benchmark --threads 8 --seconds 2
+"""
+import argparse
+import os
+import tempfile
+import threading
+from time import perf_counter
+
+from domain.entities.product import Product
+from domain.exceptions import InsufficientStockError
+from infrastructure.db.engine import dispose_engines, get_session_factory
+from infrastructure.repositories.in_memory_product_repository import STOCK_LOCK_STRIPES, InMemoryProductRepository
+from infrastructure.repositories.sqlalchemy_product_repository import SqlAlchemyProductRepository
+
+
+def _measure(repository, threads: int, seconds: float):
+    """人気商品と無関係な製品それぞれの確保数/秒を返す"""
+    hot = repository.save(Product(name="人気商品", price=100.0, stock_quantity=10**9))
+    others = [repository.save(Product(name=f"製品{i}", price=100.0, stock_quantity=10**9)) for i in range(threads)]
+    counts = {"hot": 0, "others": 0}
+    counts_lock = threading.Lock()
+    barrier = threading.Barrier(threads)
+
+    def worker(index: int):
+        product = hot if index % 2 == 0 else others[index]
+        key = "hot" if product is hot else "others"
+        done = 0
+        barrier.wait()
+        deadline = perf_counter() + seconds
+        while perf_counter() < deadline:
+            try:
+                repository.reserve_stock({product.id: 1})
+            except InsufficientStockError:
+                break
+            done += 1
+        with counts_lock:
+            counts[key] += done
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return {key: round(count / seconds, 1) for key, count in counts.items()}
+
+
+def run(threads: int = 8, seconds: float = 2.0):
+    """バックエンドごとの確保数/秒を返す"""
+    results = {
+        f"memory_striped_{STOCK_LOCK_STRIPES}": _measure(InMemoryProductRepository(), threads, seconds),
+        "memory_single_lock": _measure(InMemoryProductRepository(lock_stripes=1), threads, seconds),
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session_factory = get_session_factory(f"sqlite:///{os.path.join(tmpdir, 'benchmark.db')}")
+        results["sqlite_conditional_update"] = _measure(SqlAlchemyProductRepository(session_factory), threads, seconds)
+        dispose_engines()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+    for name, stats in run(args.threads, args.seconds).items():
+        print(name, stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+from time import perf_counter
+from typing import Any, Dict
+from uuid import uuid4
+
+from application.usecases.order_projection import project_order
+from config import database
+from config.environment import env
+from infrastructure.cache.order_response_cache import OrderResponseCache
+from infrastructure.cache.product_page_cache import ProductPageCache
+from infrastructure.db.engine import dispose_engines
+from infrastructure.metrics.instrumentation import instrument, unwrap
+from infrastructure.messaging.outbox_dispatcher import OutboxDispatcher
+from infrastructure.read_models.order_projection_repairer import OrderProjectionRepairer
+from infrastructure.repositories.catalog_tracking_product_repository import (
+    AsyncCatalogTrackingProductRepository,
+    CatalogTrackingProductRepository
+)
+
+# 呼び出しの処理時間を計測するリポジトリ（アウトボックスは配信処理が直接保持するため対象外）
+INSTRUMENTED_REPOSITORIES = (
+    "customer_repository", "product_repository", "order_command_repository", "order_query_repository",
+    "order_read_model", "order_analytics", "order_history",
+    "async_customer_repository", "async_product_repository", "async_order_command_repository",
+    "async_order_query_repository", "async_order_read_model",
+)
+
+class Container:
+    """アプリケーションスコープの依存関係コンテナ
+
+    リポジトリやエンジンなどの長寿命オブジェクトを起動時に一度だけ生成して保持する。
+    解決はキーによる辞書参照のみで行う。
+    """
+
+    def __init__(self, db_url: str | None = None):
+        self.db_url = db_url if db_url is not None else env.DATABASE_URL
+        self._instances: Dict[str, Any] = {}
+        self.wiring_seconds: float = 0.0
+        self.warm_up_seconds: float = 0.0
+
+    def register(self, name: str, instance: Any) -> None:
+        """コンポーネントを登録する"""
+        self._instances[name] = instance
+
+    def resolve(self, name: str) -> Any:
+        """登録済みのコンポーネントを取得する"""
+        return self._instances[name]
+
+    def wire(self) -> "Container":
+        """リポジトリを生成して登録する"""
+        started = perf_counter()
+        workers = int(env.WEB_CONCURRENCY)
+        if workers > 1 and not self.db_url:
+            # メモリ内リポジトリはワーカープロセスごとに別のデータになる
+            raise RuntimeError(
+                f"WEB_CONCURRENCY={workers} requires a shared database "
+                "(e.g. DATABASE_DIALECT=sqlite DATABASE_NAME=/path/to/app.db)"
+            )
+        self.register("customer_repository", database.get_customer_repository(self.db_url))
+        self.register("product_repository", database.get_product_repository(self.db_url))
+        self.register("order_command_repository", database.get_order_command_repository(self.db_url))
+        self.register("order_query_repository", database.get_order_query_repository(self.db_url))
+        self.register("order_read_model", database.get_order_read_model(self.db_url))
+        # メモリ内リポジトリの永続化（PERSISTENCE_DIR 指定時のみ、それ以外はNone）
+        self.register("persistence", database.get_persistence(self.db_url))
+        # 売上集計（メモリ内リポジトリ使用時のみ、それ以外はNone）
+        self.register("order_analytics", database.get_order_analytics(self.db_url))
+        # 過去の時点の注文の取得（ORDER_STORE=event_sourced の場合のみ、それ以外はNone）
+        self.register("order_history", database.get_order_history(self.db_url))
+        # 注文取得レスポンスのキャッシュ（プロセスごとに保持し、書き込み時に無効化する）
+        # 他のワーカーの書き込みでは無効化されないため、複数ワーカーでは保持しない（上限0件）
+        order_cache_size = int(env.ORDER_CACHE_SIZE) if workers == 1 else 0
+        self.register("order_response_cache", OrderResponseCache(max_entries=order_cache_size))
+        # 製品の読み取り用の版付きカタログと、その版ごとのシリアライズ済みレスポンス
+        self.register("product_catalog", database.get_product_catalog(self.db_url))
+        self.register("product_page_cache", ProductPageCache(max_entries=int(env.PRODUCT_PAGE_CACHE_SIZE)))
+        # 注文作成の Idempotency-Key ごとの処理結果
+        self.register("idempotency_store", database.get_idempotency_store(self.db_url))
+        outbox_repository = database.get_outbox_repository(self.db_url)
+        self.register("outbox_repository", outbox_repository)
+        self.register("outbox_dispatcher", OutboxDispatcher(
+            outbox_repository,
+            max_workers=int(env.OUTBOX_WORKERS),
+            batch_size=int(env.OUTBOX_BATCH_SIZE),
+            poll_interval=float(env.OUTBOX_POLL_INTERVAL),
+            max_attempts=int(env.OUTBOX_MAX_ATTEMPTS),
+            lease_seconds=float(env.OUTBOX_LEASE_SECONDS)
+        ))
+        # 非同期経路（/api/async）用のリポジトリ
+        self.register("async_customer_repository", database.get_async_customer_repository(self.db_url))
+        self.register("async_product_repository", database.get_async_product_repository(self.db_url))
+        self.register("async_order_command_repository", database.get_async_order_command_repository(self.db_url))
+        self.register("async_order_query_repository", database.get_async_order_query_repository(self.db_url))
+        self.register("async_order_read_model", database.get_async_order_read_model(self.db_url))
+        # 製品の書き込み（在庫の確保・解放を含む）のたびにカタログの版を上げる
+        catalog = self.resolve("product_catalog")
+        self._instances["product_repository"] = CatalogTrackingProductRepository(
+            self._instances["product_repository"], catalog
+        )
+        self._instances["async_product_repository"] = AsyncCatalogTrackingProductRepository(
+            self._instances["async_product_repository"], catalog
+        )
+        # 計測が有効な場合はリポジトリをプロキシで包む（無効な場合はそのまま）
+        for name in INSTRUMENTED_REPOSITORIES:
+            self._instances[name] = instrument(self._instances[name], "repository")
+        # 注文の書き込み後に読み取りモデルへの反映に失敗した注文を、書き込み側から読み直して反映し直す
+        self.register("order_projection_repairer", OrderProjectionRepairer(
+            self.resolve("order_query_repository"), self.resolve("order_read_model")
+        ))
+        self.wiring_seconds = perf_counter() - started
+        return self
+
+    def warm_up(self) -> "Container":
+        """接続プールやORMのマッパーを最初のリクエスト前に初期化する"""
+        started = perf_counter()
+        # 保存済みの注文・顧客・製品を復元してから読み取りモデルを作り直す
+        persistence = self.resolve("persistence")
+        if persistence is not None:
+            persistence.open()
+            self.resolve("product_catalog").mark_changed()
+        missing_id = uuid4()
+        self.resolve("customer_repository").find_by_id(missing_id)
+        self.resolve("product_repository").find_by_id(missing_id)
+        self.resolve("order_query_repository").find_by_id(missing_id)
+        self.rebuild_order_read_model()
+        self.warm_up_seconds = perf_counter() - started
+        return self
+
+    def rebuild_order_read_model(self) -> int:
+        """読み取りモデルが空で注文が存在する場合に、注文から読み取りモデルを作り直す
+
+        読み取りモデル導入前のデータベースや、プロセス内にしかない読み取りモデルの初回起動に対応する。
+        作り直した件数を返す。
+        """
+        read_model = self.resolve("order_read_model")
+        if read_model.count() > 0:
+            return 0
+        summaries = [project_order(order) for order in self.resolve("order_query_repository").find_all()]
+        read_model.upsert(summaries)
+        return len(summaries)
+
+    def start(self) -> "Container":
+        """バックグラウンド処理（アウトボックスの配信、読み取りモデルの修復、永続化のスナップショット）を開始する"""
+        self.resolve("outbox_dispatcher").start()
+        self.resolve("order_projection_repairer").start()
+        if self.resolve("persistence") is not None:
+            self.resolve("persistence").start()
+        return self
+
+    def report(self) -> Dict[str, Any]:
+        """コンテナの構成と初期化時間、アウトボックスの配信状況を返す"""
+        return {
+            "components": {name: type(unwrap(instance)).__name__ for name, instance in self._instances.items()},
+            "wiring_ms": round(self.wiring_seconds * 1000, 3),
+            "warm_up_ms": round(self.warm_up_seconds * 1000, 3),
+            "outbox": self.resolve("outbox_dispatcher").metrics() if "outbox_dispatcher" in self._instances else None,
+            "order_projection": self.resolve("order_projection_repairer").stats() if "order_projection_repairer" in self._instances else None,
+            "order_cache": self.resolve("order_response_cache").stats() if "order_response_cache" in self._instances else None,
+            "idempotency": self.resolve("idempotency_store").stats() if "idempotency_store" in self._instances else None,
+            "product_catalog": {
+                **self.resolve("product_catalog").stats(),
+                "page_cache": self.resolve("product_page_cache").stats(),
+            } if "product_catalog" in self._instances else None,
+            "persistence": self._instances["persistence"].stats() if self._instances.get("persistence") is not None else None,
+        }
+
+    def close(self) -> None:
+        """保持しているリソースを解放する"""
+        if "outbox_dispatcher" in self._instances:
+            self.resolve("outbox_dispatcher").stop()
+        if "order_projection_repairer" in self._instances:
+            self.resolve("order_projection_repairer").stop()
+        if self._instances.get("persistence") is not None:
+            self.resolve("persistence").close()
+        if self.db_url:
+            dispose_engines()
+        self._instances.clear()
+
+    async def aclose(self) -> None:
+        """非同期エンジンを含めて保持しているリソースを解放する"""
+        if self.db_url:
+            try:
+                from infrastructure.db.async_engine import dispose_async_engines
+            except ImportError:
+                pass
+            else:
+                await dispose_async_engines()
+        self.close()
+
+
+def create_container(db_url: str | None = None) -> Container:
+    """構成済みでウォームアップ済みのコンテナを作成する"""
+    return Container(db_url).wire().warm_up()
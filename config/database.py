@@ -1,15 +1,70 @@
+from application.interfaces.idempotency_store import IdempotencyStoreInterface
+from application.interfaces.order_analytics import OrderAnalyticsInterface
+from application.interfaces.order_history import OrderHistoryInterface
+from application.interfaces.order_read_model import AsyncOrderReadModelInterface, OrderReadModelInterface
+from application.interfaces.product_catalog import ProductCatalogInterface
+from domain.repositories.customer_repository import AsyncCustomerRepository, CustomerRepository
 from domain.repositories.order_repository import (
+    AsyncOrderCommandRepositoryInterface,
+    AsyncOrderQueryRepositoryInterface,
     OrderCommandRepositoryInterface,
     OrderQueryRepositoryInterface
 )
+from domain.repositories.outbox_repository import OutboxRepositoryInterface
+from domain.repositories.product_repository import AsyncProductRepository, ProductRepository
 from config.environment import env
+from infrastructure.cache.idempotency_store import InMemoryIdempotencyStore
+from infrastructure.cache.sqlalchemy_idempotency_store import SqlAlchemyIdempotencyStore
+from infrastructure.repositories.async_repository_adapters import (
+    AsyncCustomerRepositoryAdapter,
+    AsyncOrderCommandRepositoryAdapter,
+    AsyncOrderQueryRepositoryAdapter,
+    AsyncProductRepositoryAdapter
+)
+from infrastructure.repositories.compact_order_store import CompactOrderStore
+from infrastructure.repositories.event_sourced_order_repository import (
+    EventSourcedOrderCommandRepository,
+    EventSourcedOrderHistory,
+    InMemoryOrderEventStore
+)
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
 from infrastructure.repositories.in_memory_order_repository import (
     InMemoryOrderCommandRepository,
-    InMemoryOrderQueryRepository
+    InMemoryOrderQueryRepository,
+    InMemoryOrderStore
+)
+from infrastructure.repositories.in_memory_outbox_repository import InMemoryOutboxRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from infrastructure.db.engine import get_session_factory
+from infrastructure.persistence.persistence_manager import PersistenceManager
+from infrastructure.read_models.async_order_read_model_adapter import AsyncOrderReadModelAdapter
+from infrastructure.read_models.in_memory_order_read_model import InMemoryOrderReadModel
+from infrastructure.read_models.product_catalog import ProductCatalog
+from infrastructure.read_models.sqlalchemy_order_read_model import SqlAlchemyOrderReadModel
+from infrastructure.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from infrastructure.repositories.sqlalchemy_order_repository import (
+    SqlAlchemyOrderCommandRepository,
+    SqlAlchemyOrderQueryRepository
 )
+from infrastructure.repositories.sqlalchemy_outbox_repository import SqlAlchemyOutboxRepository
+from infrastructure.repositories.sqlalchemy_product_repository import SqlAlchemyProductRepository
 
-# 共有データストアを作成（本来はCQRSではコマンドとクエリで別々のデータストアを使用することが多い）
-_order_store = {}
+# 共有データストアを作成（注文の読み取りは別の読み取りモデルが担い、コマンド側の書き込み時に更新される）
+# 大量の注文を保持する場合は ORDER_STORE=compact でバイト列に詰めて格納する
+# ORDER_STORE=event_sourced の場合、_order_store はイベントストリームから更新される最新の状態（検索用）になる
+_order_store = CompactOrderStore() if env.ORDER_STORE in ("compact", "event_sourced") else InMemoryOrderStore()
+_order_events = (InMemoryOrderEventStore(_order_store, snapshot_every=int(env.ORDER_SNAPSHOT_EVERY))
+                 if env.ORDER_STORE == "event_sourced" else None)
+_outbox_repository = InMemoryOutboxRepository()
+_order_read_model = InMemoryOrderReadModel()
+_customer_repository = InMemoryCustomerRepository()
+_product_repository = InMemoryProductRepository()
+# 製品の読み取り用の版付きカタログ（メモリ内の製品はこのプロセスからしか書き込まれないため有効期限を設けない）
+_product_catalog = ProductCatalog(_product_repository)
+# 注文明細の列指向ミラー（売上集計用、最初に必要になった時点で作成する）
+_order_lines = None
+# スナップショットとジャーナルによる永続化（PERSISTENCE_DIR を指定した場合のみ作成する）
+_persistence = None
 
 def get_order_command_repository(db_url: str | None = None) -> OrderCommandRepositoryInterface:
     """注文コマンドリポジトリのインスタンスを取得する
@@ -25,10 +80,13 @@ def get_order_command_repository(db_url: str | None = None) -> OrderCommandRepos
 
     # コマンド用のデータストア（書き込み操作用）
     # 実際のプロダクションでは、書き込み用に最適化されたDBを使用する
-    print(f"Connecting to Command database at {db_url}")
-    repo = InMemoryOrderCommandRepository()
-    repo.orders = _order_store
-    return repo
+    if db_url:
+        print(f"Connecting to Command database at {db_url}")
+        return SqlAlchemyOrderCommandRepository(get_session_factory(db_url))
+
+    if _order_events is not None:
+        return EventSourcedOrderCommandRepository(_order_events, _outbox_repository, _get_order_lines())
+    return InMemoryOrderCommandRepository(_order_store, _outbox_repository, _get_order_lines())
 
 
 def get_order_query_repository(db_url: str | None = None) -> OrderQueryRepositoryInterface:
@@ -45,7 +103,332 @@ def get_order_query_repository(db_url: str | None = None) -> OrderQueryRepositor
 
     # クエリ用のデータストア（読み取り操作用）
     # 実際のプロダクションでは、読み取り用に最適化されたDBを使用する
-    print(f"Connecting to Query database at {db_url}")
-    repo = InMemoryOrderQueryRepository()
-    repo.orders = _order_store
-    return repo
\ No newline at end of file
+    if db_url:
+        print(f"Connecting to Query database at {db_url}")
+        return SqlAlchemyOrderQueryRepository(get_session_factory(db_url))
+
+    return InMemoryOrderQueryRepository(_order_store)
+
+
+def get_outbox_repository(db_url: str | None = None) -> OutboxRepositoryInterface:
+    """アウトボックスのリポジトリのインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        OutboxRepositoryInterface: アウトボックスのリポジトリのインスタンス
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    # 注文コマンドリポジトリが書き込むのと同じアウトボックスを参照する
+    if db_url:
+        return SqlAlchemyOutboxRepository(get_session_factory(db_url))
+
+    return _outbox_repository
+
+
+def get_order_read_model(db_url: str | None = None) -> OrderReadModelInterface:
+    """注文の読み取りモデルのインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        OrderReadModelInterface: 読み取りモデルのインスタンス
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    # 複数のプロセスから同じ内容を参照できるよう、DBがあればorder_summariesテーブルを使う
+    if db_url:
+        return SqlAlchemyOrderReadModel(get_session_factory(db_url))
+
+    return _order_read_model
+
+
+def _get_order_lines():
+    """注文明細の列指向ミラーを取得する（NumPyが使えない場合はNone）"""
+    global _order_lines
+    if _order_lines is None:
+        try:
+            # NumPyは売上集計にだけ使うため、必要になった時点で読み込む
+            from infrastructure.analytics.order_line_columns import OrderLineColumns
+        except ImportError as e:
+            print(f"Order analytics unavailable: {e}")
+            return None
+        _order_lines = OrderLineColumns()
+    return _order_lines
+
+
+def get_order_analytics(db_url: str | None = None) -> OrderAnalyticsInterface | None:
+    """注文明細の売上集計のインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        OrderAnalyticsInterface | None: 売上集計のインスタンス（メモリ内リポジトリ以外では None）
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    # 列指向ミラーはメモリ内の注文コマンドリポジトリの書き込みからのみ更新される
+    if db_url:
+        return None
+
+    order_lines = _get_order_lines()
+    if order_lines is None:
+        return None
+    from infrastructure.analytics.columnar_order_analytics import ColumnarOrderAnalytics
+    return ColumnarOrderAnalytics(order_lines)
+
+
+def get_order_history(db_url: str | None = None) -> OrderHistoryInterface | None:
+    """過去の時点の注文の取得のインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        OrderHistoryInterface | None: 履歴の取得のインスタンス（ORDER_STORE=event_sourced 以外では None）
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    if db_url or _order_events is None:
+        return None
+
+    return EventSourcedOrderHistory(_order_events)
+
+
+def get_idempotency_store(db_url: str | None = None) -> IdempotencyStoreInterface:
+    """Idempotency-Key の処理結果のストアのインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        IdempotencyStoreInterface: ストアのインスタンス（DB使用時に IDEMPOTENCY_STORE=database か WEB_CONCURRENCY が2以上ならテーブル、それ以外はメモリ内）
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    # 複数のワーカープロセスで同じキーを共有する場合はテーブルを使う
+    if db_url and (env.IDEMPOTENCY_STORE == "database" or int(env.WEB_CONCURRENCY) > 1):
+        return SqlAlchemyIdempotencyStore(
+            get_session_factory(db_url),
+            ttl_seconds=float(env.IDEMPOTENCY_TTL_SECONDS),
+            wait_seconds=float(env.IDEMPOTENCY_WAIT_SECONDS)
+        )
+
+    return InMemoryIdempotencyStore(
+        max_keys=int(env.IDEMPOTENCY_MAX_KEYS),
+        ttl_seconds=float(env.IDEMPOTENCY_TTL_SECONDS),
+        wait_seconds=float(env.IDEMPOTENCY_WAIT_SECONDS)
+    )
+
+
+def get_customer_repository(db_url: str | None = None) -> CustomerRepository:
+    """顧客リポジトリのインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        CustomerRepository: 顧客リポジトリのインスタンス
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    if db_url:
+        return SqlAlchemyCustomerRepository(get_session_factory(db_url))
+
+    # メールアドレスのインデックスごと共有するため、リポジトリ自体を共有する
+    return _customer_repository
+
+
+def get_product_repository(db_url: str | None = None) -> ProductRepository:
+    """製品リポジトリのインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        ProductRepository: 製品リポジトリのインスタンス
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    if db_url:
+        return SqlAlchemyProductRepository(get_session_factory(db_url))
+
+    return _product_repository
+
+
+def get_product_catalog(db_url: str | None = None) -> ProductCatalogInterface:
+    """製品カタログのインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        ProductCatalogInterface: 製品カタログのインスタンス
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    if db_url:
+        # 他のプロセスの書き込みはこのプロセスの版に反映されないため、一定時間ごとに全件から作り直す
+        return ProductCatalog(
+            SqlAlchemyProductRepository(get_session_factory(db_url)),
+            max_age_seconds=float(env.PRODUCT_CATALOG_MAX_AGE_SECONDS)
+        )
+
+    return _product_catalog
+
+
+def get_persistence(db_url: str | None = None) -> PersistenceManager | None:
+    """メモリ内リポジトリの永続化のインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        PersistenceManager | None: 永続化のインスタンス（DB使用時や PERSISTENCE_DIR が未指定の場合は None）
+    """
+    global _persistence
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    # ジャーナルは最新の状態だけを書くため、イベントストリームを保持する構成では使わない
+    if db_url or not env.PERSISTENCE_DIR or _order_events is not None:
+        return None
+
+    # 共有データストアと同じくプロセスに1つだけ作成し、復元も1度だけ行う
+    if _persistence is None:
+        _persistence = PersistenceManager(
+            env.PERSISTENCE_DIR,
+            _order_store,
+            _customer_repository,
+            _product_repository,
+            order_lines=_get_order_lines(),
+            fsync=env.PERSISTENCE_FSYNC,
+            fsync_interval=float(env.PERSISTENCE_FSYNC_INTERVAL),
+            snapshot_interval=float(env.PERSISTENCE_SNAPSHOT_INTERVAL),
+            compact_log_bytes=int(env.PERSISTENCE_COMPACT_LOG_BYTES)
+        )
+    return _persistence
+
+
+def _get_async_session_factory(db_url: str):
+    """非同期セッションファクトリを取得する（非同期ドライバーが使えない場合はNone）"""
+    try:
+        # asyncio拡張と非同期ドライバーは任意の依存関係のため、必要になった時点で読み込む
+        from infrastructure.db.async_engine import get_async_session_factory
+        return get_async_session_factory(db_url)
+    except (ImportError, ValueError) as e:
+        print(f"Async engine unavailable, wrapping sync repositories instead: {e}")
+        return None
+
+
+def get_async_order_command_repository(db_url: str | None = None) -> AsyncOrderCommandRepositoryInterface:
+    """非同期の注文コマンドリポジトリのインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        AsyncOrderCommandRepositoryInterface: 非同期コマンドリポジトリのインスタンス
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    session_factory = _get_async_session_factory(db_url) if db_url else None
+    if session_factory is not None:
+        from infrastructure.repositories.async_sqlalchemy_repositories import AsyncSqlAlchemyOrderCommandRepository
+        return AsyncSqlAlchemyOrderCommandRepository(session_factory)
+
+    # 同期経路と同じデータを参照するため、同期リポジトリを包む
+    return AsyncOrderCommandRepositoryAdapter(get_order_command_repository(db_url))
+
+
+def get_async_order_query_repository(db_url: str | None = None) -> AsyncOrderQueryRepositoryInterface:
+    """非同期の注文クエリリポジトリのインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        AsyncOrderQueryRepositoryInterface: 非同期クエリリポジトリのインスタンス
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    session_factory = _get_async_session_factory(db_url) if db_url else None
+    if session_factory is not None:
+        from infrastructure.repositories.async_sqlalchemy_repositories import AsyncSqlAlchemyOrderQueryRepository
+        return AsyncSqlAlchemyOrderQueryRepository(session_factory)
+
+    return AsyncOrderQueryRepositoryAdapter(get_order_query_repository(db_url))
+
+
+def get_async_customer_repository(db_url: str | None = None) -> AsyncCustomerRepository:
+    """非同期の顧客リポジトリのインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        AsyncCustomerRepository: 非同期顧客リポジトリのインスタンス
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    session_factory = _get_async_session_factory(db_url) if db_url else None
+    if session_factory is not None:
+        from infrastructure.repositories.async_sqlalchemy_repositories import AsyncSqlAlchemyCustomerRepository
+        return AsyncSqlAlchemyCustomerRepository(session_factory)
+
+    return AsyncCustomerRepositoryAdapter(get_customer_repository(db_url))
+
+
+def get_async_product_repository(db_url: str | None = None) -> AsyncProductRepository:
+    """非同期の製品リポジトリのインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        AsyncProductRepository: 非同期製品リポジトリのインスタンス
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    session_factory = _get_async_session_factory(db_url) if db_url else None
+    if session_factory is not None:
+        from infrastructure.repositories.async_sqlalchemy_repositories import AsyncSqlAlchemyProductRepository
+        return AsyncSqlAlchemyProductRepository(session_factory)
+
+    return AsyncProductRepositoryAdapter(get_product_repository(db_url))
+
+
+def get_async_order_read_model(db_url: str | None = None) -> AsyncOrderReadModelInterface:
+    """非同期の注文読み取りモデルのインスタンスを取得する
+
+    Args:
+        db_url (str | None, optional): データベースURL. Defaults to None.
+
+    Returns:
+        AsyncOrderReadModelInterface: 非同期読み取りモデルのインスタンス
+    """
+    if db_url is None:
+        db_url = env.DATABASE_URL
+
+    session_factory = _get_async_session_factory(db_url) if db_url else None
+    if session_factory is not None:
+        from infrastructure.read_models.async_sqlalchemy_order_read_model import AsyncSqlAlchemyOrderReadModel
+        return AsyncSqlAlchemyOrderReadModel(session_factory)
+
+    return AsyncOrderReadModelAdapter(get_order_read_model(db_url))
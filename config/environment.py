@@ -20,13 +20,68 @@ class EnvironmentSettings(BaseSettings):
     DATABASE_PASSWORD: str = os.getenv("DATABASE_PASSWORD", "")
     DATABASE_PORT: int = os.getenv("DATABASE_PORT", 5432)
     DATABASE_USERNAME: str = os.getenv("DATABASE_USERNAME", "")
+    DATABASE_POOL_SIZE: int = os.getenv("DATABASE_POOL_SIZE", 5)
+    DATABASE_MAX_OVERFLOW: int = os.getenv("DATABASE_MAX_OVERFLOW", 10)
+    DATABASE_POOL_TIMEOUT: int = os.getenv("DATABASE_POOL_TIMEOUT", 30)
+    DATABASE_POOL_RECYCLE: int = os.getenv("DATABASE_POOL_RECYCLE", 1800)
     DEBUG_MODE: bool = os.getenv("DEBUG_MODE", "true").lower() == "true"
+    # ドメインイベントのアウトボックス配信
+    OUTBOX_WORKERS: int = os.getenv("OUTBOX_WORKERS", 4)
+    OUTBOX_BATCH_SIZE: int = os.getenv("OUTBOX_BATCH_SIZE", 100)
+    OUTBOX_POLL_INTERVAL: float = os.getenv("OUTBOX_POLL_INTERVAL", 0.5)
+    OUTBOX_MAX_ATTEMPTS: int = os.getenv("OUTBOX_MAX_ATTEMPTS", 5)
+    # 配信中として確保したメッセージを、他のプロセスが確保し直せるようになるまでの秒数
+    OUTBOX_LEASE_SECONDS: float = os.getenv("OUTBOX_LEASE_SECONDS", 30)
+    # モックDB使用時の注文の保持形式（"entity": エンティティのまま, "compact": 1件1つのバイト列に詰める,
+    # "event_sourced": 注文ごとのイベントストリームとして保存し、最新の状態をバイト列に詰めて検索用に保持する）
+    ORDER_STORE: str = os.getenv("ORDER_STORE", "entity")
+    # ORDER_STORE=event_sourced の場合に集約のスナップショットを取るイベント数の間隔（0で取らない）
+    ORDER_SNAPSHOT_EVERY: int = os.getenv("ORDER_SNAPSHOT_EVERY", 64)
+    # 注文取得レスポンスのキャッシュの件数上限
+    ORDER_CACHE_SIZE: int = os.getenv("ORDER_CACHE_SIZE", 10000)
+    # 注文作成の Idempotency-Key（"memory": プロセスごとのLRU, "database": idempotency_keys テーブル（DB使用時のみ））
+    IDEMPOTENCY_STORE: str = os.getenv("IDEMPOTENCY_STORE", "memory")
+    IDEMPOTENCY_MAX_KEYS: int = os.getenv("IDEMPOTENCY_MAX_KEYS", 10000)
+    IDEMPOTENCY_TTL_SECONDS: float = os.getenv("IDEMPOTENCY_TTL_SECONDS", 24 * 60 * 60)
+    # 同じキーの処理中のリクエストの完了を待つ時間（秒）
+    IDEMPOTENCY_WAIT_SECONDS: float = os.getenv("IDEMPOTENCY_WAIT_SECONDS", 10.0)
+    # 製品一覧・検索・取得のシリアライズ済みレスポンスの件数上限（カタログの最新の版の分だけ保持する）
+    PRODUCT_PAGE_CACHE_SIZE: int = os.getenv("PRODUCT_PAGE_CACHE_SIZE", 1024)
+    # DB使用時に製品カタログのスナップショットを全件から作り直す間隔（秒、他のプロセスの書き込みを取り込む）
+    PRODUCT_CATALOG_MAX_AGE_SECONDS: float = os.getenv("PRODUCT_CATALOG_MAX_AGE_SECONDS", 5.0)
+    # uvicorn のワーカープロセス数（uvicorn も --workers の既定値として読む）
+    # 2以上の場合はデータベースが必須になり、プロセスごとのキャッシュのうち書き込み時に無効化するものを使わない
+    WEB_CONCURRENCY: int = os.getenv("WEB_CONCURRENCY", 1)
+    # ファイルのSQLiteの接続ごとに設定するPRAGMA（複数のワーカープロセスで同じファイルを共有するため）
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    # 他のプロセスが書き込み中の場合に待つミリ秒数
+    SQLITE_BUSY_TIMEOUT_MS: int = os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000)
+    SQLITE_CACHE_SIZE_KB: int = os.getenv("SQLITE_CACHE_SIZE_KB", 64 * 1024)
+    SQLITE_MMAP_SIZE: int = os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)
+    # 顧客・製品の一括取り込みで1回の一括保存に含める行数
+    IMPORT_CHUNK_SIZE: int = os.getenv("IMPORT_CHUNK_SIZE", 1000)
+    # モックDB使用時の永続化（ディレクトリを指定するとスナップショットとジャーナルに書き込み、起動時に復元する）
+    # （ORDER_STORE=event_sourced の場合はイベントストリームを永続化できないため無効）
+    PERSISTENCE_DIR: str = os.getenv("PERSISTENCE_DIR", "")
+    # ジャーナルのfsync（"always": 書き込みごと, "interval": PERSISTENCE_FSYNC_INTERVAL 秒ごと, "never": OSに任せる）
+    PERSISTENCE_FSYNC: str = os.getenv("PERSISTENCE_FSYNC", "interval")
+    PERSISTENCE_FSYNC_INTERVAL: float = os.getenv("PERSISTENCE_FSYNC_INTERVAL", 1.0)
+    # スナップショットを取り直す間隔（秒）とジャーナルの上限サイズ（バイト）
+    PERSISTENCE_SNAPSHOT_INTERVAL: float = os.getenv("PERSISTENCE_SNAPSHOT_INTERVAL", 300.0)
+    PERSISTENCE_COMPACT_LOG_BYTES: int = os.getenv("PERSISTENCE_COMPACT_LOG_BYTES", 64 * 1024 * 1024)
+    # レイヤーごとの処理時間の計測（/metrics で公開する）
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
 
     # データベースURL（計算プロパティ）
     @property
     def DATABASE_URL(self) -> str:
         if self.USE_MOCK_DB:
             return None
+        # ファイルのSQLiteはファイルパスのみで接続できる（ローカルでのベンチマーク用）
+        # メモリDB（":memory:"）の場合は従来どおり以下の判定に任せる
+        if self.DATABASE_DIALECT == "sqlite" and self.DATABASE_NAME != ":memory:":
+            return f"sqlite:///{self.DATABASE_NAME}"
         if not all([
             self.DATABASE_DIALECT,
             self.DATABASE_USERNAME,
@@ -40,8 +95,11 @@ class EnvironmentSettings(BaseSettings):
         return f"postgresql://{self.DATABASE_USERNAME}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOSTNAME}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
     
     # 環境に応じてモックDBを使用するかどうかを決定
+    # ファイルベースのSQLiteが指定されている場合は開発環境でも実DBを使用する
     @property
     def USE_MOCK_DB(self) -> bool:
+        if self.DATABASE_DIALECT == "sqlite" and self.DATABASE_NAME != ":memory:":
+            return False
         return self.APP_ENV.lower() in ["development", "develop", "test"]
 
     model_config = {
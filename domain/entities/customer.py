@@ -4,7 +4,12 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 
-@dataclass
+def normalize_email(email: str) -> str:
+    """メールアドレスを比較用に正規化する（前後の空白除去と小文字化）"""
+    return email.strip().lower()
+
+
+@dataclass(slots=True)
 class Customer:
     """顧客エンティティ"""
     name: str
@@ -1,12 +1,68 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from enum import Enum
+from typing import Dict, FrozenSet, List, Optional
 from uuid import UUID, uuid4
 
+from domain.events import DomainEvent, OrderCancelled, OrderCreated, OrderStatusChanged
+from domain.exceptions import InvalidStatusTransitionError
 
-@dataclass
+
+class OrderStatus(str, Enum):
+    """注文ステータス
+    
+    文字列としてそのまま比較・シリアライズでき、コンパクトな保存形式では整数のコードで表す。
+    """
+    PENDING = "PENDING"
+    CONFIRMED = "CONFIRMED"
+    SHIPPED = "SHIPPED"
+    DELIVERED = "DELIVERED"
+    CANCELLED = "CANCELLED"
+    
+    def __str__(self) -> str:
+        return self.value
+    
+    @property
+    def code(self) -> int:
+        return _STATUS_CODES[self]
+    
+    @classmethod
+    def from_code(cls, code: int) -> "OrderStatus":
+        return _STATUSES[code]
+    
+    def can_transition_to(self, status: "OrderStatus") -> bool:
+        """このステータスから status に変更できるかどうか（同じステータスへの変更は常に可）"""
+        return status is self or status in _NEXT_STATUSES[self]
+    
+    def previous_statuses(self) -> FrozenSet["OrderStatus"]:
+        """このステータスに変更できる元のステータス（同じステータスは含まない）"""
+        return _PREVIOUS_STATUSES[self]
+
+
+_STATUSES = list(OrderStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+
+# ステータスの遷移表（戻る方向の変更と、配達済み・キャンセル済みからの変更は許可しない）
+_TRANSITIONS = {
+    OrderStatus.PENDING: (OrderStatus.CONFIRMED, OrderStatus.SHIPPED, OrderStatus.CANCELLED),
+    OrderStatus.CONFIRMED: (OrderStatus.SHIPPED, OrderStatus.CANCELLED),
+    OrderStatus.SHIPPED: (OrderStatus.DELIVERED,),
+    OrderStatus.DELIVERED: (),
+    OrderStatus.CANCELLED: (),
+}
+# 遷移表はモジュールの読み込み時に一度だけ、変更先・変更元のそれぞれから引ける形にしておく
+_NEXT_STATUSES: Dict[OrderStatus, FrozenSet[OrderStatus]] = {
+    status: frozenset(targets) for status, targets in _TRANSITIONS.items()
+}
+_PREVIOUS_STATUSES: Dict[OrderStatus, FrozenSet[OrderStatus]] = {
+    target: frozenset(status for status, targets in _TRANSITIONS.items() if target in targets)
+    for target in _STATUSES
+}
+
+
+@dataclass(frozen=True, slots=True)
 class OrderItem:
-    """注文アイテムエンティティ"""
+    """注文アイテム（値オブジェクト）"""
     product_id: UUID
     quantity: int
     price_per_unit: float
@@ -16,15 +72,23 @@ class OrderItem:
         return self.quantity * self.price_per_unit
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """注文エンティティ"""
     id: UUID = field(default_factory=uuid4)
     customer_id: UUID = None
     items: List[OrderItem] = field(default_factory=list)
-    status: str = "PENDING"  # PENDING, CONFIRMED, SHIPPED, DELIVERED, CANCELLED
+    status: OrderStatus = OrderStatus.PENDING
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: Optional[datetime] = None
+    # 永続化された内容の版（リポジトリが更新のたびに1つ進める）
+    version: int = 1
+    # 保存されるまでの間に発生したドメインイベント（リポジトリが保存時にアウトボックスへ書き出す）
+    # 大半の注文はイベントを持たないため、最初のイベントを記録するまでリストを作らない
+    events: Optional[List[DomainEvent]] = field(default=None, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.status = OrderStatus(self.status)
     
     @property
     def total_amount(self) -> float:
@@ -38,6 +102,36 @@ class Order:
         self.items = [item for item in self.items if item.product_id != product_id]
         self.updated_at = datetime.now()
         
+    def place(self) -> None:
+        """注文の作成を記録する"""
+        self._record(OrderCreated(
+            aggregate_id=self.id,
+            customer_id=self.customer_id,
+            total_amount=self.total_amount
+        ))
+        
     def update_status(self, status: str) -> None:
-        self.status = status
-        self.updated_at = datetime.now() 
\ No newline at end of file
+        """ステータスを変更する（遷移表で許可されていない変更は InvalidStatusTransitionError）"""
+        previous_status = self.status
+        if not previous_status.can_transition_to(OrderStatus(status)):
+            raise InvalidStatusTransitionError(previous_status.value, OrderStatus(status).value)
+        self.status = OrderStatus(status)
+        self.updated_at = datetime.now()
+        if self.status == previous_status:
+            return
+        if self.status == OrderStatus.CANCELLED:
+            self._record(OrderCancelled(aggregate_id=self.id, previous_status=previous_status.value))
+        else:
+            self._record(OrderStatusChanged(
+                aggregate_id=self.id, previous_status=previous_status.value, status=self.status.value
+            ))
+        
+    def _record(self, event: DomainEvent) -> None:
+        if self.events is None:
+            self.events = []
+        self.events.append(event)
+        
+    def pull_events(self) -> List[DomainEvent]:
+        """記録済みのドメインイベントを取り出して空にする"""
+        events, self.events = self.events, None
+        return events or []
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID, uuid4
+
+
+# 全てのイベントに共通する項目（payload には含めない）
+_ENVELOPE_FIELDS = frozenset(("aggregate_id", "event_id", "occurred_at"))
+
+
+@dataclass(frozen=True, kw_only=True)
+class DomainEvent:
+    """ドメインイベントの基底クラス（集約で発生した事実を表す）"""
+    aggregate_id: UUID
+    event_id: UUID = field(default_factory=uuid4)
+    occurred_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def event_type(self) -> str:
+        return type(self).__name__
+
+    def payload(self) -> Dict[str, Any]:
+        """イベント固有の内容をJSONに変換できる辞書で返す"""
+        # 値は文字列・数値・UUIDのみのため、asdict のような再帰的なコピーはしない
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.name not in _ENVELOPE_FIELDS}
+        return {key: str(value) if isinstance(value, UUID) else value for key, value in data.items()}
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrderCreated(DomainEvent):
+    """注文が作成された"""
+    customer_id: UUID
+    total_amount: float
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrderStatusChanged(DomainEvent):
+    """注文ステータスが変更された"""
+    previous_status: str
+    status: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrderCancelled(DomainEvent):
+    """注文がキャンセルされた"""
+    previous_status: str
@@ -0,0 +1,42 @@
+from uuid import UUID
+
+
+class DomainError(Exception):
+    """ドメイン層の例外の基底クラス"""
+    pass
+
+
+class DuplicateEmailError(DomainError):
+    """メールアドレスが既に登録されている場合の例外"""
+    
+    def __init__(self, email: str):
+        super().__init__(f"Customer with email {email} already exists")
+        self.email = email
+
+
+class InsufficientStockError(DomainError):
+    """在庫の確保時に在庫が不足していた場合の例外"""
+    
+    def __init__(self, product_id: UUID, available: int, requested: int):
+        super().__init__(f"Not enough stock for product {product_id}. Available: {available}, Requested: {requested}")
+        self.product_id = product_id
+        self.available = available
+        self.requested = requested
+
+
+class InvalidQuantityError(DomainError):
+    """注文・在庫の確保・在庫の戻しの数量が正の整数でない場合の例外"""
+    
+    def __init__(self, product_id: UUID, quantity: int):
+        super().__init__(f"Quantity for product {product_id} must be positive. Requested: {quantity}")
+        self.product_id = product_id
+        self.quantity = quantity
+
+
+class InvalidStatusTransitionError(DomainError):
+    """注文ステータスの遷移表で許可されていない変更をしようとした場合の例外"""
+    
+    def __init__(self, current: str, requested: str):
+        super().__init__(f"Cannot change order status from {current} to {requested}")
+        self.current = current
+        self.requested = requested
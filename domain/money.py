@@ -0,0 +1,14 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+CENTS_PER_UNIT = 100
+_CENT = Decimal("0.01")
+
+
+def to_cents(amount: float) -> int:
+    """金額を整数のセント（最小通貨単位）に変換する（0.5セントは切り上げ）"""
+    return int(Decimal(str(amount)).quantize(_CENT, rounding=ROUND_HALF_UP) * CENTS_PER_UNIT)
+
+
+def from_cents(cents: int) -> float:
+    """整数のセントを金額に戻す"""
+    return cents / CENTS_PER_UNIT
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from domain.entities.customer import Customer
@@ -13,11 +13,25 @@ class CustomerRepository(ABC):
         """顧客を保存する"""
         pass
     
+    @abstractmethod
+    def save_many(self, customers: Iterable[Customer]) -> List[Customer]:
+        """複数の顧客を一括で登録する
+
+        メールアドレスが登録済みの顧客やバッチ内で重複する顧客が1件でもあれば、
+        何も保存せずに DuplicateEmailError を送出する。
+        """
+        pass
+    
     @abstractmethod
     def find_by_id(self, customer_id: UUID) -> Optional[Customer]:
         """IDで顧客を検索する"""
         pass
     
+    @abstractmethod
+    def find_by_ids(self, customer_ids: Iterable[UUID]) -> Dict[UUID, Customer]:
+        """複数のIDで顧客を一括検索する（見つかった顧客のみを返す）"""
+        pass
+    
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[Customer]:
         """メールアドレスで顧客を検索する"""
@@ -33,7 +47,21 @@ class CustomerRepository(ABC):
         """顧客を更新する"""
         pass
     
+    @abstractmethod
+    def update_many(self, customers: Iterable[Customer]) -> List[Customer]:
+        """複数の顧客を一括更新する"""
+        pass
+    
     @abstractmethod
     def delete(self, customer_id: UUID) -> None:
         """顧客を削除する"""
-        pass 
\ No newline at end of file
+        pass 
+
+
+class AsyncCustomerRepository(ABC):
+    """顧客リポジトリの非同期インターフェース"""
+    
+    @abstractmethod
+    async def find_by_id(self, customer_id: UUID) -> Optional[Customer]:
+        """IDで顧客を検索する"""
+        pass
@@ -1,23 +1,53 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import FrozenSet, Iterator, List, NamedTuple, Optional
 from uuid import UUID
 
-from domain.entities.order import Order
+from domain.entities.order import Order, OrderStatus
+
+
+class OrderPageCursor(NamedTuple):
+    """キーセットページネーションの位置（直前に返した注文の作成日時とID）"""
+    created_at: datetime
+    order_id: UUID
 
 
 class OrderCommandRepositoryInterface(ABC):
-    """注文コマンドリポジトリのインターフェース"""
+    """注文コマンドリポジトリのインターフェース
+    
+    save / save_many / update は、注文に記録されたドメインイベントを注文と同じ書き込みでアウトボックスに追加する。
+    """
     
     @abstractmethod
     def save(self, order: Order) -> Order:
         """注文を保存する"""
         pass
     
+    @abstractmethod
+    def save_many(self, orders: List[Order]) -> List[Order]:
+        """複数の注文を一括で保存する"""
+        pass
+    
+    @abstractmethod
+    def find_by_id(self, order_id: UUID) -> Optional[Order]:
+        """更新のためにIDで注文を読み込む"""
+        pass
+    
     @abstractmethod
     def update(self, order: Order) -> Order:
         """注文を更新する"""
         pass
     
+    @abstractmethod
+    def update_status_many(self, order_ids: List[UUID], status: OrderStatus,
+                           expected: FrozenSet[OrderStatus]) -> List[Order]:
+        """ステータスが expected のいずれかである注文だけを status に変更し、変更した注文を返す
+        
+        読み込み・判定・書き込みを注文ごとに不可分に行い（compare-and-set）、版を1つ進めて
+        ステータス変更のドメインイベントを同じ書き込みでアウトボックスに追加する。
+        """
+        pass
+    
     @abstractmethod
     def delete(self, order_id: UUID) -> None:
         """注文を削除する"""
@@ -37,7 +67,67 @@ class OrderQueryRepositoryInterface(ABC):
         """顧客IDで全ての注文を検索する"""
         pass
     
+    @abstractmethod
+    def find_page_by_customer_id(self, customer_id: UUID, limit: int,
+                                 after: Optional[OrderPageCursor] = None) -> List[Order]:
+        """顧客IDで注文を作成日時・ID順に最大limit件検索する（afterより後の注文のみ）"""
+        pass
+    
+    def iter_by_customer_id(self, customer_id: UUID, batch_size: int = 500) -> Iterator[Order]:
+        """顧客IDで注文を1件ずつ返す（内部ではキーセットでページ単位に取得する）"""
+        after = None
+        while True:
+            orders = self.find_page_by_customer_id(customer_id, batch_size, after)
+            yield from orders
+            if len(orders) < batch_size:
+                return
+            after = OrderPageCursor(orders[-1].created_at, orders[-1].id)
+    
+    @abstractmethod
+    def find_all_by_status(self, status: str) -> List[Order]:
+        """ステータスで全ての注文を検索する"""
+        pass
+    
     @abstractmethod
     def find_all(self) -> List[Order]:
         """全ての注文を取得する"""
-        pass
\ No newline at end of file
+        pass
+
+
+class AsyncOrderCommandRepositoryInterface(ABC):
+    """注文コマンドリポジトリの非同期インターフェース"""
+    
+    @abstractmethod
+    async def save(self, order: Order) -> Order:
+        """注文を保存する"""
+        pass
+    
+    @abstractmethod
+    async def update(self, order: Order) -> Order:
+        """注文を更新する"""
+        pass
+    
+    @abstractmethod
+    async def update_status_many(self, order_ids: List[UUID], status: OrderStatus,
+                                 expected: FrozenSet[OrderStatus]) -> List[Order]:
+        """ステータスが expected のいずれかである注文だけを status に変更し、変更した注文を返す（同期版と同じ compare-and-set）"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, order_id: UUID) -> None:
+        """注文を削除する"""
+        pass
+
+
+class AsyncOrderQueryRepositoryInterface(ABC):
+    """注文クエリリポジトリの非同期インターフェース"""
+    
+    @abstractmethod
+    async def find_by_id(self, order_id: UUID) -> Optional[Order]:
+        """IDで注文を検索する"""
+        pass
+    
+    @abstractmethod
+    async def find_all_by_customer_id(self, customer_id: UUID) -> List[Order]:
+        """顧客IDで全ての注文を検索する"""
+        pass
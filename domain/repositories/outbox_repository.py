@@ -0,0 +1,87 @@
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from domain.events import DomainEvent
+
+
+@dataclass
+class OutboxMessage:
+    """アウトボックスに保存された配信待ちのドメインイベント"""
+    id: UUID
+    event_type: str
+    aggregate_id: UUID
+    occurred_at: datetime
+    payload: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    
+    @classmethod
+    def from_event(cls, event: DomainEvent) -> "OutboxMessage":
+        return cls(
+            id=event.event_id,
+            event_type=event.event_type,
+            aggregate_id=event.aggregate_id,
+            occurred_at=event.occurred_at,
+            payload=event.payload()
+        )
+    
+    def to_json(self) -> str:
+        """配信先に渡すJSON文字列に変換する"""
+        return json.dumps({
+            "event_id": str(self.id),
+            "event_type": self.event_type,
+            "aggregate_id": str(self.aggregate_id),
+            "occurred_at": self.occurred_at.isoformat(),
+            "payload": self.payload
+        }, ensure_ascii=False)
+
+
+class OutboxRepositoryInterface(ABC):
+    """アウトボックス（配信待ちのドメインイベント）のリポジトリのインターフェース
+    
+    イベントの追加は注文リポジトリが注文と同じ書き込みで行う。ここでは配信側の操作を定義する。
+    """
+    
+    @abstractmethod
+    def fetch_pending(self, limit: int) -> List[OutboxMessage]:
+        """未配信のメッセージを発生順に最大limit件取得する（確保はしない）"""
+        pass
+    
+    @abstractmethod
+    def claim_pending(self, limit: int, claimed_by: str, lease_seconds: float) -> List[OutboxMessage]:
+        """未配信のメッセージを発生順に最大limit件、配信中として確保して取得する
+        
+        確保したメッセージは他の配信処理（別のプロセスを含む）には渡さない。lease_seconds を過ぎても
+        配信済み・失敗にならなかったメッセージ（確保したプロセスが停止した場合など）は再び確保できる。
+        同じ注文の先のメッセージが配信中の間や、配信に失敗したメッセージがある注文のメッセージは確保しない
+        （後のメッセージが先のメッセージより先に届かないように、未配信のまま残す）。
+        """
+        pass
+    
+    @abstractmethod
+    def release(self, message_ids: List[UUID]) -> None:
+        """確保したメッセージを配信せずに未配信に戻す"""
+        pass
+    
+    @abstractmethod
+    def mark_dispatched(self, message_ids: List[UUID]) -> None:
+        """メッセージを配信済みにする"""
+        pass
+    
+    @abstractmethod
+    def mark_failed(self, message_id: UUID, attempts: int, error: str) -> None:
+        """再試行しても配信できなかったメッセージを配信対象から外す"""
+        pass
+    
+    @abstractmethod
+    def pending_count(self) -> int:
+        """未配信のメッセージ数を返す"""
+        pass
+    
+    @abstractmethod
+    def oldest_pending_at(self) -> Optional[datetime]:
+        """最も古い未配信のメッセージの発生日時を返す（なければNone）"""
+        pass
@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from domain.entities.product import Product
+from domain.exceptions import InvalidQuantityError
+
+
+def validate_quantities(quantities: Dict[UUID, int]) -> None:
+    """在庫の確保・戻しの数量が全て正であることを確認する（負の数量で在庫が増えないようにする）"""
+    for product_id, quantity in quantities.items():
+        if quantity <= 0:
+            raise InvalidQuantityError(product_id, quantity)
 
 
 class ProductRepository(ABC):
@@ -13,11 +21,21 @@ class ProductRepository(ABC):
         """製品を保存する"""
         pass
     
+    @abstractmethod
+    def save_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を一括で登録する"""
+        pass
+    
     @abstractmethod
     def find_by_id(self, product_id: UUID) -> Optional[Product]:
         """IDで製品を検索する"""
         pass
     
+    @abstractmethod
+    def find_by_ids(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        """複数のIDで製品を一括検索する（見つかった製品のみを返す）"""
+        pass
+    
     @abstractmethod
     def find_by_name(self, name: str) -> List[Product]:
         """名前で製品を検索する"""
@@ -33,7 +51,51 @@ class ProductRepository(ABC):
         """製品を更新する"""
         pass
     
+    @abstractmethod
+    def update_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を一括更新する"""
+        pass
+    
+    @abstractmethod
+    def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, int]:
+        """製品ごとの数量だけ在庫を原子的に確保する
+
+        全ての製品で在庫が足りる場合のみ減算し、確保後の在庫数を返す。
+        1つでも不足する場合は何も変更せずに InsufficientStockError を送出する。
+        正でない数量を含む場合は何も変更せずに InvalidQuantityError を送出する。
+        """
+        pass
+    
+    @abstractmethod
+    def release_stock(self, quantities: Dict[UUID, int]) -> None:
+        """確保した在庫を原子的に戻す（正でない数量を含む場合は InvalidQuantityError）"""
+        pass
+    
     @abstractmethod
     def delete(self, product_id: UUID) -> None:
         """製品を削除する"""
-        pass 
\ No newline at end of file
+        pass 
+
+
+class AsyncProductRepository(ABC):
+    """製品リポジトリの非同期インターフェース"""
+    
+    @abstractmethod
+    async def find_by_ids(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        """複数のIDで製品を一括検索する（見つかった製品のみを返す）"""
+        pass
+    
+    @abstractmethod
+    async def update_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を一括更新する"""
+        pass
+    
+    @abstractmethod
+    async def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, int]:
+        """製品ごとの数量だけ在庫を原子的に確保する（不足時は InsufficientStockError）"""
+        pass
+    
+    @abstractmethod
+    async def release_stock(self, quantities: Dict[UUID, int]) -> None:
+        """確保した在庫を原子的に戻す"""
+        pass
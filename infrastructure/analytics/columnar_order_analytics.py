@@ -0,0 +1,111 @@
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from application.interfaces.dto import RevenueDTO
+from application.interfaces.order_analytics import OrderAnalyticsInterface
+from domain.entities.order import OrderStatus
+from domain.money import from_cents
+from infrastructure.analytics.order_line_columns import OrderLineColumns, to_micros
+
+MICROS_PER_DAY = 86_400_000_000
+# 一度に集計する行数
+CHUNK_ROWS = 1 << 18
+_EPOCH_DATE = date(1970, 1, 1)
+# 売上に含めるステータス（既定）
+REVENUE_STATUSES = [status.value for status in OrderStatus if status != OrderStatus.CANCELLED]
+
+
+class ColumnarOrderAnalytics(OrderAnalyticsInterface):
+    """注文明細の列指向ミラーをNumPyでまとめて集計する売上集計
+    
+    有効な行をステータスと作成日時の条件でマスクし、商品・顧客・日のコードごとに np.bincount で合計する。
+    Pythonのループは行数ではなく CHUNK_ROWS 行のまとまりの数だけ回る。
+    """
+    
+    def __init__(self, lines: OrderLineColumns):
+        self.lines = lines
+    
+    def revenue_by_product(self, statuses: Optional[List[str]] = None, since: Optional[datetime] = None,
+                           until: Optional[datetime] = None, limit: Optional[int] = None) -> List[RevenueDTO]:
+        """商品ごとの売上を売上の多い順に取得する"""
+        return self._revenue_by_code("product", self.lines.products.values, statuses, since, until, limit)
+    
+    def revenue_by_customer(self, statuses: Optional[List[str]] = None, since: Optional[datetime] = None,
+                            until: Optional[datetime] = None, limit: Optional[int] = None) -> List[RevenueDTO]:
+        """顧客ごとの売上を売上の多い順に取得する"""
+        return self._revenue_by_code("customer", self.lines.customers.values, statuses, since, until, limit)
+    
+    def revenue_by_day(self, statuses: Optional[List[str]] = None, since: Optional[datetime] = None,
+                       until: Optional[datetime] = None) -> List[RevenueDTO]:
+        """日ごとの売上を日付順に取得する"""
+        columns = self.lines.columns()
+        if columns["created_at"].size == 0:
+            return []
+        # 日数の範囲は明細数より十分小さいため、最初の日からの差をコードとして集計する
+        first_day = int(columns["created_at"].min()) // MICROS_PER_DAY
+        size = int(columns["created_at"].max()) // MICROS_PER_DAY - first_day + 1
+        totals = self._totals(
+            columns, lambda rows: columns["created_at"][rows] // MICROS_PER_DAY - first_day, size, statuses, since, until
+        )
+        return [
+            RevenueDTO(
+                key=(_EPOCH_DATE + timedelta(days=first_day + offset)).isoformat(),
+                revenue=from_cents(int(totals["revenue"][offset])),
+                quantity=int(totals["quantity"][offset]),
+                lines=int(totals["lines"][offset])
+            )
+            for offset in np.flatnonzero(totals["lines"]).tolist()
+        ]
+    
+    def _revenue_by_code(self, column: str, keys: Sequence, statuses: Optional[List[str]],
+                         since: Optional[datetime], until: Optional[datetime],
+                         limit: Optional[int]) -> List[RevenueDTO]:
+        columns = self.lines.columns()
+        totals = self._totals(columns, lambda rows: columns[column][rows], len(keys), statuses, since, until)
+        codes = np.flatnonzero(totals["lines"])
+        # 売上の多い順（同額はコード順）に並べる
+        codes = codes[np.argsort(-totals["revenue"][codes], kind="stable")]
+        if limit is not None:
+            codes = codes[:limit]
+        return [
+            RevenueDTO(
+                key=str(keys[code]),
+                revenue=from_cents(int(totals["revenue"][code])),
+                quantity=int(totals["quantity"][code]),
+                lines=int(totals["lines"][code])
+            )
+            for code in codes.tolist()
+        ]
+    
+    def _totals(self, columns: Dict[str, np.ndarray], codes_of: Callable[[slice], np.ndarray], size: int,
+                statuses: Optional[List[str]], since: Optional[datetime],
+                until: Optional[datetime]) -> Dict[str, np.ndarray]:
+        # ステータスのコードを添字にした真偽値の表で、行ごとの判定を1回の参照にする
+        allowed = np.zeros(len(OrderStatus), dtype=np.bool_)
+        allowed[[OrderStatus(status).code for status in (statuses or REVENUE_STATUSES)]] = True
+        since_micros = to_micros(since) if since is not None else None
+        until_micros = to_micros(until) if until is not None else None
+        revenue = np.zeros(size)
+        quantity = np.zeros(size)
+        lines = np.zeros(size, dtype=np.int64)
+        # 中間配列がキャッシュに収まる行数ずつ、条件の判定・抽出・合計を行う
+        for start in range(0, columns["live"].size, CHUNK_ROWS):
+            rows = slice(start, start + CHUNK_ROWS)
+            mask = columns["live"][rows] & allowed[columns["status"][rows]]
+            if since_micros is not None:
+                mask &= columns["created_at"][rows] >= since_micros
+            if until_micros is not None:
+                mask &= columns["created_at"][rows] < until_micros
+            codes = codes_of(rows)[mask]
+            chunk_quantity = columns["quantity"][rows][mask]
+            revenue += np.bincount(codes, weights=chunk_quantity * columns["price_cents"][rows][mask], minlength=size)
+            quantity += np.bincount(codes, weights=chunk_quantity, minlength=size)
+            lines += np.bincount(codes, minlength=size)
+        # 重み付きの合計は浮動小数点になるため、セント単位の整数に丸め直す
+        return {
+            "revenue": np.rint(revenue).astype(np.int64),
+            "quantity": np.rint(quantity).astype(np.int64),
+            "lines": lines,
+        }
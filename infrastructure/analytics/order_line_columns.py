@@ -0,0 +1,139 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from domain.entities.order import Order, OrderStatus
+from domain.money import to_cents
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+INITIAL_CAPACITY = 1024
+# 追加された明細はこの件数までリストに溜め、まとめて配列に書き込む
+FLUSH_THRESHOLD = 4096
+
+# 列名と型（日時はタイムゾーンを持たない値のエポックからのマイクロ秒）
+COLUMNS = (
+    ("order", np.int32),
+    ("customer", np.int32),
+    ("product", np.int32),
+    ("quantity", np.int32),
+    ("price_cents", np.int64),
+    ("created_at", np.int64),
+    ("status", np.int8),
+    ("live", np.bool_),
+)
+
+
+def to_micros(value: datetime) -> int:
+    """日時をエポックからのマイクロ秒に変換する"""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+class Codes:
+    """UUIDと連番のコードの対応表（列には整数のコードだけを格納する）"""
+    
+    def __init__(self):
+        self.values: List[UUID] = []
+        self._codes: Dict[UUID, int] = {}
+    
+    def encode(self, value: UUID) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+    
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class OrderLineColumns:
+    """注文明細の列指向ミラー
+    
+    注文コマンドリポジトリの保存・更新・削除に合わせて、注文明細1行を各列のNumPy配列の1要素として追記する。
+    更新された注文は既存の行を無効（live=False）にしてから新しい行を追記し、削除された注文は行を無効にするだけで、
+    行を書き換えたり詰めたりはしない。注文・顧客・商品のIDは連番のコードに置き換えて格納する。
+    """
+    
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self._columns: Dict[str, np.ndarray] = {name: np.empty(capacity, dtype) for name, dtype in COLUMNS}
+        self._size = 0
+        self._pending: List[Tuple[int, int, int, int, int, int, int]] = []
+        # 注文ごとの有効な行の範囲 [start, stop)
+        self._ranges: Dict[UUID, Tuple[int, int]] = {}
+        self.orders = Codes()
+        self.customers = Codes()
+        self.products = Codes()
+        self.lock = threading.Lock()
+    
+    def append(self, order: Order) -> None:
+        """注文の明細を追記する（同じ注文の既存の行は無効にする）"""
+        with self.lock:
+            self._invalidate(order.id)
+            start = self._size + len(self._pending)
+            order_code = self.orders.encode(order.id)
+            customer_code = self.customers.encode(order.customer_id)
+            created_at = to_micros(order.created_at)
+            status = OrderStatus(order.status).code
+            self._pending.extend(
+                (order_code, customer_code, self.products.encode(item.product_id),
+                 item.quantity, to_cents(item.price_per_unit), created_at, status)
+                for item in order.items
+            )
+            self._ranges[order.id] = (start, start + len(order.items))
+            if len(self._pending) >= FLUSH_THRESHOLD:
+                self._flush()
+    
+    def remove(self, order_id: UUID) -> None:
+        """注文の行を無効にする"""
+        with self.lock:
+            self._invalidate(order_id)
+    
+    def columns(self) -> Dict[str, np.ndarray]:
+        """全ての行（無効な行を含む）の列を返す
+        
+        返す配列は格納中の配列のビューで、呼び出し後に追記された行は含まない。
+        """
+        with self.lock:
+            self._flush()
+            return {name: column[:self._size] for name, column in self._columns.items()}
+    
+    def __len__(self) -> int:
+        with self.lock:
+            return self._size + len(self._pending)
+    
+    def _invalidate(self, order_id: UUID) -> None:
+        rows: Optional[Tuple[int, int]] = self._ranges.pop(order_id, None)
+        if rows is None:
+            return
+        start, stop = rows
+        if stop > self._size:
+            self._flush()
+        self._columns["live"][start:stop] = False
+    
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        count = len(self._pending)
+        self._reserve(self._size + count)
+        end = self._size + count
+        for (name, dtype), values in zip(COLUMNS, zip(*self._pending)):
+            self._columns[name][self._size:end] = np.fromiter(values, dtype=dtype, count=count)
+        self._columns["live"][self._size:end] = True
+        self._size = end
+        self._pending.clear()
+    
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._columns["live"])
+        if size <= capacity:
+            return
+        capacity = max(capacity, 1)
+        while capacity < size:
+            capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
@@ -0,0 +1,133 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Callable, Dict, Optional
+
+from application.interfaces.idempotency_store import (
+    IdempotencyKeyConflictError,
+    IdempotencyKeyInProgressError,
+    IdempotencyStoreInterface,
+    IdempotentResponse
+)
+
+DEFAULT_MAX_KEYS = 10000
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_WAIT_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class _StoredResponse:
+    response: IdempotentResponse
+    expires_at: float
+
+
+class InMemoryIdempotencyStore(IdempotencyStoreInterface):
+    """Idempotency-Key ごとの処理結果を保持する件数上限・有効期限付きのLRUストア
+
+    完了した結果は ttl_seconds の間だけ保持し、max_keys を超えると最も使われていないキーから追い出す。
+    処理中のキーは件数上限とは別に保持し、完了・解放されるまで追い出さない。
+    """
+
+    def __init__(self,
+                 max_keys: int = DEFAULT_MAX_KEYS,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 wait_seconds: float = DEFAULT_WAIT_SECONDS,
+                 clock: Callable[[], float] = monotonic):
+        self.max_keys = max_keys
+        self.ttl_seconds = ttl_seconds
+        self.wait_seconds = wait_seconds
+        self._clock = clock
+        self._responses: "OrderedDict[str, _StoredResponse]" = OrderedDict()
+        # 処理中のキーとそのリクエストのハッシュ
+        self._in_flight: Dict[str, str] = {}
+        self._condition = threading.Condition()
+        self.replays = 0
+        self.executions = 0
+        self.waits = 0
+        self.conflicts = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def begin(self, key: str, fingerprint: str, timeout: Optional[float] = None) -> Optional[IdempotentResponse]:
+        """保存済みの結果を返す。なければ処理権を得てNoneを返す（処理中なら完了を待つ）"""
+        deadline = monotonic() + (self.wait_seconds if timeout is None else timeout)
+        waited = False
+        with self._condition:
+            while True:
+                stored = self._lookup(key)
+                if stored is not None:
+                    if stored.fingerprint != fingerprint:
+                        self.conflicts += 1
+                        raise IdempotencyKeyConflictError(key)
+                    self.replays += 1
+                    return stored
+                pending = self._in_flight.get(key)
+                if pending is None:
+                    self._in_flight[key] = fingerprint
+                    self.executions += 1
+                    return None
+                if pending != fingerprint:
+                    self.conflicts += 1
+                    raise IdempotencyKeyConflictError(key)
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    raise IdempotencyKeyInProgressError(key)
+                if not waited:
+                    waited = True
+                    self.waits += 1
+                self._condition.wait(remaining)
+
+    def complete(self, key: str, response: IdempotentResponse) -> None:
+        """処理結果を保存し、完了を待っている呼び出しを起こす"""
+        with self._condition:
+            self._in_flight.pop(key, None)
+            self._responses[key] = _StoredResponse(response, self._clock() + self.ttl_seconds)
+            self._responses.move_to_end(key)
+            self._evict()
+            self._condition.notify_all()
+
+    def release(self, key: str) -> None:
+        """結果を保存せずに処理権を手放す"""
+        with self._condition:
+            self._in_flight.pop(key, None)
+            self._condition.notify_all()
+
+    def _lookup(self, key: str) -> Optional[IdempotentResponse]:
+        stored = self._responses.get(key)
+        if stored is None:
+            return None
+        if stored.expires_at <= self._clock():
+            del self._responses[key]
+            self.expirations += 1
+            return None
+        self._responses.move_to_end(key)
+        return stored.response
+
+    def _evict(self) -> None:
+        # 期限切れのキーを古い側から取り除いてから、件数上限を超えた分を追い出す
+        now = self._clock()
+        while self._responses:
+            oldest = next(iter(self._responses.values()))
+            if oldest.expires_at > now:
+                break
+            self._responses.popitem(last=False)
+            self.expirations += 1
+        while len(self._responses) > self.max_keys:
+            self._responses.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "keys": len(self._responses),
+                "in_flight": len(self._in_flight),
+                "max_keys": self.max_keys,
+                "ttl_seconds": self.ttl_seconds,
+                "executions": self.executions,
+                "replays": self.replays,
+                "waits": self.waits,
+                "conflicts": self.conflicts,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
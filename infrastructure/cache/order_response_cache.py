@@ -0,0 +1,90 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from application.interfaces.order_cache import OrderCacheInterface
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+@dataclass(frozen=True)
+class CachedOrderResponse:
+    """シリアライズ済みの注文レスポンス"""
+    version: int
+    etag: str
+    body: Optional[bytes]  # Noneは無効化済み（versionより前の版は格納しない）
+
+
+def order_etag(order_id: UUID, version: int) -> str:
+    """注文IDと版からETagを作成する"""
+    return f'"{order_id.hex}-{version}"'
+
+
+class OrderResponseCache(OrderCacheInterface):
+    """注文取得レスポンスの件数上限付きLRUキャッシュ
+    
+    注文IDごとに最新の版のシリアライズ済みボディを保持する。無効化した注文には版だけを残し、
+    無効化より前に読み込まれた古い版が後から格納されないようにする（これも件数上限に含まれる）。
+    """
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[UUID, CachedOrderResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def get(self, order_id: UUID) -> Optional[CachedOrderResponse]:
+        """キャッシュ済みのレスポンスを取得する"""
+        with self._lock:
+            entry = self._entries.get(order_id)
+            if entry is None or entry.body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(order_id)
+            self.hits += 1
+            return entry
+    
+    def put(self, order_id: UUID, version: int, body: bytes) -> CachedOrderResponse:
+        """レスポンスを格納する（より新しい版が格納・無効化済みの場合は格納しない）"""
+        entry = CachedOrderResponse(version, order_etag(order_id, version), body)
+        with self._lock:
+            current = self._entries.get(order_id)
+            if current is not None and current.version > version:
+                return entry
+            self._store(order_id, entry)
+        return entry
+    
+    def invalidate(self, order_id: UUID, version: int) -> None:
+        """注文のversionより前の版のキャッシュを無効化する"""
+        with self._lock:
+            current = self._entries.get(order_id)
+            if current is not None and current.version >= version:
+                return
+            self._store(order_id, CachedOrderResponse(version, order_etag(order_id, version), None))
+            self.invalidations += 1
+    
+    def _store(self, order_id: UUID, entry: CachedOrderResponse) -> None:
+        self._entries[order_id] = entry
+        self._entries.move_to_end(order_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """ヒット数・ミス数などを返す"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
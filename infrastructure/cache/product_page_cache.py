@@ -0,0 +1,80 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+@dataclass(frozen=True)
+class CachedProductPage:
+    """シリアライズ済みの製品レスポンス（一覧の1ページ・検索結果・1件）"""
+    version: int
+    etag: str
+    body: bytes
+
+
+def catalog_etag(version: int) -> str:
+    """カタログの版からETagを作成する（同じ版の間は同じURLのレスポンスは変わらない）"""
+    return f'"catalog-{version}"'
+
+
+class ProductPageCache:
+    """製品カタログの版ごとのシリアライズ済みレスポンスのキャッシュ
+    
+    最新の版のレスポンスだけを件数上限付きのLRUで保持し、より新しい版のレスポンスが格納された時点で
+    古い版のレスポンスをまとめて捨てる。版が変わるまでは、同じページを何度要求されてもシリアライズし直さない。
+    """
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._version = 0
+        self._entries: "OrderedDict[Hashable, CachedProductPage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.generations = 0
+    
+    def get(self, version: int, key: Hashable) -> Optional[CachedProductPage]:
+        """その版のキャッシュ済みのレスポンスを取得する"""
+        with self._lock:
+            entry = self._entries.get(key) if version == self._version else None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+    
+    def put(self, version: int, key: Hashable, body: bytes) -> CachedProductPage:
+        """レスポンスを格納する（格納済みの版より古い場合は格納しない）"""
+        entry = CachedProductPage(version, catalog_etag(version), body)
+        with self._lock:
+            if version < self._version:
+                return entry
+            if version > self._version:
+                self._version = version
+                self._entries.clear()
+                self.generations += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+    
+    def stats(self) -> Dict[str, Any]:
+        """ヒット数・ミス数などを返す"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self._version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "generations": self.generations,
+            }
@@ -0,0 +1,144 @@
+import threading
+from datetime import datetime, timedelta
+from time import monotonic, sleep
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from application.interfaces.idempotency_store import (
+    IdempotencyKeyConflictError,
+    IdempotencyKeyInProgressError,
+    IdempotencyStoreInterface,
+    IdempotentResponse
+)
+from infrastructure.cache.idempotency_store import DEFAULT_TTL_SECONDS, DEFAULT_WAIT_SECONDS
+from infrastructure.db.models import IdempotencyKeyModel
+
+# 期限切れの行を削除する間隔（完了した件数）
+PURGE_EVERY = 128
+
+
+class SqlAlchemyIdempotencyStore(IdempotencyStoreInterface):
+    """Idempotency-Key ごとの処理結果を idempotency_keys テーブルに保存するストア
+
+    複数のプロセスで同じキーを共有する。処理権は主キーへの挿入で得て、処理中の行は lease_seconds を過ぎると
+    （処理したプロセスが停止したものとして）別のリクエストが引き継ぐ。完了を待つ呼び出しは poll_interval 秒ごとに行を読み直す。
+    件数の上限はなく、ttl_seconds を過ぎた行を定期的に削除する。
+    """
+
+    def __init__(self,
+                 session_factory: sessionmaker[Session],
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 wait_seconds: float = DEFAULT_WAIT_SECONDS,
+                 lease_seconds: float = 60.0,
+                 poll_interval: float = 0.02):
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.wait_seconds = wait_seconds
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self.replays = 0
+        self.executions = 0
+        self.waits = 0
+        self.conflicts = 0
+        self.purged = 0
+        self._completed_since_purge = 0
+
+    def begin(self, key: str, fingerprint: str, timeout: Optional[float] = None) -> Optional[IdempotentResponse]:
+        """保存済みの結果を返す。なければ処理権を得てNoneを返す（処理中なら完了をポーリングで待つ）"""
+        deadline = monotonic() + (self.wait_seconds if timeout is None else timeout)
+        waited = False
+        while True:
+            try:
+                stored = self._try_begin(key, fingerprint)
+            except IntegrityError:
+                # 同時に同じキーを挿入したリクエストがあった（読み直して結果か処理中の行を確認する）
+                continue
+            if stored is None:
+                self._count("executions")
+                return None
+            if stored.fingerprint != fingerprint:
+                self._count("conflicts")
+                raise IdempotencyKeyConflictError(key)
+            if stored.body:
+                self._count("replays")
+                return stored
+            if monotonic() >= deadline:
+                raise IdempotencyKeyInProgressError(key)
+            if not waited:
+                waited = True
+                self._count("waits")
+            sleep(self.poll_interval)
+
+    def _try_begin(self, key: str, fingerprint: str) -> Optional[IdempotentResponse]:
+        # 既存の行があればその内容を返し（処理中は body が空）、なければ処理中の行を挿入してNoneを返す
+        now = datetime.now()
+        with self.session_factory.begin() as session:
+            row = session.get(IdempotencyKeyModel, key)
+            if row is not None and row.expires_at <= now:
+                session.delete(row)
+                session.flush()
+                row = None
+            if row is not None:
+                return IdempotentResponse(row.fingerprint, row.body or b"")
+            session.add(IdempotencyKeyModel(
+                key=key,
+                fingerprint=fingerprint,
+                body=None,
+                created_at=now,
+                expires_at=now + timedelta(seconds=self.lease_seconds)
+            ))
+        return None
+
+    def complete(self, key: str, response: IdempotentResponse) -> None:
+        """処理結果を保存する"""
+        now = datetime.now()
+        with self.session_factory.begin() as session:
+            session.execute(
+                update(IdempotencyKeyModel)
+                .where(IdempotencyKeyModel.key == key)
+                .values(body=response.body, expires_at=now + timedelta(seconds=self.ttl_seconds))
+            )
+        with self._lock:
+            self._completed_since_purge += 1
+            purge = self._completed_since_purge >= PURGE_EVERY
+            if purge:
+                self._completed_since_purge = 0
+        if purge:
+            self.purge_expired(now)
+
+    def release(self, key: str) -> None:
+        """処理中の行を削除して処理権を手放す"""
+        with self.session_factory.begin() as session:
+            session.execute(
+                delete(IdempotencyKeyModel)
+                .where(IdempotencyKeyModel.key == key, IdempotencyKeyModel.body.is_(None))
+            )
+
+    def purge_expired(self, now: Optional[datetime] = None) -> int:
+        """期限切れの行を削除し、削除した件数を返す"""
+        with self.session_factory.begin() as session:
+            result = session.execute(
+                delete(IdempotencyKeyModel).where(IdempotencyKeyModel.expires_at <= (now or datetime.now()))
+            )
+        with self._lock:
+            self.purged += result.rowcount
+        return result.rowcount
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "ttl_seconds": self.ttl_seconds,
+                "executions": self.executions,
+                "replays": self.replays,
+                "waits": self.waits,
+                "conflicts": self.conflicts,
+                "purged": self.purged,
+            }
@@ -0,0 +1,81 @@
+import threading
+from typing import Dict
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from config.environment import env
+from infrastructure.db.engine import _is_sqlite_memory, configure_sqlite, get_engine
+
+# プロセス全体で共有する非同期エンジンとセッションファクトリ（同期URLごとに1つ）
+_async_engines: Dict[str, AsyncEngine] = {}
+_async_session_factories: Dict[str, async_sessionmaker] = {}
+_lock = threading.Lock()
+
+# 同期URLのドライバを非同期ドライバに置き換える対応表
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def to_async_url(db_url: str) -> str:
+    """同期ドライバのURLを非同期ドライバのURLに変換する"""
+    scheme, separator, rest = db_url.partition("://")
+    dialect = scheme.split("+")[0]
+    if dialect not in _ASYNC_DRIVERS:
+        raise ValueError(f"Unsupported database for async engine: {db_url}")
+    return f"{_ASYNC_DRIVERS[dialect]}{separator}{rest}"
+
+
+def get_async_engine(db_url: str) -> AsyncEngine:
+    """URLに対応するプロセス共有の非同期エンジンを取得する
+
+    テーブル作成は同期エンジン側で行うため、同期ドライバも利用できる必要がある。
+    メモリ上のSQLiteは接続ごとに別DBとなり同期エンジンとデータを共有できないため対象外とする。
+
+    Args:
+        db_url (str): 同期ドライバのデータベースURL
+
+    Returns:
+        AsyncEngine: 接続プール付きの非同期エンジン
+    """
+    engine = _async_engines.get(db_url)
+    if engine is not None:
+        return engine
+
+    if _is_sqlite_memory(db_url):
+        raise ValueError(f"In-memory SQLite cannot be shared with an async engine: {db_url}")
+
+    get_engine(db_url)
+    with _lock:
+        engine = _async_engines.get(db_url)
+        if engine is None:
+            engine = create_async_engine(
+                to_async_url(db_url),
+                pool_size=int(env.DATABASE_POOL_SIZE),
+                max_overflow=int(env.DATABASE_MAX_OVERFLOW),
+                pool_timeout=int(env.DATABASE_POOL_TIMEOUT),
+                pool_recycle=int(env.DATABASE_POOL_RECYCLE),
+                pool_pre_ping=True,
+            )
+            if db_url.startswith("sqlite"):
+                configure_sqlite(engine.sync_engine)
+            _async_engines[db_url] = engine
+            _async_session_factories[db_url] = async_sessionmaker(bind=engine, expire_on_commit=False)
+    return engine
+
+
+def get_async_session_factory(db_url: str) -> async_sessionmaker[AsyncSession]:
+    """URLに対応する非同期セッションファクトリを取得する"""
+    get_async_engine(db_url)
+    return _async_session_factories[db_url]
+
+
+async def dispose_async_engines() -> None:
+    """全ての非同期エンジンの接続プールを破棄する"""
+    engines = list(_async_engines.values())
+    with _lock:
+        _async_engines.clear()
+        _async_session_factories.clear()
+    for engine in engines:
+        await engine.dispose()
@@ -0,0 +1,123 @@
+import threading
+from typing import Dict, List
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from config.environment import env
+from infrastructure.db.models import Base
+
+# プロセス全体で共有するエンジンとセッションファクトリ（URLごとに1つ）
+_engines: Dict[str, Engine] = {}
+_session_factories: Dict[str, sessionmaker] = {}
+_lock = threading.Lock()
+
+
+def _is_sqlite_memory(db_url: str) -> bool:
+    return db_url.startswith("sqlite") and (":memory:" in db_url or db_url.endswith("://"))
+
+
+def sqlite_pragmas() -> List[str]:
+    """ファイルのSQLiteの接続ごとに実行するPRAGMA
+
+    WALでは読み取りが書き込みを待たず、書き込みは busy_timeout の間だけ他のプロセスの書き込みの終了を待つ。
+    synchronous=NORMAL はチェックポイント時のみfsyncする（電源断で直近のコミットを失うことはあるが壊れない）。
+    """
+    return [
+        f"PRAGMA journal_mode={env.SQLITE_JOURNAL_MODE}",
+        f"PRAGMA synchronous={env.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA busy_timeout={int(env.SQLITE_BUSY_TIMEOUT_MS)}",
+        f"PRAGMA cache_size=-{int(env.SQLITE_CACHE_SIZE_KB)}",
+        f"PRAGMA mmap_size={int(env.SQLITE_MMAP_SIZE)}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+
+
+def configure_sqlite(engine: Engine) -> None:
+    """ファイルのSQLiteのエンジンが作る接続にPRAGMAを設定する（非同期エンジンは sync_engine を渡す）"""
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def _create_tables(engine: Engine) -> None:
+    """テーブルが存在しなければ作成する"""
+    try:
+        Base.metadata.create_all(engine)
+    except OperationalError:
+        # 複数のワーカープロセスが同時に起動すると、確認から作成までの間に他のプロセスが作成していることがある
+        Base.metadata.create_all(engine)
+
+
+def _create_engine(db_url: str) -> Engine:
+    """接続プール付きのエンジンを作成する"""
+    if _is_sqlite_memory(db_url):
+        # メモリDBは接続ごとに別DBになるため、単一接続を共有する
+        return create_engine(
+            db_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+    connect_args = {"check_same_thread": False} if db_url.startswith("sqlite") else {}
+    engine = create_engine(
+        db_url,
+        connect_args=connect_args,
+        pool_size=int(env.DATABASE_POOL_SIZE),
+        max_overflow=int(env.DATABASE_MAX_OVERFLOW),
+        pool_timeout=int(env.DATABASE_POOL_TIMEOUT),
+        pool_recycle=int(env.DATABASE_POOL_RECYCLE),
+        pool_pre_ping=True,
+    )
+    if db_url.startswith("sqlite"):
+        configure_sqlite(engine)
+    return engine
+
+
+def get_engine(db_url: str) -> Engine:
+    """URLに対応するプロセス共有のエンジンを取得する
+
+    初回呼び出し時にエンジンを作成し、テーブルが存在しなければ作成する。
+
+    Args:
+        db_url (str): データベースURL
+
+    Returns:
+        Engine: 接続プール付きのエンジン
+    """
+    engine = _engines.get(db_url)
+    if engine is not None:
+        return engine
+
+    with _lock:
+        engine = _engines.get(db_url)
+        if engine is None:
+            engine = _create_engine(db_url)
+            _create_tables(engine)
+            _engines[db_url] = engine
+            _session_factories[db_url] = sessionmaker(bind=engine, expire_on_commit=False)
+    return engine
+
+
+def get_session_factory(db_url: str) -> sessionmaker[Session]:
+    """URLに対応するセッションファクトリを取得する"""
+    get_engine(db_url)
+    return _session_factories[db_url]
+
+
+def dispose_engines() -> None:
+    """全てのエンジンの接続プールを破棄する"""
+    with _lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _session_factories.clear()
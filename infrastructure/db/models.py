@@ -0,0 +1,130 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, LargeBinary, String, Text, Uuid
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+
+class Base(DeclarativeBase):
+    """ORMモデルの基底クラス"""
+    pass
+
+
+class CustomerModel(Base):
+    """顧客テーブル"""
+    __tablename__ = "customers"
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    name: Mapped[str] = mapped_column(String(255))
+    email: Mapped[str] = mapped_column(String(255))
+    # 正規化したメールアドレス（一意制約で重複登録を防ぐ）
+    email_normalized: Mapped[str] = mapped_column(String(255), unique=True)
+    phone: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    address: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class ProductModel(Base):
+    """製品テーブル"""
+    __tablename__ = "products"
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    name: Mapped[str] = mapped_column(String(255), index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    price: Mapped[float] = mapped_column(Float)
+    stock_quantity: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class OrderModel(Base):
+    """注文テーブル"""
+    __tablename__ = "orders"
+    # 顧客ごとのキーセットページネーション用の複合インデックス
+    __table_args__ = (Index("ix_orders_customer_created_id", "customer_id", "created_at", "id"),)
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    customer_id: Mapped[UUID] = mapped_column(Uuid)
+    status: Mapped[str] = mapped_column(String(20), index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    version: Mapped[int] = mapped_column(Integer, default=1)
+
+    # 注文アイテムは常に一緒に読み込む（selectinで一括取得しN+1を防ぐ）
+    items: Mapped[List["OrderItemModel"]] = relationship(
+        back_populates="order",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        order_by="OrderItemModel.position",
+    )
+
+
+class OrderItemModel(Base):
+    """注文アイテムテーブル"""
+    __tablename__ = "order_items"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    order_id: Mapped[UUID] = mapped_column(ForeignKey("orders.id", ondelete="CASCADE"), index=True)
+    position: Mapped[int] = mapped_column(Integer)
+    product_id: Mapped[UUID] = mapped_column(Uuid)
+    quantity: Mapped[int] = mapped_column(Integer)
+    price_per_unit: Mapped[float] = mapped_column(Float)
+
+    order: Mapped[OrderModel] = relationship(back_populates="items")
+
+
+class OrderSummaryModel(Base):
+    """注文サマリーテーブル（読み取りモデル）
+
+    表示用に整形済みの注文をJSON文字列で保持し、読み取り時は結合も再計算も行わない。
+    """
+    __tablename__ = "order_summaries"
+    __table_args__ = (Index("ix_order_summaries_customer_created_id", "customer_id", "created_at", "order_id"),)
+
+    order_id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    customer_id: Mapped[UUID] = mapped_column(Uuid)
+    status: Mapped[str] = mapped_column(String(20))
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    total_amount: Mapped[float] = mapped_column(Float)
+    version: Mapped[int] = mapped_column(Integer, default=1)
+    payload: Mapped[str] = mapped_column(Text)
+
+
+class OutboxEventModel(Base):
+    """アウトボックステーブル（配信待ちのドメインイベント）
+
+    注文と同じトランザクションで挿入され、バックグラウンドの配信処理がstatusを更新する。
+    配信処理は行を IN_FLIGHT にして claimed_by と claimed_at を記録してから配信する（期限切れの行は再び確保できる）。
+    """
+    __tablename__ = "outbox_events"
+    # 未配信のイベントを発生順に取り出すためのインデックス
+    __table_args__ = (Index("ix_outbox_events_status_occurred", "status", "occurred_at"),)
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(100))
+    aggregate_id: Mapped[UUID] = mapped_column(Uuid)
+    payload: Mapped[str] = mapped_column(Text)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime)
+    status: Mapped[str] = mapped_column(String(20))  # PENDING, IN_FLIGHT, DISPATCHED, FAILED
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    claimed_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    dispatched_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+
+class IdempotencyKeyModel(Base):
+    """Idempotency-Key ごとの処理結果テーブル
+
+    body がNULLの行は処理中で、expires_at までに完了しなければ同じキーの別のリクエストが処理を引き継ぐ。
+    完了した行の expires_at は結果を保持する期限。
+    """
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64))
+    body: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, index=True)
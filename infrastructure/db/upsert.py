@@ -0,0 +1,39 @@
+from typing import Any, List, Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.sql.dml import Insert
+
+# ON CONFLICT に対応した方言ごとのINSERT（DATABASE_URL が対応する SQLite と PostgreSQL のみ）
+_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def upsert_statement(dialect_name: str, model: Any, key_columns: List[str], update_columns: List[str],
+                     only_if_newer: Optional[str] = None) -> Insert:
+    """キーが衝突した行を更新する INSERT ... ON CONFLICT DO UPDATE を作成する
+
+    only_if_newer に列名を指定すると、その列の値が既存の行より大きい場合だけ更新する
+    （遅れて届いた古い内容で新しい行を上書きしない）。
+
+    Args:
+        dialect_name (str): エンジンの方言名（engine.dialect.name）
+        model (Any): 対象のモデルクラス
+        key_columns (List[str]): 衝突を判定する一意な列
+        update_columns (List[str]): 衝突した場合に更新する列
+        only_if_newer (Optional[str], optional): 更新の条件にする版の列. Defaults to None.
+
+    Returns:
+        Insert: executemany で実行できるINSERT文
+    """
+    insert_for = _INSERTS.get(dialect_name)
+    if insert_for is None:
+        raise ValueError(f"Upsert is not supported for dialect: {dialect_name}")
+    stmt = insert_for(model)
+    where = getattr(model, only_if_newer) < stmt.excluded[only_if_newer] if only_if_newer else None
+    return stmt.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={column: stmt.excluded[column] for column in update_columns},
+        where=where
+    )
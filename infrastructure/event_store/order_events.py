@@ -0,0 +1,132 @@
+"""注文のイベントストリームに記録するイベント
+
+アウトボックスに書き出すドメインイベント（domain.events）とは別に、注文の状態を再現するための
+変更を全て記録する。各イベントは適用後の版（version）と変更が有効になった日時（recorded_at）を持ち、
+apply で注文に適用する。同じ書き込みで記録したイベントは同じ版を持つ。
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from domain.entities.order import Order, OrderItem, OrderStatus
+
+
+@dataclass(frozen=True, slots=True)
+class OrderStreamEvent:
+    """注文のイベントストリームのイベントの基底クラス"""
+    version: int
+    recorded_at: datetime
+
+    def apply(self, order: Order) -> None:
+        order.version = self.version
+        order.updated_at = self.recorded_at
+
+
+@dataclass(frozen=True, slots=True)
+class Placed(OrderStreamEvent):
+    """注文が作成された（recorded_at が作成日時になる）"""
+    customer_id: UUID
+
+    def apply(self, order: Order) -> None:
+        order.customer_id = self.customer_id
+        order.created_at = self.recorded_at
+        order.status = OrderStatus.PENDING
+        order.version = self.version
+
+
+@dataclass(frozen=True, slots=True)
+class ItemAdded(OrderStreamEvent):
+    """注文アイテムが追加された"""
+    item: OrderItem
+
+    def apply(self, order: Order) -> None:
+        order.items.append(self.item)
+        OrderStreamEvent.apply(self, order)
+
+
+@dataclass(frozen=True, slots=True)
+class ItemRemoved(OrderStreamEvent):
+    """商品の注文アイテムが削除された"""
+    product_id: UUID
+
+    def apply(self, order: Order) -> None:
+        order.items = [item for item in order.items if item.product_id != self.product_id]
+        OrderStreamEvent.apply(self, order)
+
+
+@dataclass(frozen=True, slots=True)
+class ItemsReplaced(OrderStreamEvent):
+    """追加・削除で表せない形で注文アイテムが書き換えられた"""
+    items: tuple
+
+    def apply(self, order: Order) -> None:
+        order.items = list(self.items)
+        OrderStreamEvent.apply(self, order)
+
+
+@dataclass(frozen=True, slots=True)
+class StatusChanged(OrderStreamEvent):
+    """注文ステータスが変更された（キャンセル以外）"""
+    status: OrderStatus
+
+    def apply(self, order: Order) -> None:
+        order.status = self.status
+        OrderStreamEvent.apply(self, order)
+
+
+@dataclass(frozen=True, slots=True)
+class Cancelled(OrderStreamEvent):
+    """注文がキャンセルされた"""
+
+    def apply(self, order: Order) -> None:
+        order.status = OrderStatus.CANCELLED
+        OrderStreamEvent.apply(self, order)
+
+
+def placed_events(order: Order) -> List[OrderStreamEvent]:
+    """新しい注文のイベント（作成と、作成時点のアイテムの追加）"""
+    added_at = order.updated_at if order.updated_at is not None else order.created_at
+    events: List[OrderStreamEvent] = [Placed(order.version, order.created_at, order.customer_id)]
+    events.extend(ItemAdded(order.version, added_at, item) for item in order.items)
+    if order.status != OrderStatus.PENDING:
+        events.append(_status_event(order.version, added_at, order.status))
+    return events
+
+
+def changed_events(previous: Order, order: Order, version: int, recorded_at: datetime) -> List[OrderStreamEvent]:
+    """保存済みの状態から変更後の状態にするイベント（変更がなければ空）"""
+    events: List[OrderStreamEvent] = []
+    if order.items != previous.items:
+        events.extend(_item_events(previous.items, order.items, version, recorded_at))
+    if order.status != previous.status:
+        events.append(_status_event(version, recorded_at, order.status))
+    return events
+
+
+def _status_event(version: int, recorded_at: datetime, status: OrderStatus) -> OrderStreamEvent:
+    if status == OrderStatus.CANCELLED:
+        return Cancelled(version, recorded_at)
+    return StatusChanged(version, recorded_at, OrderStatus(status))
+
+
+def _item_events(before: List[OrderItem], after: List[OrderItem], version: int,
+                 recorded_at: datetime) -> List[OrderStreamEvent]:
+    # 商品単位の削除（Order.remove_item）と末尾への追加（Order.add_item）で表せる場合はそのイベントにする
+    remaining = {item.product_id for item in after}
+    removed: List[UUID] = []
+    for item in before:
+        if item.product_id not in remaining and item.product_id not in removed:
+            removed.append(item.product_id)
+    kept = [item for item in before if item.product_id not in removed]
+    if after[:len(kept)] != kept:
+        return [ItemsReplaced(version, recorded_at, tuple(after))]
+    return ([ItemRemoved(version, recorded_at, product_id) for product_id in removed] +
+            [ItemAdded(version, recorded_at, item) for item in after[len(kept):]])
+
+
+def replay(order: Order, events: List[OrderStreamEvent]) -> Order:
+    """イベントを順に注文に適用する"""
+    for event in events:
+        event.apply(order)
+    return order
@@ -0,0 +1,178 @@
+import os
+import socket
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from domain.repositories.outbox_repository import OutboxMessage, OutboxRepositoryInterface
+
+EventHandler = Callable[[OutboxMessage], None]
+
+
+class OutboxDispatcher:
+    """アウトボックスのメッセージをバックグラウンドで配信する
+
+    1つのスレッドが未配信のメッセージをbatch_size件ずつ取り出し、上限付きのスレッドプールで
+    購読者に渡す。同じ注文のメッセージは発生順に1つのタスクで配信する。購読者が例外を投げた場合は
+    間隔を倍にしながらmax_attempts回まで再試行し、それでも失敗したメッセージは配信対象から外す。
+    その場合、同じ注文の後のメッセージは順序を守るために配信せず、未配信のまま残す
+    （アウトボックスは配信に失敗したメッセージがある注文のメッセージを以降も確保しない）。
+    リクエストの処理はアウトボックスへの追加だけで終わり、購読者の処理時間の影響を受けない。
+    メッセージは配信中として確保してから配信するため、複数のワーカープロセスがそれぞれ配信処理を
+    動かしても同じメッセージは1つのプロセスだけが配信する。確保したプロセスが lease_seconds 以内に
+    配信を終えなかったメッセージは、他のプロセスが確保し直す。
+    """
+
+    def __init__(self,
+                 outbox: OutboxRepositoryInterface,
+                 max_workers: int = 4,
+                 batch_size: int = 100,
+                 poll_interval: float = 0.5,
+                 max_attempts: int = 5,
+                 retry_backoff: float = 0.05,
+                 lease_seconds: float = 30.0):
+        self.outbox = outbox
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.lease_seconds = lease_seconds
+        # 確保した行に記録する配信処理の識別子（ホスト名・プロセスID・インスタンスごとの乱数）
+        self.claimed_by = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._handlers: Dict[str, List[EventHandler]] = defaultdict(list)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._metrics_lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        self.dispatched_total = 0
+        self.failed_total = 0
+        self.retries_total = 0
+        self.batches_total = 0
+        self.last_batch_ms = 0.0
+        self.last_dispatch_lag_ms = 0.0
+
+    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+        """イベントの種類ごとに購読者を登録する（購読者のいないメッセージはそのまま配信済みになる）"""
+        self._handlers[event_type].append(handler)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """バックグラウンドでの配信を開始する"""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="outbox-worker")
+        self._thread = threading.Thread(target=self._run, name="outbox-dispatcher", daemon=True)
+        self._started_at = perf_counter()
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """配信を停止する（処理中のバッチは完了を待つ）"""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                dispatched = self.dispatch_batch()
+            except Exception as e:
+                print(f"Outbox dispatch failed: {e}")
+                dispatched = 0
+            # 未配信が残っていればすぐに次のバッチを取り出す
+            if dispatched < self.batch_size:
+                self._stopping.wait(self.poll_interval)
+
+    def dispatch_batch(self) -> int:
+        """未配信のメッセージを1バッチ分配信し、取り出した件数を返す
+
+        バックグラウンドで実行していない場合は呼び出し元のスレッドで配信する。
+        """
+        messages = self.outbox.claim_pending(self.batch_size, self.claimed_by, self.lease_seconds)
+        if not messages:
+            return 0
+        started = perf_counter()
+
+        by_aggregate: Dict[UUID, List[OutboxMessage]] = defaultdict(list)
+        for message in messages:
+            by_aggregate[message.aggregate_id].append(message)
+        if self._executor is not None:
+            results = list(self._executor.map(self._deliver_in_order, by_aggregate.values()))
+        else:
+            results = [self._deliver_in_order(group) for group in by_aggregate.values()]
+        delivered = [message for group, _ in results for message in group]
+        self.outbox.mark_dispatched([message.id for message in delivered])
+        self.outbox.release([message.id for _, skipped in results for message in skipped])
+
+        now = datetime.now()
+        with self._metrics_lock:
+            self.dispatched_total += len(delivered)
+            self.batches_total += 1
+            self.last_batch_ms = (perf_counter() - started) * 1000
+            if delivered:
+                self.last_dispatch_lag_ms = max(
+                    (now - message.occurred_at).total_seconds() * 1000 for message in delivered
+                )
+        return len(messages)
+
+    def _deliver_in_order(self, messages: List[OutboxMessage]) -> Tuple[List[OutboxMessage], List[OutboxMessage]]:
+        """同じ注文のメッセージを発生順に配信し、配信できたものと配信しなかったものを返す
+
+        配信に失敗したメッセージがあれば、後のメッセージは先に届かないようにそこで止める。
+        """
+        for index, message in enumerate(messages):
+            if not self._deliver(message):
+                return messages[:index], messages[index + 1:]
+        return messages, []
+
+    def _deliver(self, message: OutboxMessage) -> bool:
+        """購読者にメッセージを渡す（成功した購読者には再送しない）"""
+        remaining = list(self._handlers.get(message.event_type, ()))
+        attempt = 1
+        while remaining:
+            try:
+                remaining[0](message)
+                remaining.pop(0)
+            except Exception as e:
+                if attempt >= self.max_attempts or self._stopping.is_set():
+                    self.outbox.mark_failed(message.id, attempt, str(e))
+                    with self._metrics_lock:
+                        self.failed_total += 1
+                    return False
+                with self._metrics_lock:
+                    self.retries_total += 1
+                self._stopping.wait(self.retry_backoff * 2 ** (attempt - 1))
+                attempt += 1
+        return True
+
+    def metrics(self) -> Dict[str, Any]:
+        """配信のスループットと遅延を返す"""
+        oldest = self.outbox.oldest_pending_at()
+        uptime = perf_counter() - self._started_at if self._started_at is not None else 0.0
+        with self._metrics_lock:
+            return {
+                "running": self.running,
+                "workers": self.max_workers,
+                "pending": self.outbox.pending_count(),
+                "dispatched_total": self.dispatched_total,
+                "failed_total": self.failed_total,
+                "retries_total": self.retries_total,
+                "batches_total": self.batches_total,
+                "dispatched_per_second": round(self.dispatched_total / uptime, 3) if uptime else 0.0,
+                "last_batch_ms": round(self.last_batch_ms, 3),
+                "last_dispatch_lag_ms": round(self.last_dispatch_lag_ms, 3),
+                "oldest_pending_age_ms": round((datetime.now() - oldest).total_seconds() * 1000, 3) if oldest else 0.0,
+            }
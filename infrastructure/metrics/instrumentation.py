@@ -0,0 +1,106 @@
+import functools
+import inspect
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Callable, Optional, Tuple, TypeVar
+
+from infrastructure.metrics.registry import MetricFamily, MetricsRegistry, metrics
+
+T = TypeVar("T")
+
+LAYER_DURATION = "app_layer_duration_seconds"
+LAYER_ERRORS = "app_layer_errors_total"
+
+# リクエストの受信時刻（ミドルウェアが設定し、コントローラーの入口で依存関係の解決にかかった時間を求める）
+request_started: ContextVar[Optional[float]] = ContextVar("request_started", default=None)
+
+
+@functools.lru_cache(maxsize=None)
+def layer_metrics(registry: MetricsRegistry) -> Tuple[MetricFamily, MetricFamily]:
+    """レイヤーの処理時間のヒストグラムと例外のカウンターを返す"""
+    return (
+        registry.histogram(LAYER_DURATION, "Time spent in a call across a layer boundary.",
+                           ("layer", "component", "method")),
+        registry.counter(LAYER_ERRORS, "Calls across a layer boundary that raised an exception.",
+                         ("layer", "component", "method")),
+    )
+
+
+def timed_call(function: Callable, layer: str, component: str, method: str,
+               registry: MetricsRegistry = metrics) -> Callable:
+    """関数の呼び出しごとに処理時間を記録する関数を返す（コルーチン関数はコルーチン関数のまま包む）
+
+    registry.enabled が False の間は計測せずにそのまま呼び出す。
+    """
+    durations, errors = layer_metrics(registry)
+    duration = durations.labels(layer, component, method)
+    error = errors.labels(layer, component, method)
+
+    if inspect.iscoroutinefunction(function):
+        async def timed(*args, **kwargs):
+            if not registry.enabled:
+                return await function(*args, **kwargs)
+            started = perf_counter()
+            try:
+                return await function(*args, **kwargs)
+            except BaseException:
+                error.inc()
+                raise
+            finally:
+                duration.observe(perf_counter() - started)
+    else:
+        def timed(*args, **kwargs):
+            if not registry.enabled:
+                return function(*args, **kwargs)
+            started = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            except BaseException:
+                error.inc()
+                raise
+            finally:
+                duration.observe(perf_counter() - started)
+    return functools.wraps(function)(timed)
+
+
+def timed(layer: str, component: Optional[str] = None, registry: MetricsRegistry = metrics):
+    """モジュールレベルの関数の処理時間を記録するデコレーター"""
+    def decorator(function: Callable) -> Callable:
+        return timed_call(function, layer, component or function.__module__.rsplit(".", 1)[-1],
+                          function.__name__, registry)
+    return decorator
+
+
+class InstrumentedProxy:
+    """対象のオブジェクトの公開メソッドの呼び出しを計測するプロキシ
+
+    属性の参照は対象にそのまま委譲し、メソッドだけを計測する関数に包む（包んだ関数はプロキシごとに保持する）。
+    """
+
+    def __init__(self, target, layer: str, registry: MetricsRegistry = metrics):
+        self.__wrapped__ = target
+        self._layer = layer
+        self._registry = registry
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.__wrapped__, name)
+        if name.startswith("_") or not inspect.ismethod(attribute):
+            return attribute
+        wrapped = timed_call(attribute, self._layer, type(self.__wrapped__).__name__, name, self._registry)
+        self.__dict__[name] = wrapped
+        return wrapped
+
+    def __repr__(self) -> str:
+        return f"InstrumentedProxy({self.__wrapped__!r}, layer={self._layer!r})"
+
+
+def instrument(target: T, layer: str, registry: MetricsRegistry = metrics) -> T:
+    """計測が有効な場合は対象をプロキシで包んで返す（無効な場合やNoneの場合は対象をそのまま返す）"""
+    if target is None or not registry.enabled:
+        return target
+    return InstrumentedProxy(target, layer, registry)
+
+
+def unwrap(target):
+    """プロキシで包まれている場合は元のオブジェクトを返す"""
+    return getattr(target, "__wrapped__", target)
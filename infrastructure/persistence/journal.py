@@ -0,0 +1,274 @@
+"""メモリ内リポジトリの変更を書き込む追記専用のジャーナルとスナップショット
+
+ジャーナルとスナップショットは同じフレームを並べたファイルで、フレームは
+ペイロード長（uint32）・CRC32（種別を初期値として計算する）・種別（uint8）・ペイロードからなる。
+ペイロードは16バイトのIDと record_codec の形式のバイト列（削除の場合はIDのみ）。
+
+- ジャーナル: journal.{世代}.log に変更を順に追記する。途中で切れた末尾のフレームは復元時に切り詰める
+- スナップショット: snapshot.bin にある時点の全件を書き、対応する世代以降のジャーナルと合わせて復元する
+  一時ファイルに書いてfsyncしてから置き換えるため、書き込み途中のファイルが読まれることはない
+"""
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+# 種別（削除はDELETEとの論理和）
+ORDERS = 1
+CUSTOMERS = 2
+PRODUCTS = 3
+DELETE = 0x80
+# スナップショットの終端（ペイロードは書き込んだ件数）
+_END = 0x7F
+
+FRAME = struct.Struct("<IIB")
+_SNAPSHOT_HEADER = struct.Struct("<8sQ")
+_SNAPSHOT_MAGIC = b"ORDSNAP1"
+_COUNT = struct.Struct("<Q")
+_KEY_SIZE = 16
+
+SNAPSHOT_FILE = "snapshot.bin"
+_LOG_FILE = re.compile(r"^journal\.(\d{10})\.log$")
+
+# fsyncの方針（always: 書き込みごと, interval: 一定間隔, never: OSに任せる）
+FSYNC_POLICIES = ("always", "interval", "never")
+
+
+class JournalCorruptedError(Exception):
+    """ジャーナルまたはスナップショットが読み取れない"""
+
+    def __init__(self, path: str, offset: int, reason: str):
+        self.path = path
+        self.offset = offset
+        super().__init__(f"{path} is corrupted at offset {offset}: {reason}")
+
+
+def encode_frame(kind: int, key: bytes, record: bytes = b"") -> bytes:
+    payload = key + record
+    return FRAME.pack(len(payload), zlib.crc32(payload, kind), kind) + payload
+
+
+def read_frames(buffer, path: str, offset: int = 0) -> Iterator[Tuple[int, memoryview, int]]:
+    """フレームを順に (種別, ペイロード, 次のフレームの位置) で返す（壊れたフレームでは例外）"""
+    view = memoryview(buffer)
+    end = len(view)
+    header_size = FRAME.size
+    while offset < end:
+        if end - offset < header_size:
+            raise JournalCorruptedError(path, offset, "truncated frame header")
+        length, checksum, kind = FRAME.unpack_from(view, offset)
+        start = offset + header_size
+        if end - start < length:
+            raise JournalCorruptedError(path, offset, "truncated frame payload")
+        payload = view[start:start + length]
+        if zlib.crc32(payload, kind) != checksum:
+            raise JournalCorruptedError(path, offset, "checksum mismatch")
+        offset = start + length
+        yield kind, payload, offset
+
+
+def log_path(directory: str, generation: int) -> str:
+    return os.path.join(directory, f"journal.{generation:010d}.log")
+
+
+def log_generations(directory: str) -> List[int]:
+    """ディレクトリにあるジャーナルの世代を昇順で返す"""
+    matches = (_LOG_FILE.match(name) for name in os.listdir(directory))
+    return sorted(int(match.group(1)) for match in matches if match)
+
+
+class JournalState:
+    """スナップショットとジャーナルを適用した結果（IDごとの最新のバイト列）
+
+    適用中はIDをバイト列のまま扱い（UUIDのハッシュはPythonで計算されるため）、items で最後に1回だけUUIDにする。
+    """
+
+    def __init__(self):
+        self.records: Dict[int, Dict[bytes, bytes]] = {ORDERS: {}, CUSTOMERS: {}, PRODUCTS: {}}
+        self.frames = 0
+
+    def apply(self, kind: int, payload: memoryview) -> None:
+        key = bytes(payload[:_KEY_SIZE])
+        if kind & DELETE:
+            self.records[kind & ~DELETE].pop(key, None)
+        else:
+            self.records[kind][key] = bytes(payload[_KEY_SIZE:])
+        self.frames += 1
+
+    def items(self, kind: int) -> Iterator[Tuple[UUID, bytes]]:
+        """種別ごとの (ID, バイト列) を返す"""
+        return ((UUID(bytes=key), record) for key, record in self.records[kind].items())
+
+    def count(self, kind: int) -> int:
+        return len(self.records[kind])
+
+    def replay_log(self, path: str, truncate_torn_tail: bool) -> int:
+        """ジャーナルを適用する
+
+        truncate_torn_tail が真の場合は、壊れたフレーム以降を書き込み途中のものとして切り詰める。
+        切り詰めたバイト数を返す。
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        try:
+            for kind, payload, _ in read_frames(data, path):
+                self.apply(kind, payload)
+        except JournalCorruptedError as e:
+            if not truncate_torn_tail:
+                raise
+            with open(path, "r+b") as file:
+                file.truncate(e.offset)
+                os.fsync(file.fileno())
+            return len(data) - e.offset
+        return 0
+
+    def load_snapshot(self, path: str) -> int:
+        """スナップショットを読み込み、その世代を返す（メモリマップで読み、ファイル全体をコピーしない）"""
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if len(buffer) < _SNAPSHOT_HEADER.size:
+                raise JournalCorruptedError(path, 0, "truncated header")
+            magic, generation = _SNAPSHOT_HEADER.unpack_from(buffer)
+            if magic != _SNAPSHOT_MAGIC:
+                raise JournalCorruptedError(path, 0, "unknown format")
+            written = self._apply_snapshot(buffer, path)
+            if written is None:
+                raise JournalCorruptedError(path, len(buffer), "missing end of snapshot")
+        return generation
+
+    def _apply_snapshot(self, buffer: mmap.mmap, path: str) -> Optional[int]:
+        # メモリマップを閉じる前にビューを全て手放せるよう、読み取りはこの関数の中で完結させる
+        frames = read_frames(buffer, path, _SNAPSHOT_HEADER.size)
+        apply = self.apply
+        try:
+            for kind, payload, _ in frames:
+                if kind == _END:
+                    return _COUNT.unpack(payload)[0]
+                apply(kind, payload)
+        finally:
+            frames.close()
+        return None
+
+
+def write_snapshot(directory: str, generation: int,
+                   collections: Iterable[Tuple[int, Iterable[Tuple[UUID, bytes]]]]) -> int:
+    """全件のスナップショットを書いて置き換え、書き込んだ件数を返す"""
+    path = os.path.join(directory, SNAPSHOT_FILE)
+    temporary = path + ".tmp"
+    written = 0
+    with open(temporary, "wb", buffering=1 << 20) as file:
+        file.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, generation))
+        for kind, records in collections:
+            for key, record in records:
+                file.write(encode_frame(kind, key.bytes, record))
+                written += 1
+        file.write(encode_frame(_END, _COUNT.pack(written)))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+    _fsync_directory(directory)
+    return written
+
+
+def _fsync_directory(directory: str) -> None:
+    # ファイルの作成・置き換え・削除をディレクトリのエントリとして確定させる（Windowsでは不要で、開けない）
+    if os.name != "posix":
+        return
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+class Journal:
+    """変更を現在の世代のログに追記する
+
+    追記はフレーム単位でロックし、呼び出し元は自分のストアのロックを保持したまま追記する。
+    rotate で次の世代のログに切り替え、スナップショットに含めた古い世代は remove_before で削除する。
+    """
+
+    def __init__(self, directory: str, generation: int, fsync: str = "interval"):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.directory = directory
+        self.fsync = fsync
+        self.lock = threading.Lock()
+        self.generation = generation
+        self.size = 0
+        self.appended_total = 0
+        self._file: Optional[BinaryIO] = None
+        self._open(generation)
+
+    def put_order(self, order_id: UUID, record: bytes) -> None:
+        self._append(encode_frame(ORDERS, order_id.bytes, record))
+
+    def delete_order(self, order_id: UUID) -> None:
+        self._append(encode_frame(ORDERS | DELETE, order_id.bytes))
+
+    def put_customer(self, customer_id: UUID, record: bytes) -> None:
+        self._append(encode_frame(CUSTOMERS, customer_id.bytes, record))
+
+    def delete_customer(self, customer_id: UUID) -> None:
+        self._append(encode_frame(CUSTOMERS | DELETE, customer_id.bytes))
+
+    def put_product(self, product_id: UUID, record: bytes) -> None:
+        self._append(encode_frame(PRODUCTS, product_id.bytes, record))
+
+    def delete_product(self, product_id: UUID) -> None:
+        self._append(encode_frame(PRODUCTS | DELETE, product_id.bytes))
+
+    def sync(self) -> None:
+        """バッファをOSに書き出し、方針が never でなければfsyncする"""
+        with self.lock:
+            if self._file is not None:
+                self._flush()
+
+    def rotate(self) -> int:
+        """現在のログを確定させて次の世代のログに切り替え、新しい世代を返す"""
+        with self.lock:
+            self._close()
+            self._open(self.generation + 1)
+            return self.generation
+
+    def remove_before(self, generation: int) -> None:
+        """指定した世代より前のログを削除する"""
+        for old in log_generations(self.directory):
+            if old < generation:
+                os.remove(log_path(self.directory, old))
+        _fsync_directory(self.directory)
+
+    def close(self) -> None:
+        with self.lock:
+            self._close()
+
+    def _append(self, frame: bytes) -> None:
+        with self.lock:
+            if self._file is None:
+                raise RuntimeError("Journal is closed")
+            self._file.write(frame)
+            self.size += len(frame)
+            self.appended_total += 1
+            if self.fsync == "always":
+                self._flush()
+
+    def _open(self, generation: int) -> None:
+        self.generation = generation
+        path = log_path(self.directory, generation)
+        self._file = open(path, "ab", buffering=1 << 16)
+        self.size = self._file.tell()
+        _fsync_directory(self.directory)
+
+    def _flush(self) -> None:
+        self._file.flush()
+        if self.fsync != "never":
+            os.fsync(self._file.fileno())
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._flush()
+            self._file.close()
+            self._file = None
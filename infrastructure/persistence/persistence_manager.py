@@ -0,0 +1,211 @@
+import gc
+import os
+import threading
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from infrastructure.persistence.journal import (
+    CUSTOMERS,
+    ORDERS,
+    PRODUCTS,
+    SNAPSHOT_FILE,
+    Journal,
+    JournalState,
+    log_generations,
+    log_path,
+    write_snapshot
+)
+from infrastructure.persistence.record_codec import decode_customer, decode_product, encode_customer, encode_product
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderStore
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+
+if TYPE_CHECKING:
+    from infrastructure.analytics.order_line_columns import OrderLineColumns
+
+
+class PersistenceManager:
+    """メモリ内の注文ストア・顧客・製品リポジトリをスナップショットとジャーナルで永続化する
+
+    open で最新のスナップショットとそれ以降のジャーナルから各リポジトリを復元し、
+    以後の変更を新しい世代のジャーナルに追記させる。バックグラウンドのスレッドが
+    fsync_interval ごとにジャーナルを書き出し、snapshot_interval 秒ごと、または
+    ジャーナルが compact_log_bytes を超えた時点でスナップショットを取り直して古いジャーナルを削除する。
+    ジャーナルの各レコードは変更後の状態全体のため、スナップショットと重複して適用しても結果は変わらない。
+    """
+
+    def __init__(self,
+                 directory: str,
+                 order_store: InMemoryOrderStore,
+                 customer_repository: InMemoryCustomerRepository,
+                 product_repository: InMemoryProductRepository,
+                 order_lines: Optional["OrderLineColumns"] = None,
+                 fsync: str = "interval",
+                 fsync_interval: float = 1.0,
+                 snapshot_interval: float = 300.0,
+                 compact_log_bytes: int = 64 * 1024 * 1024):
+        self.directory = directory
+        self.order_store = order_store
+        self.customer_repository = customer_repository
+        self.product_repository = product_repository
+        self.order_lines = order_lines
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.snapshot_interval = snapshot_interval
+        self.compact_log_bytes = compact_log_bytes
+        self.journal: Optional[Journal] = None
+        self.restored = False
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._snapshot_at = perf_counter()
+        self.restore_ms = 0.0
+        self.restored_counts: Dict[str, int] = {}
+        self.truncated_bytes = 0
+        self.snapshots_total = 0
+        self.last_snapshot_ms = 0.0
+        self.last_snapshot_records = 0
+
+    def open(self) -> "PersistenceManager":
+        """初回は保存済みの状態を復元し、変更をジャーナルに書き込み始める"""
+        with self._lock:
+            if not self.restored:
+                self.restore()
+            if self.journal is None:
+                # 復元時に切り詰めたログには追記せず、常に新しい世代から書き始める
+                generations = log_generations(self.directory)
+                self.journal = Journal(self.directory, (generations[-1] + 1) if generations else 1, self.fsync)
+                self._attach(self.journal)
+                self._snapshot_at = perf_counter()
+        return self
+
+    def restore(self) -> Dict[str, int]:
+        """スナップショットとジャーナルを適用した状態を空のリポジトリに読み込み、件数を返す"""
+        started = perf_counter()
+        os.makedirs(self.directory, exist_ok=True)
+        # 大量のタプルを作る間に循環参照の検出が何度も走らないよう、復元中はGCを止める
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            counts = self._restore()
+        finally:
+            if enabled:
+                gc.enable()
+        self.restored = True
+        self.restored_counts = counts
+        self.restore_ms = round((perf_counter() - started) * 1000, 3)
+        return counts
+
+    def _restore(self) -> Dict[str, int]:
+        state = JournalState()
+        snapshot = os.path.join(self.directory, SNAPSHOT_FILE)
+        generation = state.load_snapshot(snapshot) if os.path.exists(snapshot) else 0
+        generations = [old for old in log_generations(self.directory) if old >= generation]
+        for index, old in enumerate(generations):
+            # 書き込み途中で停止した可能性があるのは最後のログだけ（それ以外の破損は例外にする）
+            self.truncated_bytes += state.replay_log(log_path(self.directory, old),
+                                                     truncate_torn_tail=index == len(generations) - 1)
+
+        self.order_store.load(state.items(ORDERS))
+        for customer_id, record in state.items(CUSTOMERS):
+            self.customer_repository.save(decode_customer(customer_id, record))
+        for product_id, record in state.items(PRODUCTS):
+            self.product_repository.save(decode_product(product_id, record))
+        if self.order_lines is not None:
+            for order in self.order_store.all():
+                self.order_lines.append(order)
+
+        return {
+            "orders": state.count(ORDERS),
+            "customers": state.count(CUSTOMERS),
+            "products": state.count(PRODUCTS),
+            "frames": state.frames,
+        }
+
+    def start(self) -> None:
+        """ジャーナルの書き出しとスナップショットの取り直しをバックグラウンドで開始する"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="persistence-compactor", daemon=True)
+        self._thread.start()
+
+    def compact(self) -> int:
+        """スナップショットを取り直して古いジャーナルを削除し、書き込んだ件数を返す（不要な場合は0）"""
+        with self._compact_lock:
+            journal = self.journal
+            if journal is None:
+                return 0
+            if journal.size == 0 and log_generations(self.directory) == [journal.generation]:
+                return 0
+            started = perf_counter()
+            # 先にログを切り替えることで、以降の変更は全て新しい世代に書かれる
+            generation = journal.rotate()
+            with self.customer_repository.lock:
+                customers = list(self.customer_repository.customers.items())
+            products = list(self.product_repository.products.items())
+            written = write_snapshot(self.directory, generation, (
+                (ORDERS, self.order_store.records()),
+                (CUSTOMERS, ((key, encode_customer(customer)) for key, customer in customers)),
+                (PRODUCTS, ((key, encode_product(product)) for key, product in products)),
+            ))
+            journal.remove_before(generation)
+            self._snapshot_at = perf_counter()
+            self.snapshots_total += 1
+            self.last_snapshot_records = written
+            self.last_snapshot_ms = round((self._snapshot_at - started) * 1000, 3)
+            return written
+
+    def stats(self) -> Dict[str, Any]:
+        journal = self.journal
+        return {
+            "directory": self.directory,
+            "fsync": self.fsync,
+            "generation": journal.generation if journal is not None else None,
+            "log_bytes": journal.size if journal is not None else 0,
+            "appended_total": journal.appended_total if journal is not None else 0,
+            "restore_ms": self.restore_ms,
+            "restored": self.restored_counts,
+            "truncated_bytes": self.truncated_bytes,
+            "snapshots_total": self.snapshots_total,
+            "last_snapshot_ms": self.last_snapshot_ms,
+            "last_snapshot_records": self.last_snapshot_records,
+        }
+
+    def close(self, timeout: float = 5.0) -> None:
+        """バックグラウンド処理を止め、スナップショットを取ってからジャーナルを閉じる"""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._lock:
+            if self.journal is None:
+                return
+            # 次回の起動でジャーナルを再生しなくて済むよう、停止時にもスナップショットを取る
+            self.compact()
+            self._attach(None)
+            self.journal.close()
+            self.journal = None
+
+    def _attach(self, journal: Optional[Journal]) -> None:
+        self.order_store.journal = journal
+        self.customer_repository.journal = journal
+        self.product_repository.journal = journal
+
+    def _compaction_due(self, journal: Journal) -> bool:
+        if journal.size >= self.compact_log_bytes:
+            return True
+        return self.snapshot_interval > 0 and perf_counter() - self._snapshot_at >= self.snapshot_interval
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.fsync_interval):
+            journal = self.journal
+            if journal is None:
+                continue
+            try:
+                journal.sync()
+                if self._compaction_due(journal):
+                    self.compact()
+            except Exception as e:
+                print(f"Persistence maintenance failed: {e}")
@@ -0,0 +1,136 @@
+"""注文・顧客・製品の固定形式のバイト列への変換
+
+注文の形式はコンパクトな注文ストアの格納形式と同じで、ジャーナルとスナップショットでもそのまま使う。
+日時はタイムゾーンを持たない値としてマイクロ秒で保持する。
+"""
+import struct
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderItem, OrderStatus
+from domain.entities.product import Product
+from domain.money import from_cents, to_cents
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+NO_TIMESTAMP = -1
+# 文字列がNoneであることを表す長さ
+_NO_TEXT = 0xFFFF
+
+# 顧客ID, ステータスのコード, 作成日時, 更新日時（なければ-1）, 版, 明細数
+ORDER_HEADER = struct.Struct("<16sBqqIH")
+# 商品ID, 数量, 単価（セント）
+ORDER_ITEM = struct.Struct("<16sIq")
+# 作成日時, 更新日時, 名前・メールアドレス・電話番号・住所の長さ
+_CUSTOMER = struct.Struct("<qqHHHH")
+# 価格, 在庫数, 作成日時, 更新日時, 名前・説明の長さ
+_PRODUCT = struct.Struct("<dqqqHH")
+
+
+def to_micros(value: datetime) -> int:
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_micros(micros: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _optional_micros(value: Optional[datetime]) -> int:
+    return to_micros(value) if value is not None else NO_TIMESTAMP
+
+
+def _optional_datetime(micros: int) -> Optional[datetime]:
+    return from_micros(micros) if micros != NO_TIMESTAMP else None
+
+
+def encode_order(order: Order) -> bytes:
+    """注文をバイト列にする（注文IDは含めない）"""
+    header = ORDER_HEADER.pack(
+        order.customer_id.bytes,
+        OrderStatus(order.status).code,
+        to_micros(order.created_at),
+        _optional_micros(order.updated_at),
+        order.version,
+        len(order.items)
+    )
+    return header + b"".join(
+        ORDER_ITEM.pack(item.product_id.bytes, item.quantity, to_cents(item.price_per_unit))
+        for item in order.items
+    )
+
+
+def decode_order(order_id: UUID, record: bytes, customers: Optional[Dict[bytes, UUID]] = None) -> Order:
+    """バイト列から注文を組み立てる（customersを渡すと顧客IDのUUIDを共有する）"""
+    customer, status, created_at, updated_at, version, _ = ORDER_HEADER.unpack_from(record)
+    items = [
+        OrderItem(product_id=UUID(bytes=product_id), quantity=quantity, price_per_unit=from_cents(price))
+        for product_id, quantity, price in ORDER_ITEM.iter_unpack(record[ORDER_HEADER.size:])
+    ]
+    customer_id = customers.get(customer) if customers is not None else None
+    return Order(
+        id=order_id,
+        customer_id=customer_id or UUID(bytes=customer),
+        items=items,
+        status=OrderStatus.from_code(status),
+        created_at=from_micros(created_at),
+        updated_at=_optional_datetime(updated_at),
+        version=version
+    )
+
+
+def order_index_keys(record: bytes) -> Tuple[bytes, int, int]:
+    """インデックスに使う値（顧客IDのバイト列, ステータスのコード, 作成日時のマイクロ秒）を取り出す"""
+    customer, status, created_at, _, _, _ = ORDER_HEADER.unpack_from(record)
+    return customer, status, created_at
+
+
+def _text_length(value: Optional[str]) -> int:
+    return _NO_TEXT if value is None else len(value)
+
+
+def _pack_texts(*values: Optional[str]) -> Tuple[Tuple[int, ...], bytes]:
+    encoded = [None if value is None else value.encode() for value in values]
+    lengths = tuple(_NO_TEXT if value is None else len(value) for value in encoded)
+    return lengths, b"".join(value for value in encoded if value is not None)
+
+
+def _unpack_texts(buffer: bytes, offset: int, lengths: Tuple[int, ...]) -> Tuple[Optional[str], ...]:
+    values = []
+    for length in lengths:
+        if length == _NO_TEXT:
+            values.append(None)
+            continue
+        values.append(bytes(buffer[offset:offset + length]).decode())
+        offset += length
+    return tuple(values)
+
+
+def encode_customer(customer: Customer) -> bytes:
+    """顧客をバイト列にする（顧客IDは含めない）"""
+    lengths, texts = _pack_texts(customer.name, customer.email, customer.phone, customer.address)
+    return _CUSTOMER.pack(to_micros(customer.created_at), _optional_micros(customer.updated_at), *lengths) + texts
+
+
+def decode_customer(customer_id: UUID, record: bytes) -> Customer:
+    """バイト列から顧客を組み立てる"""
+    created_at, updated_at, *lengths = _CUSTOMER.unpack_from(record)
+    name, email, phone, address = _unpack_texts(record, _CUSTOMER.size, tuple(lengths))
+    return Customer(name=name, email=email, id=customer_id, phone=phone, address=address,
+                    created_at=from_micros(created_at), updated_at=_optional_datetime(updated_at))
+
+
+def encode_product(product: Product) -> bytes:
+    """製品をバイト列にする（製品IDは含めない、価格は浮動小数点数のまま保持する）"""
+    lengths, texts = _pack_texts(product.name, product.description)
+    return _PRODUCT.pack(float(product.price), product.stock_quantity, to_micros(product.created_at),
+                         _optional_micros(product.updated_at), *lengths) + texts
+
+
+def decode_product(product_id: UUID, record: bytes) -> Product:
+    """バイト列から製品を組み立てる"""
+    price, stock_quantity, created_at, updated_at, *lengths = _PRODUCT.unpack_from(record)
+    name, description = _unpack_texts(record, _PRODUCT.size, tuple(lengths))
+    return Product(name=name, price=price, id=product_id, description=description, stock_quantity=stock_quantity,
+                   created_at=from_micros(created_at), updated_at=_optional_datetime(updated_at))
@@ -0,0 +1,27 @@
+from typing import List, Optional
+from uuid import UUID
+
+from application.interfaces.dto import OrderSummaryDTO
+from application.interfaces.order_read_model import AsyncOrderReadModelInterface, OrderReadModelInterface
+
+
+class AsyncOrderReadModelAdapter(AsyncOrderReadModelInterface):
+    """注文読み取りモデルの非同期アダプター
+    
+    メモリ内の読み取りモデルを同期経路と共有するために使う（I/Oを行わないためそのまま呼び出す）。
+    """
+    
+    def __init__(self, read_model: OrderReadModelInterface):
+        self.read_model = read_model
+    
+    async def upsert(self, summaries: List[OrderSummaryDTO]) -> None:
+        """注文サマリーを追加または置き換える"""
+        self.read_model.upsert(summaries)
+    
+    async def get(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        """注文IDでサマリーを取得する"""
+        return self.read_model.get(order_id)
+    
+    async def list_by_customer(self, customer_id: UUID) -> List[OrderSummaryDTO]:
+        """顧客の注文サマリーを作成日時・ID順に取得する"""
+        return self.read_model.list_by_customer(customer_id)
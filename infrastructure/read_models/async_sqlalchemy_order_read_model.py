@@ -0,0 +1,39 @@
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from application.interfaces.dto import OrderSummaryDTO
+from application.interfaces.order_read_model import AsyncOrderReadModelInterface
+from infrastructure.db.models import OrderSummaryModel
+from infrastructure.read_models.sqlalchemy_order_read_model import (
+    _by_customer_statement,
+    _summary_rows,
+    _summary_upsert,
+    _to_summary
+)
+
+
+class AsyncSqlAlchemyOrderReadModel(AsyncOrderReadModelInterface):
+    """SQLAlchemy（非同期エンジン）を使用した注文読み取りモデルの実装"""
+    
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+    
+    async def upsert(self, summaries: List[OrderSummaryDTO]) -> None:
+        """注文サマリーを追加または置き換える（既存の行より版が新しい場合のみ置き換える、1回のexecutemany）"""
+        if not summaries:
+            return
+        async with self.session_factory.begin() as session:
+            await session.execute(_summary_upsert(session.get_bind().dialect.name), _summary_rows(summaries))
+    
+    async def get(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        """注文IDでサマリーを取得する"""
+        async with self.session_factory() as session:
+            model = await session.get(OrderSummaryModel, order_id)
+            return _to_summary(model) if model is not None else None
+    
+    async def list_by_customer(self, customer_id: UUID) -> List[OrderSummaryDTO]:
+        """顧客の注文サマリーを作成日時・ID順に取得する"""
+        async with self.session_factory() as session:
+            return [_to_summary(model) for model in await session.scalars(_by_customer_statement(customer_id))]
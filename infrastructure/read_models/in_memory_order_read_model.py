@@ -0,0 +1,57 @@
+import threading
+from bisect import bisect_right, insort
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from application.interfaces.dto import OrderSummaryDTO
+from application.interfaces.order_read_model import OrderReadModelInterface
+from domain.repositories.order_repository import OrderPageCursor
+
+
+class InMemoryOrderReadModel(OrderReadModelInterface):
+    """メモリ内の注文読み取りモデル
+    
+    サマリーを注文IDで保持し、顧客ごとに (作成日時, 注文ID) のソート済みリストで索引する。
+    注文の作成日時と顧客は変わらないため、置き換え時に索引を組み直す必要はない。
+    """
+    
+    def __init__(self):
+        self.summaries: Dict[UUID, OrderSummaryDTO] = {}
+        self.by_customer: Dict[UUID, List[Tuple[datetime, UUID]]] = {}
+        self.lock = threading.Lock()
+    
+    def upsert(self, summaries: List[OrderSummaryDTO]) -> None:
+        """注文サマリーを追加または置き換える（保持している版より新しい場合のみ置き換える）"""
+        with self.lock:
+            for summary in summaries:
+                current = self.summaries.get(summary.id)
+                if current is None:
+                    insort(self.by_customer.setdefault(summary.customer_id, []), (summary.created_at, summary.id))
+                elif current.version >= summary.version:
+                    # 遅れて届いた古い版で新しい版を上書きしない
+                    continue
+                self.summaries[summary.id] = summary
+    
+    def get(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        """注文IDでサマリーを取得する"""
+        return self.summaries.get(order_id)
+    
+    def list_by_customer(self, customer_id: UUID) -> List[OrderSummaryDTO]:
+        """顧客の注文サマリーを作成日時・ID順に取得する"""
+        with self.lock:
+            summaries = self.summaries
+            return [summaries[order_id] for _, order_id in self.by_customer.get(customer_id, ())]
+    
+    def page_by_customer(self, customer_id: UUID, limit: int,
+                         after: Optional[OrderPageCursor] = None) -> List[OrderSummaryDTO]:
+        """顧客の注文サマリーをafterより後ろから最大limit件取得する"""
+        with self.lock:
+            bucket = self.by_customer.get(customer_id, ())
+            start = bisect_right(bucket, tuple(after)) if after is not None else 0
+            summaries = self.summaries
+            return [summaries[order_id] for _, order_id in bucket[start:start + limit]]
+    
+    def count(self) -> int:
+        """保持している注文サマリーの件数を返す"""
+        return len(self.summaries)
@@ -0,0 +1,90 @@
+import threading
+from typing import Any, Dict, Iterable, Optional, Set
+from uuid import UUID
+
+from application.interfaces.order_projection_repair import OrderProjectionRepairInterface
+from application.interfaces.order_read_model import OrderReadModelInterface
+from application.usecases.order_projection import project_order
+from domain.repositories.order_repository import OrderQueryRepositoryInterface
+
+DEFAULT_INTERVAL = 1.0
+
+
+class OrderProjectionRepairer(OrderProjectionRepairInterface):
+    """読み取りモデルへの反映に失敗した注文を、バックグラウンドで読み直して反映し直す
+    
+    読み取りモデルは版が新しい場合だけ置き換えるため、修復が後からの書き込みと前後しても古い内容には戻らない。
+    修復に失敗した注文は予約したまま残し、次の周期で再試行する。
+    """
+    
+    def __init__(self,
+                 order_repository: OrderQueryRepositoryInterface,
+                 read_model: OrderReadModelInterface,
+                 interval: float = DEFAULT_INTERVAL):
+        self.order_repository = order_repository
+        self.read_model = read_model
+        self.interval = interval
+        self._pending: Set[UUID] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self.scheduled_total = 0
+        self.repaired_total = 0
+        self.failed_attempts = 0
+    
+    def schedule(self, order_ids: Iterable[UUID]) -> None:
+        """注文の反映し直しを予約する"""
+        with self._lock:
+            before = len(self._pending)
+            self._pending.update(order_ids)
+            self.scheduled_total += len(self._pending) - before
+    
+    def repair(self) -> int:
+        """予約された注文を読み直して反映し、反映した件数を返す（呼び出し元のスレッドで実行する）"""
+        with self._lock:
+            order_ids, self._pending = self._pending, set()
+        if not order_ids:
+            return 0
+        try:
+            orders = [order for order in map(self.order_repository.find_by_id, order_ids) if order is not None]
+            self.read_model.upsert([project_order(order) for order in orders])
+        except Exception:
+            self.schedule(order_ids)
+            with self._lock:
+                self.failed_attempts += 1
+            raise
+        with self._lock:
+            self.repaired_total += len(orders)
+        return len(orders)
+    
+    def start(self) -> None:
+        """バックグラウンドでの修復を開始する"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="order-projection-repairer", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """修復を停止する"""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _run(self) -> None:
+        while not self._stopping.wait(self.interval):
+            try:
+                self.repair()
+            except Exception as e:
+                print(f"Order projection repair failed: {e}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """予約中の件数と修復した件数を返す"""
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "scheduled_total": self.scheduled_total,
+                "repaired_total": self.repaired_total,
+                "failed_attempts": self.failed_attempts,
+            }
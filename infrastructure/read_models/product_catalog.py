@@ -0,0 +1,151 @@
+import threading
+from bisect import bisect_left
+from time import monotonic, perf_counter
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+from uuid import UUID
+
+from application.interfaces.dto import ProductDTO
+from application.interfaces.product_catalog import (
+    ProductCatalogInterface,
+    ProductCatalogSnapshot,
+    catalog_sort_key
+)
+from domain.entities.product import Product
+from domain.repositories.product_repository import ProductRepository
+
+# 変更された製品がこの件数（とカタログの1/4）を超えたら、差し替えずに全件から作り直す
+PATCH_LIMIT = 1024
+
+
+def _to_dto(product: Product) -> ProductDTO:
+    """エンティティからDTOに変換する（スナップショットはエンティティを共有しない）"""
+    return ProductDTO(
+        id=product.id,
+        name=product.name,
+        price=product.price,
+        description=product.description,
+        stock_quantity=product.stock_quantity,
+        created_at=product.created_at,
+        updated_at=product.updated_at
+    )
+
+
+class ProductCatalog(ProductCatalogInterface):
+    """製品リポジトリから作る版付きの製品カタログ
+    
+    書き込み側の mark_changed は版を1つ上げて製品IDを記録するだけで、スナップショットは次に読まれた時に作る。
+    前の版のスナップショットがあれば、記録された製品だけをリポジトリから読み直して差し替える
+    （名前が変わった・追加・削除された場合のみ並べ直す）。
+    max_age_seconds を指定すると、それより古いスナップショットは版を上げて全件から作り直す
+    （同じデータベースを使う他のプロセスの書き込みはこのプロセスの版に反映されないため）。
+    """
+    
+    def __init__(self,
+                 repository: ProductRepository,
+                 max_age_seconds: Optional[float] = None,
+                 clock: Callable[[], float] = monotonic):
+        self.repository = repository
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        # 版と変更された製品IDの記録（書き込み側が取る短いロック）
+        self._lock = threading.Lock()
+        # スナップショットの作成は同時に1つだけ行う
+        self._build_lock = threading.Lock()
+        self._version = 1
+        self._changed: Set[UUID] = set()
+        self._rebuild = True
+        self._snapshot: Optional[ProductCatalogSnapshot] = None
+        self._built_at = 0.0
+        self.full_builds = 0
+        self.patches = 0
+        self.last_build_ms = 0.0
+    
+    def version(self) -> int:
+        """最新の版を返す（max_age_seconds を過ぎていれば版を上げる）"""
+        if self.max_age_seconds and self._snapshot is not None and self._clock() - self._built_at >= self.max_age_seconds:
+            with self._lock:
+                if not self._rebuild:
+                    self._rebuild = True
+                    self._version += 1
+        return self._version
+    
+    def mark_changed(self, product_ids: Optional[Iterable[UUID]] = None) -> None:
+        """製品が変更されたことを記録して版を上げる"""
+        with self._lock:
+            self._version += 1
+            if product_ids is None:
+                self._rebuild = True
+                self._changed = set()
+            elif not self._rebuild:
+                self._changed.update(product_ids)
+    
+    def snapshot(self) -> ProductCatalogSnapshot:
+        """最新の版のスナップショットを返す（必要な場合のみ作り直す）"""
+        version = self.version()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with self._build_lock:
+            snapshot = self._snapshot
+            with self._lock:
+                version, changed, rebuild = self._version, self._changed, self._rebuild
+                if snapshot is not None and snapshot.version == version:
+                    return snapshot
+                self._changed = set()
+                self._rebuild = False
+            # 記録を取り出した後の書き込みは版を上げるため、ここで作るスナップショットは次の読み取りで作り直される
+            started = perf_counter()
+            try:
+                if rebuild or snapshot is None or len(changed) > max(PATCH_LIMIT, len(snapshot.products) // 4):
+                    snapshot = self._build(version)
+                    self._built_at = self._clock()
+                    self.full_builds += 1
+                else:
+                    snapshot = self._patch(snapshot, changed, version)
+                    self.patches += 1
+            except Exception:
+                with self._lock:
+                    self._rebuild = True
+                raise
+            self.last_build_ms = (perf_counter() - started) * 1000
+            self._snapshot = snapshot
+            return snapshot
+    
+    def _build(self, version: int) -> ProductCatalogSnapshot:
+        products = sorted((_to_dto(product) for product in self.repository.find_all()), key=catalog_sort_key)
+        return ProductCatalogSnapshot(version, tuple(products), {product.id: product for product in products})
+    
+    def _patch(self, snapshot: ProductCatalogSnapshot, changed: Set[UUID], version: int) -> ProductCatalogSnapshot:
+        fetched = self.repository.find_by_ids(changed)
+        by_id: Dict[UUID, ProductDTO] = dict(snapshot.by_id)
+        products = list(snapshot.products)
+        resort = False
+        for product_id in changed:
+            previous = by_id.get(product_id)
+            product = fetched.get(product_id)
+            if product is None:
+                if previous is not None:
+                    del by_id[product_id]
+                    resort = True
+                continue
+            current = by_id[product_id] = _to_dto(product)
+            if previous is None or previous.name != current.name:
+                resort = True
+            elif not resort:
+                # 名前が同じなら並び順の位置は変わらない
+                products[bisect_left(products, catalog_sort_key(previous), key=catalog_sort_key)] = current
+        if resort:
+            products = sorted(by_id.values(), key=catalog_sort_key)
+        return ProductCatalogSnapshot(version, tuple(products), by_id)
+    
+    def stats(self) -> Dict[str, Any]:
+        """版と件数、スナップショットの作成回数を返す"""
+        snapshot = self._snapshot
+        return {
+            "version": self._version,
+            "snapshot_version": snapshot.version if snapshot is not None else None,
+            "products": len(snapshot.products) if snapshot is not None else 0,
+            "full_builds": self.full_builds,
+            "patches": self.patches,
+            "last_build_ms": round(self.last_build_ms, 3),
+        }
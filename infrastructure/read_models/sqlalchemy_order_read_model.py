@@ -0,0 +1,101 @@
+import json
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from application.interfaces.dto import OrderSummaryDTO
+from application.interfaces.order_read_model import OrderReadModelInterface
+from domain.repositories.order_repository import OrderPageCursor
+from infrastructure.db.models import OrderSummaryModel
+from infrastructure.db.upsert import upsert_statement
+
+
+def _to_summary(model: OrderSummaryModel) -> OrderSummaryDTO:
+    """行から注文サマリーに変換する"""
+    return OrderSummaryDTO(
+        id=model.order_id,
+        customer_id=model.customer_id,
+        status=model.status,
+        created_at=model.created_at,
+        total_amount=model.total_amount,
+        version=model.version,
+        data=json.loads(model.payload)
+    )
+
+
+def _summary_rows(summaries: List[OrderSummaryDTO]) -> List[dict]:
+    """注文サマリーテーブルへ挿入する行を作成する"""
+    return [
+        {
+            "order_id": summary.id,
+            "customer_id": summary.customer_id,
+            "status": summary.status,
+            "created_at": summary.created_at,
+            "total_amount": summary.total_amount,
+            "version": summary.version,
+            "payload": json.dumps(summary.data, ensure_ascii=False)
+        }
+        for summary in summaries
+    ]
+
+
+def _summary_upsert(dialect_name: str):
+    """注文サマリーを追加し、既にある場合は版が新しい場合だけ置き換える文"""
+    return upsert_statement(
+        dialect_name, OrderSummaryModel, ["order_id"],
+        ["customer_id", "status", "created_at", "total_amount", "version", "payload"],
+        only_if_newer="version"
+    )
+
+
+def _by_customer_statement(customer_id: UUID):
+    """顧客の注文サマリーを作成日時・ID順に取得するクエリ"""
+    return (
+        select(OrderSummaryModel)
+        .where(OrderSummaryModel.customer_id == customer_id)
+        .order_by(OrderSummaryModel.created_at, OrderSummaryModel.order_id)
+    )
+
+
+class SqlAlchemyOrderReadModel(OrderReadModelInterface):
+    """SQLAlchemyを使用した注文読み取りモデルの実装（order_summariesテーブル）"""
+    
+    def __init__(self, session_factory: sessionmaker[Session]):
+        self.session_factory = session_factory
+    
+    def upsert(self, summaries: List[OrderSummaryDTO]) -> None:
+        """注文サマリーを追加または置き換える（既存の行より版が新しい場合のみ置き換える、1回のexecutemany）"""
+        if not summaries:
+            return
+        with self.session_factory.begin() as session:
+            session.execute(_summary_upsert(session.get_bind().dialect.name), _summary_rows(summaries))
+    
+    def get(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        """注文IDでサマリーを取得する"""
+        with self.session_factory() as session:
+            model = session.get(OrderSummaryModel, order_id)
+            return _to_summary(model) if model is not None else None
+    
+    def list_by_customer(self, customer_id: UUID) -> List[OrderSummaryDTO]:
+        """顧客の注文サマリーを作成日時・ID順に取得する"""
+        with self.session_factory() as session:
+            return [_to_summary(model) for model in session.scalars(_by_customer_statement(customer_id))]
+    
+    def page_by_customer(self, customer_id: UUID, limit: int,
+                         after: Optional[OrderPageCursor] = None) -> List[OrderSummaryDTO]:
+        """顧客の注文サマリーをキーセット方式で最大limit件取得する"""
+        with self.session_factory() as session:
+            stmt = _by_customer_statement(customer_id)
+            if after is not None:
+                stmt = stmt.where(or_(
+                    OrderSummaryModel.created_at > after.created_at,
+                    and_(OrderSummaryModel.created_at == after.created_at, OrderSummaryModel.order_id > after.order_id)
+                ))
+            return [_to_summary(model) for model in session.scalars(stmt.limit(limit))]
+    
+    def count(self) -> int:
+        """保持している注文サマリーの件数を返す"""
+        with self.session_factory() as session:
+            return session.scalar(select(func.count()).select_from(OrderSummaryModel))
@@ -0,0 +1,92 @@
+from typing import Dict, FrozenSet, Iterable, List, Optional
+from uuid import UUID
+
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderStatus
+from domain.entities.product import Product
+from domain.repositories.customer_repository import AsyncCustomerRepository, CustomerRepository
+from domain.repositories.order_repository import (
+    AsyncOrderCommandRepositoryInterface,
+    AsyncOrderQueryRepositoryInterface,
+    OrderCommandRepositoryInterface,
+    OrderQueryRepositoryInterface
+)
+from domain.repositories.product_repository import AsyncProductRepository, ProductRepository
+
+# 同期リポジトリを非同期インターフェースに合わせるアダプター。
+# メモリ内リポジトリはI/Oを行わないため、イベントループ上で同期実装をそのまま呼び出しても問題ない。
+# 同期経路と同じインスタンスを包むので、両経路でデータが共有される。
+# 非同期ドライバーが使えない環境でSQLリポジトリを包んだ場合は、I/Oの間イベントループがブロックされる。
+
+
+class AsyncOrderCommandRepositoryAdapter(AsyncOrderCommandRepositoryInterface):
+    """注文コマンドリポジトリの非同期アダプター"""
+    
+    def __init__(self, repository: OrderCommandRepositoryInterface):
+        self.repository = repository
+    
+    async def save(self, order: Order) -> Order:
+        """注文を保存する"""
+        return self.repository.save(order)
+    
+    async def update(self, order: Order) -> Order:
+        """注文を更新する"""
+        return self.repository.update(order)
+    
+    async def update_status_many(self, order_ids: List[UUID], status: OrderStatus,
+                                 expected: FrozenSet[OrderStatus]) -> List[Order]:
+        """ステータスが expected のいずれかである注文だけを status に変更する"""
+        return self.repository.update_status_many(order_ids, status, expected)
+    
+    async def delete(self, order_id: UUID) -> None:
+        """注文を削除する"""
+        self.repository.delete(order_id)
+
+
+class AsyncOrderQueryRepositoryAdapter(AsyncOrderQueryRepositoryInterface):
+    """注文クエリリポジトリの非同期アダプター"""
+    
+    def __init__(self, repository: OrderQueryRepositoryInterface):
+        self.repository = repository
+    
+    async def find_by_id(self, order_id: UUID) -> Optional[Order]:
+        """IDで注文を検索する"""
+        return self.repository.find_by_id(order_id)
+    
+    async def find_all_by_customer_id(self, customer_id: UUID) -> List[Order]:
+        """顧客IDで全ての注文を検索する"""
+        return self.repository.find_all_by_customer_id(customer_id)
+
+
+class AsyncCustomerRepositoryAdapter(AsyncCustomerRepository):
+    """顧客リポジトリの非同期アダプター"""
+    
+    def __init__(self, repository: CustomerRepository):
+        self.repository = repository
+    
+    async def find_by_id(self, customer_id: UUID) -> Optional[Customer]:
+        """IDで顧客を検索する"""
+        return self.repository.find_by_id(customer_id)
+
+
+class AsyncProductRepositoryAdapter(AsyncProductRepository):
+    """製品リポジトリの非同期アダプター"""
+    
+    def __init__(self, repository: ProductRepository):
+        self.repository = repository
+    
+    async def find_by_ids(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        """複数のIDで製品を一括検索する"""
+        return self.repository.find_by_ids(product_ids)
+    
+    async def update_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を一括更新する"""
+        return self.repository.update_many(products)
+    
+    async def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, int]:
+        """製品ごとの数量だけ在庫を原子的に確保する"""
+        return self.repository.reserve_stock(quantities)
+    
+    async def release_stock(self, quantities: Dict[UUID, int]) -> None:
+        """確保した在庫を原子的に戻す"""
+        self.repository.release_stock(quantities)
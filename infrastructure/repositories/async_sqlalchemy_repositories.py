@@ -0,0 +1,188 @@
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderStatus
+from domain.entities.product import Product
+from domain.exceptions import InsufficientStockError
+from domain.repositories.customer_repository import AsyncCustomerRepository
+from domain.repositories.order_repository import (
+    AsyncOrderCommandRepositoryInterface,
+    AsyncOrderQueryRepositoryInterface
+)
+from domain.repositories.product_repository import AsyncProductRepository, validate_quantities
+from infrastructure.db.models import CustomerModel, OrderItemModel, OrderModel, OutboxEventModel, ProductModel
+from infrastructure.repositories.sqlalchemy_customer_repository import _to_entity as _customer_entity
+from infrastructure.repositories.sqlalchemy_order_repository import (
+    STATUS_UPDATE_CHUNK,
+    _in_request_order,
+    _item_rows,
+    _order_rows,
+    _pending_event_rows,
+    _status_changed_order,
+    _status_update_statement,
+    _update_statement
+)
+from infrastructure.repositories.sqlalchemy_order_repository import _to_entity as _order_entity
+from infrastructure.repositories.sqlalchemy_product_repository import _release_statement, _reserve_statement
+from infrastructure.repositories.sqlalchemy_product_repository import _to_entity as _product_entity
+from infrastructure.repositories.sqlalchemy_product_repository import _to_row as _product_row
+
+# SQLAlchemyのasyncio拡張（greenlet）と非同期ドライバー（aiosqlite / asyncpg）が必要なため、
+# 同期リポジトリとは別モジュールに置き、同期経路がこれらに依存しないようにする。
+
+
+async def _insert_events(session: AsyncSession, orders: List[Order]) -> None:
+    """ドメインイベントを注文と同じトランザクションでアウトボックスに挿入する"""
+    rows = _pending_event_rows(orders)
+    if rows:
+        await session.execute(insert(OutboxEventModel), rows)
+
+
+class AsyncSqlAlchemyOrderCommandRepository(AsyncOrderCommandRepositoryInterface):
+    """SQLAlchemy（非同期エンジン）を使用した注文コマンドリポジトリの実装"""
+    
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+    
+    async def save(self, order: Order) -> Order:
+        """注文を保存する"""
+        async with self.session_factory.begin() as session:
+            await session.execute(insert(OrderModel), _order_rows([order]))
+            rows = _item_rows([order])
+            if rows:
+                await session.execute(insert(OrderItemModel), rows)
+            await _insert_events(session, [order])
+        return order
+    
+    async def update(self, order: Order) -> Order:
+        """注文を更新する"""
+        async with self.session_factory.begin() as session:
+            version = (await session.execute(_update_statement(order))).scalar_one_or_none()
+            if version is not None:
+                order.version = version
+                # アイテムは置き換える（削除1回と挿入1回）
+                await session.execute(delete(OrderItemModel).where(OrderItemModel.order_id == order.id))
+                rows = _item_rows([order])
+                if rows:
+                    await session.execute(insert(OrderItemModel), rows)
+                await _insert_events(session, [order])
+        return order
+    
+    async def update_status_many(self, order_ids: List[UUID], status: OrderStatus,
+                                 expected: FrozenSet[OrderStatus]) -> List[Order]:
+        """ステータスが expected のいずれかである注文だけを status に変更する（同期版と同じ条件付きUPDATE、1トランザクション）"""
+        if not order_ids or not expected:
+            return []
+        updated_at = datetime.now()
+        changed: Dict[UUID, OrderStatus] = {}
+        async with self.session_factory.begin() as session:
+            for start in range(0, len(order_ids), STATUS_UPDATE_CHUNK):
+                chunk = order_ids[start:start + STATUS_UPDATE_CHUNK]
+                for previous in expected:
+                    result = await session.execute(_status_update_statement(chunk, previous, status, updated_at))
+                    changed.update((order_id, previous) for order_id in result.scalars())
+            orders = []
+            changed_ids = list(changed)
+            for start in range(0, len(changed_ids), STATUS_UPDATE_CHUNK):
+                stmt = select(OrderModel).where(OrderModel.id.in_(changed_ids[start:start + STATUS_UPDATE_CHUNK]))
+                orders.extend(_status_changed_order(model, changed, status, updated_at)
+                              for model in await session.scalars(stmt))
+            await _insert_events(session, orders)
+        return _in_request_order(orders, order_ids)
+    
+    async def delete(self, order_id: UUID) -> None:
+        """注文を削除する"""
+        async with self.session_factory.begin() as session:
+            model = await session.get(OrderModel, order_id)
+            if model is not None:
+                await session.delete(model)
+
+
+class AsyncSqlAlchemyOrderQueryRepository(AsyncOrderQueryRepositoryInterface):
+    """SQLAlchemy（非同期エンジン）を使用した注文クエリリポジトリの実装"""
+    
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+    
+    async def find_by_id(self, order_id: UUID) -> Optional[Order]:
+        """IDで注文を検索する"""
+        async with self.session_factory() as session:
+            model = await session.get(OrderModel, order_id)
+            return _order_entity(model) if model is not None else None
+    
+    async def find_all_by_customer_id(self, customer_id: UUID) -> List[Order]:
+        """顧客IDで全ての注文を検索する"""
+        async with self.session_factory() as session:
+            stmt = (
+                select(OrderModel)
+                .where(OrderModel.customer_id == customer_id)
+                .order_by(OrderModel.created_at, OrderModel.id)
+            )
+            return [_order_entity(model) for model in await session.scalars(stmt)]
+
+
+class AsyncSqlAlchemyCustomerRepository(AsyncCustomerRepository):
+    """SQLAlchemy（非同期エンジン）を使用した顧客リポジトリの実装"""
+    
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+    
+    async def find_by_id(self, customer_id: UUID) -> Optional[Customer]:
+        """IDで顧客を検索する"""
+        async with self.session_factory() as session:
+            model = await session.get(CustomerModel, customer_id)
+            return _customer_entity(model) if model is not None else None
+
+
+class AsyncSqlAlchemyProductRepository(AsyncProductRepository):
+    """SQLAlchemy（非同期エンジン）を使用した製品リポジトリの実装"""
+    
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+    
+    async def find_by_ids(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        """複数のIDで製品を一括検索する（1クエリ）"""
+        product_ids = list(product_ids)
+        if not product_ids:
+            return {}
+        async with self.session_factory() as session:
+            stmt = select(ProductModel).where(ProductModel.id.in_(product_ids))
+            return {model.id: _product_entity(model) for model in await session.scalars(stmt)}
+    
+    async def update_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を一括更新する（主キー指定のexecutemany）"""
+        products = list(products)
+        if products:
+            async with self.session_factory.begin() as session:
+                await session.execute(update(ProductModel), [_product_row(product) for product in products])
+        return products
+    
+    async def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, int]:
+        """製品ごとの数量だけ在庫を原子的に確保する（条件付きUPDATE）"""
+        validate_quantities(quantities)
+        now = datetime.now()
+        remaining: Dict[UUID, int] = {}
+        async with self.session_factory.begin() as session:
+            for product_id in sorted(quantities):
+                quantity = quantities[product_id]
+                stock = (await session.execute(_reserve_statement(product_id, quantity, now))).scalar_one_or_none()
+                if stock is None:
+                    available = await session.scalar(
+                        select(ProductModel.stock_quantity).where(ProductModel.id == product_id)
+                    )
+                    raise InsufficientStockError(product_id, available or 0, quantity)
+                remaining[product_id] = stock
+        return remaining
+    
+    async def release_stock(self, quantities: Dict[UUID, int]) -> None:
+        """確保した在庫を原子的に戻す"""
+        validate_quantities(quantities)
+        now = datetime.now()
+        async with self.session_factory.begin() as session:
+            for product_id in sorted(quantities):
+                await session.execute(_release_statement(product_id, quantities[product_id], now))
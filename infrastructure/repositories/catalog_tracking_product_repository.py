@@ -0,0 +1,103 @@
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from application.interfaces.product_catalog import ProductCatalogInterface
+from domain.entities.product import Product
+from domain.repositories.product_repository import AsyncProductRepository, ProductRepository
+
+# 製品リポジトリへの書き込みを製品カタログに知らせるラッパー。
+# 書き込みが成功した後に変更した製品IDを渡して版を上げるだけで、スナップショットは読み取り時に作り直される。
+# 在庫の確保・解放（注文の作成・キャンセル）もカタログの在庫数を変えるため版を上げる。
+
+
+class CatalogTrackingProductRepository(ProductRepository):
+    """書き込みのたびに製品カタログの版を上げる製品リポジトリ"""
+    
+    def __init__(self, repository: ProductRepository, catalog: ProductCatalogInterface):
+        self.repository = repository
+        self.catalog = catalog
+    
+    def save(self, product: Product) -> Product:
+        """製品を保存する"""
+        saved = self.repository.save(product)
+        self.catalog.mark_changed([product.id])
+        return saved
+    
+    def save_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を一括で登録する"""
+        saved = self.repository.save_many(products)
+        self.catalog.mark_changed([product.id for product in saved])
+        return saved
+    
+    def find_by_id(self, product_id: UUID) -> Optional[Product]:
+        """IDで製品を検索する"""
+        return self.repository.find_by_id(product_id)
+    
+    def find_by_ids(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        """複数のIDで製品を一括検索する"""
+        return self.repository.find_by_ids(product_ids)
+    
+    def find_by_name(self, name: str) -> List[Product]:
+        """名前で製品を検索する"""
+        return self.repository.find_by_name(name)
+    
+    def find_all(self) -> List[Product]:
+        """全ての製品を取得する"""
+        return self.repository.find_all()
+    
+    def update(self, product: Product) -> Product:
+        """製品を更新する"""
+        updated = self.repository.update(product)
+        self.catalog.mark_changed([product.id])
+        return updated
+    
+    def update_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を一括更新する"""
+        updated = self.repository.update_many(products)
+        self.catalog.mark_changed([product.id for product in updated])
+        return updated
+    
+    def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, int]:
+        """製品ごとの数量だけ在庫を原子的に確保する（不足時は何も変わらないため版も上げない）"""
+        remaining = self.repository.reserve_stock(quantities)
+        self.catalog.mark_changed(quantities)
+        return remaining
+    
+    def release_stock(self, quantities: Dict[UUID, int]) -> None:
+        """確保した在庫を原子的に戻す"""
+        self.repository.release_stock(quantities)
+        self.catalog.mark_changed(quantities)
+    
+    def delete(self, product_id: UUID) -> None:
+        """製品を削除する"""
+        self.repository.delete(product_id)
+        self.catalog.mark_changed([product_id])
+
+
+class AsyncCatalogTrackingProductRepository(AsyncProductRepository):
+    """書き込みのたびに製品カタログの版を上げる非同期の製品リポジトリ"""
+    
+    def __init__(self, repository: AsyncProductRepository, catalog: ProductCatalogInterface):
+        self.repository = repository
+        self.catalog = catalog
+    
+    async def find_by_ids(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        """複数のIDで製品を一括検索する"""
+        return await self.repository.find_by_ids(product_ids)
+    
+    async def update_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を一括更新する"""
+        updated = await self.repository.update_many(products)
+        self.catalog.mark_changed([product.id for product in updated])
+        return updated
+    
+    async def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, int]:
+        """製品ごとの数量だけ在庫を原子的に確保する"""
+        remaining = await self.repository.reserve_stock(quantities)
+        self.catalog.mark_changed(quantities)
+        return remaining
+    
+    async def release_stock(self, quantities: Dict[UUID, int]) -> None:
+        """確保した在庫を原子的に戻す"""
+        await self.repository.release_stock(quantities)
+        self.catalog.mark_changed(quantities)
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, Tuple
+from uuid import UUID
+
+from domain.entities.order import Order
+from infrastructure.persistence.record_codec import decode_order, encode_order, from_micros, order_index_keys
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderStore
+
+
+class CompactOrderStore(InMemoryOrderStore):
+    """注文を1件1つのバイト列に詰めて保持するメモリ内ストア
+    
+    注文ごとのエンティティ・明細・UUID・日時・金額のオブジェクトを持たず、
+    顧客ID・ステータスのコード・日時（マイクロ秒）・版・明細（商品ID・数量・単価のセント）を固定長で格納する。
+    読み込みのたびに新しいエンティティを組み立てるため、SQLのリポジトリと同じく
+    取得したエンティティへの変更は update するまでストアに反映されない。
+    日時はタイムゾーンを持たない値として扱う（形式は record_codec.encode_order を参照）。
+    """
+    
+    def __init__(self):
+        super().__init__()
+        # 顧客IDは注文間で共有する（インデックスが注文ごとにUUIDを持たないようにする）
+        self._customers: Dict[bytes, UUID] = {}
+    
+    def put(self, order: Order) -> None:
+        """注文を格納し、インデックスを更新する"""
+        with self.lock:
+            order.customer_id = self._customers.setdefault(order.customer_id.bytes, order.customer_id)
+            super().put(order)
+    
+    def _loaded(self, records: Iterable[Tuple[UUID, bytes]]) -> Iterator[Tuple[UUID, UUID, int, datetime, object]]:
+        """復元する注文はバイト列のまま格納し、インデックスに使う値だけをヘッダーから取り出す"""
+        customers = self._customers
+        for order_id, record in records:
+            customer, status, created_at = order_index_keys(record)
+            customer_id = customers.get(customer)
+            if customer_id is None:
+                customer_id = customers[customer] = UUID(bytes=customer)
+            yield order_id, customer_id, status, from_micros(created_at), record
+    
+    def _encode(self, order: Order) -> bytes:
+        return encode_order(order)
+    
+    def _record(self, stored: bytes) -> bytes:
+        return stored
+    
+    def _decode(self, order_id: UUID, record: bytes) -> Order:
+        return decode_order(order_id, record, self._customers)
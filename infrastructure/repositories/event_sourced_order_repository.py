@@ -0,0 +1,197 @@
+import threading
+from bisect import bisect_right
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional
+from uuid import UUID
+
+from application.interfaces.order_history import OrderHistoryInterface
+from domain.entities.order import Order, OrderStatus
+from domain.repositories.order_repository import OrderCommandRepositoryInterface
+from infrastructure.event_store.order_events import OrderStreamEvent, changed_events, placed_events, replay
+from infrastructure.persistence.record_codec import decode_order, encode_order
+from infrastructure.repositories.compact_order_store import CompactOrderStore
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderStore
+from infrastructure.repositories.in_memory_outbox_repository import InMemoryOutboxRepository
+
+if TYPE_CHECKING:
+    from infrastructure.analytics.order_line_columns import OrderLineColumns
+
+# 集約のスナップショットを取るイベント数の間隔
+SNAPSHOT_EVERY = 64
+
+
+class OrderEventStream:
+    """1件の注文のイベントと、その途中の状態のスナップショット
+
+    times はイベントごとの recorded_at（単調増加に揃える）で、ある日時の状態を二分探索で求めるのに使う。
+    スナップショットは (適用済みのイベント数, record_codec の形式のバイト列) を古い順に持つ。
+    """
+    __slots__ = ("events", "times", "snapshot_positions", "snapshots")
+
+    def __init__(self):
+        self.events: List[OrderStreamEvent] = []
+        self.times: List[datetime] = []
+        self.snapshot_positions: List[int] = []
+        self.snapshots: List[bytes] = []
+
+    def append(self, events: List[OrderStreamEvent]) -> None:
+        latest = self.times[-1] if self.times else None
+        for event in events:
+            latest = event.recorded_at if latest is None or event.recorded_at > latest else latest
+            self.events.append(event)
+            self.times.append(latest)
+
+    def position_at(self, at: datetime) -> int:
+        """at 以前に記録されたイベントの数"""
+        return bisect_right(self.times, at)
+
+
+class InMemoryOrderEventStore:
+    """注文ごとのイベントストリームを保持するメモリ内のイベントストア
+
+    最新の状態は projection（コンパクトな注文ストア）にも書き込み、顧客・ステータスでの検索はそちらで行う。
+    snapshot_every 件のイベントごとに集約のスナップショットを取り、読み込み時の再生をそれ以降のイベントに限る
+    （0 を指定するとスナップショットを取らずに常に先頭から再生する）。
+    """
+
+    def __init__(self, projection: Optional[InMemoryOrderStore] = None, snapshot_every: int = SNAPSHOT_EVERY):
+        self.streams: Dict[UUID, OrderEventStream] = {}
+        self.projection = projection if projection is not None else CompactOrderStore()
+        self.snapshot_every = snapshot_every
+        self.lock = threading.RLock()
+
+    def append(self, order: Order, events: List[OrderStreamEvent]) -> None:
+        """イベントを追記し、必要ならその時点の注文のスナップショットを取る"""
+        with self.lock:
+            stream = self.streams.get(order.id)
+            if stream is None:
+                stream = self.streams[order.id] = OrderEventStream()
+            stream.append(events)
+            since = stream.snapshot_positions[-1] if stream.snapshot_positions else 0
+            if self.snapshot_every and len(stream.events) - since >= self.snapshot_every:
+                stream.snapshot_positions.append(len(stream.events))
+                stream.snapshots.append(encode_order(order))
+            self.projection.put(order)
+
+    def load(self, order_id: UUID, at: Optional[datetime] = None) -> Optional[Order]:
+        """イベントを再生して注文を組み立てる（at を指定するとその日時の状態、作成前ならNone）"""
+        with self.lock:
+            stream = self.streams.get(order_id)
+            if stream is None:
+                return None
+            position = len(stream.events) if at is None else stream.position_at(at)
+            if position == 0:
+                return None
+            # position 以前で最も新しいスナップショットから再生する
+            index = bisect_right(stream.snapshot_positions, position) - 1
+            if index >= 0:
+                start, record = stream.snapshot_positions[index], stream.snapshots[index]
+            else:
+                start, record = 0, None
+            events = stream.events[start:position]
+        order = decode_order(order_id, record) if record is not None else Order(id=order_id)
+        return replay(order, events)
+
+    def remove(self, order_id: UUID) -> None:
+        with self.lock:
+            self.streams.pop(order_id, None)
+            self.projection.remove(order_id)
+
+    def stream_length(self, order_id: UUID) -> int:
+        stream = self.streams.get(order_id)
+        return len(stream.events) if stream is not None else 0
+
+
+class EventSourcedOrderCommandRepository(OrderCommandRepositoryInterface):
+    """注文をイベントストリームとして保存するコマンドリポジトリ
+
+    保存時は直前の状態（イベントの再生結果）との差分をイベントにして追記し、find_by_id はイベントを再生して注文を返す。
+    ドメインイベントのアウトボックスへの追加と列指向ミラーへの反映はメモリ内リポジトリと同じ。
+    変更のない update はイベントを追記せず、版も進めない。
+    """
+
+    def __init__(self, events: Optional[InMemoryOrderEventStore] = None,
+                 outbox: Optional[InMemoryOutboxRepository] = None,
+                 lines: Optional["OrderLineColumns"] = None):
+        self.events = events if events is not None else InMemoryOrderEventStore()
+        self.outbox = outbox if outbox is not None else InMemoryOutboxRepository()
+        self.lines = lines
+
+    def save(self, order: Order) -> Order:
+        """注文を保存する（既存の注文の場合は更新と同じ）"""
+        with self.events.lock:
+            self._commit(order)
+        return order
+
+    def save_many(self, orders: List[Order]) -> List[Order]:
+        """複数の注文を一括で保存する"""
+        with self.events.lock:
+            for order in orders:
+                self._commit(order)
+        return orders
+
+    def find_by_id(self, order_id: UUID) -> Optional[Order]:
+        """イベントを再生して注文を読み込む"""
+        return self.events.load(order_id)
+
+    def update(self, order: Order) -> Order:
+        """注文を更新する"""
+        with self.events.lock:
+            if order.id in self.events.streams:
+                self._commit(order)
+        return order
+
+    def update_status_many(self, order_ids: List[UUID], status: OrderStatus,
+                           expected: FrozenSet[OrderStatus]) -> List[Order]:
+        """ステータスが expected のいずれかである注文だけを status に変更する"""
+        updated = []
+        with self.events.lock:
+            for order_id in order_ids:
+                order = self.events.load(order_id)
+                if order is None or order.status not in expected:
+                    continue
+                order.update_status(status)
+                self._commit(order)
+                updated.append(order)
+        return updated
+    
+    def delete(self, order_id: UUID) -> None:
+        """注文をイベントストリームごと削除する"""
+        with self.events.lock:
+            self.events.remove(order_id)
+            if self.lines is not None:
+                self.lines.remove(order_id)
+
+    def _commit(self, order: Order) -> None:
+        previous = self.events.load(order.id)
+        if previous is None:
+            events = placed_events(order)
+        else:
+            recorded_at = order.updated_at if order.updated_at is not None else datetime.now()
+            events = changed_events(previous, order, previous.version + 1, recorded_at)
+            if not events:
+                order.version = previous.version
+                self.outbox.append(order.pull_events())
+                return
+            order.version = previous.version + 1
+        self.events.append(order, events)
+        self.outbox.append(order.pull_events())
+        if self.lines is not None:
+            self.lines.append(order)
+
+
+class EventSourcedOrderHistory(OrderHistoryInterface):
+    """イベントストリームから過去の時点の注文を組み立てる"""
+
+    def __init__(self, events: InMemoryOrderEventStore):
+        self.events = events
+
+    def find_as_of(self, order_id: UUID, at: datetime) -> Optional[Order]:
+        """at の時点の注文を取得する（その時点で作成されていなければNone）"""
+        return self.events.load(order_id, at)
+
+    def find_by_customer_as_of(self, customer_id: UUID, at: datetime) -> List[Order]:
+        """at 以前に作成された顧客の注文を、それぞれ at の時点の状態で取得する"""
+        order_ids = self.events.projection.ids_by_customer(customer_id, created_until=at)
+        orders = (self.events.load(order_id, at) for order_id in order_ids)
+        return [order for order in orders if order is not None]
@@ -1,31 +1,71 @@
-from typing import Dict, List, Optional
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 from uuid import UUID
 
-from domain.entities.customer import Customer
+from domain.entities.customer import Customer, normalize_email
+from domain.exceptions import DuplicateEmailError
 from domain.repositories.customer_repository import CustomerRepository
+from infrastructure.persistence.record_codec import encode_customer
+
+if TYPE_CHECKING:
+    from infrastructure.persistence.journal import Journal
 
 
 class InMemoryCustomerRepository(CustomerRepository):
-    """メモリ内顧客リポジトリの実装"""
+    """メモリ内顧客リポジトリの実装
+    
+    正規化したメールアドレスから顧客IDへの一意インデックスを保持し、
+    メールアドレスによる検索と重複チェックを定数時間で行う。
+    """
     
     def __init__(self):
         self.customers: Dict[UUID, Customer] = {}
+        self.email_index: Dict[str, UUID] = {}
+        # 顧客IDごとにインデックス登録済みのメールアドレス（update_detailsで書き換えられても古いキーを外せるように保持する）
+        self._indexed_emails: Dict[UUID, str] = {}
+        self.lock = threading.RLock()
+        # 永続化が有効な場合の変更の書き込み先
+        self.journal: Optional["Journal"] = None
     
     def save(self, customer: Customer) -> Customer:
         """顧客を保存する"""
-        self.customers[customer.id] = customer
+        with self.lock:
+            self._index(customer)
+            self.customers[customer.id] = customer
+            self._journal_put(customer)
         return customer
     
+    def save_many(self, customers: Iterable[Customer]) -> List[Customer]:
+        """複数の顧客を一括で登録する（重複があれば何も保存しない）"""
+        customers = list(customers)
+        with self.lock:
+            # 全てのメールアドレスを検証してから登録する
+            emails = set()
+            for customer in customers:
+                email = normalize_email(customer.email)
+                owner = self.email_index.get(email)
+                if email in emails or (owner is not None and owner != customer.id):
+                    raise DuplicateEmailError(customer.email)
+                emails.add(email)
+            for customer in customers:
+                self._index(customer)
+                self.customers[customer.id] = customer
+                self._journal_put(customer)
+        return customers
+    
     def find_by_id(self, customer_id: UUID) -> Optional[Customer]:
         """IDで顧客を検索する"""
         return self.customers.get(customer_id)
     
+    def find_by_ids(self, customer_ids: Iterable[UUID]) -> Dict[UUID, Customer]:
+        """複数のIDで顧客を一括検索する"""
+        customers = self.customers
+        return {customer_id: customers[customer_id] for customer_id in customer_ids if customer_id in customers}
+    
     def find_by_email(self, email: str) -> Optional[Customer]:
         """メールアドレスで顧客を検索する"""
-        for customer in self.customers.values():
-            if customer.email == email:
-                return customer
-        return None
+        customer_id = self.email_index.get(normalize_email(email))
+        return self.customers.get(customer_id) if customer_id is not None else None
     
     def find_all(self) -> List[Customer]:
         """全ての顧客を取得する"""
@@ -33,11 +73,41 @@ class InMemoryCustomerRepository(CustomerRepository):
     
     def update(self, customer: Customer) -> Customer:
         """顧客を更新する"""
-        if customer.id in self.customers:
-            self.customers[customer.id] = customer
+        with self.lock:
+            if customer.id in self.customers:
+                self._index(customer)
+                self.customers[customer.id] = customer
+                self._journal_put(customer)
         return customer
     
+    def update_many(self, customers: Iterable[Customer]) -> List[Customer]:
+        """複数の顧客を一括更新する"""
+        with self.lock:
+            return [self.update(customer) for customer in customers]
+    
     def delete(self, customer_id: UUID) -> None:
         """顧客を削除する"""
-        if customer_id in self.customers:
-            del self.customers[customer_id] 
\ No newline at end of file
+        with self.lock:
+            if customer_id in self.customers:
+                del self.customers[customer_id]
+                if self.journal is not None:
+                    self.journal.delete_customer(customer_id)
+            email = self._indexed_emails.pop(customer_id, None)
+            if email is not None:
+                self.email_index.pop(email, None)
+    
+    def _index(self, customer: Customer) -> None:
+        """メールアドレスのインデックスを更新する（重複時は例外）"""
+        email = normalize_email(customer.email)
+        owner = self.email_index.get(email)
+        if owner is not None and owner != customer.id:
+            raise DuplicateEmailError(customer.email)
+        previous = self._indexed_emails.get(customer.id)
+        if previous is not None and previous != email:
+            del self.email_index[previous]
+        self.email_index[email] = customer.id
+        self._indexed_emails[customer.id] = email
+    
+    def _journal_put(self, customer: Customer) -> None:
+        if self.journal is not None:
+            self.journal.put_customer(customer.id, encode_customer(customer))
@@ -1,47 +1,288 @@
-from typing import Dict, List, Optional
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 
-from domain.entities.order import Order
-from domain.repositories.order_repository import OrderCommandRepositoryInterface, OrderQueryRepositoryInterface
+from domain.entities.order import Order, OrderStatus
+from domain.repositories.order_repository import (
+    OrderCommandRepositoryInterface,
+    OrderPageCursor,
+    OrderQueryRepositoryInterface
+)
+from infrastructure.persistence.record_codec import decode_order, encode_order
+from infrastructure.repositories.in_memory_outbox_repository import InMemoryOutboxRepository
 
+if TYPE_CHECKING:
+    from infrastructure.analytics.order_line_columns import OrderLineColumns
+    from infrastructure.persistence.journal import Journal
 
-class InMemoryOrderCommandRepository(OrderCommandRepositoryInterface):
-    """メモリ内注文コマンドリポジトリの実装"""
+# 同じ日時のエントリを全て含めて二分探索するための最大のID
+_MAX_UUID = UUID(int=(1 << 128) - 1)
+
+
+class InMemoryOrderStore:
+    """注文とセカンダリインデックスを保持するメモリ内ストア
+
+    コマンドリポジトリとクエリリポジトリで共有する。顧客IDのインデックスは
+    (作成日時, 注文ID) のソート済みリストで保持し、キーセットページネーションを二分探索で行う。
+    ステータスのインデックスは値を持たない辞書を順序付き集合として使う。
+    """
     
     def __init__(self):
         self.orders: Dict[UUID, Order] = {}
+        self.by_customer: Dict[UUID, List[Tuple[datetime, UUID]]] = {}
+        self.by_status: Dict[str, Dict[UUID, None]] = {}
+        # インデックスに登録済みのキー（エンティティが直接書き換えられても古いエントリを外せるように保持する）
+        self._indexed_keys: Dict[UUID, Tuple[UUID, str, datetime]] = {}
+        self.lock = threading.RLock()
+        # 永続化が有効な場合の変更の書き込み先（ロックを保持したまま追記し、ログの順序を変更の順序と一致させる）
+        self.journal: Optional["Journal"] = None
+    
+    def put(self, order: Order) -> None:
+        """注文を格納し、インデックスを更新する"""
+        with self.lock:
+            keys = (order.customer_id, order.status, order.created_at)
+            previous = self._indexed_keys.get(order.id)
+            if previous != keys:
+                if previous is not None:
+                    self._unindex(order.id, previous)
+                # 通常は作成日時順に保存されるため末尾への追加になる
+                insort(self.by_customer.setdefault(order.customer_id, []), (order.created_at, order.id))
+                self.by_status.setdefault(order.status, {})[order.id] = None
+                self._indexed_keys[order.id] = keys
+            stored = self._encode(order)
+            self.orders[order.id] = stored
+            if self.journal is not None:
+                self.journal.put_order(order.id, self._record(stored))
+    
+    def get(self, order_id: UUID) -> Optional[Order]:
+        """IDで注文を取得する"""
+        record = self.orders.get(order_id)
+        return None if record is None else self._decode(order_id, record)
+    
+    def contains(self, order_id: UUID) -> bool:
+        """注文が格納されているかどうかを返す"""
+        return order_id in self.orders
+    
+    def all(self) -> List[Order]:
+        """全ての注文を取得する"""
+        with self.lock:
+            records = list(self.orders.items())
+        return [self._decode(order_id, record) for order_id, record in records]
+    
+    def remove(self, order_id: UUID) -> None:
+        """注文を削除し、インデックスから外す"""
+        with self.lock:
+            previous = self._indexed_keys.pop(order_id, None)
+            if previous is not None:
+                self._unindex(order_id, previous)
+            if self.orders.pop(order_id, None) is not None and self.journal is not None:
+                self.journal.delete_order(order_id)
+    
+    def ids_by_customer(self, customer_id: UUID, created_until: Optional[datetime] = None) -> List[UUID]:
+        """顧客IDに対応する注文IDを取得する（created_until を指定するとその日時以前に作成されたもののみ）"""
+        with self.lock:
+            bucket = self.by_customer.get(customer_id, ())
+            if created_until is not None:
+                bucket = bucket[:bisect_right(bucket, (created_until, _MAX_UUID))]
+            return [order_id for _, order_id in bucket]
+    
+    def page_by_customer(self, customer_id: UUID, limit: int, after: Optional[OrderPageCursor] = None) -> List[UUID]:
+        """顧客IDに対応する注文IDを、afterより後ろから最大limit件取得する"""
+        with self.lock:
+            bucket = self.by_customer.get(customer_id, ())
+            start = bisect_right(bucket, tuple(after)) if after is not None else 0
+            return [order_id for _, order_id in bucket[start:start + limit]]
+    
+    def ids_by_status(self, status: str) -> List[UUID]:
+        """ステータスに対応する注文IDを取得する"""
+        with self.lock:
+            return list(self.by_status.get(status, ()))
+    
+    def records(self) -> Iterator[Tuple[UUID, bytes]]:
+        """全ての注文を (注文ID, record_codec の形式のバイト列) で返す
+
+        ロックは格納した値の一覧をコピーする間だけ保持し、変換はロックの外で行う。
+        """
+        with self.lock:
+            items = list(self.orders.items())
+        record = self._record
+        return ((order_id, record(stored)) for order_id, stored in items)
+    
+    def load(self, records: Iterable[Tuple[UUID, bytes]]) -> int:
+        """永続化した注文（record_codec の形式）を空のストアにまとめて格納し、格納した件数を返す
+
+        1件ずつ put するのではなく、顧客ごとのインデックスを最後に1回だけ並べ替える。
+        """
+        with self.lock:
+            self._load_indexed(self._loaded(records))
+            return len(self.orders)
+    
+    def _loaded(self, records: Iterable[Tuple[UUID, bytes]]) -> Iterator[Tuple[UUID, UUID, int, datetime, object]]:
+        """復元する注文ごとに (注文ID, 顧客ID, ステータスのコード, 作成日時, 格納する値) を返す"""
+        for order_id, record in records:
+            order = decode_order(order_id, record)
+            yield order_id, order.customer_id, OrderStatus(order.status).code, order.created_at, order
+    
+    def _load_indexed(self, entries: Iterable[Tuple[UUID, UUID, int, datetime, object]]) -> None:
+        orders, indexed_keys, by_customer = self.orders, self._indexed_keys, self.by_customer
+        statuses = list(OrderStatus)
+        # ステータスはコードの位置で振り分ける（列挙型のハッシュを注文ごとに計算しない）
+        by_code: List[Dict[UUID, None]] = [{} for _ in statuses]
+        for order_id, customer_id, code, created_at, stored in entries:
+            orders[order_id] = stored
+            indexed_keys[order_id] = (customer_id, statuses[code], created_at)
+            entries_of_customer = by_customer.get(customer_id)
+            if entries_of_customer is None:
+                entries_of_customer = by_customer[customer_id] = []
+            entries_of_customer.append((created_at, order_id))
+            by_code[code][order_id] = None
+        for entries_of_customer in by_customer.values():
+            entries_of_customer.sort()
+        for status, bucket in zip(statuses, by_code):
+            if bucket:
+                self.by_status.setdefault(status, {}).update(bucket)
+    
+    def _encode(self, order: Order):
+        """格納する形式に変換する（このストアはエンティティをそのまま保持する）"""
+        return order
+    
+    def _decode(self, order_id: UUID, record) -> Order:
+        return record
+    
+    def _record(self, stored) -> bytes:
+        """格納した値をジャーナル・スナップショットに書き込むバイト列にする"""
+        return encode_order(stored)
+    
+    def _unindex(self, order_id: UUID, keys: Tuple[UUID, str, datetime]) -> None:
+        customer_id, status, created_at = keys
+        entries = self.by_customer.get(customer_id)
+        if entries is not None:
+            position = bisect_left(entries, (created_at, order_id))
+            if position < len(entries) and entries[position][1] == order_id:
+                del entries[position]
+            if not entries:
+                del self.by_customer[customer_id]
+        bucket = self.by_status.get(status)
+        if bucket is not None:
+            bucket.pop(order_id, None)
+            if not bucket:
+                del self.by_status[status]
+
+
+class InMemoryOrderCommandRepository(OrderCommandRepositoryInterface):
+    """メモリ内注文コマンドリポジトリの実装
+    
+    注文の格納とドメインイベントのアウトボックスへの追加は、ストアのロックを保持したまま行う。
+    lines を渡した場合は、売上集計用の注文明細の列指向ミラーにも同じ書き込みを反映する。
+    """
+    
+    def __init__(self, store: Optional[InMemoryOrderStore] = None,
+                 outbox: Optional[InMemoryOutboxRepository] = None,
+                 lines: Optional["OrderLineColumns"] = None):
+        self.store = store if store is not None else InMemoryOrderStore()
+        self.outbox = outbox if outbox is not None else InMemoryOutboxRepository()
+        self.lines = lines
+    
+    @property
+    def orders(self) -> Dict[UUID, object]:
+        return self.store.orders
     
     def save(self, order: Order) -> Order:
         """注文を保存する"""
-        self.orders[order.id] = order
+        with self.store.lock:
+            self.store.put(order)
+            self.outbox.append(order.pull_events())
+            if self.lines is not None:
+                self.lines.append(order)
         return order
     
+    def save_many(self, orders: List[Order]) -> List[Order]:
+        """複数の注文を一括で保存する"""
+        with self.store.lock:
+            for order in orders:
+                self.store.put(order)
+                self.outbox.append(order.pull_events())
+                if self.lines is not None:
+                    self.lines.append(order)
+        return orders
+    
+    def find_by_id(self, order_id: UUID) -> Optional[Order]:
+        """更新のためにIDで注文を読み込む"""
+        return self.store.get(order_id)
+    
     def update(self, order: Order) -> Order:
         """注文を更新する"""
-        if order.id in self.orders:
-            self.orders[order.id] = order
+        # Order.update_status で書き換えられたステータスもここでインデックスに反映される
+        with self.store.lock:
+            if self.store.contains(order.id):
+                order.version += 1
+                self.store.put(order)
+                self.outbox.append(order.pull_events())
+                if self.lines is not None:
+                    self.lines.append(order)
         return order
     
+    def update_status_many(self, order_ids: List[UUID], status: OrderStatus,
+                           expected: FrozenSet[OrderStatus]) -> List[Order]:
+        """ステータスが expected のいずれかである注文だけを status に変更する（ロックの取得は1回）"""
+        updated = []
+        with self.store.lock:
+            for order_id in order_ids:
+                order = self.store.get(order_id)
+                if order is None or order.status not in expected:
+                    continue
+                order.update_status(status)
+                order.version += 1
+                self.store.put(order)
+                self.outbox.append(order.pull_events())
+                if self.lines is not None:
+                    self.lines.append(order)
+                updated.append(order)
+        return updated
+    
     def delete(self, order_id: UUID) -> None:
         """注文を削除する"""
-        if order_id in self.orders:
-            del self.orders[order_id]
+        with self.store.lock:
+            self.store.remove(order_id)
+            if self.lines is not None:
+                self.lines.remove(order_id)
 
 
 class InMemoryOrderQueryRepository(OrderQueryRepositoryInterface):
     """メモリ内注文クエリリポジトリの実装"""
     
-    def __init__(self):
-        self.orders: Dict[UUID, Order] = {}
+    def __init__(self, store: Optional[InMemoryOrderStore] = None):
+        self.store = store if store is not None else InMemoryOrderStore()
+    
+    @property
+    def orders(self) -> Dict[UUID, object]:
+        return self.store.orders
     
     def find_by_id(self, order_id: UUID) -> Optional[Order]:
         """IDで注文を検索する"""
-        return self.orders.get(order_id)
+        return self.store.get(order_id)
     
     def find_all_by_customer_id(self, customer_id: UUID) -> List[Order]:
         """顧客IDで全ての注文を検索する"""
-        return [order for order in self.orders.values() if order.customer_id == customer_id]
+        return self._existing(self.store.ids_by_customer(customer_id))
+    
+    def find_page_by_customer_id(self, customer_id: UUID, limit: int,
+                                 after: Optional[OrderPageCursor] = None) -> List[Order]:
+        """顧客IDで注文を作成日時・ID順に最大limit件検索する"""
+        return self._existing(self.store.page_by_customer(customer_id, limit, after))
+    
+    def find_all_by_status(self, status: str) -> List[Order]:
+        """ステータスで全ての注文を検索する"""
+        # update前にエンティティだけ書き換えられた注文は除外する
+        return [order for order in self._existing(self.store.ids_by_status(status)) if order.status == status]
     
     def find_all(self) -> List[Order]:
         """全ての注文を取得する"""
-        return list(self.orders.values())
\ No newline at end of file
+        return self.store.all()
+    
+    def _existing(self, order_ids: List[UUID]) -> List[Order]:
+        # インデックスの取得後に削除された注文は除外する
+        orders = (self.store.get(order_id) for order_id in order_ids)
+        return [order for order in orders if order is not None]
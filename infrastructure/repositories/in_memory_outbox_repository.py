@@ -0,0 +1,89 @@
+import threading
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from domain.events import DomainEvent
+from domain.repositories.outbox_repository import OutboxMessage, OutboxRepositoryInterface
+
+
+class InMemoryOutboxRepository(OutboxRepositoryInterface):
+    """メモリ内アウトボックスの実装
+    
+    未配信のメッセージを追加順（発生順）の辞書で保持する。配信済みのメッセージは保持しない。
+    配信中として確保したメッセージは、確保した配信処理と日時を別の辞書で保持する。
+    """
+    
+    def __init__(self):
+        self.pending: Dict[UUID, OutboxMessage] = {}
+        self.failed: Dict[UUID, Tuple[OutboxMessage, str]] = {}
+        self.claims: Dict[UUID, Tuple[str, datetime]] = {}
+        # 配信に失敗したメッセージがある注文（後のメッセージを確保しない）
+        self.blocked_aggregates: Set[UUID] = set()
+        self.lock = threading.Lock()
+    
+    def append(self, events: List[DomainEvent]) -> None:
+        """ドメインイベントを未配信のメッセージとして追加する"""
+        if not events:
+            return
+        with self.lock:
+            for event in events:
+                self.pending[event.event_id] = OutboxMessage.from_event(event)
+    
+    def fetch_pending(self, limit: int) -> List[OutboxMessage]:
+        """未配信のメッセージを発生順に最大limit件取得する（確保はしない）"""
+        with self.lock:
+            return list(islice(self.pending.values(), limit))
+    
+    def claim_pending(self, limit: int, claimed_by: str, lease_seconds: float) -> List[OutboxMessage]:
+        """未配信のメッセージを発生順に最大limit件、配信中として確保して取得する"""
+        now = datetime.now()
+        expired = now - timedelta(seconds=lease_seconds)
+        claimed: List[OutboxMessage] = []
+        with self.lock:
+            busy = set(self.blocked_aggregates)
+            for message in self.pending.values():
+                if len(claimed) >= limit:
+                    break
+                claim = self.claims.get(message.id)
+                if message.aggregate_id in busy or (claim is not None and claim[1] >= expired):
+                    # 先のメッセージが配信中・配信に失敗した注文は、後のメッセージも確保しない
+                    busy.add(message.aggregate_id)
+                    continue
+                self.claims[message.id] = (claimed_by, now)
+                claimed.append(message)
+        return claimed
+    
+    def release(self, message_ids: List[UUID]) -> None:
+        """確保したメッセージを配信せずに未配信に戻す"""
+        with self.lock:
+            for message_id in message_ids:
+                self.claims.pop(message_id, None)
+    
+    def mark_dispatched(self, message_ids: List[UUID]) -> None:
+        """メッセージを配信済みにする"""
+        with self.lock:
+            for message_id in message_ids:
+                self.pending.pop(message_id, None)
+                self.claims.pop(message_id, None)
+    
+    def mark_failed(self, message_id: UUID, attempts: int, error: str) -> None:
+        """再試行しても配信できなかったメッセージを配信対象から外す"""
+        with self.lock:
+            message = self.pending.pop(message_id, None)
+            self.claims.pop(message_id, None)
+            if message is not None:
+                self.blocked_aggregates.add(message.aggregate_id)
+                message.attempts = attempts
+                self.failed[message_id] = (message, error)
+    
+    def pending_count(self) -> int:
+        """未配信のメッセージ数を返す"""
+        return len(self.pending)
+    
+    def oldest_pending_at(self) -> Optional[datetime]:
+        """最も古い未配信のメッセージの発生日時を返す（なければNone）"""
+        with self.lock:
+            message = next(iter(self.pending.values()), None)
+            return message.occurred_at if message is not None else None
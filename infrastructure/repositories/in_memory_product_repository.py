@@ -1,25 +1,59 @@
-from typing import Dict, List, Optional
+import threading
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 from uuid import UUID
 
 from domain.entities.product import Product
-from domain.repositories.product_repository import ProductRepository
+from domain.exceptions import InsufficientStockError
+from domain.repositories.product_repository import ProductRepository, validate_quantities
+from infrastructure.persistence.record_codec import encode_product
+
+if TYPE_CHECKING:
+    from infrastructure.persistence.journal import Journal
+
+# 在庫操作のロックのストライプ数（異なる製品は大半が別のロックになる）
+STOCK_LOCK_STRIPES = 64
 
 
 class InMemoryProductRepository(ProductRepository):
-    """メモリ内製品リポジトリの実装"""
+    """メモリ内製品リポジトリの実装
+    
+    在庫の確保・解放は製品IDから決まるストライプロックで保護する。
+    無関係な製品同士は別のロックを使うため、人気商品への集中が他の製品の注文を止めない。
+    複数のロックは番号順に取得してデッドロックを防ぐ。
+    """
     
-    def __init__(self):
+    def __init__(self, lock_stripes: int = STOCK_LOCK_STRIPES):
         self.products: Dict[UUID, Product] = {}
+        self._stock_locks = [threading.Lock() for _ in range(lock_stripes)]
+        # 永続化が有効な場合の変更の書き込み先（在庫の変更は製品のロックを保持したまま追記する）
+        self.journal: Optional["Journal"] = None
     
     def save(self, product: Product) -> Product:
         """製品を保存する"""
-        self.products[product.id] = product
+        with self._locked([product.id]):
+            self.products[product.id] = product
+            self._journal_put(product)
         return product
     
+    def save_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を一括で登録する"""
+        products = list(products)
+        with self._locked([product.id for product in products]):
+            for product in products:
+                self.products[product.id] = product
+                self._journal_put(product)
+        return products
+    
     def find_by_id(self, product_id: UUID) -> Optional[Product]:
         """IDで製品を検索する"""
         return self.products.get(product_id)
     
+    def find_by_ids(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        """複数のIDで製品を一括検索する"""
+        products = self.products
+        return {product_id: products[product_id] for product_id in product_ids if product_id in products}
+    
     def find_by_name(self, name: str) -> List[Product]:
         """名前で製品を検索する"""
         return [product for product in self.products.values() if name.lower() in product.name.lower()]
@@ -30,11 +64,61 @@ class InMemoryProductRepository(ProductRepository):
     
     def update(self, product: Product) -> Product:
         """製品を更新する"""
-        if product.id in self.products:
-            self.products[product.id] = product
+        with self._locked([product.id]):
+            if product.id in self.products:
+                self.products[product.id] = product
+                self._journal_put(product)
         return product
     
+    def update_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を一括更新する"""
+        return [self.update(product) for product in products]
+    
+    def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, int]:
+        """製品ごとの数量だけ在庫を原子的に確保する"""
+        validate_quantities(quantities)
+        with self._locked(quantities):
+            # 全て検証してから減算する（途中で失敗しても在庫は変わらない）
+            for product_id, quantity in quantities.items():
+                product = self.products.get(product_id)
+                available = product.stock_quantity if product else 0
+                if available < quantity:
+                    raise InsufficientStockError(product_id, available, quantity)
+            remaining: Dict[UUID, int] = {}
+            for product_id, quantity in quantities.items():
+                product = self.products[product_id]
+                product.update_stock(product.stock_quantity - quantity)
+                remaining[product_id] = product.stock_quantity
+                self._journal_put(product)
+            return remaining
+    
+    def release_stock(self, quantities: Dict[UUID, int]) -> None:
+        """確保した在庫を原子的に戻す"""
+        validate_quantities(quantities)
+        with self._locked(quantities):
+            for product_id, quantity in quantities.items():
+                product = self.products.get(product_id)
+                if product:
+                    product.update_stock(product.stock_quantity + quantity)
+                    self._journal_put(product)
+    
+    def _locked(self, product_ids: Iterable[UUID]) -> ExitStack:
+        """製品IDに対応するストライプロックを番号順に全て取得する"""
+        stack = ExitStack()
+        stripes = len(self._stock_locks)
+        for index in sorted({hash(product_id) % stripes for product_id in product_ids}):
+            stack.enter_context(self._stock_locks[index])
+        return stack
+    
     def delete(self, product_id: UUID) -> None:
         """製品を削除する"""
-        if product_id in self.products:
-            del self.products[product_id] 
\ No newline at end of file
+        with self._locked([product_id]):
+            if product_id in self.products:
+                del self.products[product_id]
+                if self.journal is not None:
+                    self.journal.delete_product(product_id)
+    
+    def _journal_put(self, product: Product) -> None:
+        if self.journal is not None:
+            self.journal.put_product(product.id, encode_product(product))
+ 
\ No newline at end of file
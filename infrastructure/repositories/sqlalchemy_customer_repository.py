@@ -0,0 +1,169 @@
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from domain.entities.customer import Customer, normalize_email
+from domain.exceptions import DuplicateEmailError
+from domain.repositories.customer_repository import CustomerRepository
+from infrastructure.db.models import CustomerModel
+from infrastructure.db.upsert import upsert_statement
+
+
+def _to_entity(model: CustomerModel) -> Customer:
+    """ORMモデルからエンティティに変換する"""
+    return Customer(
+        id=model.id,
+        name=model.name,
+        email=model.email,
+        phone=model.phone,
+        address=model.address,
+        created_at=model.created_at,
+        updated_at=model.updated_at
+    )
+
+
+def _duplicate_emails(session: Session, customers: List[Customer]) -> List[Customer]:
+    """一意制約に違反した顧客（同じメールアドレスが別の顧客に登録済み、またはチャンク内で重複）を返す"""
+    emails = [normalize_email(customer.email) for customer in customers]
+    stmt = select(CustomerModel.email_normalized, CustomerModel.id).where(CustomerModel.email_normalized.in_(emails))
+    owners = {email: owner for email, owner in session.execute(stmt)}
+    duplicates = []
+    for customer, email in zip(customers, emails):
+        owner = owners.setdefault(email, customer.id)
+        if owner != customer.id:
+            duplicates.append(customer)
+    return duplicates
+
+
+class SqlAlchemyCustomerRepository(CustomerRepository):
+    """SQLAlchemyを使用した顧客リポジトリの実装"""
+    
+    def __init__(self, session_factory: sessionmaker[Session]):
+        self.session_factory = session_factory
+    
+    def save(self, customer: Customer) -> Customer:
+        """顧客を保存する"""
+        try:
+            with self.session_factory.begin() as session:
+                session.merge(CustomerModel(
+                    id=customer.id,
+                    name=customer.name,
+                    email=customer.email,
+                    email_normalized=normalize_email(customer.email),
+                    phone=customer.phone,
+                    address=customer.address,
+                    created_at=customer.created_at,
+                    updated_at=customer.updated_at
+                ))
+        except IntegrityError as e:
+            raise DuplicateEmailError(customer.email) from e
+        return customer
+    
+    def save_many(self, customers: Iterable[Customer]) -> List[Customer]:
+        """複数の顧客を1回のexecutemanyで一括登録する（重複があればトランザクションごと戻す）
+
+        登録済みのIDはsaveと同じく置き換える。メールアドレスの重複で失敗した場合は、重複した顧客のみを例外に含める。
+        """
+        customers = list(customers)
+        if customers:
+            try:
+                with self.session_factory.begin() as session:
+                    stmt = upsert_statement(
+                        session.get_bind().dialect.name, CustomerModel, ["id"],
+                        ["name", "email", "email_normalized", "phone", "address", "created_at", "updated_at"]
+                    )
+                    session.execute(stmt, [
+                        {
+                            "id": customer.id,
+                            "name": customer.name,
+                            "email": customer.email,
+                            "email_normalized": normalize_email(customer.email),
+                            "phone": customer.phone,
+                            "address": customer.address,
+                            "created_at": customer.created_at,
+                            "updated_at": customer.updated_at
+                        }
+                        for customer in customers
+                    ])
+            except IntegrityError as e:
+                with self.session_factory() as session:
+                    duplicates = _duplicate_emails(session, customers)
+                if not duplicates:
+                    raise
+                raise DuplicateEmailError(", ".join(customer.email for customer in duplicates)) from e
+        return customers
+    
+    def find_by_id(self, customer_id: UUID) -> Optional[Customer]:
+        """IDで顧客を検索する"""
+        with self.session_factory() as session:
+            model = session.get(CustomerModel, customer_id)
+            return _to_entity(model) if model is not None else None
+    
+    def find_by_ids(self, customer_ids: Iterable[UUID]) -> Dict[UUID, Customer]:
+        """複数のIDで顧客を一括検索する（1クエリ）"""
+        customer_ids = list(customer_ids)
+        if not customer_ids:
+            return {}
+        with self.session_factory() as session:
+            stmt = select(CustomerModel).where(CustomerModel.id.in_(customer_ids))
+            return {model.id: _to_entity(model) for model in session.scalars(stmt)}
+    
+    def find_by_email(self, email: str) -> Optional[Customer]:
+        """メールアドレスで顧客を検索する"""
+        with self.session_factory() as session:
+            stmt = select(CustomerModel).where(CustomerModel.email_normalized == normalize_email(email))
+            model = session.scalars(stmt).first()
+            return _to_entity(model) if model is not None else None
+    
+    def find_all(self) -> List[Customer]:
+        """全ての顧客を取得する"""
+        with self.session_factory() as session:
+            return [_to_entity(model) for model in session.scalars(select(CustomerModel))]
+    
+    def update(self, customer: Customer) -> Customer:
+        """顧客を更新する"""
+        try:
+            with self.session_factory.begin() as session:
+                model = session.get(CustomerModel, customer.id)
+                if model is not None:
+                    model.name = customer.name
+                    model.email = customer.email
+                    model.email_normalized = normalize_email(customer.email)
+                    model.phone = customer.phone
+                    model.address = customer.address
+                    model.updated_at = customer.updated_at
+        except IntegrityError as e:
+            raise DuplicateEmailError(customer.email) from e
+        return customer
+    
+    def update_many(self, customers: Iterable[Customer]) -> List[Customer]:
+        """複数の顧客を一括更新する（主キー指定のexecutemany）"""
+        customers = list(customers)
+        if customers:
+            try:
+                with self.session_factory.begin() as session:
+                    session.execute(update(CustomerModel), [
+                        {
+                            "id": customer.id,
+                            "name": customer.name,
+                            "email": customer.email,
+                            "email_normalized": normalize_email(customer.email),
+                            "phone": customer.phone,
+                            "address": customer.address,
+                            "updated_at": customer.updated_at
+                        }
+                        for customer in customers
+                    ])
+            except IntegrityError as e:
+                raise DuplicateEmailError(", ".join(customer.email for customer in customers)) from e
+        return customers
+    
+    def delete(self, customer_id: UUID) -> None:
+        """顧客を削除する"""
+        with self.session_factory.begin() as session:
+            model = session.get(CustomerModel, customer_id)
+            if model is not None:
+                session.delete(model)
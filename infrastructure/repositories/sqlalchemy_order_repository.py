@@ -0,0 +1,262 @@
+from datetime import datetime
+from typing import Dict, FrozenSet, List, Optional
+from uuid import UUID
+
+from sqlalchemy import Update, and_, delete, insert, or_, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from domain.entities.order import Order, OrderItem, OrderStatus
+from domain.repositories.order_repository import (
+    OrderCommandRepositoryInterface,
+    OrderPageCursor,
+    OrderQueryRepositoryInterface
+)
+from infrastructure.db.models import OrderItemModel, OrderModel, OutboxEventModel
+from infrastructure.repositories.sqlalchemy_outbox_repository import _event_rows
+
+# 一括のステータス変更で1文のIN句に含める注文IDの数
+STATUS_UPDATE_CHUNK = 500
+
+
+def _to_entity(model: OrderModel) -> Order:
+    """ORMモデルからエンティティに変換する"""
+    return Order(
+        id=model.id,
+        customer_id=model.customer_id,
+        items=[
+            OrderItem(
+                product_id=item.product_id,
+                quantity=item.quantity,
+                price_per_unit=item.price_per_unit
+            )
+            for item in model.items
+        ],
+        status=model.status,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+        version=model.version
+    )
+
+
+def _order_rows(orders: List[Order]) -> List[dict]:
+    """注文テーブルへ挿入する行を作成する"""
+    return [
+        {
+            "id": order.id,
+            "customer_id": order.customer_id,
+            "status": order.status.value,
+            "created_at": order.created_at,
+            "updated_at": order.updated_at,
+            "version": order.version
+        }
+        for order in orders
+    ]
+
+
+def _item_rows(orders: List[Order]) -> List[dict]:
+    """注文アイテムテーブルへ挿入する行を作成する"""
+    return [
+        {
+            "order_id": order.id,
+            "position": position,
+            "product_id": item.product_id,
+            "quantity": item.quantity,
+            "price_per_unit": item.price_per_unit
+        }
+        for order in orders
+        for position, item in enumerate(order.items)
+    ]
+
+
+def _pending_event_rows(orders: List[Order]) -> List[dict]:
+    """注文に記録されたドメインイベントを取り出し、アウトボックスの行にする"""
+    return _event_rows([event for order in orders for event in order.pull_events()])
+
+
+def _insert_orders(session: Session, orders: List[Order]) -> None:
+    """注文と注文アイテム、ドメインイベントをそれぞれ1回のexecutemanyで挿入する"""
+    session.execute(insert(OrderModel), _order_rows(orders))
+    _insert_items(session, orders)
+    _insert_events(session, orders)
+
+
+def _insert_items(session: Session, orders: List[Order]) -> None:
+    """注文アイテムを1回のexecutemanyで挿入する"""
+    rows = _item_rows(orders)
+    if rows:
+        session.execute(insert(OrderItemModel), rows)
+
+
+def _insert_events(session: Session, orders: List[Order]) -> None:
+    """ドメインイベントを注文と同じトランザクションでアウトボックスに挿入する"""
+    rows = _pending_event_rows(orders)
+    if rows:
+        session.execute(insert(OutboxEventModel), rows)
+
+
+def _update_statement(order: Order) -> Update:
+    """注文の行を読み込まずに更新し、版を進めるUPDATE（進めた版を返す、行がなければ何も返さない）"""
+    return (
+        update(OrderModel)
+        .where(OrderModel.id == order.id)
+        .values(
+            version=OrderModel.version + 1,
+            customer_id=order.customer_id,
+            status=order.status.value,
+            updated_at=order.updated_at
+        )
+        .returning(OrderModel.version)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _status_update_statement(order_ids: List[UUID], previous: OrderStatus, status: OrderStatus,
+                             updated_at: datetime) -> Update:
+    """ステータスが previous の注文だけを status に変更する条件付きUPDATE（変更した行のIDを返す）"""
+    return (
+        update(OrderModel)
+        .where(OrderModel.id.in_(order_ids), OrderModel.status == previous.value)
+        .values(status=status.value, updated_at=updated_at, version=OrderModel.version + 1)
+        .returning(OrderModel.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _status_changed_order(model: OrderModel, previous: Dict[UUID, OrderStatus], status: OrderStatus,
+                          updated_at: datetime) -> Order:
+    """条件付きUPDATEで変更した行から注文を作る（変更前の状態から Order.update_status を通してドメインイベントを記録する）"""
+    order = _to_entity(model)
+    order.status = previous[order.id]
+    order.update_status(status)
+    order.updated_at = updated_at
+    return order
+
+
+def _in_request_order(orders: List[Order], order_ids: List[UUID]) -> List[Order]:
+    """注文を指定されたIDの順に並べる"""
+    position = {order_id: index for index, order_id in enumerate(order_ids)}
+    orders.sort(key=lambda order: position[order.id])
+    return orders
+
+
+class SqlAlchemyOrderCommandRepository(OrderCommandRepositoryInterface):
+    """SQLAlchemyを使用した注文コマンドリポジトリの実装"""
+    
+    def __init__(self, session_factory: sessionmaker[Session]):
+        self.session_factory = session_factory
+    
+    def save(self, order: Order) -> Order:
+        """注文を保存する"""
+        with self.session_factory.begin() as session:
+            _insert_orders(session, [order])
+        return order
+    
+    def save_many(self, orders: List[Order]) -> List[Order]:
+        """複数の注文を1トランザクションで一括保存する"""
+        if orders:
+            with self.session_factory.begin() as session:
+                _insert_orders(session, orders)
+        return orders
+    
+    def find_by_id(self, order_id: UUID) -> Optional[Order]:
+        """更新のためにIDで注文を読み込む"""
+        with self.session_factory() as session:
+            model = session.get(OrderModel, order_id)
+            return _to_entity(model) if model is not None else None
+    
+    def update(self, order: Order) -> Order:
+        """注文を更新する"""
+        with self.session_factory.begin() as session:
+            version = session.execute(_update_statement(order)).scalar_one_or_none()
+            if version is not None:
+                order.version = version
+                # アイテムは置き換える（削除1回と挿入1回）
+                session.execute(delete(OrderItemModel).where(OrderItemModel.order_id == order.id))
+                _insert_items(session, [order])
+                _insert_events(session, [order])
+        return order
+    
+    def update_status_many(self, order_ids: List[UUID], status: OrderStatus,
+                           expected: FrozenSet[OrderStatus]) -> List[Order]:
+        """ステータスが expected のいずれかである注文だけを status に変更する（1トランザクション）
+        
+        元のステータスごとに UPDATE ... WHERE id IN (...) AND status = 元のステータス を実行し、
+        変更した行のIDを RETURNING で受け取る。読み込みは変更した注文のドメインイベントと戻り値を作るためだけに行う。
+        """
+        if not order_ids or not expected:
+            return []
+        updated_at = datetime.now()
+        changed: Dict[UUID, OrderStatus] = {}
+        with self.session_factory.begin() as session:
+            for start in range(0, len(order_ids), STATUS_UPDATE_CHUNK):
+                chunk = order_ids[start:start + STATUS_UPDATE_CHUNK]
+                for previous in expected:
+                    result = session.execute(_status_update_statement(chunk, previous, status, updated_at))
+                    changed.update((order_id, previous) for order_id in result.scalars())
+            orders = []
+            changed_ids = list(changed)
+            for start in range(0, len(changed_ids), STATUS_UPDATE_CHUNK):
+                stmt = select(OrderModel).where(OrderModel.id.in_(changed_ids[start:start + STATUS_UPDATE_CHUNK]))
+                orders.extend(_status_changed_order(model, changed, status, updated_at) for model in session.scalars(stmt))
+            _insert_events(session, orders)
+        return _in_request_order(orders, order_ids)
+    
+    def delete(self, order_id: UUID) -> None:
+        """注文を削除する"""
+        with self.session_factory.begin() as session:
+            model = session.get(OrderModel, order_id)
+            if model is not None:
+                session.delete(model)
+
+
+class SqlAlchemyOrderQueryRepository(OrderQueryRepositoryInterface):
+    """SQLAlchemyを使用した注文クエリリポジトリの実装"""
+    
+    def __init__(self, session_factory: sessionmaker[Session]):
+        self.session_factory = session_factory
+    
+    def find_by_id(self, order_id: UUID) -> Optional[Order]:
+        """IDで注文を検索する"""
+        with self.session_factory() as session:
+            model = session.get(OrderModel, order_id)
+            return _to_entity(model) if model is not None else None
+    
+    def find_all_by_customer_id(self, customer_id: UUID) -> List[Order]:
+        """顧客IDで全ての注文を検索する"""
+        with self.session_factory() as session:
+            # itemsはselectinで一括ロードされるため、クエリ数は注文数に依存しない
+            stmt = (
+                select(OrderModel)
+                .where(OrderModel.customer_id == customer_id)
+                .order_by(OrderModel.created_at, OrderModel.id)
+            )
+            return [_to_entity(model) for model in session.scalars(stmt)]
+    
+    def find_page_by_customer_id(self, customer_id: UUID, limit: int,
+                                 after: Optional[OrderPageCursor] = None) -> List[Order]:
+        """顧客IDで注文をキーセット方式で最大limit件検索する"""
+        with self.session_factory() as session:
+            stmt = select(OrderModel).where(OrderModel.customer_id == customer_id)
+            if after is not None:
+                stmt = stmt.where(or_(
+                    OrderModel.created_at > after.created_at,
+                    and_(OrderModel.created_at == after.created_at, OrderModel.id > after.order_id)
+                ))
+            stmt = stmt.order_by(OrderModel.created_at, OrderModel.id).limit(limit)
+            return [_to_entity(model) for model in session.scalars(stmt)]
+    
+    def find_all_by_status(self, status: str) -> List[Order]:
+        """ステータスで全ての注文を検索する"""
+        with self.session_factory() as session:
+            stmt = (
+                select(OrderModel)
+                .where(OrderModel.status == status)
+                .order_by(OrderModel.created_at)
+            )
+            return [_to_entity(model) for model in session.scalars(stmt)]
+    
+    def find_all(self) -> List[Order]:
+        """全ての注文を取得する"""
+        with self.session_factory() as session:
+            stmt = select(OrderModel).order_by(OrderModel.created_at)
+            return [_to_entity(model) for model in session.scalars(stmt)]
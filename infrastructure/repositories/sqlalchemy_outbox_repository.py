@@ -0,0 +1,148 @@
+import json
+from datetime import datetime, timedelta
+from typing import Any, List, Optional
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, func, or_, select, update
+from sqlalchemy.orm import Session, aliased, sessionmaker
+
+from domain.events import DomainEvent
+from domain.repositories.outbox_repository import OutboxMessage, OutboxRepositoryInterface
+from infrastructure.db.models import OutboxEventModel
+
+
+def _event_rows(events: List[DomainEvent]) -> List[dict]:
+    """アウトボックステーブルへ挿入する行を作成する"""
+    return [
+        {
+            "id": event.event_id,
+            "event_type": event.event_type,
+            "aggregate_id": event.aggregate_id,
+            "payload": json.dumps(event.payload(), ensure_ascii=False),
+            "occurred_at": event.occurred_at,
+            "status": "PENDING",
+            "attempts": 0
+        }
+        for event in events
+    ]
+
+
+def _to_message(model: OutboxEventModel) -> OutboxMessage:
+    """行からアウトボックスのメッセージに変換する"""
+    return OutboxMessage(
+        id=model.id,
+        event_type=model.event_type,
+        aggregate_id=model.aggregate_id,
+        occurred_at=model.occurred_at,
+        payload=json.loads(model.payload),
+        attempts=model.attempts
+    )
+
+
+# 未配信（配信中として確保されたものを含む）の状態
+UNDELIVERED = ("PENDING", "IN_FLIGHT")
+
+
+def _claimable(model: Any, expired: datetime) -> ColumnElement[bool]:
+    """確保できる行（未配信、または確保の期限が切れた配信中の行）の条件"""
+    return or_(
+        model.status == "PENDING",
+        and_(model.status == "IN_FLIGHT", model.claimed_at < expired)
+    )
+
+
+class SqlAlchemyOutboxRepository(OutboxRepositoryInterface):
+    """SQLAlchemyを使用したアウトボックスの実装（outbox_eventsテーブル）"""
+    
+    def __init__(self, session_factory: sessionmaker[Session]):
+        self.session_factory = session_factory
+    
+    def fetch_pending(self, limit: int) -> List[OutboxMessage]:
+        """未配信のメッセージを発生順に最大limit件取得する（確保はしない）"""
+        with self.session_factory() as session:
+            stmt = (
+                select(OutboxEventModel)
+                .where(OutboxEventModel.status == "PENDING")
+                .order_by(OutboxEventModel.occurred_at)
+                .limit(limit)
+            )
+            return [_to_message(model) for model in session.scalars(stmt)]
+    
+    def claim_pending(self, limit: int, claimed_by: str, lease_seconds: float) -> List[OutboxMessage]:
+        """未配信のメッセージを発生順に最大limit件、配信中として確保して取得する
+
+        候補の選択と確保を1つの UPDATE ... RETURNING で行うため、複数のプロセスが同時に呼んでも
+        同じ行は1つのプロセスにしか返らない（PostgreSQL では候補の行を FOR UPDATE SKIP LOCKED で選ぶ）。
+        """
+        now = datetime.now()
+        expired = now - timedelta(seconds=lease_seconds)
+        candidate = aliased(OutboxEventModel)
+        blocking = aliased(OutboxEventModel)
+        # 先のメッセージが配信中・配信に失敗した注文は、後のメッセージも確保しない
+        busy = select(blocking.aggregate_id).where(or_(
+            and_(blocking.status == "IN_FLIGHT", blocking.claimed_at >= expired),
+            blocking.status == "FAILED"
+        ))
+        candidates = (
+            select(candidate.id)
+            .where(_claimable(candidate, expired), candidate.aggregate_id.not_in(busy))
+            .order_by(candidate.occurred_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id.in_(candidates), _claimable(OutboxEventModel, expired))
+            .values(status="IN_FLIGHT", claimed_by=claimed_by, claimed_at=now)
+            .returning(OutboxEventModel)
+            .execution_options(synchronize_session=False)
+        )
+        with self.session_factory.begin() as session:
+            messages = [_to_message(model) for model in session.scalars(stmt)]
+        # RETURNING の順序は保証されないため発生順に並べ直す
+        return sorted(messages, key=lambda message: message.occurred_at)
+    
+    def release(self, message_ids: List[UUID]) -> None:
+        """確保したメッセージを配信せずに未配信に戻す（1回のUPDATE）"""
+        if not message_ids:
+            return
+        with self.session_factory.begin() as session:
+            session.execute(
+                update(OutboxEventModel)
+                .where(OutboxEventModel.id.in_(message_ids), OutboxEventModel.status == "IN_FLIGHT")
+                .values(status="PENDING", claimed_by=None, claimed_at=None)
+            )
+    
+    def mark_dispatched(self, message_ids: List[UUID]) -> None:
+        """メッセージを配信済みにする（1回のUPDATE）"""
+        if not message_ids:
+            return
+        with self.session_factory.begin() as session:
+            session.execute(
+                update(OutboxEventModel)
+                .where(OutboxEventModel.id.in_(message_ids))
+                .values(status="DISPATCHED", dispatched_at=datetime.now())
+            )
+    
+    def mark_failed(self, message_id: UUID, attempts: int, error: str) -> None:
+        """再試行しても配信できなかったメッセージを配信対象から外す"""
+        with self.session_factory.begin() as session:
+            session.execute(
+                update(OutboxEventModel)
+                .where(OutboxEventModel.id == message_id)
+                .values(status="FAILED", attempts=attempts, last_error=error)
+            )
+    
+    def pending_count(self) -> int:
+        """未配信のメッセージ数を返す"""
+        with self.session_factory() as session:
+            return session.scalar(
+                select(func.count()).select_from(OutboxEventModel).where(OutboxEventModel.status.in_(UNDELIVERED))
+            )
+    
+    def oldest_pending_at(self) -> Optional[datetime]:
+        """最も古い未配信のメッセージの発生日時を返す（なければNone）"""
+        with self.session_factory() as session:
+            return session.scalar(
+                select(func.min(OutboxEventModel.occurred_at)).where(OutboxEventModel.status.in_(UNDELIVERED))
+            )
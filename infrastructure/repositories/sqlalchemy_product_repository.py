@@ -0,0 +1,170 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import Update, func, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from domain.entities.product import Product
+from domain.exceptions import InsufficientStockError
+from domain.repositories.product_repository import ProductRepository, validate_quantities
+from infrastructure.db.models import ProductModel
+from infrastructure.db.upsert import upsert_statement
+
+
+def _to_entity(model: ProductModel) -> Product:
+    """ORMモデルからエンティティに変換する"""
+    return Product(
+        id=model.id,
+        name=model.name,
+        description=model.description,
+        price=model.price,
+        stock_quantity=model.stock_quantity,
+        created_at=model.created_at,
+        updated_at=model.updated_at
+    )
+
+
+def _to_row(product: Product) -> dict:
+    """一括更新用の行を作成する"""
+    return {
+        "id": product.id,
+        "name": product.name,
+        "description": product.description,
+        "price": product.price,
+        "stock_quantity": product.stock_quantity,
+        "updated_at": product.updated_at
+    }
+
+
+def _reserve_statement(product_id: UUID, quantity: int, now: datetime) -> Update:
+    """在庫が足りる場合のみ減算する条件付きUPDATE（減算後の在庫数を返す）"""
+    return (
+        update(ProductModel)
+        .where(ProductModel.id == product_id, ProductModel.stock_quantity >= quantity)
+        .values(stock_quantity=ProductModel.stock_quantity - quantity, updated_at=now)
+        .returning(ProductModel.stock_quantity)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _release_statement(product_id: UUID, quantity: int, now: datetime) -> Update:
+    """在庫を戻すUPDATE（読み込まずにDB上で加算する）"""
+    return (
+        update(ProductModel)
+        .where(ProductModel.id == product_id)
+        .values(stock_quantity=ProductModel.stock_quantity + quantity, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+
+
+class SqlAlchemyProductRepository(ProductRepository):
+    """SQLAlchemyを使用した製品リポジトリの実装"""
+    
+    def __init__(self, session_factory: sessionmaker[Session]):
+        self.session_factory = session_factory
+    
+    def save(self, product: Product) -> Product:
+        """製品を保存する"""
+        with self.session_factory.begin() as session:
+            session.merge(ProductModel(
+                id=product.id,
+                name=product.name,
+                description=product.description,
+                price=product.price,
+                stock_quantity=product.stock_quantity,
+                created_at=product.created_at,
+                updated_at=product.updated_at
+            ))
+        return product
+    
+    def save_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を1回のexecutemanyで一括登録する（登録済みのIDはsaveと同じく置き換える）"""
+        products = list(products)
+        if products:
+            with self.session_factory.begin() as session:
+                stmt = upsert_statement(
+                    session.get_bind().dialect.name, ProductModel, ["id"],
+                    ["name", "description", "price", "stock_quantity", "created_at", "updated_at"]
+                )
+                session.execute(stmt, [
+                    {**_to_row(product), "created_at": product.created_at} for product in products
+                ])
+        return products
+    
+    def find_by_id(self, product_id: UUID) -> Optional[Product]:
+        """IDで製品を検索する"""
+        with self.session_factory() as session:
+            model = session.get(ProductModel, product_id)
+            return _to_entity(model) if model is not None else None
+    
+    def find_by_ids(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        """複数のIDで製品を一括検索する（1クエリ）"""
+        product_ids = list(product_ids)
+        if not product_ids:
+            return {}
+        with self.session_factory() as session:
+            stmt = select(ProductModel).where(ProductModel.id.in_(product_ids))
+            return {model.id: _to_entity(model) for model in session.scalars(stmt)}
+    
+    def find_by_name(self, name: str) -> List[Product]:
+        """名前で製品を検索する"""
+        with self.session_factory() as session:
+            stmt = select(ProductModel).where(func.lower(ProductModel.name).contains(name.lower()))
+            return [_to_entity(model) for model in session.scalars(stmt)]
+    
+    def find_all(self) -> List[Product]:
+        """全ての製品を取得する"""
+        with self.session_factory() as session:
+            return [_to_entity(model) for model in session.scalars(select(ProductModel))]
+    
+    def update(self, product: Product) -> Product:
+        """製品を更新する"""
+        with self.session_factory.begin() as session:
+            model = session.get(ProductModel, product.id)
+            if model is not None:
+                model.name = product.name
+                model.description = product.description
+                model.price = product.price
+                model.stock_quantity = product.stock_quantity
+                model.updated_at = product.updated_at
+        return product
+    
+    def update_many(self, products: Iterable[Product]) -> List[Product]:
+        """複数の製品を一括更新する（主キー指定のexecutemany）"""
+        products = list(products)
+        if products:
+            with self.session_factory.begin() as session:
+                session.execute(update(ProductModel), [_to_row(product) for product in products])
+        return products
+    
+    def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, int]:
+        """製品ごとの数量だけ在庫を原子的に確保する（条件付きUPDATE）"""
+        validate_quantities(quantities)
+        now = datetime.now()
+        remaining: Dict[UUID, int] = {}
+        with self.session_factory.begin() as session:
+            # 行ロックの取得順を揃えるためID順に更新する。1件でも失敗すればトランザクションごと戻す
+            for product_id in sorted(quantities):
+                quantity = quantities[product_id]
+                stock = session.execute(_reserve_statement(product_id, quantity, now)).scalar_one_or_none()
+                if stock is None:
+                    available = session.scalar(select(ProductModel.stock_quantity).where(ProductModel.id == product_id))
+                    raise InsufficientStockError(product_id, available or 0, quantity)
+                remaining[product_id] = stock
+        return remaining
+    
+    def release_stock(self, quantities: Dict[UUID, int]) -> None:
+        """確保した在庫を原子的に戻す"""
+        validate_quantities(quantities)
+        now = datetime.now()
+        with self.session_factory.begin() as session:
+            for product_id in sorted(quantities):
+                session.execute(_release_statement(product_id, quantities[product_id], now))
+    
+    def delete(self, product_id: UUID) -> None:
+        """製品を削除する"""
+        with self.session_factory.begin() as session:
+            model = session.get(ProductModel, product_id)
+            if model is not None:
+                session.delete(model)
@@ -1,12 +1,32 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 
+from config.container import create_container
 from config.environment import env
+from presentation.controllers.async_order_controller import AsyncOrderRouter
+from presentation.controllers.catalog_import_controller import CatalogImportRouter
+from presentation.controllers.customer_controller import CustomerRouter
+from presentation.controllers.metrics_controller import MetricsRouter
+from presentation.controllers.order_analytics_controller import OrderAnalyticsRouter
 from presentation.controllers.order_controller import OrderRouter
+from presentation.controllers.product_controller import ProductRouter
 from fastapi.middleware.cors import CORSMiddleware
+from presentation.middleware.request_metrics import RequestMetricsMiddleware
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """起動時に依存関係コンテナを構築してアウトボックスの配信を開始し、終了時に解放する"""
+    container = create_container().start()
+    app.state.container = container
+    report = container.report()
+    print(f"Container wired in {report['wiring_ms']}ms, warmed up in {report['warm_up_ms']}ms")
+    yield
+    await container.aclose()
 
 # アプリケーション作成
-app = FastAPI(title=env.APP_NAME)
+app = FastAPI(title=env.APP_NAME, lifespan=lifespan)
 
 # CORSミドルウェアの設定
 app.add_middleware(
@@ -17,9 +37,19 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# ルートごとの処理時間の計測（METRICS_ENABLED=false の場合は何もしない）
+app.add_middleware(RequestMetricsMiddleware)
 
 # APIルートを登録
 app.include_router(OrderRouter, prefix="/api")
+app.include_router(CustomerRouter, prefix="/api")
+app.include_router(ProductRouter, prefix="/api")
+app.include_router(OrderAnalyticsRouter, prefix="/api")
+app.include_router(CatalogImportRouter, prefix="/api")
+# イベントループ上で処理する非同期版（同期版はスレッドプールで処理される）
+app.include_router(AsyncOrderRouter, prefix="/api/async")
+# Prometheus形式のメトリクス
+app.include_router(MetricsRouter)
 
 @app.get("/", tags=["root"])
 async def root():
@@ -28,7 +58,8 @@ async def root():
         "version": env.API_VERSION,
         "environment": env.APP_ENV,
         "using_mock": env.USE_MOCK_DB,
-        "database_url": env.DATABASE_URL
+        "database_url": env.DATABASE_URL,
+        "container": app.state.container.report()
     }
 
 if __name__ == "__main__":
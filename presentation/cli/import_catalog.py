@@ -0,0 +1,90 @@
+"""顧客・製品をCSV/NDJSONファイルから一括で取り込む
+
+ファイルは1行ずつ読み進め、--chunk-size 行（既定 IMPORT_CHUNK_SIZE）ごとにリポジトリの save_many で保存するため、
+ファイル全体をメモリに読み込まない。取り込み先はアプリケーションと同じ環境変数（DATABASE_* / PERSISTENCE_DIR）で決まり、
+--db-url で上書きできる。メモリ内リポジトリで PERSISTENCE_DIR が未指定の場合は、取り込んだ内容はプロセスの終了とともに失われる。
+
+CSVは1行目をヘッダーとし、列名はエンティティのフィールド名（顧客: id, name, email, phone, address、
+製品: id, name, description, price, stock_quantity）とする。id を省略すると新しいIDを振る。
+
+    python -m presentation.cli.import_catalog products products.csv
+    python -m presentation.cli.import_catalog customers customers.ndjson --chunk-size 5000
+    gzip -dc products.ndjson.gz | python -m presentation.cli.import_catalog products - --format ndjson
+"""
+import argparse
+import json
+import sys
+from time import monotonic
+
+from application.interfaces.dto import CatalogImportResultDTO
+from application.usecases.catalog_import_interactor import CatalogImportInteractor
+from config.container import create_container
+from config.environment import env
+from presentation.presenters.catalog_import_presenter import CatalogImportPresenter, import_result_to_dict
+from presentation.serializers.catalog_record_reader import FORMATS, format_from_filename, read_records
+
+# 途中経過を表示する間隔（秒）
+PROGRESS_INTERVAL = 1.0
+
+
+class ConsoleCatalogImportPresenter(CatalogImportPresenter):
+    """途中経過を標準エラー出力に表示するプレゼンター"""
+    
+    def __init__(self):
+        super().__init__()
+        self._last_progress = monotonic()
+    
+    def present_import_progress(self, result: CatalogImportResultDTO) -> None:
+        """前回の表示から PROGRESS_INTERVAL 秒以上経っていれば途中経過を表示する"""
+        now = monotonic()
+        if now - self._last_progress < PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        print(
+            f"{result.kind}: {result.rows} rows, {result.imported} imported, {result.rejected} rejected, "
+            f"{result.rows_per_second:.0f} rows/s",
+            file=sys.stderr
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("kind", choices=["customers", "products"])
+    parser.add_argument("path", help="取り込むファイル（- で標準入力）")
+    parser.add_argument("--format", choices=FORMATS, help="省略時は拡張子（.csv / .ndjson / .jsonl）から判定する")
+    parser.add_argument("--chunk-size", type=int, default=int(env.IMPORT_CHUNK_SIZE))
+    parser.add_argument("--db-url", default=None, help="省略時は DATABASE_* から決まるURL")
+    args = parser.parse_args()
+
+    record_format = args.format or format_from_filename(args.path)
+    if record_format is None:
+        parser.error("cannot infer the format from the file name; pass --format")
+
+    container = create_container(args.db_url)
+    try:
+        if not container.db_url and container.resolve("persistence") is None:
+            print("warning: importing into in-memory repositories without PERSISTENCE_DIR", file=sys.stderr)
+        presenter = ConsoleCatalogImportPresenter()
+        interactor = CatalogImportInteractor(
+            container.resolve("customer_repository"),
+            container.resolve("product_repository"),
+            presenter,
+            presenter,
+            chunk_size=args.chunk_size
+        )
+        run = interactor.import_customers if args.kind == "customers" else interactor.import_products
+        stream = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+        with stream:
+            result = run(read_records(stream, record_format))
+    finally:
+        container.close()
+
+    print(json.dumps(import_result_to_dict(result), ensure_ascii=False, indent=2))
+    if not presenter.view_model.success:
+        print(presenter.view_model.error, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+from typing import Optional
+from uuid import UUID
+from typing import Annotated
+from application.interfaces.idempotency_store import (
+    IdempotencyKeyError,
+    IdempotencyStoreInterface,
+    IdempotentResponse,
+    request_fingerprint
+)
+from application.interfaces.order_use_case import (
+    AsyncOrderCommandInputBoundary,
+    AsyncOrderQueryInputBoundary,
+)
+from presentation.presenters.order_presenter import (
+    OrderCommandPresenter,
+    OrderQueryPresenter
+)
+from application.usecases.dependancies import (
+    get_idempotency_store,
+    get_order_command_presenter,
+    get_order_query_presenter,
+    get_order_response_cache,
+    async_order_command_usecase,
+    async_order_query_usecase
+)
+from presentation.controllers.order_controller import (
+    OrderListResponse,
+    OrderRequest,
+    OrderResultResponse,
+    OrderStatusUpdate,
+    _begin_idempotent,
+    _cached_order_response,
+    _create_order_dto_from_request,
+    _json_response,
+    _replayed_response
+)
+from infrastructure.cache.order_response_cache import OrderResponseCache
+from presentation.controllers.instrumented_route import InstrumentedRoute
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+# 同期版（order_controller）と同じエンドポイントをasync defで提供する。
+# スレッドプールを経由せずイベントループ上で処理し、I/O待ちの間は他のリクエストを処理できる。
+AsyncOrderRouter = APIRouter(prefix="/orders", tags=["orders (async)"], route_class=InstrumentedRoute)
+
+# コマンド（書き込み操作）
+@AsyncOrderRouter.post("/", response_model=OrderResultResponse)
+async def create_order(
+    request_data: OrderRequest,
+    order_use_case: Annotated[AsyncOrderCommandInputBoundary, Depends(async_order_command_usecase)],
+    presenter: Annotated[OrderCommandPresenter, Depends(get_order_command_presenter)],
+    idempotency: Annotated[IdempotencyStoreInterface, Depends(get_idempotency_store)],
+    idempotency_key: Annotated[Optional[str], Header()] = None
+) -> Response:
+    """注文を作成する（同じ Idempotency-Key の再送には保存済みのレスポンスを返す）"""
+    if idempotency_key is None:
+        return await _create_order(request_data, order_use_case, presenter)
+    
+    # 完了待ちやテーブルの読み書きでイベントループを止めないよう、ストアはスレッドプールで呼ぶ
+    fingerprint = request_fingerprint(request_data.model_dump())
+    try:
+        stored = await run_in_threadpool(_begin_idempotent, idempotency, idempotency_key, fingerprint)
+    except IdempotencyKeyError as e:
+        presenter.present_error(str(e))
+        return _json_response(presenter.view_model)
+    if stored is not None:
+        return _replayed_response(stored)
+    
+    completed = False
+    try:
+        response = await _create_order(request_data, order_use_case, presenter)
+        if presenter.view_model.success:
+            await run_in_threadpool(idempotency.complete, idempotency_key, IdempotentResponse(fingerprint, response.body))
+            completed = True
+        return response
+    finally:
+        if not completed:
+            await run_in_threadpool(idempotency.release, idempotency_key)
+
+async def _create_order(
+    request_data: OrderRequest,
+    order_use_case: AsyncOrderCommandInputBoundary,
+    presenter: OrderCommandPresenter
+) -> Response:
+    try:
+        # リクエストデータからDTOを作成
+        order_dto = _create_order_dto_from_request(request_data.model_dump())
+        
+        # ユースケースを実行
+        await order_use_case.create_order(order_dto)
+        
+        # レスポンスを返す
+        return _json_response(presenter.view_model)
+        
+    except ValueError as e:
+        # UUIDの形式が不正な場合など
+        presenter.present_error(f"Invalid input data: {str(e)}")
+        return _json_response(presenter.view_model)
+    except Exception as e:
+        # その他のエラー
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return _json_response(presenter.view_model)
+
+@AsyncOrderRouter.put("/{order_id}/status", response_model=OrderResultResponse)
+async def update_order_status(
+    order_id: str,
+    status_update: OrderStatusUpdate,
+    order_use_case: Annotated[AsyncOrderCommandInputBoundary, Depends(async_order_command_usecase)],
+    presenter: Annotated[OrderCommandPresenter, Depends(get_order_command_presenter)]
+) -> Response:
+    """注文ステータスを更新する"""
+    try:
+        # 注文IDをUUIDに変換
+        order_uuid = UUID(order_id)
+        
+        # ユースケースを実行
+        await order_use_case.update_order_status(order_uuid, status_update.status)
+        
+        # レスポンスを返す
+        return _json_response(presenter.view_model)
+        
+    except ValueError as e:
+        # UUIDの形式が不正な場合
+        presenter.present_error(f"Invalid order ID format: {str(e)}")
+        return _json_response(presenter.view_model)
+    except Exception as e:
+        # その他のエラー
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return _json_response(presenter.view_model)
+
+@AsyncOrderRouter.delete("/{order_id}", response_model=OrderResultResponse)
+async def cancel_order(
+    order_id: str,
+    order_use_case: Annotated[AsyncOrderCommandInputBoundary, Depends(async_order_command_usecase)],
+    presenter: Annotated[OrderCommandPresenter, Depends(get_order_command_presenter)]
+) -> Response:
+    """注文をキャンセルする"""
+    try:
+        # 注文IDをUUIDに変換
+        order_uuid = UUID(order_id)
+        
+        # ユースケースを実行
+        await order_use_case.cancel_order(order_uuid)
+        
+        # レスポンスを返す
+        return _json_response(presenter.view_model)
+        
+    except ValueError as e:
+        # UUIDの形式が不正な場合
+        presenter.present_error(f"Invalid order ID format: {str(e)}")
+        return _json_response(presenter.view_model)
+    except Exception as e:
+        # その他のエラー
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return _json_response(presenter.view_model)
+
+# クエリ（読み取り操作）
+@AsyncOrderRouter.get("/{order_id}", response_model=OrderResultResponse)
+async def get_order(
+    order_id: str,
+    order_use_case: Annotated[AsyncOrderQueryInputBoundary, Depends(async_order_query_usecase)],
+    presenter: Annotated[OrderQueryPresenter, Depends(get_order_query_presenter)],
+    cache: Annotated[OrderResponseCache, Depends(get_order_response_cache)],
+    if_none_match: Annotated[Optional[str], Header()] = None
+) -> Response:
+    """注文を取得する（ETagが一致する場合は304を返す）"""
+    try:
+        # 注文IDをUUIDに変換
+        order_uuid = UUID(order_id)
+        
+        # キャッシュになければユースケースを実行し、シリアライズした結果を格納する
+        cached = cache.get(order_uuid)
+        if cached is None:
+            summary = await order_use_case.get_order(order_uuid)
+            if summary is None:
+                return _json_response(presenter.view_model)
+            cached = cache.put(order_uuid, summary.version, presenter.view_model.to_json())
+        
+        # レスポンスを返す
+        return _cached_order_response(cached, if_none_match)
+        
+    except ValueError as e:
+        # UUIDの形式が不正な場合
+        presenter.present_error(f"Invalid order ID format: {str(e)}")
+        return _json_response(presenter.view_model)
+    except Exception as e:
+        # その他のエラー
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return _json_response(presenter.view_model)
+
+@AsyncOrderRouter.get("/customer/{customer_id}", response_model=OrderListResponse)
+async def get_customer_orders(
+    customer_id: str,
+    order_use_case: Annotated[AsyncOrderQueryInputBoundary, Depends(async_order_query_usecase)],
+    presenter: Annotated[OrderQueryPresenter, Depends(get_order_query_presenter)]
+) -> Response:
+    """顧客の注文を取得する"""
+    try:
+        # 顧客IDをUUIDに変換
+        customer_uuid = UUID(customer_id)
+        
+        # ユースケースを実行
+        await order_use_case.get_customer_orders(customer_uuid)
+        
+        # レスポンスを返す
+        return _json_response(presenter.view_model)
+        
+    except ValueError as e:
+        # UUIDの形式が不正な場合
+        presenter.present_error(f"Invalid customer ID format: {str(e)}")
+        return _json_response(presenter.view_model)
+    except Exception as e:
+        # その他のエラー
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return _json_response(presenter.view_model)
@@ -0,0 +1,96 @@
+from typing import Annotated, Any, Callable, Dict, Iterator, List, Optional
+
+import anyio.from_thread
+from fastapi import APIRouter, Depends, Query, Request
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from application.interfaces.catalog_import_use_case import CatalogImportInputBoundary, ImportRecord
+from application.usecases.dependancies import catalog_import_usecase, get_catalog_import_presenter
+from presentation.controllers.instrumented_route import InstrumentedRoute
+from presentation.presenters.catalog_import_presenter import CatalogImportPresenter
+from presentation.serializers.catalog_record_reader import (
+    FORMATS,
+    format_from_content_type,
+    read_records,
+    split_lines
+)
+
+CatalogImportRouter = APIRouter(prefix="/catalog", tags=["catalog"], route_class=InstrumentedRoute)
+
+# Pydanticモデル
+class ImportRejectionResponse(BaseModel):
+    line: int
+    error: str
+
+class CatalogImportResponse(BaseModel):
+    kind: str
+    rows: int
+    imported: int
+    rejected: int
+    seconds: float
+    rows_per_second: float
+    rejections: List[ImportRejectionResponse]
+
+class CatalogImportResultResponse(BaseModel):
+    success: bool
+    data: Optional[CatalogImportResponse] = None
+    error: Optional[str] = None
+
+# コマンド（書き込み操作）
+# 本文（CSVまたはNDJSON）は受信しながら読み進め、全体をメモリに読み込まない
+@CatalogImportRouter.post("/customers/import", response_model=CatalogImportResultResponse)
+async def import_customers(
+    request: Request,
+    catalog_use_case: Annotated[CatalogImportInputBoundary, Depends(catalog_import_usecase)],
+    presenter: Annotated[CatalogImportPresenter, Depends(get_catalog_import_presenter)],
+    format: Optional[str] = Query(None, description="csv または ndjson（省略時は Content-Type から判定）")
+) -> Dict[str, Any]:
+    """顧客をCSV/NDJSONから一括で取り込む"""
+    return await _import(request, catalog_use_case.import_customers, presenter, format)
+
+@CatalogImportRouter.post("/products/import", response_model=CatalogImportResultResponse)
+async def import_products(
+    request: Request,
+    catalog_use_case: Annotated[CatalogImportInputBoundary, Depends(catalog_import_usecase)],
+    presenter: Annotated[CatalogImportPresenter, Depends(get_catalog_import_presenter)],
+    format: Optional[str] = Query(None, description="csv または ndjson（省略時は Content-Type から判定）")
+) -> Dict[str, Any]:
+    """製品をCSV/NDJSONから一括で取り込む"""
+    return await _import(request, catalog_use_case.import_products, presenter, format)
+
+async def _import(
+    request: Request,
+    run: Callable[[Iterator[ImportRecord]], Any],
+    presenter: CatalogImportPresenter,
+    record_format: Optional[str]
+) -> Dict[str, Any]:
+    try:
+        record_format = record_format or format_from_content_type(request.headers.get("content-type", ""))
+        if record_format not in FORMATS:
+            presenter.present_error(f"Unsupported import format: {record_format}. Use one of {', '.join(FORMATS)}")
+            return presenter.view_model.to_dict()
+
+        # リポジトリの呼び出しは同期のためスレッドプールで取り込み、本文はそのスレッドからイベントループ経由で受け取る
+        await run_in_threadpool(lambda: run(read_records(split_lines(_receive_body(request)), record_format)))
+        return presenter.view_model.to_dict()
+
+    except Exception as e:
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return presenter.view_model.to_dict()
+
+async def _next_chunk(stream) -> Optional[bytes]:
+    try:
+        return await stream.__anext__()
+    except StopAsyncIteration:
+        return None
+
+def _receive_body(request: Request) -> Iterator[bytes]:
+    """リクエスト本文を受信したチャンクごとに返す（スレッドプールのスレッドから呼ぶ）"""
+    stream = request.stream()
+    while True:
+        chunk = anyio.from_thread.run(_next_chunk, stream)
+        if chunk is None:
+            return
+        if chunk:
+            yield chunk
@@ -0,0 +1,92 @@
+from typing import Annotated, Any, Dict, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+from api.routes import CustomerResponse
+from application.interfaces.customer_use_case import (
+    CustomerCommandInputBoundary,
+    CustomerQueryInputBoundary
+)
+from application.interfaces.dto import CustomerDTO
+from application.usecases.dependancies import (
+    customer_command_usecase,
+    customer_query_usecase,
+    get_customer_command_presenter,
+    get_customer_query_presenter
+)
+from presentation.controllers.instrumented_route import InstrumentedRoute
+from presentation.presenters.customer_presenter import (
+    CustomerCommandPresenter,
+    CustomerQueryPresenter
+)
+
+CustomerRouter = APIRouter(prefix="/customers", tags=["customers"], route_class=InstrumentedRoute)
+
+# Pydanticモデル
+class CustomerRequest(BaseModel):
+    name: str
+    email: str
+    phone: Optional[str] = None
+    address: Optional[str] = None
+
+class CustomerResultResponse(BaseModel):
+    success: bool
+    data: Optional[CustomerResponse] = None
+    error: Optional[str] = None
+
+# コマンド（書き込み操作）
+@CustomerRouter.post("/", response_model=CustomerResultResponse)
+def register_customer(
+    request_data: CustomerRequest,
+    customer_use_case: Annotated[CustomerCommandInputBoundary, Depends(customer_command_usecase)],
+    presenter: Annotated[CustomerCommandPresenter, Depends(get_customer_command_presenter)]
+) -> Dict[str, Any]:
+    """顧客を登録する"""
+    try:
+        customer_use_case.register_customer(CustomerDTO(**request_data.model_dump()))
+        return presenter.view_model.to_dict()
+        
+    except Exception as e:
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return presenter.view_model.to_dict()
+
+# クエリ（読み取り操作）
+# /{customer_id} より先に登録してパスの衝突を避ける
+@CustomerRouter.get("/by-email", response_model=CustomerResultResponse)
+def find_customer_by_email(
+    email: str,
+    customer_use_case: Annotated[CustomerQueryInputBoundary, Depends(customer_query_usecase)],
+    presenter: Annotated[CustomerQueryPresenter, Depends(get_customer_query_presenter)]
+) -> Dict[str, Any]:
+    """メールアドレスで顧客を取得する"""
+    try:
+        customer_use_case.find_customer_by_email(email)
+        return presenter.view_model.to_dict()
+        
+    except Exception as e:
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return presenter.view_model.to_dict()
+
+@CustomerRouter.get("/{customer_id}", response_model=CustomerResultResponse)
+def get_customer(
+    customer_id: str,
+    customer_use_case: Annotated[CustomerQueryInputBoundary, Depends(customer_query_usecase)],
+    presenter: Annotated[CustomerQueryPresenter, Depends(get_customer_query_presenter)]
+) -> Dict[str, Any]:
+    """顧客を取得する"""
+    try:
+        # 顧客IDをUUIDに変換
+        customer_uuid = UUID(customer_id)
+        
+        customer_use_case.get_customer(customer_uuid)
+        return presenter.view_model.to_dict()
+        
+    except ValueError as e:
+        # UUIDの形式が不正な場合
+        presenter.present_error(f"Invalid customer ID format: {str(e)}")
+        return presenter.view_model.to_dict()
+    except Exception as e:
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return presenter.view_model.to_dict()
@@ -0,0 +1,48 @@
+import functools
+import inspect
+from time import perf_counter
+from typing import Callable
+
+from fastapi.routing import APIRoute
+
+from infrastructure.metrics.instrumentation import layer_metrics, request_started, timed_call
+from infrastructure.metrics.registry import metrics
+
+
+def _instrument_endpoint(endpoint: Callable) -> Callable:
+    """エンドポイントの処理時間（controller）と、呼び出されるまでの時間（dependencies）を記録する関数に包む
+
+    dependencies はリクエストの受信からエンドポイントが呼ばれるまで（ボディの検証と Depends の解決）の時間。
+    include_router はルートを包み済みのエンドポイントで作り直すため、包み済みの場合はそのまま返す。
+    """
+    if getattr(endpoint, "_instrumented", False):
+        return endpoint
+    component = endpoint.__module__.rsplit(".", 1)[-1]
+    name = endpoint.__name__
+    timed_endpoint = timed_call(endpoint, "controller", component, name)
+    durations, _ = layer_metrics(metrics)
+    dependencies = durations.labels("dependencies", component, name)
+
+    def observe_dependencies() -> None:
+        started = request_started.get()
+        if started is not None and metrics.enabled:
+            dependencies.observe(perf_counter() - started)
+
+    if inspect.iscoroutinefunction(endpoint):
+        async def instrumented(*args, **kwargs):
+            observe_dependencies()
+            return await timed_endpoint(*args, **kwargs)
+    else:
+        def instrumented(*args, **kwargs):
+            observe_dependencies()
+            return timed_endpoint(*args, **kwargs)
+    instrumented = functools.wraps(endpoint)(instrumented)
+    instrumented._instrumented = True
+    return instrumented
+
+
+class InstrumentedRoute(APIRoute):
+    """エンドポイントの処理時間をレイヤーごとのメトリクスに記録するルート（APIRouter の route_class に指定する）"""
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _instrument_endpoint(endpoint), **kwargs)
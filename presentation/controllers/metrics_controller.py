@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from infrastructure.metrics.registry import metrics
+
+MetricsRouter = APIRouter(tags=["metrics"])
+
+# Prometheusのテキスト形式のContent-Type
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@MetricsRouter.get("/metrics")
+async def get_metrics() -> Response:
+    """レイヤーごとの処理時間とリクエストの件数をPrometheusのテキスト形式で返す"""
+    return Response(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
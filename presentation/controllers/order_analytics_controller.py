@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Annotated, Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+
+from application.interfaces.order_use_case import OrderAnalyticsInputBoundary
+from application.usecases.dependancies import get_order_analytics_presenter, order_analytics_usecase
+from presentation.controllers.instrumented_route import InstrumentedRoute
+from presentation.presenters.order_presenter import OrderAnalyticsPresenter
+
+OrderAnalyticsRouter = APIRouter(prefix="/analytics", tags=["analytics"], route_class=InstrumentedRoute)
+
+# Pydanticモデル
+class RevenueRowResponse(BaseModel):
+    key: str
+    revenue: float
+    quantity: int
+    lines: int
+
+class RevenueReportResponse(BaseModel):
+    by: str
+    rows: List[RevenueRowResponse]
+
+class RevenueResponse(BaseModel):
+    success: bool
+    data: Optional[RevenueReportResponse] = None
+    error: Optional[str] = None
+
+@OrderAnalyticsRouter.get("/revenue", response_model=RevenueResponse)
+def get_revenue(
+    analytics_use_case: Annotated[OrderAnalyticsInputBoundary, Depends(order_analytics_usecase)],
+    presenter: Annotated[OrderAnalyticsPresenter, Depends(get_order_analytics_presenter)],
+    by: str = "product",
+    status: Annotated[Optional[List[str]], Query()] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: Annotated[Optional[int], Query(ge=1)] = None
+) -> Dict[str, Any]:
+    """商品・顧客・日ごとの売上を集計する（ステータス省略時はキャンセル以外の注文が対象）"""
+    try:
+        # ユースケースを実行
+        analytics_use_case.get_revenue(by, status, since, until, limit)
+        
+        # レスポンスを返す
+        return presenter.view_model.to_dict()
+        
+    except Exception as e:
+        # その他のエラー
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return presenter.view_model.to_dict()
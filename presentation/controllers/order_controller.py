@@ -1,9 +1,18 @@
+from datetime import datetime
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 from typing import Annotated
-from application.interfaces.dto import OrderDTO, OrderItemDTO
+from application.interfaces.dto import OrderCreationResultDTO, OrderDTO, OrderItemDTO
+from application.interfaces.idempotency_store import (
+    MAX_KEY_LENGTH,
+    IdempotencyKeyError,
+    IdempotencyStoreInterface,
+    IdempotentResponse,
+    request_fingerprint
+)
 from application.interfaces.order_use_case import (
     OrderCommandInputBoundary,
+    OrderHistoryInputBoundary,
     OrderQueryInputBoundary,
 )
 from presentation.presenters.order_presenter import (
@@ -11,13 +20,27 @@ from presentation.presenters.order_presenter import (
     OrderQueryPresenter
 )
 from application.usecases.dependancies import (
+    get_idempotency_store,
+    get_order_command_presenter,
+    get_order_query_presenter,
+    get_order_response_cache,
     order_command_usecase,
+    order_history_usecase,
     order_query_usecase
 )
-from fastapi import APIRouter, Depends
+from infrastructure.cache.order_response_cache import CachedOrderResponse, OrderResponseCache
+from infrastructure.metrics.instrumentation import timed
+from presentation.controllers.instrumented_route import InstrumentedRoute
+from presentation.viewmodels.order_view_model import OrderViewModel
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
-OrderRouter = APIRouter(prefix="/orders", tags=["orders"])
+OrderRouter = APIRouter(prefix="/orders", tags=["orders"], route_class=InstrumentedRoute)
+
+# 顧客の注文一覧のページサイズ
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
 
 # Pydanticモデル
 class OrderItemRequest(BaseModel):
@@ -29,9 +52,16 @@ class OrderRequest(BaseModel):
     customer_id: str
     items: List[OrderItemRequest]
 
+class OrderBatchRequest(BaseModel):
+    orders: List[OrderRequest]
+
 class OrderStatusUpdate(BaseModel):
     status: str
 
+class OrderBulkStatusUpdate(BaseModel):
+    order_ids: List[str]
+    status: str
+
 class OrderItemResponse(BaseModel):
     product_id: str
     quantity: int
@@ -47,40 +77,168 @@ class OrderResponse(BaseModel):
     created_at: Optional[str] = None
     error: Optional[str] = None
 
+class OrderResultResponse(BaseModel):
+    success: bool
+    data: Optional[OrderResponse] = None
+    error: Optional[str] = None
+
+class OrderListResponse(BaseModel):
+    success: bool
+    data: Optional[List[OrderResponse]] = None
+    next_cursor: Optional[str] = None
+    error: Optional[str] = None
+
+class OrderBatchResultResponse(BaseModel):
+    index: int
+    success: bool
+    data: Optional[OrderResponse] = None
+    error: Optional[str] = None
+
+class OrderBatchResponse(BaseModel):
+    success: bool
+    data: Optional[List[OrderBatchResultResponse]] = None
+    error: Optional[str] = None
+
+class OrderStatusUpdateResultResponse(BaseModel):
+    order_id: str
+    success: bool
+    status: Optional[str] = None
+    error: Optional[str] = None
+
+class OrderBulkStatusResponse(BaseModel):
+    success: bool
+    data: Optional[List[OrderStatusUpdateResultResponse]] = None
+    error: Optional[str] = None
+
 # コマンド（書き込み操作）
-@OrderRouter.post("/", response_model=OrderResponse)
+@OrderRouter.post("/", response_model=OrderResultResponse)
 def create_order(
     request_data: OrderRequest,
     order_use_case: Annotated[OrderCommandInputBoundary, Depends(order_command_usecase)],
-    presenter: OrderCommandPresenter = Depends()
-) -> Dict[str, Any]:
-    """注文を作成する"""
+    presenter: Annotated[OrderCommandPresenter, Depends(get_order_command_presenter)],
+    idempotency: Annotated[IdempotencyStoreInterface, Depends(get_idempotency_store)],
+    idempotency_key: Annotated[Optional[str], Header()] = None
+) -> Response:
+    """注文を作成する（同じ Idempotency-Key の再送には保存済みのレスポンスを返す）"""
+    if idempotency_key is None:
+        return _create_order(request_data, order_use_case, presenter)
+    
+    # 保存済みの結果があればリポジトリに触れずに返し、同じキーの処理中のリクエストがあれば完了を待つ
+    fingerprint = request_fingerprint(request_data.model_dump())
+    try:
+        stored = _begin_idempotent(idempotency, idempotency_key, fingerprint)
+    except IdempotencyKeyError as e:
+        presenter.present_error(str(e))
+        return _json_response(presenter.view_model)
+    if stored is not None:
+        return _replayed_response(stored)
+    
+    # 成功した結果だけを保存する（失敗した場合は処理権を手放し、再送で改めて実行する）
+    completed = False
+    try:
+        response = _create_order(request_data, order_use_case, presenter)
+        if presenter.view_model.success:
+            idempotency.complete(idempotency_key, IdempotentResponse(fingerprint, response.body))
+            completed = True
+        return response
+    finally:
+        if not completed:
+            idempotency.release(idempotency_key)
+
+def _create_order(
+    request_data: OrderRequest,
+    order_use_case: OrderCommandInputBoundary,
+    presenter: OrderCommandPresenter
+) -> Response:
     try:
         # リクエストデータからDTOを作成
-        order_dto = _create_order_dto_from_request(request_data.dict())
+        order_dto = _create_order_dto_from_request(request_data.model_dump())
         
         # ユースケースを実行
         order_use_case.create_order(order_dto)
         
         # レスポンスを返す
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
         
     except ValueError as e:
         # UUIDの形式が不正な場合など
         presenter.present_error(f"Invalid input data: {str(e)}")
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
     except Exception as e:
         # その他のエラー
         presenter.present_error(f"Error in controller: {str(e)}")
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
 
-@OrderRouter.put("/{order_id}/status", response_model=OrderResponse)
+@OrderRouter.post("/batch", response_model=OrderBatchResponse)
+def create_orders(
+    request_data: OrderBatchRequest,
+    order_use_case: Annotated[OrderCommandInputBoundary, Depends(order_command_usecase)],
+    presenter: Annotated[OrderCommandPresenter, Depends(get_order_command_presenter)]
+) -> Response:
+    """複数の注文を一括で作成する"""
+    try:
+        # リクエストデータからDTOを作成（不正な注文はその注文だけエラーにする）
+        order_dtos: List[OrderDTO] = []
+        positions: List[int] = []
+        invalid: Dict[int, str] = {}
+        for index, order_request in enumerate(request_data.orders):
+            try:
+                order_dtos.append(_create_order_dto_from_request(order_request.model_dump()))
+                positions.append(index)
+            except ValueError as e:
+                invalid[index] = f"Invalid input data: {str(e)}"
+        
+        # ユースケースを実行
+        results = order_use_case.create_orders(order_dtos)
+        if not invalid or presenter.view_model.error:
+            return _json_response(presenter.view_model)
+        
+        # 入力エラーがあった場合のみ、結果をリクエスト内の位置に戻して入力エラーと合わせて表示し直す
+        for result in results:
+            result.index = positions[result.index]
+        results.extend(OrderCreationResultDTO(index=index, error=error) for index, error in invalid.items())
+        results.sort(key=lambda result: result.index)
+        presenter.present_created_orders(results)
+        return _json_response(presenter.view_model)
+        
+    except Exception as e:
+        # その他のエラー
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return _json_response(presenter.view_model)
+
+@OrderRouter.put("/status:bulk", response_model=OrderBulkStatusResponse)
+def update_orders_status(
+    status_update: OrderBulkStatusUpdate,
+    order_use_case: Annotated[OrderCommandInputBoundary, Depends(order_command_usecase)],
+    presenter: Annotated[OrderCommandPresenter, Depends(get_order_command_presenter)]
+) -> Response:
+    """複数の注文のステータスを一括で更新する（遷移表で許可されない注文はその注文だけエラーにする）"""
+    try:
+        # 注文IDをUUIDに変換
+        order_uuids = [UUID(order_id) for order_id in status_update.order_ids]
+        
+        # ユースケースを実行
+        order_use_case.update_orders_status(order_uuids, status_update.status)
+        
+        # レスポンスを返す
+        return _json_response(presenter.view_model)
+        
+    except ValueError as e:
+        # UUIDの形式が不正な場合
+        presenter.present_error(f"Invalid order ID format: {str(e)}")
+        return _json_response(presenter.view_model)
+    except Exception as e:
+        # その他のエラー
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return _json_response(presenter.view_model)
+
+@OrderRouter.put("/{order_id}/status", response_model=OrderResultResponse)
 def update_order_status(
     order_id: str,
     status_update: OrderStatusUpdate,
     order_use_case: Annotated[OrderCommandInputBoundary, Depends(order_command_usecase)],
-    presenter: OrderCommandPresenter = Depends()
-) -> Dict[str, Any]:
+    presenter: Annotated[OrderCommandPresenter, Depends(get_order_command_presenter)]
+) -> Response:
     """注文ステータスを更新する"""
     try:
         # 注文IDをUUIDに変換
@@ -90,23 +248,23 @@ def update_order_status(
         order_use_case.update_order_status(order_uuid, status_update.status)
         
         # レスポンスを返す
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
         
     except ValueError as e:
         # UUIDの形式が不正な場合
         presenter.present_error(f"Invalid order ID format: {str(e)}")
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
     except Exception as e:
         # その他のエラー
         presenter.present_error(f"Error in controller: {str(e)}")
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
 
-@OrderRouter.delete("/{order_id}", response_model=OrderResponse)
+@OrderRouter.delete("/{order_id}", response_model=OrderResultResponse)
 def cancel_order(
     order_id: str,
     order_use_case: Annotated[OrderCommandInputBoundary, Depends(order_command_usecase)],
-    presenter: OrderCommandPresenter = Depends()
-) -> Dict[str, Any]:
+    presenter: Annotated[OrderCommandPresenter, Depends(get_order_command_presenter)]
+) -> Response:
     """注文をキャンセルする"""
     try:
         # 注文IDをUUIDに変換
@@ -116,70 +274,190 @@ def cancel_order(
         order_use_case.cancel_order(order_uuid)
         
         # レスポンスを返す
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
         
     except ValueError as e:
         # UUIDの形式が不正な場合
         presenter.present_error(f"Invalid order ID format: {str(e)}")
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
     except Exception as e:
         # その他のエラー
         presenter.present_error(f"Error in controller: {str(e)}")
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
 
 # クエリ（読み取り操作）
-@OrderRouter.get("/{order_id}", response_model=OrderResponse)
+@OrderRouter.get("/{order_id}", response_model=OrderResultResponse)
 def get_order(
     order_id: str,
     order_use_case: Annotated[OrderQueryInputBoundary, Depends(order_query_usecase)],
-    presenter: OrderQueryPresenter = Depends()
-) -> Dict[str, Any]:
-    """注文を取得する"""
+    presenter: Annotated[OrderQueryPresenter, Depends(get_order_query_presenter)],
+    cache: Annotated[OrderResponseCache, Depends(get_order_response_cache)],
+    if_none_match: Annotated[Optional[str], Header()] = None
+) -> Response:
+    """注文を取得する（ETagが一致する場合は304を返す）"""
     try:
         # 注文IDをUUIDに変換
         order_uuid = UUID(order_id)
         
-        # ユースケースを実行
-        order_use_case.get_order(order_uuid)
+        # キャッシュになければユースケースを実行し、シリアライズした結果を格納する
+        cached = cache.get(order_uuid)
+        if cached is None:
+            summary = order_use_case.get_order(order_uuid)
+            if summary is None:
+                return _json_response(presenter.view_model)
+            cached = cache.put(order_uuid, summary.version, presenter.view_model.to_json())
         
         # レスポンスを返す
-        return presenter.view_model.to_dict()
+        return _cached_order_response(cached, if_none_match)
         
     except ValueError as e:
         # UUIDの形式が不正な場合
         presenter.present_error(f"Invalid order ID format: {str(e)}")
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
     except Exception as e:
         # その他のエラー
         presenter.present_error(f"Error in controller: {str(e)}")
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
 
-@OrderRouter.get("/customer/{customer_id}", response_model=OrderResponse)
+@OrderRouter.get("/customer/{customer_id}", response_model=OrderListResponse)
 def get_customer_orders(
     customer_id: str,
     order_use_case: Annotated[OrderQueryInputBoundary, Depends(order_query_usecase)],
-    presenter: OrderQueryPresenter = Depends()
-) -> Dict[str, Any]:
-    """顧客の注文を取得する"""
+    presenter: Annotated[OrderQueryPresenter, Depends(get_order_query_presenter)],
+    limit: Annotated[Optional[int], Query(ge=1, le=MAX_PAGE_SIZE)] = None,
+    cursor: Optional[str] = None
+) -> Response:
+    """顧客の注文を取得する（limitまたはcursorを指定した場合はページ単位で取得する）"""
     try:
         # 顧客IDをUUIDに変換
         customer_uuid = UUID(customer_id)
         
         # ユースケースを実行
-        order_use_case.get_customer_orders(customer_uuid)
+        if limit is not None or cursor is not None:
+            order_use_case.get_customer_orders_page(customer_uuid, limit or DEFAULT_PAGE_SIZE, cursor)
+        else:
+            order_use_case.get_customer_orders(customer_uuid)
         
         # レスポンスを返す
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
         
     except ValueError as e:
         # UUIDの形式が不正な場合
         presenter.present_error(f"Invalid customer ID format: {str(e)}")
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
     except Exception as e:
         # その他のエラー
         presenter.present_error(f"Error in controller: {str(e)}")
-        return presenter.view_model.to_dict()
+        return _json_response(presenter.view_model)
+
+@OrderRouter.get("/{order_id}/as-of", response_model=OrderResultResponse)
+def get_order_as_of(
+    order_id: str,
+    at: datetime,
+    history_use_case: Annotated[OrderHistoryInputBoundary, Depends(order_history_usecase)],
+    presenter: Annotated[OrderQueryPresenter, Depends(get_order_query_presenter)]
+) -> Response:
+    """at の時点の注文を取得する（ORDER_STORE=event_sourced の場合のみ）"""
+    try:
+        # 注文IDをUUIDに変換
+        order_uuid = UUID(order_id)
+        
+        # ユースケースを実行
+        history_use_case.get_order_as_of(order_uuid, at)
+        
+        # レスポンスを返す
+        return _json_response(presenter.view_model)
+        
+    except ValueError as e:
+        # UUIDの形式が不正な場合
+        presenter.present_error(f"Invalid order ID format: {str(e)}")
+        return _json_response(presenter.view_model)
+    except Exception as e:
+        # その他のエラー
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return _json_response(presenter.view_model)
+
+@OrderRouter.get("/customer/{customer_id}/as-of", response_model=OrderListResponse)
+def get_customer_orders_as_of(
+    customer_id: str,
+    at: datetime,
+    history_use_case: Annotated[OrderHistoryInputBoundary, Depends(order_history_usecase)],
+    presenter: Annotated[OrderQueryPresenter, Depends(get_order_query_presenter)]
+) -> Response:
+    """at の時点の顧客の注文を取得する（ORDER_STORE=event_sourced の場合のみ）"""
+    try:
+        # 顧客IDをUUIDに変換
+        customer_uuid = UUID(customer_id)
+        
+        # ユースケースを実行
+        history_use_case.get_customer_orders_as_of(customer_uuid, at)
+        
+        # レスポンスを返す
+        return _json_response(presenter.view_model)
+        
+    except ValueError as e:
+        # UUIDの形式が不正な場合
+        presenter.present_error(f"Invalid customer ID format: {str(e)}")
+        return _json_response(presenter.view_model)
+    except Exception as e:
+        # その他のエラー
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return _json_response(presenter.view_model)
+
+@OrderRouter.get("/customer/{customer_id}/stream")
+def stream_customer_orders(
+    customer_id: str,
+    order_use_case: Annotated[OrderQueryInputBoundary, Depends(order_query_usecase)],
+    presenter: Annotated[OrderQueryPresenter, Depends(get_order_query_presenter)]
+) -> Response:
+    """顧客の注文をNDJSONで逐次返す"""
+    try:
+        # 顧客IDをUUIDに変換
+        customer_uuid = UUID(customer_id)
+        
+        # ユースケースを実行（注文はレスポンス送信中に1件ずつ取り出される）
+        order_use_case.stream_customer_orders(customer_uuid)
+        if presenter.view_model.stream is not None:
+            return StreamingResponse(presenter.view_model.stream, media_type="application/x-ndjson")
+        return _json_response(presenter.view_model)
+        
+    except ValueError as e:
+        # UUIDの形式が不正な場合
+        presenter.present_error(f"Invalid customer ID format: {str(e)}")
+        return _json_response(presenter.view_model)
+    except Exception as e:
+        # その他のエラー
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return _json_response(presenter.view_model)
+
+def _json_response(view_model: OrderViewModel) -> Response:
+    """ビューモデルのJSONのバイト列をそのまま返す（response_modelによる再検証と再変換を行わない）"""
+    return Response(content=view_model.to_json(), media_type="application/json")
+
+def _begin_idempotent(store: IdempotencyStoreInterface, key: str, fingerprint: str,
+                      timeout: Optional[float] = None) -> Optional[IdempotentResponse]:
+    """Idempotency-Key の処理を開始する（保存済みの結果があれば返す）"""
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise IdempotencyKeyError(f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters")
+    return store.begin(key, fingerprint, timeout)
+
+def _replayed_response(stored: IdempotentResponse) -> Response:
+    """保存済みのレスポンスを返す（再送であることをヘッダーで示す）"""
+    return Response(content=stored.body, media_type="application/json", headers={"Idempotent-Replayed": "true"})
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """If-None-MatchヘッダーがETagに一致するかを判定する（弱い比較）"""
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+def _cached_order_response(cached: CachedOrderResponse, if_none_match: Optional[str]) -> Response:
+    """キャッシュ済みの注文レスポンスを返す（クライアントが同じ版を持っている場合は304）"""
+    headers = {"ETag": cached.etag}
+    if if_none_match and _etag_matches(cached.etag, if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
 
+@timed("controller")
 def _create_order_dto_from_request(request_data: Dict[str, Any]) -> OrderDTO:
     """リクエストデータからOrderDTOを作成する"""
     try:
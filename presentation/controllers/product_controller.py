@@ -0,0 +1,128 @@
+from typing import Annotated, Callable, Hashable, List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from api.routes import ProductResponse
+from application.interfaces.product_use_case import ProductQueryInputBoundary
+from application.usecases.dependancies import (
+    get_product_page_cache,
+    get_product_query_presenter,
+    product_query_usecase
+)
+from infrastructure.cache.product_page_cache import CachedProductPage, ProductPageCache
+from presentation.controllers.instrumented_route import InstrumentedRoute
+from presentation.controllers.order_controller import _etag_matches, _json_response
+from presentation.presenters.product_presenter import ProductQueryPresenter
+
+ProductRouter = APIRouter(prefix="/products", tags=["products"], route_class=InstrumentedRoute)
+
+# 製品一覧のページサイズ
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Pydanticモデル
+class ProductResultResponse(BaseModel):
+    success: bool
+    data: Optional[ProductResponse] = None
+    error: Optional[str] = None
+
+class ProductPageResponse(BaseModel):
+    products: List[ProductResponse]
+    next_cursor: Optional[str] = None
+
+class ProductPageResultResponse(BaseModel):
+    success: bool
+    data: Optional[ProductPageResponse] = None
+    error: Optional[str] = None
+
+# クエリ（読み取り操作）
+# レスポンスはカタログの版ごとにシリアライズ済みのものを使い回し、版が変わるまでユースケースを実行しない
+@ProductRouter.get("/", response_model=ProductPageResultResponse)
+def list_products(
+    product_use_case: Annotated[ProductQueryInputBoundary, Depends(product_query_usecase)],
+    presenter: Annotated[ProductQueryPresenter, Depends(get_product_query_presenter)],
+    cache: Annotated[ProductPageCache, Depends(get_product_page_cache)],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None
+) -> Response:
+    """製品を名前順にページ単位で取得する（レスポンスの next_cursor を次のリクエストに渡す）"""
+    return _cached_query(
+        ("list", limit, cursor),
+        lambda: product_use_case.list_products(limit, cursor),
+        product_use_case, presenter, cache, if_none_match
+    )
+
+# /{product_id} より先に登録してパスの衝突を避ける
+@ProductRouter.get("/search", response_model=ProductPageResultResponse)
+def search_products(
+    q: str,
+    product_use_case: Annotated[ProductQueryInputBoundary, Depends(product_query_usecase)],
+    presenter: Annotated[ProductQueryPresenter, Depends(get_product_query_presenter)],
+    cache: Annotated[ProductPageCache, Depends(get_product_page_cache)],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None
+) -> Response:
+    """名前に q を含む製品を名前順にページ単位で取得する"""
+    return _cached_query(
+        ("search", q.strip().lower(), limit, cursor),
+        lambda: product_use_case.search_products(q, limit, cursor),
+        product_use_case, presenter, cache, if_none_match
+    )
+
+@ProductRouter.get("/{product_id}", response_model=ProductResultResponse)
+def get_product(
+    product_id: str,
+    product_use_case: Annotated[ProductQueryInputBoundary, Depends(product_query_usecase)],
+    presenter: Annotated[ProductQueryPresenter, Depends(get_product_query_presenter)],
+    cache: Annotated[ProductPageCache, Depends(get_product_page_cache)],
+    if_none_match: Annotated[Optional[str], Header()] = None
+) -> Response:
+    """製品を取得する"""
+    try:
+        # 製品IDをUUIDに変換
+        product_uuid = UUID(product_id)
+    except ValueError as e:
+        # UUIDの形式が不正な場合
+        presenter.present_error(f"Invalid product ID format: {str(e)}")
+        return _json_response(presenter.view_model)
+    return _cached_query(
+        ("get", product_uuid),
+        lambda: product_use_case.get_product(product_uuid),
+        product_use_case, presenter, cache, if_none_match
+    )
+
+def _cached_query(
+    key: Hashable,
+    run: Callable[[], object],
+    product_use_case: ProductQueryInputBoundary,
+    presenter: ProductQueryPresenter,
+    cache: ProductPageCache,
+    if_none_match: Optional[str]
+) -> Response:
+    """カタログの最新の版のキャッシュ済みレスポンスを返す（なければユースケースを実行して格納する）"""
+    try:
+        # 実行前に読んだ版で格納する（スナップショットがそれより新しくても、古い内容を新しい版として格納することはない）
+        version = product_use_case.catalog_version()
+        cached = cache.get(version, key)
+        if cached is None:
+            run()
+            if not presenter.view_model.success:
+                return _json_response(presenter.view_model)
+            cached = cache.put(version, key, presenter.view_model.to_json())
+        return _cached_product_response(cached, if_none_match)
+
+    except Exception as e:
+        presenter.present_error(f"Error in controller: {str(e)}")
+        return _json_response(presenter.view_model)
+
+def _cached_product_response(cached: CachedProductPage, if_none_match: Optional[str]) -> Response:
+    """キャッシュ済みのレスポンスを返す（クライアントが同じ版を持っている場合は304）"""
+    headers = {"ETag": cached.etag}
+    if if_none_match and _etag_matches(cached.etag, if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
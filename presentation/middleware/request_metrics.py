@@ -0,0 +1,57 @@
+from time import perf_counter
+
+from infrastructure.metrics.instrumentation import request_started
+from infrastructure.metrics.registry import MetricsRegistry, metrics
+
+
+def _route_template(scope) -> str:
+    """リクエストのパスのパスパラメーター部分を {名前} に戻したルートのテンプレートを返す
+
+    ルーターのプレフィックスを含めた形にするため、一致したルートの path ではなくリクエストのパスから組み立てる。
+    """
+    if scope.get("route") is None:
+        return "unmatched"
+    names = {str(value): name for name, value in scope.get("path_params", {}).items()}
+    return "/".join(f"{{{names[segment]}}}" if segment in names else segment for segment in scope["path"].split("/"))
+
+
+class RequestMetricsMiddleware:
+    """リクエスト全体の処理時間と件数をルートごとに記録するASGIミドルウェア
+
+    ラベルにはURLではなくルートのパステンプレート（/api/orders/{order_id} など）を使い、
+    どのルートにも一致しなかったリクエストは "unmatched" にまとめる。
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = metrics):
+        self.app = app
+        self.registry = registry
+        self.durations = registry.histogram(
+            "http_request_duration_seconds", "Time from receiving a request to sending the last response byte.",
+            ("method", "route")
+        )
+        self.requests = registry.counter(
+            "http_requests_total", "Requests handled, by route and response status.", ("method", "route", "status")
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        started = perf_counter()
+        token = request_started.set(started)
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            request_started.reset(token)
+            route = _route_template(scope)
+            self.durations.labels(scope["method"], route).observe(perf_counter() - started)
+            self.requests.labels(scope["method"], route, str(status_code)).inc()
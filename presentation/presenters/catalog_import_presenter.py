@@ -0,0 +1,38 @@
+from application.interfaces.catalog_import_use_case import (
+    CatalogImportErrorOutputBoundary,
+    CatalogImportOutputBoundary
+)
+from application.interfaces.dto import CatalogImportResultDTO
+from presentation.viewmodels.catalog_import_view_model import CatalogImportViewModel
+
+
+def import_result_to_dict(result: CatalogImportResultDTO) -> dict:
+    """CatalogImportResultDTOを辞書に変換する"""
+    return {
+        "kind": result.kind,
+        "rows": result.rows,
+        "imported": result.imported,
+        "rejected": result.rejected,
+        "seconds": round(result.seconds, 3),
+        "rows_per_second": round(result.rows_per_second, 1),
+        "rejections": [{"line": rejection.line, "error": rejection.error} for rejection in result.rejections]
+    }
+
+
+class CatalogImportPresenter(CatalogImportOutputBoundary, CatalogImportErrorOutputBoundary):
+    """顧客・製品の一括取り込みの結果を表示するプレゼンター"""
+    
+    def __init__(self):
+        self.view_model = CatalogImportViewModel()
+    
+    def present_import_progress(self, result: CatalogImportResultDTO) -> None:
+        """途中経過は表示しない（レスポンスには最終的な結果だけを返す）"""
+        pass
+    
+    def present_import_result(self, result: CatalogImportResultDTO) -> None:
+        """取り込みの結果を表示する"""
+        self.view_model.set_result(import_result_to_dict(result))
+    
+    def present_error(self, message: str) -> None:
+        """エラーを表示する"""
+        self.view_model.set_error(message)
@@ -0,0 +1,49 @@
+from application.interfaces.customer_use_case import (
+    CustomerCommandOutputBoundary,
+    CustomerErrorOutputBoundary,
+    CustomerQueryOutputBoundary
+)
+from application.interfaces.dto import CustomerDTO
+from presentation.viewmodels.customer_view_model import CustomerViewModel
+
+
+def _to_dict(customer_dto: CustomerDTO) -> dict:
+    """CustomerDTOを辞書に変換する"""
+    return {
+        "id": str(customer_dto.id) if customer_dto.id else None,
+        "name": customer_dto.name,
+        "email": customer_dto.email,
+        "phone": customer_dto.phone,
+        "address": customer_dto.address,
+        "created_at": customer_dto.created_at.isoformat() if customer_dto.created_at else None
+    }
+
+
+class CustomerCommandPresenter(CustomerCommandOutputBoundary, CustomerErrorOutputBoundary):
+    """顧客コマンド操作の結果を表示するプレゼンター"""
+    
+    def __init__(self):
+        self.view_model = CustomerViewModel()
+    
+    def present_registered_customer(self, customer_dto: CustomerDTO) -> None:
+        """登録された顧客を表示する"""
+        self.view_model.set_customer(_to_dict(customer_dto))
+    
+    def present_error(self, message: str) -> None:
+        """エラーを表示する"""
+        self.view_model.set_error(message)
+
+
+class CustomerQueryPresenter(CustomerQueryOutputBoundary, CustomerErrorOutputBoundary):
+    """顧客クエリ操作の結果を表示するプレゼンター"""
+    
+    def __init__(self):
+        self.view_model = CustomerViewModel()
+    
+    def present_customer(self, customer_dto: CustomerDTO) -> None:
+        """顧客を表示する"""
+        self.view_model.set_customer(_to_dict(customer_dto))
+    
+    def present_error(self, message: str) -> None:
+        """エラーを表示する"""
+        self.view_model.set_error(message)
@@ -1,9 +1,25 @@
-from application.interfaces.dto import OrderDTO
+import json
+from typing import Iterator, List
+
+from application.interfaces.dto import (
+    OrderCreationResultDTO,
+    OrderDTO,
+    OrderPageDTO,
+    OrderStatusUpdateResultDTO,
+    OrderSummaryDTO,
+    RevenueDTO
+)
 from application.interfaces.order_use_case import (
+    OrderAnalyticsOutputBoundary,
     OrderCommandOutputBoundary,
     OrderQueryOutputBoundary,
     OrderErrorOutputBoundary,
 )
+from presentation.serializers.order_serializer import (
+    serialize_creation_results,
+    serialize_order,
+    serialize_status_update_results
+)
 from presentation.viewmodels.order_view_model import OrderViewModel
 
 
@@ -15,78 +31,75 @@ class OrderCommandPresenter(OrderCommandOutputBoundary, OrderErrorOutputBoundary
     
     def present_created_order(self, order_dto: OrderDTO) -> None:
         """作成された注文を表示する"""
-        order_dict = self._to_dict(order_dto)
-        self.view_model.set_order(order_dict)
+        self.view_model.set_data_json(serialize_order(order_dto))
+    
+    def present_created_orders(self, results: List[OrderCreationResultDTO]) -> None:
+        """一括作成の結果を表示する"""
+        self.view_model.set_data_json(serialize_creation_results(results))
     
     def present_updated_order(self, order_dto: OrderDTO) -> None:
         """更新された注文を表示する"""
-        order_dict = self._to_dict(order_dto)
-        self.view_model.set_order(order_dict)
+        self.view_model.set_data_json(serialize_order(order_dto))
+    
+    def present_updated_orders(self, results: List[OrderStatusUpdateResultDTO]) -> None:
+        """一括ステータス更新の結果を表示する"""
+        self.view_model.set_data_json(serialize_status_update_results(results))
     
     def present_cancelled_order(self, order_dto: OrderDTO) -> None:
         """キャンセルされた注文を表示する"""
-        order_dict = self._to_dict(order_dto)
-        self.view_model.set_order(order_dict)
+        self.view_model.set_data_json(serialize_order(order_dto))
     
     def present_error(self, message: str) -> None:
         """エラーを表示する"""
         self.view_model.set_error(message)
-    
-    def _to_dict(self, order_dto: OrderDTO) -> dict:
-        """OrderDTOを辞書に変換する"""
-        return {
-            "order_id": str(order_dto.id) if order_dto.id else None,
-            "customer_id": str(order_dto.customer_id) if order_dto.customer_id else None,
-            "items": [
-                {
-                    "product_id": str(item.product_id),
-                    "quantity": item.quantity,
-                    "price_per_unit": item.price_per_unit,
-                    "total_price": item.quantity * item.price_per_unit
-                }
-                for item in order_dto.items
-            ],
-            "status": order_dto.status,
-            "created_at": order_dto.created_at.isoformat() if order_dto.created_at else None,
-            "total_amount": order_dto.total_amount or sum(item.quantity * item.price_per_unit for item in order_dto.items)
-        }
 
 
 class OrderQueryPresenter(OrderQueryOutputBoundary, OrderErrorOutputBoundary):
-    """注文クエリ操作の結果を表示するプレゼンター"""
+    """注文クエリ操作の結果を表示するプレゼンター（読み取りモデルの整形済みデータをそのまま使う）"""
     
     def __init__(self):
         self.view_model = OrderViewModel()
     
-    def present_order(self, order_dto: OrderDTO) -> None:
+    def present_order(self, summary: OrderSummaryDTO) -> None:
         """単一の注文を表示する"""
-        order_dict = self._to_dict(order_dto)
-        self.view_model.set_order(order_dict)
+        self.view_model.set_order(summary.data)
     
-    def present_orders(self, order_dtos: list[OrderDTO]) -> None:
+    def present_orders(self, summaries: List[OrderSummaryDTO]) -> None:
         """注文リストを表示する"""
-        orders_dict = [self._to_dict(order) for order in order_dtos]
-        self.view_model.set_orders(orders_dict)
+        self.view_model.set_orders([summary.data for summary in summaries])
+    
+    def present_order_page(self, order_page: OrderPageDTO) -> None:
+        """注文リストの1ページを表示する"""
+        self.view_model.set_page([summary.data for summary in order_page.orders], order_page.next_cursor)
+    
+    def present_order_stream(self, summaries: Iterator[OrderSummaryDTO]) -> None:
+        """注文をNDJSON（1行1注文）として逐次表示する"""
+        self.view_model.set_stream(
+            json.dumps(summary.data, ensure_ascii=False).encode() + b"\n"
+            for summary in summaries
+        )
     
     def present_error(self, message: str) -> None:
         """エラーを表示する"""
         self.view_model.set_error(message)
+
+
+class OrderAnalyticsPresenter(OrderAnalyticsOutputBoundary, OrderErrorOutputBoundary):
+    """注文の売上集計の結果を表示するプレゼンター"""
+    
+    def __init__(self):
+        self.view_model = OrderViewModel()
     
-    def _to_dict(self, order_dto: OrderDTO) -> dict:
-        """OrderDTOを辞書に変換する"""
-        return {
-            "order_id": str(order_dto.id) if order_dto.id else None,
-            "customer_id": str(order_dto.customer_id) if order_dto.customer_id else None,
-            "items": [
-                {
-                    "product_id": str(item.product_id),
-                    "quantity": item.quantity,
-                    "price_per_unit": item.price_per_unit,
-                    "total_price": item.quantity * item.price_per_unit
-                }
-                for item in order_dto.items
-            ],
-            "status": order_dto.status,
-            "created_at": order_dto.created_at.isoformat() if order_dto.created_at else None,
-            "total_amount": order_dto.total_amount or sum(item.quantity * item.price_per_unit for item in order_dto.items)
-        }
\ No newline at end of file
+    def present_revenue(self, by: str, rows: List[RevenueDTO]) -> None:
+        """集計単位ごとの売上を表示する"""
+        self.view_model.set_order({
+            "by": by,
+            "rows": [
+                {"key": row.key, "revenue": row.revenue, "quantity": row.quantity, "lines": row.lines}
+                for row in rows
+            ]
+        })
+    
+    def present_error(self, message: str) -> None:
+        """エラーを表示する"""
+        self.view_model.set_error(message)
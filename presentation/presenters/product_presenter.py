@@ -0,0 +1,23 @@
+from application.interfaces.dto import ProductDTO, ProductPageDTO
+from application.interfaces.product_use_case import ProductErrorOutputBoundary, ProductQueryOutputBoundary
+from presentation.serializers.product_serializer import serialize_product, serialize_product_page
+from presentation.viewmodels.product_view_model import ProductViewModel
+
+
+class ProductQueryPresenter(ProductQueryOutputBoundary, ProductErrorOutputBoundary):
+    """製品クエリ操作の結果を表示するプレゼンター"""
+    
+    def __init__(self):
+        self.view_model = ProductViewModel()
+    
+    def present_product(self, product_dto: ProductDTO) -> None:
+        """製品を表示する"""
+        self.view_model.set_data_json(serialize_product(product_dto))
+    
+    def present_product_page(self, product_page: ProductPageDTO) -> None:
+        """製品一覧の1ページを表示する"""
+        self.view_model.set_data_json(serialize_product_page(product_page))
+    
+    def present_error(self, message: str) -> None:
+        """エラーを表示する"""
+        self.view_model.set_error(message)
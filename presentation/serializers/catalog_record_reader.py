@@ -0,0 +1,97 @@
+import csv
+import json
+from typing import Iterable, Iterator, Optional
+
+from application.interfaces.catalog_import_use_case import ImportRecord
+
+# 取り込みで受け付ける形式
+FORMATS = ("csv", "ndjson")
+_SUFFIXES = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+def format_from_filename(name: str) -> Optional[str]:
+    """ファイル名の拡張子から形式を判定する（判定できなければNone）"""
+    for suffix, record_format in _SUFFIXES.items():
+        if name.lower().endswith(suffix):
+            return record_format
+    return None
+
+
+def format_from_content_type(content_type: str) -> Optional[str]:
+    """Content-Type から形式を判定する（判定できなければNone）"""
+    return _CONTENT_TYPES.get(content_type.split(";", 1)[0].strip().lower())
+
+
+def split_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """任意の位置で区切られたバイト列のチャンクを行に分ける（行末の改行は残す）"""
+    pending = b""
+    for chunk in chunks:
+        data = pending + chunk if pending else chunk
+        start = 0
+        end = data.find(b"\n")
+        while end >= 0:
+            yield data[start:end + 1]
+            start = end + 1
+            end = data.find(b"\n", start)
+        pending = data[start:]
+    if pending:
+        yield pending
+
+
+def _decode(lines: Iterable[bytes]) -> Iterator[str]:
+    first = True
+    for line in lines:
+        text = line.decode("utf-8")
+        if first:
+            first = False
+            text = text.lstrip("\ufeff")
+        yield text
+
+
+def read_csv(lines: Iterable[bytes]) -> Iterator[ImportRecord]:
+    """ヘッダー行付きのCSVを1行ずつ読む（列数が合わない行は理由付きで返す）"""
+    reader = csv.reader(_decode(lines))
+    header = next(reader, None)
+    if header is None:
+        return
+    header = [name.strip() for name in header]
+    width = len(header)
+    for row in reader:
+        if not row:
+            continue
+        if len(row) != width:
+            yield ImportRecord(reader.line_num, None, f"Expected {width} columns, got {len(row)}")
+        else:
+            yield ImportRecord(reader.line_num, dict(zip(header, row)))
+
+
+def read_ndjson(lines: Iterable[bytes]) -> Iterator[ImportRecord]:
+    """1行1オブジェクトのJSONを1行ずつ読む（解析できない行は理由付きで返す）"""
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            fields = json.loads(line)
+        except ValueError as e:
+            yield ImportRecord(number, None, f"Invalid JSON: {e}")
+            continue
+        if isinstance(fields, dict):
+            yield ImportRecord(number, fields)
+        else:
+            yield ImportRecord(number, None, "Expected a JSON object")
+
+
+def read_records(lines: Iterable[bytes], record_format: str) -> Iterator[ImportRecord]:
+    """行のイテラブルを指定した形式で読む"""
+    if record_format == "csv":
+        return read_csv(lines)
+    if record_format == "ndjson":
+        return read_ndjson(lines)
+    raise ValueError(f"Unsupported import format: {record_format}")
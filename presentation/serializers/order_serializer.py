@@ -0,0 +1,77 @@
+import json
+from typing import Iterable, List, Optional
+
+from application.interfaces.dto import OrderCreationResultDTO, OrderDTO, OrderItemDTO, OrderStatusUpdateResultDTO
+from domain.entities.order import OrderStatus
+
+# 注文のJSONの雛形（キーの並びと区切り文字を固定し、値だけを埋め込む）
+# 数値は json.dumps と同じく repr（{!r}）で出力する
+_ORDER = '{{"order_id":{},"customer_id":{},"items":[{}],"status":{},"created_at":{},"total_amount":{!r}}}'.format
+_ITEM = '{{"product_id":"{}","quantity":{!r},"price_per_unit":{!r},"total_price":{!r}}}'.format
+_CREATION_RESULT = '{{"index":{},"success":{},"data":{},"error":{}}}'.format
+_STATUS_UPDATE_RESULT = '{{"order_id":"{}","success":{},"status":{},"error":{}}}'.format
+# ステータスは取りうる値が決まっているため、JSON文字列をあらかじめ作っておく
+_STATUSES = {status.value: json.dumps(status.value) for status in OrderStatus}
+
+
+def _string(value) -> str:
+    """UUIDや日時など、エスケープが不要な値をJSON文字列にする"""
+    return "null" if value is None else f'"{value}"'
+
+
+def _error(message: Optional[str]) -> str:
+    return "null" if message is None else json.dumps(message, ensure_ascii=False)
+
+
+def _item(item: OrderItemDTO) -> str:
+    price_per_unit = item.price_per_unit
+    return _ITEM(item.product_id, item.quantity, price_per_unit, item.quantity * price_per_unit)
+
+
+def _order(order_dto: OrderDTO) -> str:
+    total_amount = order_dto.total_amount or sum(item.quantity * item.price_per_unit for item in order_dto.items)
+    status = _STATUSES.get(order_dto.status) or json.dumps(order_dto.status, ensure_ascii=False)
+    return _ORDER(
+        _string(order_dto.id),
+        _string(order_dto.customer_id),
+        ",".join(map(_item, order_dto.items)),
+        status,
+        _string(order_dto.created_at.isoformat() if order_dto.created_at else None),
+        total_amount
+    )
+
+
+def serialize_order(order_dto: OrderDTO) -> bytes:
+    """注文をレスポンスの data として返すJSONのバイト列にする"""
+    return _order(order_dto).encode()
+
+
+def serialize_orders(order_dtos: Iterable[OrderDTO]) -> bytes:
+    """注文のリストをJSON配列のバイト列にする"""
+    return ("[" + ",".join(map(_order, order_dtos)) + "]").encode()
+
+
+def serialize_creation_results(results: List[OrderCreationResultDTO]) -> bytes:
+    """一括作成の結果（注文ごとの成否）をJSON配列のバイト列にする"""
+    return ("[" + ",".join(
+        _CREATION_RESULT(
+            result.index,
+            "true" if result.success else "false",
+            _order(result.order) if result.order else "null",
+            _error(result.error)
+        )
+        for result in results
+    ) + "]").encode()
+
+
+def serialize_status_update_results(results: List[OrderStatusUpdateResultDTO]) -> bytes:
+    """一括ステータス更新の結果（注文ごとの成否）をJSON配列のバイト列にする"""
+    return ("[" + ",".join(
+        _STATUS_UPDATE_RESULT(
+            result.order_id,
+            "true" if result.success else "false",
+            _STATUSES.get(result.status, "null"),
+            _error(result.error)
+        )
+        for result in results
+    ) + "]").encode()
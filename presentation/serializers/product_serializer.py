@@ -0,0 +1,36 @@
+import json
+from typing import Optional
+
+from application.interfaces.dto import ProductDTO, ProductPageDTO
+
+# 製品のJSONの雛形（キーの並びは api.routes.ProductResponse と同じ、数値は repr で出力する）
+_PRODUCT = '{{"id":"{}","name":{},"description":{},"price":{!r},"stock_quantity":{!r}}}'.format
+_PAGE = '{{"products":[{}],"next_cursor":{}}}'.format
+
+
+def _text(value: Optional[str]) -> str:
+    return "null" if value is None else json.dumps(value, ensure_ascii=False)
+
+
+def _product(product_dto: ProductDTO) -> str:
+    return _PRODUCT(
+        product_dto.id,
+        _text(product_dto.name),
+        _text(product_dto.description),
+        product_dto.price,
+        product_dto.stock_quantity
+    )
+
+
+def serialize_product(product_dto: ProductDTO) -> bytes:
+    """製品をレスポンスの data として返すJSONのバイト列にする"""
+    return _product(product_dto).encode()
+
+
+def serialize_product_page(product_page: ProductPageDTO) -> bytes:
+    """製品一覧の1ページ（製品の配列と次ページのカーソル）をJSONのバイト列にする"""
+    next_cursor = product_page.next_cursor
+    return _PAGE(
+        ",".join(map(_product, product_page.products)),
+        "null" if next_cursor is None else f'"{next_cursor}"'
+    ).encode()
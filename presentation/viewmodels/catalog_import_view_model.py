@@ -0,0 +1,35 @@
+from typing import Any, Dict, Optional
+
+
+class CatalogImportViewModel:
+    """顧客・製品の一括取り込みのビューモデル"""
+    
+    def __init__(self):
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.success: bool = False
+    
+    def set_result(self, result: Dict[str, Any]) -> None:
+        """取り込みの結果を設定する"""
+        self.result = result
+        self.success = True
+        self.error = None
+    
+    def set_error(self, message: str) -> None:
+        """エラーを設定する"""
+        self.error = message
+        self.success = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """ビューモデルをAPIレスポンス用の辞書に変換する"""
+        result = {
+            "success": self.success
+        }
+        
+        if self.result:
+            result["data"] = self.result
+        
+        if self.error:
+            result["error"] = self.error
+            
+        return result
@@ -0,0 +1,35 @@
+from typing import Any, Dict, Optional
+
+
+class CustomerViewModel:
+    """顧客ビューモデル"""
+    
+    def __init__(self):
+        self.customer: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.success: bool = False
+    
+    def set_customer(self, customer: Dict[str, Any]) -> None:
+        """顧客を設定する"""
+        self.customer = customer
+        self.success = True
+        self.error = None
+    
+    def set_error(self, message: str) -> None:
+        """エラーを設定する"""
+        self.error = message
+        self.success = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """ビューモデルをAPIレスポンス用の辞書に変換する"""
+        result = {
+            "success": self.success
+        }
+        
+        if self.customer:
+            result["data"] = self.customer
+        
+        if self.error:
+            result["error"] = self.error
+            
+        return result
@@ -1,4 +1,5 @@
-from typing import Dict, List, Any, Optional
+import json
+from typing import Dict, Iterator, List, Any, Optional
 from fastapi import status
 
 class OrderViewModel:
@@ -9,6 +10,11 @@ class OrderViewModel:
         self.orders: List[Dict[str, Any]] = []
         self.error: Optional[str] = None
         self.success: bool = False
+        self.paginated: bool = False
+        self.next_cursor: Optional[str] = None
+        self.stream: Optional[Iterator[bytes]] = None
+        # シリアライズ済みの data（JSONのバイト列）
+        self.data_json: Optional[bytes] = None
     
     def set_order(self, order: Dict[str, Any]) -> None:
         """注文を設定する"""
@@ -22,6 +28,24 @@ class OrderViewModel:
         self.success = True
         self.error = None
     
+    def set_page(self, orders: List[Dict[str, Any]], next_cursor: Optional[str]) -> None:
+        """注文リストの1ページと次ページのカーソルを設定する"""
+        self.set_orders(orders)
+        self.paginated = True
+        self.next_cursor = next_cursor
+    
+    def set_stream(self, stream: Iterator[bytes]) -> None:
+        """逐次出力する注文のストリームを設定する"""
+        self.stream = stream
+        self.success = True
+        self.error = None
+    
+    def set_data_json(self, data_json: bytes) -> None:
+        """シリアライズ済みの注文（またはリスト）を設定する"""
+        self.data_json = data_json
+        self.success = True
+        self.error = None
+    
     def set_error(self, message: str) -> None:
         """エラーを設定する"""
         self.error = message
@@ -33,15 +57,27 @@ class OrderViewModel:
             "success": self.success
         }
         
-        if self.order:
+        if self.data_json is not None:
+            result["data"] = json.loads(self.data_json)
+        elif self.order:
             result["data"] = self.order
-        elif self.orders:
+        elif self.orders or self.paginated:
             result["data"] = self.orders
         
+        if self.paginated:
+            result["next_cursor"] = self.next_cursor
+        
         if self.error:
             result["error"] = self.error
             
-        return result 
+        return result
+    
+    def to_json(self) -> bytes:
+        """ビューモデルをAPIレスポンスのJSONのバイト列に変換する"""
+        if self.data_json is not None and self.success:
+            # シリアライズ済みの data は辞書に戻さずにそのまま埋め込む
+            return b'{"success":true,"data":' + self.data_json + b'}'
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")).encode()
     
 
 class HttpResponseOrderCreationViewModel(OrderViewModel):
@@ -0,0 +1,44 @@
+import json
+from typing import Any, Dict, Optional
+
+
+class ProductViewModel:
+    """製品ビューモデル"""
+    
+    def __init__(self):
+        # シリアライズ済みの data（JSONのバイト列）
+        self.data_json: Optional[bytes] = None
+        self.error: Optional[str] = None
+        self.success: bool = False
+    
+    def set_data_json(self, data_json: bytes) -> None:
+        """シリアライズ済みの製品（または製品一覧の1ページ）を設定する"""
+        self.data_json = data_json
+        self.success = True
+        self.error = None
+    
+    def set_error(self, message: str) -> None:
+        """エラーを設定する"""
+        self.error = message
+        self.success = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """ビューモデルをAPIレスポンス用の辞書に変換する"""
+        result = {
+            "success": self.success
+        }
+        
+        if self.data_json is not None:
+            result["data"] = json.loads(self.data_json)
+        
+        if self.error:
+            result["error"] = self.error
+            
+        return result
+    
+    def to_json(self) -> bytes:
+        """ビューモデルをAPIレスポンスのJSONのバイト列に変換する"""
+        if self.data_json is not None and self.success:
+            # シリアライズ済みの data は辞書に戻さずにそのまま埋め込む
+            return b'{"success":true,"data":' + self.data_json + b'}'
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")).encode()
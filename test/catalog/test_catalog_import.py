@@ -0,0 +1,192 @@
+import os
+import tempfile
+import unittest
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from application.usecases.catalog_import_interactor import CatalogImportInteractor
+from domain.entities.customer import Customer
+from domain.exceptions import DuplicateEmailError
+from infrastructure.db.engine import dispose_engines, get_session_factory
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from infrastructure.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from infrastructure.repositories.sqlalchemy_product_repository import SqlAlchemyProductRepository
+from main import app
+from presentation.presenters.catalog_import_presenter import CatalogImportPresenter
+from presentation.serializers.catalog_record_reader import read_records, split_lines
+
+
+class _ProgressPresenter(CatalogImportPresenter):
+    def __init__(self):
+        super().__init__()
+        self.progress = []
+
+    def present_import_progress(self, result):
+        self.progress.append(result.imported)
+
+
+def _chunked(data: bytes, size: int):
+    """任意の位置で区切られた本文のチャンクを返す"""
+    return (data[start:start + size] for start in range(0, len(data), size))
+
+
+class TestCatalogRecordReader(unittest.TestCase):
+    """CSV/NDJSONの逐次読み込みのテストケース"""
+
+    def test_reads_records_split_across_chunks(self):
+        """チャンクの境界をまたぐ行や引用符内の改行を含む行を読めることのテスト"""
+        csv_body = '\ufeffname,price\n"改行を\n含む製品",10\nりんご,20\n短い行\n'.encode()
+        records = list(read_records(split_lines(_chunked(csv_body, 3)), "csv"))
+        self.assertEqual([record.fields for record in records[:2]],
+                         [{"name": "改行を\n含む製品", "price": "10"}, {"name": "りんご", "price": "20"}])
+        self.assertEqual((records[2].line, records[2].error), (5, "Expected 2 columns, got 1"))
+
+        ndjson_body = b'{"name": "a"}\n\n[1]\n{"name": "b"}'
+        records = list(read_records(split_lines(_chunked(ndjson_body, 5)), "ndjson"))
+        self.assertEqual([(record.line, record.fields) for record in records],
+                         [(1, {"name": "a"}), (3, None), (4, {"name": "b"})])
+
+
+class TestCatalogImportInteractor(unittest.TestCase):
+    """顧客・製品の一括取り込みのテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.customer_repository = InMemoryCustomerRepository()
+        self.product_repository = InMemoryProductRepository()
+        self.presenter = _ProgressPresenter()
+        self.interactor = CatalogImportInteractor(
+            self.customer_repository, self.product_repository, self.presenter, self.presenter, chunk_size=2
+        )
+
+    def test_imports_products_in_chunks_and_reports_rejections(self):
+        """チャンクごとに保存され、検証に失敗した行が行番号付きで除外されることのテスト"""
+        product_id = uuid4()
+        body = (
+            "id,name,price,stock_quantity\n"
+            f"{product_id},製品A,100,5\n"
+            ",製品B,2.5,\n"
+            ",,10,1\n"
+            ",製品C,-1,1\n"
+            ",製品D,abc,1\n"
+            ",製品E,3,7\n"
+        ).encode()
+
+        result = self.interactor.import_products(read_records(split_lines([body]), "csv"))
+
+        self.assertEqual((result.rows, result.imported, result.rejected), (6, 3, 3))
+        self.assertEqual([rejection.line for rejection in result.rejections], [4, 5, 6])
+        self.assertEqual(result.rejections[2].error, "Invalid price: abc")
+        self.assertEqual(self.product_repository.find_by_id(product_id).stock_quantity, 5)
+        self.assertEqual(self.presenter.progress, [2])
+        self.assertEqual(self.presenter.view_model.to_dict()["data"]["imported"], 3)
+
+    def test_duplicate_emails_reject_only_duplicate_rows(self):
+        """登録済みやバッチ内で重複するメールアドレスの行だけが除外されることのテスト"""
+        self.customer_repository.save(Customer(name="既存の顧客", email="taken@example.com"))
+        body = b"\n".join([
+            b'{"name": "A", "email": "a@example.com"}',
+            b'{"name": "B", "email": "TAKEN@example.com"}',
+            b'{"name": "C", "email": "c@example.com"}',
+            b'{"name": "D", "email": "c@example.com"}',
+            b'{"name": "E", "email": "e@example.com"}',
+        ])
+
+        result = self.interactor.import_customers(read_records(split_lines([body]), "ndjson"))
+
+        self.assertEqual((result.imported, result.rejected), (3, 2))
+        self.assertEqual([rejection.line for rejection in result.rejections], [2, 4])
+        self.assertEqual(len(self.customer_repository.find_all()), 4)
+
+
+class TestSqlAlchemyCatalogImport(unittest.TestCase):
+    """SQLAlchemyリポジトリへの一括取り込みのテストケース（ファイルベースのSQLite）"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        session_factory = get_session_factory(f"sqlite:///{os.path.join(self.tmpdir.name, 'test.db')}")
+        self.customer_repository = SqlAlchemyCustomerRepository(session_factory)
+        self.product_repository = SqlAlchemyProductRepository(session_factory)
+        self.presenter = CatalogImportPresenter()
+        self.interactor = CatalogImportInteractor(
+            self.customer_repository, self.product_repository, self.presenter, self.presenter, chunk_size=3
+        )
+
+    def tearDown(self):
+        """テスト後の後始末"""
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def test_imports_with_batched_inserts(self):
+        """一括挿入で保存され、重複したチャンクは1件ずつ保存し直されることのテスト"""
+        products = "name,price,stock_quantity\n" + "".join(f"製品{index},{index}.5,{index}\n" for index in range(7))
+        result = self.interactor.import_products(read_records(split_lines([products.encode()]), "csv"))
+        self.assertEqual(result.imported, 7)
+        self.assertEqual(len(self.product_repository.find_by_name("製品")), 7)
+
+        customers = "name,email\n" + "".join(f"顧客{index},c{index % 4}@example.com\n" for index in range(6))
+        result = self.interactor.import_customers(read_records(split_lines([customers.encode()]), "csv"))
+        self.assertEqual((result.imported, result.rejected), (4, 2))
+        self.assertEqual(self.customer_repository.find_by_email("c1@example.com").name, "顧客1")
+
+    def test_reimporting_existing_products_replaces_them(self):
+        """登録済みのIDの製品を再度取り込むと、エラーにならずに置き換わることのテスト"""
+        product_id = uuid4()
+        first = f"id,name,price,stock_quantity\n{product_id},製品A,100,5\n,製品B,200,1\n"
+        self.interactor.import_products(read_records(split_lines([first.encode()]), "csv"))
+
+        again = f"id,name,price,stock_quantity\n{product_id},製品A改,150,8\n,製品C,300,2\n"
+        result = self.interactor.import_products(read_records(split_lines([again.encode()]), "csv"))
+
+        self.assertEqual((result.imported, result.rejected), (2, 0))
+        product = self.product_repository.find_by_id(product_id)
+        self.assertEqual((product.name, product.price, product.stock_quantity), ("製品A改", 150, 8))
+        self.assertEqual(len(self.product_repository.find_all()), 3)
+
+    def test_customer_save_many_reports_only_duplicate_rows(self):
+        """一括保存のメールアドレスの重複では重複した顧客だけが報告され、登録済みのIDは置き換わることのテスト"""
+        existing = self.customer_repository.save(Customer(name="既存の顧客", email="taken@example.com"))
+        existing.name = "更新した顧客"
+
+        with self.assertRaises(DuplicateEmailError) as raised:
+            self.customer_repository.save_many([
+                Customer(name="A", email="a@example.com"),
+                Customer(name="B", email="Taken@example.com"),
+                existing,
+            ])
+        self.assertIn("Taken@example.com", str(raised.exception))
+        self.assertNotIn("a@example.com", str(raised.exception))
+        self.assertIsNone(self.customer_repository.find_by_email("a@example.com"))
+
+        self.customer_repository.save_many([existing, Customer(name="A", email="a@example.com")])
+        self.assertEqual(self.customer_repository.find_by_id(existing.id).name, "更新した顧客")
+        self.assertEqual(len(self.customer_repository.find_all()), 2)
+
+
+class TestCatalogImportEndpoint(unittest.TestCase):
+    """一括取り込みエンドポイントのテストケース"""
+
+    def test_streams_request_body(self):
+        """分割して送られた本文を取り込み、形式が判定できなければエラーを返すことのテスト"""
+        email = f"{uuid4().hex}@example.com"
+        body = f"name,email\n取り込み顧客,{email}\n,missing@example.com\n".encode()
+        with TestClient(app) as client:
+            response = client.post(
+                "/api/catalog/customers/import",
+                content=_chunked(body, 7),
+                headers={"Content-Type": "text/csv"}
+            )
+            unknown = client.post("/api/catalog/products/import", content=b"{}")
+
+            data = response.json()["data"]
+            self.assertEqual((data["rows"], data["imported"], data["rejected"]), (2, 1, 1))
+            self.assertEqual(data["rejections"], [{"line": 3, "error": "Customer name and email are required"}])
+            self.assertEqual(app.state.container.resolve("customer_repository").find_by_email(email).name, "取り込み顧客")
+            self.assertFalse(unknown.json()["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from fastapi.testclient import TestClient
+
+from config.container import Container, create_container
+from domain.entities.customer import Customer
+from domain.entities.product import Product
+from main import app
+
+
+class TestContainer(unittest.TestCase):
+    """依存関係コンテナのテストケース"""
+
+    def test_create_container_wires_and_reports(self):
+        """コンテナが構成と初期化時間を報告することのテスト"""
+        container = create_container(db_url="")
+        report = container.report()
+
+        self.assertEqual(
+            set(report["components"]),
+            {
+                "customer_repository", "product_repository", "order_command_repository", "order_query_repository",
+                "order_read_model", "async_order_read_model", "outbox_repository", "outbox_dispatcher", "order_projection_repairer", "order_response_cache",
+                "order_analytics", "order_history", "persistence", "idempotency_store", "product_catalog", "product_page_cache",
+                "async_customer_repository", "async_product_repository",
+                "async_order_command_repository", "async_order_query_repository"
+            }
+        )
+        self.assertGreaterEqual(report["wiring_ms"], 0)
+        self.assertGreaterEqual(report["warm_up_ms"], 0)
+
+    def test_resolve_returns_same_instance(self):
+        """解決のたびに同じインスタンスが返されることのテスト"""
+        container = Container(db_url="").wire()
+        self.assertIs(container.resolve("customer_repository"), container.resolve("customer_repository"))
+
+    def test_requests_share_application_scoped_repositories(self):
+        """リクエストを跨いでリポジトリが共有されることのテスト"""
+        with TestClient(app) as client:
+            container = app.state.container
+            customer = container.resolve("customer_repository").save(Customer(name="テスト顧客", email="test@example.com"))
+            product = container.resolve("product_repository").save(Product(name="テスト商品", price=1000, stock_quantity=10))
+
+            for _ in range(2):
+                response = client.post("/api/orders/", json={
+                    "customer_id": str(customer.id),
+                    "items": [{"product_id": str(product.id), "quantity": 1, "price_per_unit": 1000}]
+                })
+                self.assertEqual(response.status_code, 200)
+
+            self.assertEqual(container.resolve("product_repository").find_by_id(product.id).stock_quantity, 8)
+            self.assertEqual(len(container.resolve("order_query_repository").find_all_by_customer_id(customer.id)), 2)
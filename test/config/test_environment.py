@@ -0,0 +1,24 @@
+import unittest
+
+from config.environment import EnvironmentSettings
+
+
+class TestEnvironmentSettings(unittest.TestCase):
+    """環境設定のテストケース"""
+
+    def test_sqlite_url_only_for_file_databases(self):
+        """SQLiteのURLはファイルを指定した場合だけ返し、メモリDBは従来どおりの判定になることのテスト"""
+        settings = EnvironmentSettings(APP_ENV="production", DATABASE_DIALECT="sqlite", DATABASE_NAME="/tmp/app.db")
+        self.assertEqual(settings.DATABASE_URL, "sqlite:////tmp/app.db")
+
+        settings = EnvironmentSettings(
+            APP_ENV="production", DATABASE_DIALECT="sqlite", DATABASE_NAME=":memory:", DATABASE_PASSWORD=""
+        )
+        self.assertIsNone(settings.DATABASE_URL)
+
+        settings = EnvironmentSettings(APP_ENV="development", DATABASE_DIALECT="sqlite", DATABASE_NAME=":memory:")
+        self.assertIsNone(settings.DATABASE_URL)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from domain.entities.customer import Customer
+from domain.exceptions import DuplicateEmailError
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from main import app
+
+
+class TestCustomerEmailIndex(unittest.TestCase):
+    """顧客メールアドレスの一意インデックスのテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.repository = InMemoryCustomerRepository()
+        self.customer = self.repository.save(Customer(name="テスト顧客", email="Test@Example.com"))
+
+    def test_find_by_email_is_case_insensitive(self):
+        """正規化したメールアドレスで検索できることのテスト"""
+        self.assertEqual(self.repository.find_by_email(" test@example.COM ").id, self.customer.id)
+
+    def test_duplicate_email_is_rejected(self):
+        """重複したメールアドレスが拒否されることのテスト"""
+        with self.assertRaises(DuplicateEmailError):
+            self.repository.save(Customer(name="別の顧客", email="test@example.com"))
+
+    def test_update_details_moves_index_entry(self):
+        """update_details後の更新でインデックスが付け替えられることのテスト"""
+        self.customer.update_details(email="new@example.com")
+        self.repository.update(self.customer)
+
+        self.assertIsNone(self.repository.find_by_email("test@example.com"))
+        self.assertEqual(self.repository.find_by_email("new@example.com").id, self.customer.id)
+
+        # 解放されたメールアドレスは再登録できる
+        self.repository.save(Customer(name="別の顧客", email="test@example.com"))
+
+    def test_delete_releases_email(self):
+        """削除でメールアドレスが解放されることのテスト"""
+        self.repository.delete(self.customer.id)
+        self.assertIsNone(self.repository.find_by_email("test@example.com"))
+        self.assertEqual(self.repository.email_index, {})
+
+
+class TestCustomerApi(unittest.TestCase):
+    """顧客APIのテストケース"""
+
+    def test_register_get_and_lookup_by_email(self):
+        """顧客の登録・取得・メールアドレス検索のテスト"""
+        email = f"{uuid4().hex}@example.com"
+        with TestClient(app) as client:
+            created = client.post("/api/customers/", json={"name": "テスト顧客", "email": email}).json()
+            self.assertTrue(created["success"])
+            customer_id = created["data"]["id"]
+
+            fetched = client.get(f"/api/customers/{customer_id}").json()
+            self.assertEqual(fetched["data"]["email"], email)
+
+            found = client.get("/api/customers/by-email", params={"email": email.upper()}).json()
+            self.assertEqual(found["data"]["id"], customer_id)
+
+            duplicate = client.post("/api/customers/", json={"name": "重複顧客", "email": email.upper()}).json()
+            self.assertFalse(duplicate["success"])
+            self.assertIn("already exists", duplicate["error"])
@@ -0,0 +1,80 @@
+import unittest
+from datetime import datetime
+from uuid import uuid4
+
+from application.usecases.order_interactor import _to_dto
+from application.usecases.order_projection import project_order
+from domain.entities.order import Order, OrderItem, OrderStatus
+from domain.money import from_cents, to_cents
+from infrastructure.repositories.compact_order_store import CompactOrderStore
+from infrastructure.repositories.in_memory_order_repository import (
+    InMemoryOrderCommandRepository,
+    InMemoryOrderQueryRepository
+)
+from presentation.presenters.order_presenter import OrderCommandPresenter
+
+
+class TestCompactOrderStore(unittest.TestCase):
+    """バイト列に詰めて注文を保持するストアのテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        store = CompactOrderStore()
+        self.command_repository = InMemoryOrderCommandRepository(store)
+        self.query_repository = InMemoryOrderQueryRepository(store)
+        self.customer_id = uuid4()
+
+    def _order(self) -> Order:
+        order = Order(customer_id=self.customer_id, created_at=datetime(2024, 5, 1, 12, 30, 15, 123456))
+        order.add_item(OrderItem(product_id=uuid4(), quantity=3, price_per_unit=19.99))
+        order.add_item(OrderItem(product_id=uuid4(), quantity=1, price_per_unit=1000))
+        return order
+
+    def test_round_trip_preserves_order(self):
+        """格納した注文が同じ内容で読み込めることのテスト"""
+        order = self.command_repository.save(self._order())
+
+        found = self.query_repository.find_by_id(order.id)
+        self.assertIsNot(found, order)
+        self.assertEqual(found, order)
+        self.assertIs(found.status, OrderStatus.PENDING)
+        self.assertAlmostEqual(found.total_amount, 1059.97)
+        self.assertEqual([o.id for o in self.query_repository.find_all_by_customer_id(self.customer_id)], [order.id])
+
+    def test_changes_are_visible_only_after_update(self):
+        """読み込んだ注文の変更が update するまでストアに反映されないことのテスト"""
+        order = self.command_repository.save(self._order())
+        loaded = self.command_repository.find_by_id(order.id)
+        loaded.update_status("SHIPPED")
+        self.assertEqual(self.query_repository.find_by_id(order.id).status, "PENDING")
+
+        self.command_repository.update(loaded)
+        found = self.query_repository.find_by_id(order.id)
+        self.assertEqual((found.status, found.version), ("SHIPPED", 2))
+        self.assertEqual(found.updated_at, loaded.updated_at)
+        self.assertEqual(self.query_repository.find_all_by_status("PENDING"), [])
+
+
+class TestCompactValues(unittest.TestCase):
+    """金額とステータスの表現のテストケース"""
+
+    def test_cents_round_half_up(self):
+        """金額が四捨五入で整数のセントに変換されることのテスト"""
+        self.assertEqual(to_cents(19.99), 1999)
+        self.assertEqual(to_cents(0.125), 13)
+        self.assertEqual(from_cents(to_cents(1234.5)), 1234.5)
+
+    def test_status_round_trips_through_presenter(self):
+        """ステータスがコードから復元され、プレゼンターでは文字列として出力されることのテスト"""
+        order = Order(customer_id=uuid4(), status=OrderStatus.from_code(OrderStatus.CONFIRMED.code))
+        presenter = OrderCommandPresenter()
+        presenter.present_updated_order(_to_dto(order))
+
+        data = presenter.view_model.to_dict()["data"]
+        self.assertEqual(data["status"], "CONFIRMED")
+        self.assertIs(type(data["status"]), str)
+        self.assertIs(type(project_order(order).data["status"]), str)
+
+
+if __name__ == "__main__":
+    unittest.main()
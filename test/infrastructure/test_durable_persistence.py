@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from uuid import uuid4
+
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderItem, OrderStatus
+from domain.entities.product import Product
+from infrastructure.persistence.journal import JournalCorruptedError, log_generations, log_path
+from infrastructure.persistence.persistence_manager import PersistenceManager
+from infrastructure.repositories.compact_order_store import CompactOrderStore
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_order_repository import (
+    InMemoryOrderCommandRepository,
+    InMemoryOrderQueryRepository,
+    InMemoryOrderStore
+)
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+
+
+class TestDurablePersistence(unittest.TestCase):
+    """スナップショットとジャーナルによるメモリ内リポジトリの永続化のテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def _open(self, store=None) -> PersistenceManager:
+        """空のリポジトリで永続化を開く（再起動に相当する）"""
+        manager = PersistenceManager(self.directory.name, store if store is not None else InMemoryOrderStore(),
+                                     InMemoryCustomerRepository(), InMemoryProductRepository(), fsync="always")
+        return manager.open()
+
+    def _order(self, customer_id, created_at) -> Order:
+        order = Order(customer_id=customer_id, created_at=created_at)
+        order.add_item(OrderItem(product_id=uuid4(), quantity=2, price_per_unit=12.5))
+        return order
+
+    def test_restores_journal_after_restart(self):
+        """スナップショットを取らずに停止しても、ジャーナルから全ての変更が復元されることのテスト"""
+        manager = self._open()
+        commands = InMemoryOrderCommandRepository(manager.order_store)
+        customer = manager.customer_repository.save(Customer(name="山田太郎", email="taro@example.com"))
+        product = manager.product_repository.save(Product(name="ノート", price=120.0, stock_quantity=10))
+        first = commands.save(self._order(customer.id, datetime(2024, 5, 1, 10)))
+        second = commands.save(self._order(customer.id, datetime(2024, 5, 1, 9)))
+        deleted = commands.save(self._order(customer.id, datetime(2024, 5, 1, 11)))
+        first.update_status(OrderStatus.CONFIRMED)
+        commands.update(first)
+        commands.delete(deleted.id)
+        manager.product_repository.reserve_stock({product.id: 3})
+        manager.journal.close()
+
+        restored = self._open()
+        queries = InMemoryOrderQueryRepository(restored.order_store)
+        self.assertEqual(restored.restored_counts["orders"], 2)
+        self.assertEqual([order.id for order in queries.find_all_by_customer_id(customer.id)], [second.id, first.id])
+        self.assertEqual(queries.find_by_id(first.id), first)
+        self.assertEqual(queries.find_by_id(first.id).version, first.version)
+        self.assertEqual([order.id for order in queries.find_all_by_status(OrderStatus.CONFIRMED)], [first.id])
+        self.assertIsNone(queries.find_by_id(deleted.id))
+        self.assertEqual(restored.customer_repository.find_by_email("TARO@example.com").id, customer.id)
+        self.assertEqual(restored.product_repository.find_by_id(product.id).stock_quantity, 7)
+
+    def test_compaction_replaces_logs_with_snapshot(self):
+        """スナップショット後は古いジャーナルが削除され、以降の変更と合わせて復元されることのテスト"""
+        manager = self._open(CompactOrderStore())
+        commands = InMemoryOrderCommandRepository(manager.order_store)
+        customer_id = uuid4()
+        before = commands.save(self._order(customer_id, datetime(2024, 5, 1, 10)))
+        self.assertEqual(manager.compact(), 1)
+        self.assertEqual(log_generations(self.directory.name), [manager.journal.generation])
+        after = commands.save(self._order(customer_id, datetime(2024, 5, 1, 12)))
+        manager.journal.close()
+
+        restored = self._open(CompactOrderStore())
+        queries = InMemoryOrderQueryRepository(restored.order_store)
+        self.assertEqual(restored.restored_counts["orders"], 2)
+        self.assertEqual([order.id for order in queries.find_all_by_customer_id(customer_id)], [before.id, after.id])
+        self.assertEqual(queries.find_by_id(after.id), after)
+
+    def test_close_snapshots_and_reopens(self):
+        """停止時にスナップショットを取り、同じインスタンスを開き直しても書き込みを続けられることのテスト"""
+        manager = self._open()
+        commands = InMemoryOrderCommandRepository(manager.order_store)
+        commands.save(self._order(uuid4(), datetime(2024, 5, 1, 10)))
+        manager.close()
+        self.assertIsNone(manager.order_store.journal)
+        self.assertEqual(manager.snapshots_total, 1)
+
+        manager.open()
+        commands.save(self._order(uuid4(), datetime(2024, 5, 1, 11)))
+        manager.close()
+        self.assertEqual(self._open().restored_counts["orders"], 2)
+
+    def test_torn_tail_is_truncated(self):
+        """最後のジャーナルの末尾が書き込み途中で切れていても、そこまでの変更が復元されることのテスト"""
+        manager = self._open()
+        commands = InMemoryOrderCommandRepository(manager.order_store)
+        kept = commands.save(self._order(uuid4(), datetime(2024, 5, 1, 10)))
+        commands.save(self._order(uuid4(), datetime(2024, 5, 1, 11)))
+        manager.journal.close()
+        path = log_path(self.directory.name, manager.journal.generation)
+        os.truncate(path, os.path.getsize(path) - 5)
+
+        restored = self._open()
+        self.assertEqual(restored.restored_counts["orders"], 1)
+        self.assertIsNotNone(restored.order_store.get(kept.id))
+        self.assertGreater(restored.truncated_bytes, 0)
+
+    def test_corruption_before_last_log_is_an_error(self):
+        """最後以外のジャーナルが壊れている場合は復元せずに例外になることのテスト"""
+        manager = self._open()
+        InMemoryOrderCommandRepository(manager.order_store).save(self._order(uuid4(), datetime(2024, 5, 1, 10)))
+        corrupted = log_path(self.directory.name, manager.journal.generation)
+        manager.journal.rotate()
+        manager.journal.close()
+        with open(corrupted, "r+b") as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b"\xff")
+
+        with self.assertRaises(JournalCorruptedError):
+            self._open()
+
+
+if __name__ == "__main__":
+    unittest.main()
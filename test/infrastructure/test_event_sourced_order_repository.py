@@ -0,0 +1,137 @@
+import unittest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from config.environment import env
+from domain.entities.order import Order, OrderItem, OrderStatus
+from infrastructure.event_store.order_events import Cancelled, ItemAdded, ItemRemoved, Placed, StatusChanged
+from infrastructure.repositories.event_sourced_order_repository import (
+    EventSourcedOrderCommandRepository,
+    EventSourcedOrderHistory,
+    InMemoryOrderEventStore,
+    OrderEventStream
+)
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderQueryRepository
+from main import app
+
+_START = datetime(2024, 5, 1, 9, 0)
+
+
+class TestEventSourcedOrderRepository(unittest.TestCase):
+    """注文をイベントストリームとして保存するリポジトリのテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.events = InMemoryOrderEventStore(snapshot_every=4)
+        self.repository = EventSourcedOrderCommandRepository(self.events)
+        self.history = EventSourcedOrderHistory(self.events)
+        self.customer_id = uuid4()
+
+    def _place(self, created_at: datetime = _START) -> Order:
+        order = Order(customer_id=self.customer_id, created_at=created_at)
+        order.items.append(OrderItem(product_id=uuid4(), quantity=1, price_per_unit=10.0))
+        order.updated_at = created_at
+        order.place()
+        return self.repository.save(order)
+
+    def _change_status(self, order: Order, status: OrderStatus, at: datetime) -> Order:
+        loaded = self.repository.find_by_id(order.id)
+        loaded.update_status(status)
+        loaded.updated_at = at
+        return self.repository.update(loaded)
+
+    def test_changes_are_recorded_as_events_and_replayed(self):
+        """アイテムの追加・削除とステータスの変更がイベントとして記録され、再生した注文が一致することのテスト"""
+        order = self._place()
+        loaded = self.repository.find_by_id(order.id)
+        removed_product = loaded.items[0].product_id
+        loaded.add_item(OrderItem(product_id=uuid4(), quantity=2, price_per_unit=5.0))
+        loaded.remove_item(removed_product)
+        self.repository.update(loaded)
+        cancelled = self._change_status(loaded, OrderStatus.CANCELLED, _START + timedelta(hours=1))
+
+        stream = self.events.streams[order.id].events
+        self.assertEqual([type(event) for event in stream], [Placed, ItemAdded, ItemRemoved, ItemAdded, Cancelled])
+        self.assertEqual([event.version for event in stream], [1, 1, 2, 2, 3])
+        self.assertEqual(self.repository.find_by_id(order.id), cancelled)
+        self.assertEqual(cancelled.version, 3)
+        self.assertEqual(InMemoryOrderQueryRepository(self.events.projection).find_by_id(order.id), cancelled)
+
+    def test_unchanged_update_appends_nothing(self):
+        """変更のない更新ではイベントを追記せず、版も進まないことのテスト"""
+        order = self._place()
+        loaded = self.repository.find_by_id(order.id)
+        self.repository.update(loaded)
+
+        self.assertEqual(self.events.stream_length(order.id), 2)
+        self.assertEqual(loaded.version, 1)
+
+    def test_snapshots_bound_replay_and_match_full_replay(self):
+        """スナップショットから再生した結果が先頭から再生した結果と一致することのテスト"""
+        order = self._place()
+        statuses = iter([OrderStatus.CONFIRMED, OrderStatus.SHIPPED, OrderStatus.DELIVERED])
+        changes = 9
+        for hour in range(1, changes + 1):
+            if hour % 3 == 0:
+                self._change_status(order, next(statuses), _START + timedelta(hours=hour))
+                continue
+            loaded = self.repository.find_by_id(order.id)
+            loaded.add_item(OrderItem(product_id=uuid4(), quantity=hour, price_per_unit=1.0))
+            loaded.updated_at = _START + timedelta(hours=hour)
+            self.repository.update(loaded)
+
+        stream = self.events.streams[order.id]
+        self.assertEqual(stream.snapshot_positions, [4, 8])
+        full = InMemoryOrderEventStore(snapshot_every=0)
+        full.streams[order.id] = OrderEventStream()
+        full.streams[order.id].append(stream.events)
+        self.assertEqual(self.events.load(order.id), full.load(order.id))
+        for hour in range(changes + 1):
+            at = _START + timedelta(hours=hour, minutes=30)
+            self.assertEqual(self.events.load(order.id, at), full.load(order.id, at))
+
+    def test_as_of_returns_state_at_time(self):
+        """指定した日時の時点の注文と、その時点までに作成された顧客の注文を取得できることのテスト"""
+        first = self._place(_START)
+        self._change_status(first, OrderStatus.CONFIRMED, _START + timedelta(hours=2))
+        second = self._place(_START + timedelta(hours=3))
+
+        self.assertIsNone(self.history.find_as_of(first.id, _START - timedelta(minutes=1)))
+        self.assertEqual(self.history.find_as_of(first.id, _START + timedelta(hours=1)).status, OrderStatus.PENDING)
+        self.assertEqual(self.history.find_as_of(first.id, _START + timedelta(hours=2)).status, OrderStatus.CONFIRMED)
+        self.assertEqual(
+            [order.id for order in self.history.find_by_customer_as_of(self.customer_id, _START + timedelta(hours=1))],
+            [first.id]
+        )
+        self.assertEqual(
+            [order.id for order in self.history.find_by_customer_as_of(self.customer_id, _START + timedelta(hours=4))],
+            [first.id, second.id]
+        )
+
+    def test_status_changed_event_keeps_status_enum(self):
+        """ステータス変更のイベントが列挙型のステータスを持つことのテスト"""
+        order = self._place()
+        self._change_status(order, OrderStatus.CONFIRMED, _START + timedelta(hours=1))
+        event = self.events.streams[order.id].events[-1]
+        self.assertIsInstance(event, StatusChanged)
+        self.assertIs(event.status, OrderStatus.CONFIRMED)
+
+
+class TestOrderHistoryEndpoint(unittest.TestCase):
+    """過去の時点の注文を取得するエンドポイントのテストケース"""
+
+    @unittest.skipIf(env.ORDER_STORE == "event_sourced", "イベントソーシングのリポジトリで起動している")
+    def test_requires_event_sourced_store(self):
+        """イベントソーシングのリポジトリ以外ではエラーを返すことのテスト"""
+        with TestClient(app) as client:
+            response = client.get(f"/api/orders/{uuid4()}/as-of", params={"at": "2024-05-01T09:00:00+09:00"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["success"])
+        self.assertIn("ORDER_STORE=event_sourced", response.json()["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
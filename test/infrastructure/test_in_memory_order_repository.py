@@ -0,0 +1,52 @@
+import unittest
+from uuid import uuid4
+
+from domain.entities.order import Order
+from infrastructure.repositories.in_memory_order_repository import (
+    InMemoryOrderCommandRepository,
+    InMemoryOrderQueryRepository,
+    InMemoryOrderStore
+)
+
+
+class TestInMemoryOrderIndexes(unittest.TestCase):
+    """メモリ内注文リポジトリのセカンダリインデックスのテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        store = InMemoryOrderStore()
+        self.command_repository = InMemoryOrderCommandRepository(store)
+        self.query_repository = InMemoryOrderQueryRepository(store)
+        self.customer_id = uuid4()
+        self.other_customer_id = uuid4()
+
+    def test_find_all_by_customer_id_uses_index(self):
+        """顧客IDインデックスで注文が取得できることのテスト"""
+        orders = [self.command_repository.save(Order(customer_id=self.customer_id)) for _ in range(3)]
+        self.command_repository.save(Order(customer_id=self.other_customer_id))
+
+        found = self.query_repository.find_all_by_customer_id(self.customer_id)
+        self.assertEqual([order.id for order in found], [order.id for order in orders])
+        self.assertEqual(self.query_repository.find_all_by_customer_id(uuid4()), [])
+
+    def test_status_index_follows_update(self):
+        """ステータス変更が更新時にインデックスへ反映されることのテスト"""
+        order = self.command_repository.save(Order(customer_id=self.customer_id))
+        self.assertEqual(len(self.query_repository.find_all_by_status("PENDING")), 1)
+
+        order.update_status("SHIPPED")
+        # 更新前でも古いステータスでは返さない
+        self.assertEqual(self.query_repository.find_all_by_status("PENDING"), [])
+
+        self.command_repository.update(order)
+        self.assertEqual(self.query_repository.find_all_by_status("PENDING"), [])
+        self.assertEqual([o.id for o in self.query_repository.find_all_by_status("SHIPPED")], [order.id])
+
+    def test_delete_removes_index_entries(self):
+        """削除時にインデックスから外れることのテスト"""
+        order = self.command_repository.save(Order(customer_id=self.customer_id))
+        self.command_repository.delete(order.id)
+
+        self.assertEqual(self.query_repository.find_all_by_customer_id(self.customer_id), [])
+        self.assertEqual(self.query_repository.find_all_by_status("PENDING"), [])
+        self.assertNotIn(self.customer_id, self.command_repository.store.by_customer)
@@ -0,0 +1,100 @@
+import asyncio
+import unittest
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from infrastructure.metrics.instrumentation import LAYER_DURATION, InstrumentedProxy, instrument, unwrap
+from infrastructure.metrics.registry import MetricsRegistry
+from main import app
+
+
+class _Repository:
+    """計測対象のテスト用リポジトリ"""
+
+    def __init__(self):
+        self.name = "repository"
+
+    def find(self, key):
+        return key
+
+    async def find_async(self, key):
+        return key
+
+    def fail(self):
+        raise ValueError("boom")
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """メトリクスのレジストリのテストケース"""
+
+    def test_render_prometheus_text(self):
+        """ヒストグラムが累積件数・合計・件数の形式で出力されることのテスト"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+        histogram.labels('/a"b').observe(0.05)
+        histogram.labels('/a"b').observe(0.5)
+        histogram.labels('/a"b').observe(5)
+        registry.counter("requests_total", "Requests.", ("status",)).labels("200").inc()
+
+        lines = registry.render().splitlines()
+        self.assertIn("# TYPE latency_seconds histogram", lines)
+        self.assertIn('latency_seconds_bucket{route="/a\\"b",le="0.1"} 1', lines)
+        self.assertIn('latency_seconds_bucket{route="/a\\"b",le="1.0"} 2', lines)
+        self.assertIn('latency_seconds_bucket{route="/a\\"b",le="+Inf"} 3', lines)
+        self.assertIn('latency_seconds_sum{route="/a\\"b"} 5.55', lines)
+        self.assertIn('latency_seconds_count{route="/a\\"b"} 3', lines)
+        self.assertIn('requests_total{status="200"} 1', lines)
+
+
+class TestInstrumentedProxy(unittest.TestCase):
+    """計測用プロキシのテストケース"""
+
+    def test_records_calls_and_errors(self):
+        """メソッドの呼び出しと例外が記録され、属性はそのまま参照できることのテスト"""
+        registry = MetricsRegistry()
+        repository = _Repository()
+        proxy = InstrumentedProxy(repository, "repository", registry)
+
+        self.assertEqual(proxy.find(1), 1)
+        self.assertEqual(asyncio.run(proxy.find_async(2)), 2)
+        with self.assertRaises(ValueError):
+            proxy.fail()
+        self.assertEqual(proxy.name, "repository")
+        self.assertIs(unwrap(proxy), repository)
+
+        text = registry.render()
+        self.assertIn('app_layer_duration_seconds_count{layer="repository",component="_Repository",method="find"} 1', text)
+        self.assertIn('app_layer_duration_seconds_count{layer="repository",component="_Repository",method="find_async"} 1', text)
+        self.assertIn('app_layer_errors_total{layer="repository",component="_Repository",method="fail"} 1', text)
+
+    def test_disabled_registry_does_not_record(self):
+        """計測が無効な場合は包まず、包み済みのプロキシも記録しないことのテスト"""
+        registry = MetricsRegistry(enabled=False)
+        repository = _Repository()
+        self.assertIs(instrument(repository, "repository", registry), repository)
+
+        proxy = InstrumentedProxy(repository, "repository", registry)
+        proxy.find(1)
+        self.assertIn(f'{LAYER_DURATION}_count{{layer="repository",component="_Repository",method="find"}} 0', registry.render())
+
+
+class TestMetricsEndpoint(unittest.TestCase):
+    """/metrics エンドポイントのテストケース"""
+
+    def test_exposes_layer_and_request_metrics(self):
+        """リクエスト後にルート・依存関係の解決・各境界の計測結果が出力されることのテスト"""
+        with TestClient(app) as client:
+            client.get(f"/api/orders/{uuid4()}")
+            response = client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain; version=0.0.4"))
+        text = response.text
+        self.assertIn('http_requests_total{method="GET",route="/api/orders/{order_id}",status="200"}', text)
+        for layer in ("dependencies", "controller", "input_boundary", "output_boundary", "repository"):
+            self.assertIn(f'layer="{layer}"', text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+from uuid import uuid4
+
+from sqlalchemy import event
+
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderItem
+from domain.entities.product import Product
+from domain.repositories.order_repository import OrderPageCursor
+from infrastructure.db.engine import dispose_engines, get_engine, get_session_factory
+from infrastructure.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from infrastructure.repositories.sqlalchemy_order_repository import (
+    SqlAlchemyOrderCommandRepository,
+    SqlAlchemyOrderQueryRepository
+)
+from infrastructure.repositories.sqlalchemy_product_repository import SqlAlchemyProductRepository
+
+
+class TestSqlAlchemyRepositories(unittest.TestCase):
+    """SQLAlchemyリポジトリのテストケース（ファイルベースのSQLite）"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_url = f"sqlite:///{os.path.join(self.tmpdir.name, 'test.db')}"
+        session_factory = get_session_factory(self.db_url)
+
+        self.order_command_repository = SqlAlchemyOrderCommandRepository(session_factory)
+        self.order_query_repository = SqlAlchemyOrderQueryRepository(session_factory)
+        self.customer_repository = SqlAlchemyCustomerRepository(session_factory)
+        self.product_repository = SqlAlchemyProductRepository(session_factory)
+
+        self.customer = self.customer_repository.save(Customer(name="テスト顧客", email="test@example.com"))
+        self.product = self.product_repository.save(Product(name="テスト商品", price=1000, stock_quantity=10))
+
+    def tearDown(self):
+        """テスト後の後始末"""
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def _create_order(self, quantity: int = 1) -> Order:
+        order = Order(customer_id=self.customer.id)
+        order.add_item(OrderItem(product_id=self.product.id, quantity=quantity, price_per_unit=self.product.price))
+        return self.order_command_repository.save(order)
+
+    def test_engine_is_shared_per_url(self):
+        """同じURLでは同じプール付きエンジンが返されることのテスト"""
+        self.assertIs(get_engine(self.db_url), get_engine(self.db_url))
+
+    def test_order_round_trip(self):
+        """注文の保存・更新・削除のテスト"""
+        order = self._create_order(quantity=2)
+
+        found = self.order_query_repository.find_by_id(order.id)
+        self.assertEqual(found.customer_id, self.customer.id)
+        self.assertEqual(len(found.items), 1)
+        self.assertEqual(found.total_amount, 2000)
+
+        order.update_status("CONFIRMED")
+        self.order_command_repository.update(order)
+        self.assertEqual(self.order_query_repository.find_by_id(order.id).status, "CONFIRMED")
+
+        self.order_command_repository.delete(order.id)
+        self.assertIsNone(self.order_query_repository.find_by_id(order.id))
+
+    def test_find_all_by_customer_id_without_n_plus_one(self):
+        """顧客の注文取得でクエリ数が注文数に依存しないことのテスト"""
+        for _ in range(20):
+            self._create_order()
+
+        statements = []
+        engine = get_engine(self.db_url)
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            orders = self.order_query_repository.find_all_by_customer_id(self.customer.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        self.assertEqual(len(orders), 20)
+        self.assertTrue(all(len(order.items) == 1 for order in orders))
+        self.assertLessEqual(len(statements), 2)
+
+    def test_customer_and_product_repositories(self):
+        """顧客・製品リポジトリの基本操作のテスト"""
+        self.assertEqual(self.customer_repository.find_by_email("test@example.com").id, self.customer.id)
+
+        self.product.update_stock(7)
+        self.product_repository.update(self.product)
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 7)
+        self.assertEqual(len(self.product_repository.find_by_name("テスト")), 1)
+
+    def test_find_by_ids_and_update_many(self):
+        """製品の一括取得と一括更新のテスト"""
+        other = self.product_repository.save(Product(name="別の商品", price=500, stock_quantity=3))
+
+        products = self.product_repository.find_by_ids([self.product.id, other.id, uuid4()])
+        self.assertEqual(set(products), {self.product.id, other.id})
+
+        for product in products.values():
+            product.update_stock(product.stock_quantity - 1)
+        self.product_repository.update_many(products.values())
+
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 9)
+        self.assertEqual(self.product_repository.find_by_id(other.id).stock_quantity, 2)
+
+    def test_find_page_by_customer_id_uses_keyset(self):
+        """キーセットページネーションで全注文を一度ずつ取得できることのテスト"""
+        created = [self._create_order() for _ in range(5)]
+
+        first = self.order_query_repository.find_page_by_customer_id(self.customer.id, 3)
+        last = first[-1]
+        second = self.order_query_repository.find_page_by_customer_id(
+            self.customer.id, 3, OrderPageCursor(last.created_at, last.id)
+        )
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 2)
+        self.assertEqual({o.id for o in first + second}, {o.id for o in created})
+        self.assertEqual(len(list(self.order_query_repository.iter_by_customer_id(self.customer.id, batch_size=2))), 5)
@@ -0,0 +1,76 @@
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest import mock
+from uuid import UUID
+
+from sqlalchemy import text
+
+from config.container import Container
+from config.environment import env
+from domain.entities.product import Product
+from domain.exceptions import InsufficientStockError
+from infrastructure.db.engine import dispose_engines, get_engine, get_session_factory
+from infrastructure.repositories.sqlalchemy_product_repository import SqlAlchemyProductRepository
+
+
+def _reserve_one_at_a_time(db_url: str, product_id: UUID, attempts: int) -> int:
+    """別のプロセスから在庫を1つずつ確保し、確保できた回数を返す"""
+    repository = SqlAlchemyProductRepository(get_session_factory(db_url))
+    reserved = 0
+    for _ in range(attempts):
+        try:
+            repository.reserve_stock({product_id: 1})
+            reserved += 1
+        except InsufficientStockError:
+            pass
+    dispose_engines()
+    return reserved
+
+
+class TestSqliteSharedStore(unittest.TestCase):
+    """複数のワーカープロセスで共有するファイルのSQLiteのテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_url = f"sqlite:///{os.path.join(self.tmpdir.name, 'shared.db')}"
+
+    def tearDown(self):
+        """テスト後の後始末"""
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def test_connections_use_wal(self):
+        """接続ごとにWALと書き込み待ちの時間が設定されることのテスト"""
+        with get_engine(self.db_url).connect() as connection:
+            self.assertEqual(connection.execute(text("PRAGMA journal_mode")).scalar(), "wal")
+            self.assertEqual(connection.execute(text("PRAGMA busy_timeout")).scalar(), int(env.SQLITE_BUSY_TIMEOUT_MS))
+
+    def test_processes_do_not_oversell_stock(self):
+        """複数のプロセスが同時に在庫を確保しても在庫数を超えて確保されないことのテスト"""
+        repository = SqlAlchemyProductRepository(get_session_factory(self.db_url))
+        product = repository.save(Product(name="テスト商品", price=100, stock_quantity=30))
+        dispose_engines()
+
+        with multiprocessing.get_context("spawn").Pool(3) as pool:
+            reserved = pool.starmap(_reserve_one_at_a_time, [(self.db_url, product.id, 15)] * 3)
+
+        self.assertEqual(sum(reserved), 30)
+        repository = SqlAlchemyProductRepository(get_session_factory(self.db_url))
+        self.assertEqual(repository.find_by_id(product.id).stock_quantity, 0)
+
+    def test_workers_require_shared_database(self):
+        """複数ワーカーではメモリ内リポジトリを使えず、注文レスポンスのキャッシュを保持しないことのテスト"""
+        with mock.patch.object(env, "WEB_CONCURRENCY", 2):
+            with self.assertRaises(RuntimeError):
+                Container(db_url="").wire()
+            container = Container(db_url=self.db_url).wire()
+            self.assertEqual(container.resolve("order_response_cache").max_entries, 0)
+            asyncio.run(container.aclose())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from application.interfaces.dto import OrderDTO, OrderItemDTO
+from application.usecases.async_order_interactor import AsyncOrderCommandInteractor, AsyncOrderQueryInteractor
+from domain.entities.customer import Customer
+from domain.entities.order import OrderStatus
+from domain.entities.product import Product
+from infrastructure.db.async_engine import dispose_async_engines, get_async_session_factory
+from infrastructure.db.engine import dispose_engines, get_session_factory
+from infrastructure.read_models.async_sqlalchemy_order_read_model import AsyncSqlAlchemyOrderReadModel
+from infrastructure.repositories.async_sqlalchemy_repositories import (
+    AsyncSqlAlchemyCustomerRepository,
+    AsyncSqlAlchemyOrderCommandRepository,
+    AsyncSqlAlchemyOrderQueryRepository,
+    AsyncSqlAlchemyProductRepository
+)
+from infrastructure.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from infrastructure.repositories.sqlalchemy_order_repository import (
+    SqlAlchemyOrderCommandRepository,
+    SqlAlchemyOrderQueryRepository
+)
+from infrastructure.repositories.sqlalchemy_product_repository import SqlAlchemyProductRepository
+from presentation.presenters.order_presenter import OrderCommandPresenter, OrderQueryPresenter
+
+
+class TestAsyncOrderInteractor(unittest.TestCase):
+    """非同期の注文ユースケースのテストケース（aiosqlite + ファイルベースのSQLite）"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_url = f"sqlite:///{os.path.join(self.tmpdir.name, 'test.db')}"
+
+        # データの準備と結果の確認は同期リポジトリで行い、同じDBを共有していることも確かめる
+        session_factory = get_session_factory(self.db_url)
+        self.product_repository = SqlAlchemyProductRepository(session_factory)
+        self.order_query_repository = SqlAlchemyOrderQueryRepository(session_factory)
+        self.customer = SqlAlchemyCustomerRepository(session_factory).save(
+            Customer(name="テスト顧客", email="test@example.com")
+        )
+        self.product = self.product_repository.save(Product(name="テスト商品", price=1000, stock_quantity=5))
+
+    def tearDown(self):
+        """テスト後の後始末"""
+        asyncio.run(dispose_async_engines())
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def _interactors(self):
+        async_session_factory = get_async_session_factory(self.db_url)
+        command_presenter = OrderCommandPresenter()
+        query_presenter = OrderQueryPresenter()
+        read_model = AsyncSqlAlchemyOrderReadModel(async_session_factory)
+        command = AsyncOrderCommandInteractor(
+            order_repository=AsyncSqlAlchemyOrderCommandRepository(async_session_factory),
+            order_query_repository=AsyncSqlAlchemyOrderQueryRepository(async_session_factory),
+            customer_repository=AsyncSqlAlchemyCustomerRepository(async_session_factory),
+            product_repository=AsyncSqlAlchemyProductRepository(async_session_factory),
+            output_boundary=command_presenter,
+            error_boundary=command_presenter,
+            read_model=read_model
+        )
+        query = AsyncOrderQueryInteractor(read_model, query_presenter, query_presenter)
+        return command, command_presenter, query, query_presenter
+
+    def _order(self, quantity: int) -> OrderDTO:
+        return OrderDTO(
+            customer_id=self.customer.id,
+            items=[OrderItemDTO(product_id=self.product.id, quantity=quantity, price_per_unit=1000)]
+        )
+
+    def test_create_and_cancel_order(self):
+        """注文の作成・取得・キャンセルが非同期エンジン経由で行えることのテスト"""
+        async def scenario():
+            command, command_presenter, query, query_presenter = self._interactors()
+
+            created = await command.create_order(self._order(3))
+            self.assertTrue(command_presenter.view_model.success)
+            self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 2)
+
+            fetched = await query.get_order(created.id)
+            self.assertEqual(fetched.total_amount, 3000)
+            self.assertEqual(len(await query.get_customer_orders(self.customer.id)), 1)
+
+            cancelled = await command.cancel_order(created.id)
+            self.assertEqual(cancelled.status, "CANCELLED")
+            self.assertEqual((await query.get_order(created.id)).data["status"], "CANCELLED")
+            return created
+
+        created = asyncio.run(scenario())
+        self.assertEqual(self.order_query_repository.find_by_id(created.id).status, "CANCELLED")
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 5)
+
+    def test_create_order_with_insufficient_stock(self):
+        """在庫不足の場合にエラーが表示され、在庫が変わらないことのテスト"""
+        async def scenario():
+            command, command_presenter, _, _ = self._interactors()
+            await command.create_order(self._order(6))
+            return command_presenter
+
+        presenter = asyncio.run(scenario())
+        self.assertFalse(presenter.view_model.success)
+        self.assertIn("Not enough stock", presenter.view_model.error)
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 5)
+
+    def test_concurrent_cancels_release_stock_once(self):
+        """同じ注文を同時にキャンセルしても在庫は1回だけ戻り、同期経路で変更したステータスを上書きしないことのテスト"""
+        async def scenario():
+            command, command_presenter, _, _ = self._interactors()
+            created = await command.create_order(self._order(3))
+            interactors = [self._interactors() for _ in range(4)]
+            await asyncio.gather(*(other[0].cancel_order(created.id) for other in interactors))
+            shipped = await command.create_order(self._order(1))
+            return created, shipped, [other[1].view_model.success for other in interactors], command
+
+        created, shipped, successes, command = asyncio.run(scenario())
+        self.assertEqual(successes.count(True), 1)
+        self.assertEqual(self.order_query_repository.find_by_id(created.id).status, "CANCELLED")
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 4)
+
+        # 同期経路（条件付き更新）で出荷済みにした注文は非同期経路でキャンセルできない
+        session_factory = get_session_factory(self.db_url)
+        SqlAlchemyOrderCommandRepository(session_factory).update_status_many(
+            [shipped.id], OrderStatus.SHIPPED, OrderStatus.SHIPPED.previous_statuses()
+        )
+
+        async def cancel_shipped():
+            other, presenter, _, _ = self._interactors()
+            await other.cancel_order(shipped.id)
+            return presenter
+
+        presenter = asyncio.run(cancel_shipped())
+        self.assertFalse(presenter.view_model.success)
+        self.assertEqual(self.order_query_repository.find_by_id(shipped.id).status, "SHIPPED")
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import json
+import unittest
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from application.usecases.order_interactor import OrderQueryInteractor
+from application.usecases.order_projection import project_order
+from domain.entities.order import Order, OrderItem
+from infrastructure.read_models.in_memory_order_read_model import InMemoryOrderReadModel
+from main import app
+from presentation.presenters.order_presenter import OrderQueryPresenter
+
+
+class TestCustomerOrderPagination(unittest.TestCase):
+    """顧客の注文一覧のカーソルページネーションとストリーミングのテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.read_model = InMemoryOrderReadModel()
+        self.customer_id = uuid4()
+
+        # 作成日時が同じ注文を含めてもページ間で重複・欠落しないことを確認する
+        created_at = datetime(2024, 1, 1)
+        self.orders = [
+            Order(customer_id=self.customer_id, created_at=created_at if i % 2 else datetime.now())
+            for i in range(7)
+        ]
+        self.read_model.upsert([project_order(order) for order in self.orders + [Order(customer_id=uuid4())]])
+
+    def _interactor(self):
+        presenter = OrderQueryPresenter()
+        return OrderQueryInteractor(self.read_model, presenter, presenter), presenter
+
+    def test_pages_cover_all_orders_once(self):
+        """全てのページを辿ると各注文が一度ずつ返されることのテスト"""
+        seen = []
+        cursor = None
+        while True:
+            interactor, presenter = self._interactor()
+            page = interactor.get_customer_orders_page(self.customer_id, 3, cursor)
+            self.assertLessEqual(len(page.orders), 3)
+            seen.extend(order.id for order in page.orders)
+            self.assertEqual(presenter.view_model.to_dict()["next_cursor"], page.next_cursor)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        self.assertEqual(sorted(seen), sorted(order.id for order in self.orders))
+        self.assertEqual(len(seen), len(set(seen)))
+
+    def test_invalid_cursor_is_reported(self):
+        """不正なカーソルがエラーになることのテスト"""
+        interactor, presenter = self._interactor()
+        interactor.get_customer_orders_page(self.customer_id, 3, "not-a-cursor")
+        self.assertFalse(presenter.view_model.success)
+        self.assertIn("Invalid cursor", presenter.view_model.error)
+
+    def test_stream_endpoint_returns_ndjson(self):
+        """ストリーミングエンドポイントがNDJSONを返すことのテスト"""
+        with TestClient(app) as client:
+            repository = app.state.container.resolve("order_command_repository")
+            read_model = app.state.container.resolve("order_read_model")
+            customer_id = uuid4()
+            for _ in range(3):
+                order = Order(customer_id=customer_id)
+                order.add_item(OrderItem(product_id=uuid4(), quantity=1, price_per_unit=100))
+                read_model.upsert([project_order(repository.save(order))])
+
+            response = client.get(f"/api/orders/customer/{customer_id}/stream")
+            lines = [json.loads(line) for line in response.text.splitlines()]
+
+            page = client.get(f"/api/orders/customer/{customer_id}", params={"limit": 2}).json()
+
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(all(line["customer_id"] == str(customer_id) for line in lines))
+        self.assertEqual(len(page["data"]), 2)
+        self.assertIsNotNone(page["next_cursor"])
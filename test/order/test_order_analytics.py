@@ -0,0 +1,94 @@
+import unittest
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderItem
+from domain.entities.product import Product
+from infrastructure.analytics.columnar_order_analytics import ColumnarOrderAnalytics
+from infrastructure.analytics.order_line_columns import OrderLineColumns
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderCommandRepository
+from main import app
+
+
+class TestColumnarOrderAnalytics(unittest.TestCase):
+    """注文明細の列指向ミラーと売上集計のテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.lines = OrderLineColumns(capacity=2)
+        self.repository = InMemoryOrderCommandRepository(lines=self.lines)
+        self.analytics = ColumnarOrderAnalytics(self.lines)
+        self.customers = [uuid4(), uuid4()]
+        self.products = [uuid4(), uuid4()]
+
+    def _save(self, customer: int, created_at: datetime, *items) -> Order:
+        order = Order(customer_id=self.customers[customer], created_at=created_at)
+        for product, quantity, price in items:
+            order.add_item(OrderItem(product_id=self.products[product], quantity=quantity, price_per_unit=price))
+        return self.repository.save(order)
+
+    def test_revenue_matches_entity_totals(self):
+        """商品・顧客・日ごとの売上がエンティティの合計と一致することのテスト"""
+        self._save(0, datetime(2024, 1, 1, 9), (0, 2, 10.5), (1, 1, 3.25))
+        self._save(1, datetime(2024, 1, 1, 23), (0, 1, 10.5))
+        self._save(1, datetime(2024, 1, 3, 0), (1, 4, 3.25))
+
+        by_product = self.analytics.revenue_by_product()
+        self.assertEqual(
+            [(row.key, row.revenue, row.quantity, row.lines) for row in by_product],
+            [(str(self.products[0]), 31.5, 3, 2), (str(self.products[1]), 16.25, 5, 2)]
+        )
+        by_customer = {row.key: row.revenue for row in self.analytics.revenue_by_customer()}
+        self.assertEqual(by_customer, {str(self.customers[0]): 24.25, str(self.customers[1]): 23.5})
+        by_day = [(row.key, row.revenue) for row in self.analytics.revenue_by_day()]
+        self.assertEqual(by_day, [("2024-01-01", 34.75), ("2024-01-03", 13.0)])
+
+        january_2 = self.analytics.revenue_by_product(since=datetime(2024, 1, 2), limit=1)
+        self.assertEqual([(row.key, row.revenue) for row in january_2], [(str(self.products[1]), 13.0)])
+
+    def test_update_and_delete_replace_rows(self):
+        """ステータス更新と削除が以降の集計に反映されることのテスト"""
+        cancelled = self._save(0, datetime(2024, 1, 1), (0, 1, 100))
+        deleted = self._save(0, datetime(2024, 1, 1), (0, 1, 50))
+        kept = self._save(1, datetime(2024, 1, 1), (0, 2, 1))
+
+        cancelled.update_status("CANCELLED")
+        self.repository.update(cancelled)
+        self.repository.delete(deleted.id)
+        kept.update_status("SHIPPED")
+        self.repository.update(kept)
+
+        self.assertEqual([row.revenue for row in self.analytics.revenue_by_product()], [2.0])
+        self.assertEqual([row.revenue for row in self.analytics.revenue_by_product(statuses=["CANCELLED"])], [100.0])
+        self.assertEqual(self.analytics.revenue_by_product(statuses=["PENDING"]), [])
+        # 行は追記のみで、置き換えられた行は無効として残る
+        self.assertEqual(len(self.lines), 5)
+
+
+class TestOrderAnalyticsEndpoint(unittest.TestCase):
+    """売上集計エンドポイントのテストケース"""
+
+    def test_revenue_by_customer(self):
+        """作成した注文の売上が顧客ごとに集計されることのテスト"""
+        with TestClient(app) as client:
+            container = app.state.container
+            customer = container.resolve("customer_repository").save(Customer(name="テスト顧客", email="analytics@example.com"))
+            product = container.resolve("product_repository").save(Product(name="テスト商品", price=250, stock_quantity=10))
+            client.post("/api/orders/", json={
+                "customer_id": str(customer.id),
+                "items": [{"product_id": str(product.id), "quantity": 3, "price_per_unit": 250}]
+            })
+
+            response = client.get("/api/analytics/revenue", params={"by": "customer", "status": "PENDING"})
+            rows = {row["key"]: row for row in response.json()["data"]["rows"]}
+            self.assertEqual(rows[str(customer.id)]["revenue"], 750.0)
+
+            invalid = client.get("/api/analytics/revenue", params={"by": "region"})
+            self.assertFalse(invalid.json()["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from application.interfaces.dto import OrderDTO, OrderItemDTO
+from application.usecases.order_interactor import OrderCommandInteractor
+from domain.entities.customer import Customer
+from domain.entities.product import Product
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderCommandRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from main import app
+from presentation.presenters.order_presenter import OrderCommandPresenter
+
+
+class TestOrderBatchCreation(unittest.TestCase):
+    """注文一括作成機能のテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.order_repository = InMemoryOrderCommandRepository()
+        self.customer_repository = InMemoryCustomerRepository()
+        self.product_repository = InMemoryProductRepository()
+        self.presenter = OrderCommandPresenter()
+        self.interactor = OrderCommandInteractor(
+            order_repository=self.order_repository,
+            customer_repository=self.customer_repository,
+            product_repository=self.product_repository,
+            output_boundary=self.presenter,
+            error_boundary=self.presenter
+        )
+
+        self.customer = self.customer_repository.save(Customer(name="テスト顧客", email="test@example.com"))
+        self.product = self.product_repository.save(Product(name="テスト商品", price=1000, stock_quantity=5))
+
+    def _order(self, quantity: int, customer_id=None) -> OrderDTO:
+        return OrderDTO(
+            customer_id=customer_id or self.customer.id,
+            items=[OrderItemDTO(product_id=self.product.id, quantity=quantity, price_per_unit=1000)]
+        )
+
+    def test_create_orders_reports_each_result(self):
+        """注文ごとに成功・失敗が返り、在庫がまとめて減ることのテスト"""
+        results = self.interactor.create_orders([
+            self._order(3),
+            self._order(1, customer_id=uuid4()),
+            self._order(3),  # 先の注文で3つ確保済みのため在庫不足
+            self._order(2),
+        ])
+
+        self.assertEqual([result.success for result in results], [True, False, False, True])
+        self.assertIn("Customer with ID", results[1].error)
+        self.assertIn("Not enough stock", results[2].error)
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 0)
+        self.assertEqual(len(self.order_repository.orders), 2)
+        self.assertTrue(self.presenter.view_model.success)
+        self.assertEqual(len(self.presenter.view_model.to_dict()["data"]), 4)
+
+    def test_batch_endpoint_keeps_request_positions(self):
+        """不正な入力を含むバッチでもリクエスト順に結果が返ることのテスト"""
+        with TestClient(app) as client:
+            container = app.state.container
+            customer = container.resolve("customer_repository").save(
+                Customer(name="テスト顧客", email=f"{uuid4().hex}@example.com")
+            )
+            product = container.resolve("product_repository").save(Product(name="テスト商品", price=500, stock_quantity=10))
+            order = {
+                "customer_id": str(customer.id),
+                "items": [{"product_id": str(product.id), "quantity": 2, "price_per_unit": 500}]
+            }
+            response = client.post("/api/orders/batch", json={"orders": [
+                order,
+                {"customer_id": "not-a-uuid", "items": []},
+                order,
+            ]}).json()
+
+        self.assertTrue(response["success"])
+        self.assertEqual([result["index"] for result in response["data"]], [0, 1, 2])
+        self.assertEqual([result["success"] for result in response["data"]], [True, False, True])
+        self.assertEqual(response["data"][0]["data"]["total_amount"], 1000)
+        self.assertEqual(product.stock_quantity, 6)
@@ -3,11 +3,11 @@ from uuid import uuid4
 from domain.entities.customer import Customer
 from domain.entities.product import Product
 from application.interfaces.dto import OrderDTO, OrderItemDTO
-from application.usecases.order_interactor import OrderCreationInteractor
-from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from application.usecases.order_interactor import OrderCommandInteractor
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderCommandRepository
 from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
 from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
-from presentation.presenters.order_presenter import OrderCreationPresenter
+from presentation.presenters.order_presenter import OrderCommandPresenter
 
 
 class TestOrderCreation(unittest.TestCase):
@@ -16,15 +16,15 @@ class TestOrderCreation(unittest.TestCase):
     def setUp(self):
         """テスト前の準備"""
         # リポジトリの初期化
-        self.order_repository = InMemoryOrderRepository()
+        self.order_repository = InMemoryOrderCommandRepository()
         self.customer_repository = InMemoryCustomerRepository()
         self.product_repository = InMemoryProductRepository()
 
         # プレゼンターの初期化
-        self.presenter = OrderCreationPresenter()
+        self.presenter = OrderCommandPresenter()
 
         # インタラクターの初期化
-        self.interactor = OrderCreationInteractor(
+        self.interactor = OrderCommandInteractor(
             order_repository=self.order_repository,
             customer_repository=self.customer_repository,
             product_repository=self.product_repository,
@@ -100,7 +100,7 @@ class TestOrderCreation(unittest.TestCase):
         # プレゼンターにデータが設定されているかチェック
         self.assertIsNone(self.presenter.view_model.error)
         self.assertTrue(self.presenter.view_model.success)
-        self.assertIsNotNone(self.presenter.view_model.order)
+        self.assertIsNotNone(self.presenter.view_model.data_json)
 
     def test_create_order_invalid_customer(self):
         """存在しない顧客IDによる注文作成失敗のテスト"""
@@ -0,0 +1,139 @@
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from application.interfaces.idempotency_store import (
+    IdempotencyKeyConflictError,
+    IdempotencyKeyInProgressError,
+    IdempotentResponse
+)
+from domain.entities.customer import Customer
+from domain.entities.product import Product
+from infrastructure.cache.idempotency_store import InMemoryIdempotencyStore
+from infrastructure.cache.sqlalchemy_idempotency_store import SqlAlchemyIdempotencyStore
+from infrastructure.db.engine import dispose_engines, get_session_factory
+from main import app
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryIdempotencyStore(unittest.TestCase):
+    """Idempotency-Key のメモリ内ストアのテストケース"""
+
+    def test_replays_completed_response_and_rejects_different_request(self):
+        """完了したキーには保存済みの結果を返し、別の内容のリクエストは拒否することのテスト"""
+        store = InMemoryIdempotencyStore()
+        self.assertIsNone(store.begin("key", "a"))
+        store.complete("key", IdempotentResponse("a", b"{}"))
+
+        self.assertEqual(store.begin("key", "a").body, b"{}")
+        with self.assertRaises(IdempotencyKeyConflictError):
+            store.begin("key", "b")
+        self.assertEqual((store.stats()["executions"], store.stats()["replays"]), (1, 1))
+
+    def test_expires_after_ttl_and_evicts_least_recently_used(self):
+        """有効期限を過ぎたキーと、件数上限を超えて最も使われていないキーが取り除かれることのテスト"""
+        clock = _Clock()
+        store = InMemoryIdempotencyStore(max_keys=2, ttl_seconds=60, clock=clock)
+        for key in ("first", "second"):
+            store.begin(key, key)
+            store.complete(key, IdempotentResponse(key, key.encode()))
+        store.begin("first", "first")
+        store.begin("third", "third")
+        store.complete("third", IdempotentResponse("third", b"third"))
+
+        self.assertIsNone(store.begin("second", "second"))
+        self.assertEqual(store.stats()["evictions"], 1)
+        clock.now = 61
+        self.assertIsNone(store.begin("first", "first"))
+
+    def test_concurrent_duplicate_waits_for_in_flight_result(self):
+        """処理中のキーで開始したリクエストが、完了した結果を受け取ることのテスト"""
+        store = InMemoryIdempotencyStore()
+        self.assertIsNone(store.begin("key", "a"))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            waiting = executor.submit(store.begin, "key", "a", 5.0)
+            while store.stats()["waits"] == 0:
+                threading.Event().wait(0.001)
+            store.complete("key", IdempotentResponse("a", b"done"))
+            self.assertEqual(waiting.result().body, b"done")
+
+        self.assertIsNone(store.begin("other", "a"))
+        with self.assertRaises(IdempotencyKeyInProgressError):
+            store.begin("other", "a", timeout=0)
+        store.release("other")
+        self.assertIsNone(store.begin("other", "a"))
+
+
+class TestSqlAlchemyIdempotencyStore(unittest.TestCase):
+    """Idempotency-Key のテーブルのストアのテストケース（ファイルベースのSQLite）"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_url = f"sqlite:///{os.path.join(self.tmpdir.name, 'test.db')}"
+        self.store = SqlAlchemyIdempotencyStore(get_session_factory(db_url), poll_interval=0.001)
+
+    def tearDown(self):
+        """テスト後の後始末"""
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def test_claims_replays_and_releases(self):
+        """処理権の取得・結果の保存と再送・処理権の解放のテスト"""
+        self.assertIsNone(self.store.begin("key", "a"))
+        with self.assertRaises(IdempotencyKeyInProgressError):
+            self.store.begin("key", "a", timeout=0)
+        self.store.complete("key", IdempotentResponse("a", b"{}"))
+        self.assertEqual(self.store.begin("key", "a").body, b"{}")
+        with self.assertRaises(IdempotencyKeyConflictError):
+            self.store.begin("key", "b")
+
+        self.assertIsNone(self.store.begin("failed", "a"))
+        self.store.release("failed")
+        self.assertIsNone(self.store.begin("failed", "a"))
+
+
+class TestOrderIdempotencyEndpoint(unittest.TestCase):
+    """注文作成エンドポイントの Idempotency-Key 対応のテストケース"""
+
+    def test_retries_with_same_key_create_one_order(self):
+        """同じキーの再送・同時送信で注文が1件だけ作成され、在庫も1回だけ減ることのテスト"""
+        with TestClient(app) as client:
+            container = app.state.container
+            customer = container.resolve("customer_repository").save(Customer(name="テスト顧客", email="idempotency@example.com"))
+            product = container.resolve("product_repository").save(Product(name="テスト商品", price=500, stock_quantity=10))
+            body = {
+                "customer_id": str(customer.id),
+                "items": [{"product_id": str(product.id), "quantity": 2, "price_per_unit": 500}]
+            }
+            headers = {"Idempotency-Key": str(uuid4())}
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                responses = list(executor.map(
+                    lambda path: client.post(path, json=body, headers=headers),
+                    ["/api/orders/", "/api/orders/", "/api/async/orders/", "/api/orders/"]
+                ))
+            conflict = client.post("/api/orders/", json={**body, "items": []}, headers=headers)
+
+            self.assertEqual({response.json()["data"]["order_id"] for response in responses},
+                             {responses[0].json()["data"]["order_id"]})
+            self.assertEqual(sum(response.headers.get("idempotent-replayed") == "true" for response in responses), 3)
+            self.assertEqual(len(container.resolve("order_read_model").list_by_customer(customer.id)), 1)
+            self.assertEqual(container.resolve("product_repository").find_by_id(product.id).stock_quantity, 8)
+            self.assertFalse(conflict.json()["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,295 @@
+import os
+import tempfile
+import threading
+import unittest
+from uuid import uuid4
+
+from application.interfaces.dto import OrderDTO, OrderItemDTO
+from application.usecases.order_interactor import OrderCommandInteractor
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderItem
+from domain.entities.product import Product
+from infrastructure.db.engine import dispose_engines, get_session_factory
+from infrastructure.messaging.outbox_dispatcher import OutboxDispatcher
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderCommandRepository
+from infrastructure.repositories.in_memory_outbox_repository import InMemoryOutboxRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from infrastructure.repositories.sqlalchemy_order_repository import SqlAlchemyOrderCommandRepository
+from infrastructure.repositories.sqlalchemy_outbox_repository import SqlAlchemyOutboxRepository
+from presentation.presenters.order_presenter import OrderCommandPresenter
+
+
+class TestOrderOutbox(unittest.TestCase):
+    """注文のドメインイベントがアウトボックスに書き込まれることのテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.outbox = InMemoryOutboxRepository()
+        customer_repository = InMemoryCustomerRepository()
+        self.product_repository = InMemoryProductRepository()
+        self.presenter = OrderCommandPresenter()
+        self.interactor = OrderCommandInteractor(
+            order_repository=InMemoryOrderCommandRepository(outbox=self.outbox),
+            customer_repository=customer_repository,
+            product_repository=self.product_repository,
+            output_boundary=self.presenter,
+            error_boundary=self.presenter
+        )
+        self.customer = customer_repository.save(Customer(name="テスト顧客", email="test@example.com"))
+        self.product = self.product_repository.save(Product(name="テスト商品", price=1000, stock_quantity=5))
+
+    def _order(self, quantity: int) -> OrderDTO:
+        return OrderDTO(
+            customer_id=self.customer.id,
+            items=[OrderItemDTO(product_id=self.product.id, quantity=quantity, price_per_unit=1000)]
+        )
+
+    def test_lifecycle_events_are_appended_in_order(self):
+        """作成・ステータス変更・キャンセルのイベントが発生順に追加されることのテスト"""
+        created = self.interactor.create_order(self._order(2))
+        self.interactor.update_order_status(created.id, "CONFIRMED")
+        self.interactor.cancel_order(created.id)
+
+        messages = self.outbox.fetch_pending(10)
+        self.assertEqual(
+            [message.event_type for message in messages],
+            ["OrderCreated", "OrderStatusChanged", "OrderCancelled"]
+        )
+        self.assertTrue(all(message.aggregate_id == created.id for message in messages))
+        self.assertEqual(messages[0].payload["total_amount"], 2000)
+        self.assertEqual(messages[1].payload, {"previous_status": "PENDING", "status": "CONFIRMED"})
+
+    def test_failed_creation_appends_no_event(self):
+        """在庫不足で作成できなかった注文のイベントが追加されないことのテスト"""
+        self.interactor.create_order(self._order(6))
+        self.assertFalse(self.presenter.view_model.success)
+        self.assertEqual(self.outbox.pending_count(), 0)
+
+
+class TestSqlAlchemyOutbox(unittest.TestCase):
+    """SQLAlchemyのアウトボックスのテストケース"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        session_factory = get_session_factory(f"sqlite:///{os.path.join(self.tmpdir.name, 'test.db')}")
+        self.order_repository = SqlAlchemyOrderCommandRepository(session_factory)
+        self.outbox = SqlAlchemyOutboxRepository(session_factory)
+
+    def tearDown(self):
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def _placed_order(self) -> Order:
+        order = Order(customer_id=uuid4())
+        order.add_item(OrderItem(product_id=uuid4(), quantity=1, price_per_unit=100))
+        order.place()
+        return order
+
+    def test_events_are_written_with_the_order(self):
+        """イベントが注文と同じ書き込みで保存され、配信済みにできることのテスト"""
+        order = self.order_repository.save(self._placed_order())
+        order.update_status("CANCELLED")
+        self.order_repository.update(order)
+
+        messages = self.outbox.fetch_pending(10)
+        self.assertEqual([message.event_type for message in messages], ["OrderCreated", "OrderCancelled"])
+        self.assertIsNotNone(self.outbox.oldest_pending_at())
+
+        self.outbox.mark_dispatched([message.id for message in messages])
+        self.assertEqual(self.outbox.pending_count(), 0)
+
+    def test_rolled_back_write_leaves_no_event(self):
+        """注文の書き込みが失敗した場合はイベントも保存されないことのテスト"""
+        order = self.order_repository.save(self._placed_order())
+        self.outbox.mark_dispatched([message.id for message in self.outbox.fetch_pending(10)])
+
+        # 同じIDの注文を再度保存すると主キー違反でロールバックされる
+        duplicate = Order(id=order.id, customer_id=order.customer_id)
+        duplicate.place()
+        with self.assertRaises(Exception):
+            self.order_repository.save(duplicate)
+        self.assertEqual(self.outbox.pending_count(), 0)
+
+    def test_claimed_messages_are_not_claimed_again_until_lease_expires(self):
+        """確保したメッセージは期限まで他の配信処理に渡らず、同じ注文の後のメッセージも確保されないことのテスト"""
+        order = self.order_repository.save(self._placed_order())
+        order.update_status("CONFIRMED")
+        self.order_repository.update(order)
+        other = self.order_repository.save(self._placed_order())
+
+        first = self.outbox.claim_pending(1, "worker-a", lease_seconds=60)
+        self.assertEqual([(message.aggregate_id, message.event_type) for message in first], [(order.id, "OrderCreated")])
+        second = self.outbox.claim_pending(10, "worker-b", lease_seconds=60)
+        self.assertEqual([message.aggregate_id for message in second], [other.id])
+        self.assertEqual(self.outbox.pending_count(), 3)
+
+        # 期限が切れた確保は他の配信処理が確保し直せる
+        reclaimed = self.outbox.claim_pending(10, "worker-b", lease_seconds=0)
+        self.assertIn(first[0].id, [message.id for message in reclaimed])
+
+        self.outbox.release([message.id for message in reclaimed])
+        self.assertEqual(len(self.outbox.claim_pending(10, "worker-c", lease_seconds=60)), 3)
+
+    def test_order_with_failed_message_is_not_claimed(self):
+        """配信に失敗したメッセージがある注文は、後のメッセージが確保されないことのテスト"""
+        order = self.order_repository.save(self._placed_order())
+        order.update_status("CONFIRMED")
+        self.order_repository.update(order)
+        other = self.order_repository.save(self._placed_order())
+
+        first, = self.outbox.claim_pending(1, "worker-a", lease_seconds=60)
+        self.outbox.mark_failed(first.id, 5, "consumer down")
+
+        claimed = self.outbox.claim_pending(10, "worker-a", lease_seconds=0)
+        self.assertEqual([message.aggregate_id for message in claimed], [other.id])
+        self.assertEqual([message.event_type for message in self.outbox.fetch_pending(10)], ["OrderStatusChanged"])
+
+    def test_concurrent_dispatchers_deliver_each_event_once(self):
+        """複数の配信処理が同じアウトボックスを配信しても、各イベントが1回だけ発生順に届くことのテスト"""
+        orders = []
+        for _ in range(30):
+            order = self.order_repository.save(self._placed_order())
+            order.update_status("CONFIRMED")
+            orders.append(self.order_repository.update(order))
+        received = []
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def record(message):
+            with lock:
+                received.append(message)
+                if len(received) >= 60:
+                    done.set()
+
+        dispatchers = [
+            OutboxDispatcher(self.outbox, max_workers=2, batch_size=8, poll_interval=0.01) for _ in range(3)
+        ]
+        for dispatcher in dispatchers:
+            dispatcher.subscribe("OrderCreated", record)
+            dispatcher.subscribe("OrderStatusChanged", record)
+            dispatcher.start()
+        try:
+            self.assertTrue(done.wait(10))
+        finally:
+            for dispatcher in dispatchers:
+                dispatcher.stop()
+
+        self.assertEqual(len(received), 60)
+        self.assertEqual(len({message.id for message in received}), 60)
+        by_order = {}
+        for message in received:
+            by_order.setdefault(message.aggregate_id, []).append(message.event_type)
+        self.assertTrue(all(events == ["OrderCreated", "OrderStatusChanged"] for events in by_order.values()))
+        self.assertEqual(self.outbox.pending_count(), 0)
+
+
+class TestOutboxDispatcher(unittest.TestCase):
+    """アウトボックスの配信処理のテストケース"""
+
+    def setUp(self):
+        self.outbox = InMemoryOutboxRepository()
+        self.repository = InMemoryOrderCommandRepository(outbox=self.outbox)
+
+    def _save_orders(self, count: int):
+        orders = []
+        for _ in range(count):
+            order = Order(customer_id=uuid4())
+            order.place()
+            order.update_status("CONFIRMED")
+            orders.append(self.repository.save(order))
+        return orders
+
+    def test_retries_until_handler_succeeds(self):
+        """購読者が一時的に失敗しても再試行で配信されることのテスト"""
+        self._save_orders(1)
+        calls = []
+
+        def flaky(message):
+            calls.append(message.id)
+            if len(calls) < 3:
+                raise RuntimeError("temporary failure")
+
+        dispatcher = OutboxDispatcher(self.outbox, max_attempts=5, retry_backoff=0)
+        dispatcher.subscribe("OrderCreated", flaky)
+        dispatcher.dispatch_batch()
+
+        metrics = dispatcher.metrics()
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(metrics["retries_total"], 2)
+        self.assertEqual(metrics["dispatched_total"], 2)
+        self.assertEqual(metrics["pending"], 0)
+
+    def test_gives_up_after_max_attempts(self):
+        """再試行しても失敗したメッセージが配信対象から外されることのテスト"""
+        self._save_orders(1)
+
+        def broken(message):
+            raise RuntimeError("consumer down")
+
+        dispatcher = OutboxDispatcher(self.outbox, max_attempts=2, retry_backoff=0)
+        dispatcher.subscribe("OrderStatusChanged", broken)
+        dispatcher.dispatch_batch()
+
+        self.assertEqual(dispatcher.metrics()["failed_total"], 1)
+        self.assertEqual(self.outbox.pending_count(), 0)
+        (message, error), = self.outbox.failed.values()
+        self.assertEqual(message.attempts, 2)
+        self.assertIn("consumer down", error)
+
+    def test_failed_message_stops_later_messages_of_the_same_order(self):
+        """先のメッセージの配信に失敗した注文は、後のメッセージを配信せずに未配信のまま残すことのテスト"""
+        failing, healthy = self._save_orders(2)
+        received = []
+
+        def created(message):
+            if message.aggregate_id == failing.id:
+                raise RuntimeError("consumer down")
+            received.append((message.aggregate_id, message.event_type))
+
+        dispatcher = OutboxDispatcher(self.outbox, max_attempts=2, retry_backoff=0)
+        dispatcher.subscribe("OrderCreated", created)
+        dispatcher.subscribe("OrderStatusChanged", lambda message: received.append((message.aggregate_id, message.event_type)))
+        dispatcher.dispatch_batch()
+
+        self.assertEqual(received, [(healthy.id, "OrderCreated"), (healthy.id, "OrderStatusChanged")])
+        self.assertEqual(dispatcher.metrics()["failed_total"], 1)
+        remaining = self.outbox.fetch_pending(10)
+        self.assertEqual([(message.aggregate_id, message.event_type) for message in remaining],
+                         [(failing.id, "OrderStatusChanged")])
+        self.assertEqual(self.outbox.claims, {})
+
+        # 次のバッチでも失敗した注文の後のメッセージは配信しない
+        self.assertEqual(dispatcher.dispatch_batch(), 0)
+        self.assertEqual(received, [(healthy.id, "OrderCreated"), (healthy.id, "OrderStatusChanged")])
+        self.assertEqual([message.event_type for message in self.outbox.fetch_pending(10)], ["OrderStatusChanged"])
+
+    def test_background_dispatch_preserves_order_per_aggregate(self):
+        """バックグラウンドで全て配信され、同じ注文のイベントは発生順に届くことのテスト"""
+        orders = self._save_orders(50)
+        received = {}
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def record(message):
+            with lock:
+                received.setdefault(message.aggregate_id, []).append(message.event_type)
+                if sum(len(events) for events in received.values()) == 100:
+                    done.set()
+
+        dispatcher = OutboxDispatcher(self.outbox, max_workers=4, batch_size=16, poll_interval=0.01)
+        dispatcher.subscribe("OrderCreated", record)
+        dispatcher.subscribe("OrderStatusChanged", record)
+        dispatcher.start()
+        try:
+            self.assertTrue(done.wait(5))
+        finally:
+            dispatcher.stop()
+
+        self.assertEqual(set(received), {order.id for order in orders})
+        self.assertTrue(all(events == ["OrderCreated", "OrderStatusChanged"] for events in received.values()))
+        self.assertFalse(dispatcher.running)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from application.interfaces.dto import OrderDTO, OrderItemDTO
+from application.usecases.order_interactor import OrderCommandInteractor
+from application.usecases.order_projection import project_order
+from config.container import Container
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderItem
+from domain.entities.product import Product
+from domain.repositories.order_repository import OrderPageCursor
+from infrastructure.db.engine import dispose_engines, get_session_factory
+from infrastructure.read_models.in_memory_order_read_model import InMemoryOrderReadModel
+from infrastructure.read_models.order_projection_repairer import OrderProjectionRepairer
+from infrastructure.read_models.sqlalchemy_order_read_model import SqlAlchemyOrderReadModel
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderCommandRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from infrastructure.repositories.sqlalchemy_order_repository import SqlAlchemyOrderCommandRepository
+from main import app
+from presentation.presenters.order_presenter import OrderCommandPresenter
+
+
+class OrderReadModelContract:
+    """読み取りモデルの実装に共通するテスト"""
+
+    def _order(self, customer_id, created_at=None, quantity=2):
+        order = Order(customer_id=customer_id, created_at=created_at or datetime.now())
+        order.add_item(OrderItem(product_id=uuid4(), quantity=quantity, price_per_unit=150))
+        return order
+
+    def test_upsert_and_get(self):
+        """投影したサマリーがそのまま取得できることのテスト"""
+        order = self._order(uuid4())
+        self.read_model.upsert([project_order(order)])
+
+        summary = self.read_model.get(order.id)
+        self.assertEqual(summary.total_amount, 300)
+        self.assertEqual(summary.data["order_id"], str(order.id))
+        self.assertEqual(summary.data["items"][0]["total_price"], 300)
+        self.assertIsNone(self.read_model.get(uuid4()))
+
+    def test_upsert_replaces_existing_summary(self):
+        """同じ注文を再投影すると置き換わり、一覧で重複しないことのテスト"""
+        customer_id = uuid4()
+        order = self._order(customer_id)
+        self.read_model.upsert([project_order(order)])
+        # リポジトリと同じく、更新のたびに版を進める
+        order.update_status("CONFIRMED")
+        order.version += 1
+        self.read_model.upsert([project_order(order)])
+
+        summaries = self.read_model.list_by_customer(customer_id)
+        self.assertEqual(len(summaries), 1)
+        self.assertEqual(summaries[0].data["status"], "CONFIRMED")
+        self.assertEqual(self.read_model.count(), 1)
+
+    def test_upsert_ignores_older_version(self):
+        """遅れて届いた古い版のサマリーで新しい版が上書きされないことのテスト"""
+        order = self._order(uuid4())
+        stale = project_order(order)
+        order.update_status("CONFIRMED")
+        order.version += 1
+        self.read_model.upsert([project_order(order)])
+        self.read_model.upsert([stale])
+
+        summary = self.read_model.get(order.id)
+        self.assertEqual((summary.version, summary.status), (2, "CONFIRMED"))
+
+    def test_page_by_customer_orders_by_created_at_and_id(self):
+        """ページ取得が作成日時・ID順でカーソルより後ろを返すことのテスト"""
+        customer_id = uuid4()
+        created_at = datetime(2024, 1, 1)
+        orders = [self._order(customer_id, created_at) for _ in range(5)]
+        self.read_model.upsert([project_order(order) for order in orders] + [project_order(self._order(uuid4()))])
+
+        expected = sorted(order.id for order in orders)
+        first = self.read_model.page_by_customer(customer_id, 2)
+        rest = self.read_model.page_by_customer(customer_id, 10, OrderPageCursor(created_at, first[-1].id))
+        self.assertEqual([summary.id for summary in first + rest], expected)
+        self.assertEqual([summary.id for summary in self.read_model.iter_by_customer(customer_id, 2)], expected)
+
+
+class TestInMemoryOrderReadModel(OrderReadModelContract, unittest.TestCase):
+    """メモリ内の読み取りモデルのテストケース"""
+
+    def setUp(self):
+        self.read_model = InMemoryOrderReadModel()
+
+
+class TestSqlAlchemyOrderReadModel(OrderReadModelContract, unittest.TestCase):
+    """SQLAlchemyの読み取りモデルのテストケース"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_url = f"sqlite:///{os.path.join(self.tmpdir.name, 'test.db')}"
+        self.read_model = SqlAlchemyOrderReadModel(get_session_factory(self.db_url))
+
+    def tearDown(self):
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def test_container_rebuilds_empty_read_model(self):
+        """読み取りモデルが空の場合に起動時に既存の注文から作り直されることのテスト"""
+        customer_id = uuid4()
+        repository = SqlAlchemyOrderCommandRepository(get_session_factory(self.db_url))
+        repository.save_many([self._order(customer_id) for _ in range(3)])
+
+        container = Container(self.db_url).wire()
+        self.assertEqual(container.rebuild_order_read_model(), 3)
+        self.assertEqual(len(self.read_model.list_by_customer(customer_id)), 3)
+        # 既に内容がある場合は作り直さない
+        self.assertEqual(container.rebuild_order_read_model(), 0)
+
+
+class TestOrderReadModelProjection(unittest.TestCase):
+    """コマンド側の書き込みが読み取りモデルに反映されることのテストケース"""
+
+    def test_status_update_and_cancel_are_visible_to_queries(self):
+        """ステータス更新とキャンセルがクエリの結果に反映されることのテスト"""
+        with TestClient(app) as client:
+            container = app.state.container
+            customer = container.resolve("customer_repository").save(Customer(name="テスト顧客", email="read@example.com"))
+            product = container.resolve("product_repository").save(Product(name="テスト商品", price=500, stock_quantity=10))
+
+            client.post("/api/orders/", json={
+                "customer_id": str(customer.id),
+                "items": [{"product_id": str(product.id), "quantity": 2, "price_per_unit": 500}]
+            })
+            read_model = container.resolve("order_read_model")
+            order_id = read_model.list_by_customer(customer.id)[0].id
+
+            client.put(f"/api/orders/{order_id}/status", json={"status": "CONFIRMED"})
+            self.assertEqual(read_model.get(order_id).data["status"], "CONFIRMED")
+
+            client.delete(f"/api/orders/{order_id}")
+            summary = read_model.get(order_id)
+            self.assertEqual(summary.status, "CANCELLED")
+            self.assertEqual(summary.total_amount, 1000)
+
+
+class FailingOrderReadModel(InMemoryOrderReadModel):
+    """反映に失敗する読み取りモデル（failures 回だけ失敗する）"""
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def upsert(self, summaries):
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("read model unavailable")
+        super().upsert(summaries)
+
+
+class TestOrderProjectionRepair(unittest.TestCase):
+    """読み取りモデルへの反映の失敗が書き込みの失敗として扱われず、後から修復されることのテストケース"""
+
+    def setUp(self):
+        self.order_repository = InMemoryOrderCommandRepository()
+        customer_repository = InMemoryCustomerRepository()
+        self.product_repository = InMemoryProductRepository()
+        self.read_model = FailingOrderReadModel(failures=1)
+        self.repairer = OrderProjectionRepairer(self.order_repository, self.read_model)
+        presenter = OrderCommandPresenter()
+        self.interactor = OrderCommandInteractor(
+            self.order_repository, customer_repository, self.product_repository, presenter, presenter,
+            self.read_model, repairs=self.repairer
+        )
+        self.customer = customer_repository.save(Customer(name="テスト顧客", email="repair@example.com"))
+        self.product = self.product_repository.save(Product(name="テスト商品", price=500, stock_quantity=10))
+
+    def test_create_order_succeeds_and_schedules_repair(self):
+        """反映に失敗しても注文の作成は成功し、修復で読み取りモデルに反映されることのテスト"""
+        result = self.interactor.create_order(OrderDTO(
+            customer_id=self.customer.id,
+            items=[OrderItemDTO(product_id=self.product.id, quantity=2, price_per_unit=500)]
+        ))
+
+        self.assertIsNotNone(self.order_repository.find_by_id(result.id))
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 8)
+        self.assertIsNone(self.read_model.get(result.id))
+        self.assertEqual(self.repairer.stats()["pending"], 1)
+
+        self.assertEqual(self.repairer.repair(), 1)
+        self.assertEqual(self.read_model.get(result.id).total_amount, 1000)
+        self.assertEqual(self.repairer.stats()["pending"], 0)
+
+    def test_failed_repair_is_retried(self):
+        """修復自体が失敗した場合は予約が残り、次の修復で反映されることのテスト"""
+        self.read_model.failures = 2
+        result = self.interactor.create_order(OrderDTO(
+            customer_id=self.customer.id,
+            items=[OrderItemDTO(product_id=self.product.id, quantity=1, price_per_unit=500)]
+        ))
+
+        with self.assertRaises(RuntimeError):
+            self.repairer.repair()
+        self.assertEqual(self.repairer.stats()["pending"], 1)
+        self.assertEqual(self.repairer.repair(), 1)
+        self.assertIsNotNone(self.read_model.get(result.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
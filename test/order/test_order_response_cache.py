@@ -0,0 +1,99 @@
+import unittest
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from domain.entities.customer import Customer
+from domain.entities.product import Product
+from infrastructure.cache.order_response_cache import OrderResponseCache
+from main import app
+
+
+class TestOrderResponseCache(unittest.TestCase):
+    """注文取得レスポンスのキャッシュのテストケース"""
+
+    def test_counts_hits_and_misses(self):
+        """ヒット数とミス数が数えられることのテスト"""
+        cache = OrderResponseCache()
+        order_id = uuid4()
+        self.assertIsNone(cache.get(order_id))
+        cache.put(order_id, 1, b"{}")
+        self.assertEqual(cache.get(order_id).body, b"{}")
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_evicts_least_recently_used(self):
+        """件数上限を超えると最も使われていない注文が追い出されることのテスト"""
+        cache = OrderResponseCache(max_entries=2)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.put(first, 1, b"1")
+        cache.put(second, 1, b"2")
+        cache.get(first)
+        cache.put(third, 1, b"3")
+
+        self.assertIsNotNone(cache.get(first))
+        self.assertIsNone(cache.get(second))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_stale_version_is_not_stored_after_invalidation(self):
+        """無効化より前に読み込まれた古い版が後から格納されないことのテスト"""
+        cache = OrderResponseCache()
+        order_id = uuid4()
+        cache.put(order_id, 1, b"v1")
+        cache.invalidate(order_id, 2)
+        self.assertIsNone(cache.get(order_id))
+
+        cache.put(order_id, 1, b"v1")
+        self.assertIsNone(cache.get(order_id))
+        cache.put(order_id, 2, b"v2")
+        self.assertEqual(cache.get(order_id).body, b"v2")
+
+
+class TestOrderEtagEndpoint(unittest.TestCase):
+    """注文取得エンドポイントのETag対応のテストケース"""
+
+    def test_not_modified_until_status_changes(self):
+        """同じ版には304を返し、ステータス更新後は新しい内容を返すことのテスト"""
+        with TestClient(app) as client:
+            container = app.state.container
+            customer = container.resolve("customer_repository").save(Customer(name="テスト顧客", email="etag@example.com"))
+            product = container.resolve("product_repository").save(Product(name="テスト商品", price=500, stock_quantity=10))
+            client.post("/api/orders/", json={
+                "customer_id": str(customer.id),
+                "items": [{"product_id": str(product.id), "quantity": 1, "price_per_unit": 500}]
+            })
+            order_id = container.resolve("order_read_model").list_by_customer(customer.id)[0].id
+            cache = container.resolve("order_response_cache")
+
+            first = client.get(f"/api/orders/{order_id}")
+            etag = first.headers["etag"]
+            self.assertEqual(first.json()["data"]["status"], "PENDING")
+
+            not_modified = client.get(f"/api/orders/{order_id}", headers={"If-None-Match": etag})
+            self.assertEqual(not_modified.status_code, 304)
+            self.assertEqual(cache.stats()["hits"], 1)
+
+            client.put(f"/api/orders/{order_id}/status", json={"status": "CONFIRMED"})
+            updated = client.get(f"/api/orders/{order_id}", headers={"If-None-Match": etag})
+            self.assertEqual(updated.status_code, 200)
+            self.assertNotEqual(updated.headers["etag"], etag)
+            self.assertEqual(updated.json()["data"]["status"], "CONFIRMED")
+
+            # 非同期ルートのキャンセルでも無効化される
+            client.delete(f"/api/async/orders/{order_id}")
+            cancelled = client.get(f"/api/async/orders/{order_id}", headers={"If-None-Match": updated.headers["etag"]})
+            self.assertEqual(cancelled.status_code, 200)
+            self.assertEqual(cancelled.json()["data"]["status"], "CANCELLED")
+
+    def test_missing_order_is_not_cached(self):
+        """存在しない注文はキャッシュされずエラーが返ることのテスト"""
+        with TestClient(app) as client:
+            response = client.get(f"/api/orders/{uuid4()}")
+            self.assertFalse(response.json()["success"])
+            self.assertNotIn("etag", response.headers)
+            self.assertEqual(app.state.container.resolve("order_response_cache").stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import json
+import unittest
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from application.interfaces.dto import OrderCreationResultDTO, OrderDTO, OrderItemDTO
+from domain.entities.customer import Customer
+from domain.entities.product import Product
+from main import app
+from presentation.serializers.order_serializer import serialize_creation_results, serialize_order, serialize_orders
+
+
+class TestOrderSerializer(unittest.TestCase):
+    """注文のJSONシリアライザーのテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.order = OrderDTO(
+            id=uuid4(),
+            customer_id=uuid4(),
+            items=[OrderItemDTO(product_id=uuid4(), quantity=3, price_per_unit=0.1)],
+            status="CONFIRMED",
+            created_at=datetime(2024, 5, 1, 12, 30, 15, 123456)
+        )
+
+    def test_matches_json_dumps_of_order_dict(self):
+        """json.dumps で辞書から作ったJSONと同じバイト列になることのテスト"""
+        item = self.order.items[0]
+        expected = {
+            "order_id": str(self.order.id),
+            "customer_id": str(self.order.customer_id),
+            "items": [{
+                "product_id": str(item.product_id),
+                "quantity": 3,
+                "price_per_unit": 0.1,
+                "total_price": 3 * 0.1
+            }],
+            "status": "CONFIRMED",
+            "created_at": "2024-05-01T12:30:15.123456",
+            "total_amount": 3 * 0.1
+        }
+        self.assertEqual(serialize_order(self.order), json.dumps(expected, separators=(",", ":")).encode())
+        self.assertEqual(json.loads(serialize_orders([self.order, self.order])), [expected, expected])
+        self.assertEqual(serialize_orders([]), b"[]")
+
+    def test_creation_results_escape_errors(self):
+        """一括作成の結果のエラーメッセージがエスケープされることのテスト"""
+        results = [
+            OrderCreationResultDTO(index=0, order=self.order),
+            OrderCreationResultDTO(index=1, error='Invalid product ID: "x"\n在庫不足')
+        ]
+        decoded = json.loads(serialize_creation_results(results))
+        self.assertEqual(decoded[0]["data"]["order_id"], str(self.order.id))
+        self.assertTrue(decoded[0]["success"])
+        self.assertEqual(decoded[1], {"index": 1, "success": False, "data": None, "error": 'Invalid product ID: "x"\n在庫不足'})
+
+
+class TestOrderCommandResponse(unittest.TestCase):
+    """注文コマンドのレスポンスのテストケース"""
+
+    def test_envelope_is_returned_as_is(self):
+        """作成・更新のレスポンスに success と data がそのまま含まれることのテスト"""
+        with TestClient(app) as client:
+            container = app.state.container
+            customer = container.resolve("customer_repository").save(Customer(name="テスト顧客", email="serializer@example.com"))
+            product = container.resolve("product_repository").save(Product(name="テスト商品", price=120, stock_quantity=10))
+            created = client.post("/api/orders/", json={
+                "customer_id": str(customer.id),
+                "items": [{"product_id": str(product.id), "quantity": 2, "price_per_unit": 120}]
+            })
+            body = created.json()
+            self.assertEqual(created.headers["content-type"], "application/json")
+            self.assertTrue(body["success"])
+            self.assertEqual(body["data"]["total_amount"], 240.0)
+
+            updated = client.put(f"/api/orders/{body['data']['order_id']}/status", json={"status": "SHIPPED"})
+            self.assertEqual(updated.json()["data"]["status"], "SHIPPED")
+
+            failed = client.put(f"/api/orders/{uuid4()}/status", json={"status": "SHIPPED"})
+            self.assertFalse(failed.json()["success"])
+            self.assertIn("not found", failed.json()["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import os
+import tempfile
+import threading
+import unittest
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from application.interfaces.dto import OrderDTO, OrderItemDTO
+from application.usecases.order_interactor import OrderCommandInteractor
+from domain.entities.customer import Customer
+from domain.entities.order import Order, OrderItem, OrderStatus
+from domain.entities.product import Product
+from domain.exceptions import InvalidStatusTransitionError
+from infrastructure.db.engine import dispose_engines, get_session_factory
+from infrastructure.read_models.in_memory_order_read_model import InMemoryOrderReadModel
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderCommandRepository
+from infrastructure.repositories.in_memory_outbox_repository import InMemoryOutboxRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from infrastructure.repositories.sqlalchemy_order_repository import SqlAlchemyOrderCommandRepository
+from infrastructure.repositories.sqlalchemy_outbox_repository import SqlAlchemyOutboxRepository
+from main import app
+from presentation.presenters.order_presenter import OrderCommandPresenter
+
+
+class TestOrderStatusTransitions(unittest.TestCase):
+    """注文ステータスの遷移表と一括更新のテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.outbox = InMemoryOutboxRepository()
+        self.order_repository = InMemoryOrderCommandRepository(outbox=self.outbox)
+        customer_repository = InMemoryCustomerRepository()
+        self.product_repository = InMemoryProductRepository()
+        self.read_model = InMemoryOrderReadModel()
+        self.presenter = OrderCommandPresenter()
+        self.interactor = OrderCommandInteractor(
+            self.order_repository, customer_repository, self.product_repository,
+            self.presenter, self.presenter, self.read_model
+        )
+        self.customer = customer_repository.save(Customer(name="テスト顧客", email="test@example.com"))
+        self.product = self.product_repository.save(Product(name="テスト商品", price=1000, stock_quantity=10))
+
+    def _create(self, *statuses: str) -> OrderDTO:
+        order = self.interactor.create_order(OrderDTO(
+            customer_id=self.customer.id,
+            items=[OrderItemDTO(product_id=self.product.id, quantity=1, price_per_unit=1000)]
+        ))
+        for status in statuses:
+            self.interactor.update_order_status(order.id, status)
+        return order
+
+    def test_transition_table_rejects_backward_changes(self):
+        """配達済みから保留中に戻すような変更が拒否されることのテスト"""
+        order = Order(customer_id=uuid4(), status=OrderStatus.SHIPPED)
+        order.update_status("DELIVERED")
+        with self.assertRaises(InvalidStatusTransitionError):
+            order.update_status("PENDING")
+
+        self.assertEqual(OrderStatus.SHIPPED.previous_statuses(), {OrderStatus.PENDING, OrderStatus.CONFIRMED})
+        self.assertFalse(OrderStatus.CANCELLED.can_transition_to(OrderStatus.CONFIRMED))
+
+        created = self._create("SHIPPED", "DELIVERED")
+        self.interactor.update_order_status(created.id, "PENDING")
+        self.assertEqual(self.presenter.view_model.error, "Cannot change order status from DELIVERED to PENDING")
+
+    def test_bulk_update_changes_allowed_orders_only(self):
+        """一括更新で変更できる注文だけが変更され、それ以外は理由が返ることのテスト"""
+        confirmed = [self._create("CONFIRMED") for _ in range(3)]
+        delivered = self._create("SHIPPED", "DELIVERED")
+        missing = uuid4()
+        events_before = len(self.outbox.fetch_pending(100))
+
+        results = self.interactor.update_orders_status(
+            [order.id for order in confirmed] + [delivered.id, missing, confirmed[0].id], "SHIPPED"
+        )
+
+        self.assertEqual([result.order_id for result in results], [order.id for order in confirmed] + [delivered.id, missing])
+        self.assertEqual([result.success for result in results], [True, True, True, False, False])
+        self.assertEqual(results[3].error, "Cannot change order status from DELIVERED to SHIPPED")
+        self.assertEqual(results[4].error, f"Order with ID {missing} not found")
+        self.assertEqual({self.read_model.get(order.id).status for order in confirmed}, {"SHIPPED"})
+        self.assertEqual(len(self.outbox.fetch_pending(100)) - events_before, 3)
+
+    def test_concurrent_cancellations_release_stock_once(self):
+        """同じ注文を同時にキャンセルしても1回だけ成功し、在庫が1回だけ戻ることのテスト"""
+        order = self._create()
+        barrier = threading.Barrier(4)
+        succeeded = []
+
+        def cancel():
+            presenter = OrderCommandPresenter()
+            interactor = OrderCommandInteractor(self.order_repository, None, self.product_repository, presenter, presenter)
+            barrier.wait()
+            interactor.cancel_order(order.id)
+            if presenter.view_model.success:
+                succeeded.append(order.id)
+
+        threads = [threading.Thread(target=cancel) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(succeeded), 1)
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 10)
+
+
+class TestSqlAlchemyConditionalStatusUpdate(unittest.TestCase):
+    """SQLAlchemyリポジトリの条件付きステータス更新のテストケース（ファイルベースのSQLite）"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        session_factory = get_session_factory(f"sqlite:///{os.path.join(self.tmpdir.name, 'test.db')}")
+        self.repository = SqlAlchemyOrderCommandRepository(session_factory)
+        self.outbox = SqlAlchemyOutboxRepository(session_factory)
+
+    def tearDown(self):
+        """テスト後の後始末"""
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def test_updates_only_rows_with_expected_status(self):
+        """元のステータスが条件に合う行だけが更新され、版とイベントが記録されることのテスト"""
+        orders = []
+        for status in (OrderStatus.PENDING, OrderStatus.CONFIRMED, OrderStatus.DELIVERED):
+            order = Order(customer_id=uuid4(), status=status)
+            order.items.append(OrderItem(product_id=uuid4(), quantity=2, price_per_unit=5.0))
+            orders.append(order)
+        self.repository.save_many(orders)
+
+        updated = self.repository.update_status_many(
+            [order.id for order in orders], OrderStatus.SHIPPED, OrderStatus.SHIPPED.previous_statuses()
+        )
+
+        self.assertEqual([order.id for order in updated], [orders[0].id, orders[1].id])
+        self.assertEqual([order.version for order in updated], [2, 2])
+        self.assertEqual(updated[0].items, orders[0].items)
+        self.assertEqual(self.repository.find_by_id(orders[2].id).status, OrderStatus.DELIVERED)
+        payloads = [message.payload for message in self.outbox.fetch_pending(10)]
+        self.assertEqual(
+            sorted(payload["previous_status"] for payload in payloads),
+            ["CONFIRMED", "PENDING"]
+        )
+
+
+class TestBulkStatusEndpoint(unittest.TestCase):
+    """一括ステータス更新エンドポイントのテストケース"""
+
+    def test_bulk_update_endpoint(self):
+        """注文ごとの成否が返り、不正な注文IDはリクエスト全体のエラーになることのテスト"""
+        with TestClient(app) as client:
+            container = app.state.container
+            customer = container.resolve("customer_repository").save(Customer(name="テスト顧客", email="bulk@example.com"))
+            product = container.resolve("product_repository").save(Product(name="テスト商品", price=500, stock_quantity=10))
+            order_ids = []
+            for _ in range(2):
+                response = client.post("/api/orders/", json={
+                    "customer_id": str(customer.id),
+                    "items": [{"product_id": str(product.id), "quantity": 1, "price_per_unit": 500}]
+                })
+                order_ids.append(response.json()["data"]["order_id"])
+            client.put(f"/api/orders/{order_ids[1]}/status", json={"status": "CANCELLED"})
+
+            response = client.put("/api/orders/status:bulk", json={"order_ids": order_ids, "status": "CONFIRMED"})
+            invalid = client.put("/api/orders/status:bulk", json={"order_ids": ["x"], "status": "CONFIRMED"})
+
+            self.assertEqual(
+                [(result["success"], result["status"]) for result in response.json()["data"]],
+                [(True, "CONFIRMED"), (False, None)]
+            )
+            self.assertEqual(client.get(f"/api/orders/{order_ids[0]}").json()["data"]["status"], "CONFIRMED")
+            self.assertEqual(container.resolve("product_repository").find_by_id(product.id).stock_quantity, 9)
+            self.assertFalse(invalid.json()["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
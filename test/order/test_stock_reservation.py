@@ -0,0 +1,161 @@
+import os
+import tempfile
+import threading
+import unittest
+from uuid import uuid4
+
+from application.interfaces.dto import OrderDTO, OrderItemDTO
+from application.usecases.order_interactor import OrderCommandInteractor
+from domain.entities.customer import Customer
+from domain.entities.product import Product
+from domain.exceptions import InsufficientStockError, InvalidQuantityError
+from infrastructure.db.engine import dispose_engines, get_session_factory
+from infrastructure.repositories.in_memory_customer_repository import InMemoryCustomerRepository
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderCommandRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from infrastructure.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from infrastructure.repositories.sqlalchemy_order_repository import (
+    SqlAlchemyOrderCommandRepository,
+    SqlAlchemyOrderQueryRepository
+)
+from infrastructure.repositories.sqlalchemy_product_repository import SqlAlchemyProductRepository
+from presentation.presenters.order_presenter import OrderCommandPresenter
+
+
+def _place_orders_concurrently(order_repository, customer_repository, product_repository,
+                               customer, product, threads: int, attempts: int) -> int:
+    """複数スレッドから同時に1個ずつ注文し、成功した注文数を返す"""
+    barrier = threading.Barrier(threads)
+    succeeded = []
+
+    def worker():
+        presenter = OrderCommandPresenter()
+        interactor = OrderCommandInteractor(order_repository, customer_repository, product_repository, presenter, presenter)
+        barrier.wait()
+        for _ in range(attempts):
+            interactor.create_order(OrderDTO(
+                customer_id=customer.id,
+                items=[OrderItemDTO(product_id=product.id, quantity=1, price_per_unit=product.price)]
+            ))
+            if presenter.view_model.success:
+                succeeded.append(1)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return len(succeeded)
+
+
+def _assert_rejects_non_positive_quantities(test: unittest.TestCase) -> None:
+    """正でない数量の確保・戻しと注文が拒否され、在庫が変わらないことを確認する"""
+    product_id = test.product.id
+    before = test.product_repository.find_by_id(product_id).stock_quantity
+    for quantity in (0, -10):
+        with test.assertRaises(InvalidQuantityError):
+            test.product_repository.reserve_stock({product_id: quantity})
+        with test.assertRaises(InvalidQuantityError):
+            test.product_repository.release_stock({product_id: quantity})
+
+    presenter = OrderCommandPresenter()
+    interactor = OrderCommandInteractor(
+        test.order_repository, test.customer_repository, test.product_repository, presenter, presenter
+    )
+    interactor.create_order(OrderDTO(
+        customer_id=test.customer.id,
+        items=[OrderItemDTO(product_id=product_id, quantity=-10, price_per_unit=1000)]
+    ))
+    test.assertFalse(presenter.view_model.success)
+    test.assertIn("must be positive", presenter.view_model.error)
+    test.assertEqual(test.product_repository.find_by_id(product_id).stock_quantity, before)
+
+
+class TestInMemoryStockReservation(unittest.TestCase):
+    """メモリ内リポジトリでの在庫確保のテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.order_repository = InMemoryOrderCommandRepository()
+        self.customer_repository = InMemoryCustomerRepository()
+        self.product_repository = InMemoryProductRepository()
+        self.customer = self.customer_repository.save(Customer(name="テスト顧客", email="test@example.com"))
+        self.product = self.product_repository.save(Product(name="人気商品", price=1000, stock_quantity=100))
+
+    def test_concurrent_orders_never_oversell(self):
+        """同じ製品への同時注文で在庫数を超えて売れないことのテスト"""
+        succeeded = _place_orders_concurrently(
+            self.order_repository, self.customer_repository, self.product_repository,
+            self.customer, self.product, threads=16, attempts=20
+        )
+
+        self.assertEqual(succeeded, 100)
+        self.assertEqual(len(self.order_repository.orders), 100)
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 0)
+
+    def test_reserve_stock_is_all_or_nothing(self):
+        """1つでも在庫が足りない場合は何も確保されないことのテスト"""
+        other = self.product_repository.save(Product(name="在庫僅少", price=500, stock_quantity=1))
+
+        with self.assertRaises(InsufficientStockError) as context:
+            self.product_repository.reserve_stock({self.product.id: 10, other.id: 2})
+
+        self.assertEqual(context.exception.product_id, other.id)
+        self.assertEqual(context.exception.available, 1)
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 100)
+
+        self.product_repository.release_stock({other.id: 4})
+        self.assertEqual(self.product_repository.reserve_stock({other.id: 5}), {other.id: 0})
+
+    def test_non_positive_quantities_are_rejected(self):
+        """正でない数量では在庫が増えないことのテスト"""
+        _assert_rejects_non_positive_quantities(self)
+
+
+class TestSqlAlchemyStockReservation(unittest.TestCase):
+    """SQLAlchemyリポジトリでの在庫確保のテストケース（ファイルベースのSQLite）"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        session_factory = get_session_factory(f"sqlite:///{os.path.join(self.tmpdir.name, 'test.db')}")
+        self.order_repository = SqlAlchemyOrderCommandRepository(session_factory)
+        self.order_query_repository = SqlAlchemyOrderQueryRepository(session_factory)
+        self.customer_repository = SqlAlchemyCustomerRepository(session_factory)
+        self.product_repository = SqlAlchemyProductRepository(session_factory)
+        self.customer = self.customer_repository.save(Customer(name="テスト顧客", email="test@example.com"))
+        self.product = self.product_repository.save(Product(name="人気商品", price=1000, stock_quantity=30))
+
+    def tearDown(self):
+        """テスト後の後始末"""
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def test_concurrent_orders_never_oversell(self):
+        """条件付きUPDATEにより同時注文でも在庫数を超えて売れないことのテスト"""
+        succeeded = _place_orders_concurrently(
+            self.order_repository, self.customer_repository, self.product_repository,
+            self.customer, self.product, threads=8, attempts=6
+        )
+
+        self.assertEqual(succeeded, 30)
+        self.assertEqual(len(self.order_query_repository.find_all_by_customer_id(self.customer.id)), 30)
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 0)
+
+    def test_reserve_stock_rolls_back_on_shortage(self):
+        """1つでも在庫が足りない場合はトランザクションごと戻ることのテスト"""
+        other = self.product_repository.save(Product(name="在庫僅少", price=500, stock_quantity=1))
+
+        with self.assertRaises(InsufficientStockError):
+            self.product_repository.reserve_stock({self.product.id: 10, other.id: 2, uuid4(): 1})
+
+        self.assertEqual(self.product_repository.find_by_id(self.product.id).stock_quantity, 30)
+        self.assertEqual(self.product_repository.find_by_id(other.id).stock_quantity, 1)
+
+    def test_non_positive_quantities_are_rejected(self):
+        """正でない数量では在庫が増えないことのテスト"""
+        _assert_rejects_non_positive_quantities(self)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+from dataclasses import FrozenInstanceError
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from domain.entities.customer import Customer
+from domain.entities.product import Product
+from infrastructure.cache.product_page_cache import ProductPageCache
+from infrastructure.read_models.product_catalog import ProductCatalog
+from infrastructure.repositories.catalog_tracking_product_repository import CatalogTrackingProductRepository
+from infrastructure.repositories.in_memory_product_repository import InMemoryProductRepository
+from main import app
+
+
+class TestProductCatalog(unittest.TestCase):
+    """版付きの製品カタログのテストケース"""
+
+    def setUp(self):
+        self.catalog = ProductCatalog(InMemoryProductRepository())
+        self.repository = CatalogTrackingProductRepository(self.catalog.repository, self.catalog)
+
+    def test_writes_bump_version_and_patch_snapshot(self):
+        """書き込みで版が上がり、変更された製品だけが差し替えられることのテスト"""
+        apple = self.repository.save(Product(name="apple", price=100, stock_quantity=10))
+        banana = self.repository.save(Product(name="banana", price=200, stock_quantity=10))
+        first = self.catalog.snapshot()
+        self.assertEqual([p.name for p in first.products], ["apple", "banana"])
+        self.assertIs(self.catalog.snapshot(), first)
+
+        self.repository.reserve_stock({apple.id: 3})
+        banana.update_price(250)
+        self.repository.update(banana)
+        second = self.catalog.snapshot()
+
+        self.assertGreater(second.version, first.version)
+        self.assertEqual(second.by_id[apple.id].stock_quantity, 7)
+        self.assertEqual(second.by_id[banana.id].price, 250)
+        self.assertEqual(first.by_id[apple.id].stock_quantity, 10)
+        self.assertEqual((self.catalog.full_builds, self.catalog.patches), (1, 1))
+        # スナップショットの製品は変更できない
+        with self.assertRaises(FrozenInstanceError):
+            second.by_id[apple.id].stock_quantity = 0
+
+    def test_rename_and_delete_keep_name_order(self):
+        """名前の変更と削除の後も名前順が保たれることのテスト"""
+        apple = self.repository.save(Product(name="apple", price=100))
+        self.repository.save(Product(name="banana", price=200))
+        cherry = self.repository.save(Product(name="cherry", price=300))
+        self.catalog.snapshot()
+
+        apple.name = "date"
+        self.repository.update(apple)
+        self.repository.delete(cherry.id)
+        snapshot = self.catalog.snapshot()
+
+        self.assertEqual([p.name for p in snapshot.products], ["banana", "date"])
+        self.assertEqual([p.name for p in snapshot.page(1, after=("banana", snapshot.products[0].id))], ["date"])
+
+    def test_expired_snapshot_is_rebuilt(self):
+        """max_age_seconds を過ぎたスナップショットは他のプロセスの書き込みを読み直すことのテスト"""
+        now = [0.0]
+        catalog = ProductCatalog(InMemoryProductRepository(), max_age_seconds=5, clock=lambda: now[0])
+        first = catalog.snapshot()
+        catalog.repository.save(Product(name="apple", price=100))
+        self.assertIs(catalog.snapshot(), first)
+
+        now[0] = 5.0
+        self.assertEqual([p.name for p in catalog.snapshot().products], ["apple"])
+        self.assertEqual(catalog.full_builds, 2)
+
+
+class TestProductPageCache(unittest.TestCase):
+    """製品レスポンスのキャッシュのテストケース"""
+
+    def test_newer_version_replaces_older_entries(self):
+        """新しい版が格納されると古い版のレスポンスが捨てられることのテスト"""
+        cache = ProductPageCache()
+        cache.put(1, "page", b"v1")
+        self.assertEqual(cache.get(1, "page").body, b"v1")
+
+        cache.put(2, "other", b"v2")
+        self.assertIsNone(cache.get(1, "page"))
+        self.assertIsNone(cache.get(2, "page"))
+        cache.put(1, "page", b"v1")
+        self.assertIsNone(cache.get(2, "page"))
+        self.assertEqual(cache.stats()["generations"], 2)
+
+
+class TestProductEndpoints(unittest.TestCase):
+    """製品取得エンドポイントのテストケース"""
+
+    def test_pages_search_and_not_modified(self):
+        """カーソルでページを辿れて、同じ版には304を返し、注文で在庫が減ると新しい内容を返すことのテスト"""
+        with TestClient(app) as client:
+            container = app.state.container
+            tag = uuid4().hex
+            products = container.resolve("product_repository")
+            saved = [products.save(Product(name=f"{tag}-{i}", price=100, stock_quantity=5)) for i in range(3)]
+
+            first = client.get("/api/products/search", params={"q": tag, "limit": 2}).json()["data"]
+            second = client.get("/api/products/search", params={"q": tag, "limit": 2, "cursor": first["next_cursor"]}).json()["data"]
+            self.assertEqual([p["name"] for p in first["products"] + second["products"]], [p.name for p in saved])
+            self.assertIsNone(second["next_cursor"])
+
+            response = client.get(f"/api/products/{saved[0].id}")
+            etag = response.headers["etag"]
+            self.assertEqual(response.json()["data"]["stock_quantity"], 5)
+            not_modified = client.get(f"/api/products/{saved[0].id}", headers={"If-None-Match": etag})
+            self.assertEqual(not_modified.status_code, 304)
+
+            customer = container.resolve("customer_repository").save(Customer(name="テスト顧客", email=f"{tag}@example.com"))
+            client.post("/api/orders/", json={
+                "customer_id": str(customer.id),
+                "items": [{"product_id": str(saved[0].id), "quantity": 2, "price_per_unit": 100}]
+            })
+            updated = client.get(f"/api/products/{saved[0].id}", headers={"If-None-Match": etag})
+            self.assertEqual(updated.status_code, 200)
+            self.assertEqual(updated.json()["data"]["stock_quantity"], 3)
+
+    def test_unknown_product_and_invalid_cursor(self):
+        """存在しない製品と不正なカーソルがエラーとして返されることのテスト"""
+        with TestClient(app) as client:
+            missing = client.get(f"/api/products/{uuid4()}").json()
+            self.assertFalse(missing["success"])
+            self.assertIn("not found", missing["error"])
+
+            invalid = client.get("/api/products/", params={"cursor": "!!"}).json()
+            self.assertFalse(invalid["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()